@@ -0,0 +1,56 @@
+"""add channel quotas and tags
+
+Revision ID: f1a2b3c4d5e6
+Revises: e0f1a2b3c4d5
+Create Date: 2025-09-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "f1a2b3c4d5e6"
+down_revision: Union[str, Sequence[str], None] = "e0f1a2b3c4d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "channel_quotas",
+        sa.Column("tenant", sa.String(length=64), nullable=False),
+        sa.Column("max_active_channels", sa.Integer(), nullable=True),
+        sa.Column("active_channels", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("tenant"),
+    )
+    op.create_table(
+        "channel_tags",
+        sa.Column("channel_id", sa.String(length=255), nullable=False),
+        sa.Column("tag", sa.String(length=64), nullable=False),
+        sa.ForeignKeyConstraint(["channel_id"], ["channels.channel_id"]),
+        sa.PrimaryKeyConstraint("channel_id", "tag"),
+    )
+    op.create_index(op.f("ix_channel_tags_tag"), "channel_tags", ["tag"], unique=False)
+    op.create_index(
+        "ix_channels_active_added",
+        "channels",
+        ["is_active", "added_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_channels_active_added", table_name="channels")
+    op.drop_index(op.f("ix_channel_tags_tag"), table_name="channel_tags")
+    op.drop_table("channel_tags")
+    op.drop_table("channel_quotas")
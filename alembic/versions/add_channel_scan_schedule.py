@@ -0,0 +1,43 @@
+"""add adaptive scan schedule to channels
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2025-09-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "b7c8d9e0f1a2"
+down_revision: Union[str, Sequence[str], None] = "a6b7c8d9e0f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "channels", sa.Column("scan_interval_minutes", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "channels",
+        sa.Column("last_scanned_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "channels",
+        sa.Column("next_scan_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_channels_next_scan_at"), "channels", ["next_scan_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_channels_next_scan_at"), table_name="channels")
+    op.drop_column("channels", "next_scan_at")
+    op.drop_column("channels", "last_scanned_at")
+    op.drop_column("channels", "scan_interval_minutes")
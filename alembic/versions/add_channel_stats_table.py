@@ -0,0 +1,92 @@
+"""add channel stats table
+
+Revision ID: c2d3e4f5a6b7
+Revises: b1c2d3e4f5g6
+Create Date: 2025-09-08 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "c2d3e4f5a6b7"
+down_revision: Union[str, Sequence[str], None] = "b1c2d3e4f5g6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "channel_stats",
+        sa.Column("channel_id", sa.String(length=255), nullable=False),
+        sa.Column("total_videos", sa.Integer(), nullable=False),
+        sa.Column("available_videos", sa.Integer(), nullable=False),
+        sa.Column("missing_videos", sa.Integer(), nullable=False),
+        sa.Column("private_events", sa.Integer(), nullable=False),
+        sa.Column("deleted_events", sa.Integer(), nullable=False),
+        sa.Column("geo_blocked_events", sa.Integer(), nullable=False),
+        sa.Column("age_restricted_events", sa.Integer(), nullable=False),
+        sa.Column("unknown_events", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["channel_id"],
+            ["channels.channel_id"],
+        ),
+        sa.PrimaryKeyConstraint("channel_id"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO channel_stats (
+            channel_id, total_videos, available_videos, missing_videos,
+            private_events, deleted_events, geo_blocked_events,
+            age_restricted_events, unknown_events
+        )
+        SELECT
+            c.channel_id,
+            COALESCE(v.total, 0),
+            COALESCE(v.available, 0),
+            COALESCE(v.total, 0) - COALESCE(v.available, 0),
+            COALESCE(e.private, 0),
+            COALESCE(e.deleted, 0),
+            COALESCE(e.geo_blocked, 0),
+            COALESCE(e.age_restricted, 0),
+            COALESCE(e.unknown, 0)
+        FROM channels c
+        LEFT JOIN (
+            SELECT
+                channel_id,
+                COUNT(*) AS total,
+                SUM(CASE WHEN is_available THEN 1 ELSE 0 END) AS available
+            FROM videos
+            GROUP BY channel_id
+        ) v ON v.channel_id = c.channel_id
+        LEFT JOIN (
+            SELECT
+                videos.channel_id,
+                SUM(CASE WHEN event_type = 'PRIVATE' THEN 1 ELSE 0 END) AS private,
+                SUM(CASE WHEN event_type = 'DELETED' THEN 1 ELSE 0 END) AS deleted,
+                SUM(CASE WHEN event_type = 'GEO_BLOCKED' THEN 1 ELSE 0 END)
+                    AS geo_blocked,
+                SUM(CASE WHEN event_type = 'AGE_RESTRICTED' THEN 1 ELSE 0 END)
+                    AS age_restricted,
+                SUM(CASE WHEN event_type = 'UNKNOWN' THEN 1 ELSE 0 END) AS unknown
+            FROM disappearance_events
+            JOIN videos ON videos.video_id = disappearance_events.video_id
+            GROUP BY videos.channel_id
+        ) e ON e.channel_id = c.channel_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("channel_stats")
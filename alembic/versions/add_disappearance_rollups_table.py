@@ -0,0 +1,92 @@
+"""add disappearance rollups table
+
+Revision ID: d3e4f5a6b7c8
+Revises: c2d3e4f5a6b7
+Create Date: 2025-09-09 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "d3e4f5a6b7c8"
+down_revision: Union[str, Sequence[str], None] = "c2d3e4f5a6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "disappearance_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("channel_id", sa.String(length=255), nullable=False),
+        sa.Column(
+            "event_type",
+            postgresql.ENUM(name="eventtype", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("bucket", sa.String(length=8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["channel_id"],
+            ["channels.channel_id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "channel_id",
+            "event_type",
+            "bucket",
+            "bucket_start",
+            name="uq_disappearance_rollups_key",
+        ),
+    )
+    op.create_index(
+        op.f("ix_disappearance_rollups_id"),
+        "disappearance_rollups",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_disappearance_rollups_bucket_start",
+        "disappearance_rollups",
+        ["bucket", "bucket_start"],
+        unique=False,
+    )
+
+    # Truncate the UTC wall-clock time and turn it back into a timestamptz,
+    # so buckets match the UTC buckets written at runtime whatever the
+    # session's TimeZone setting is.
+    for bucket in ("hour", "day"):
+        op.execute(
+            f"""
+            INSERT INTO disappearance_rollups
+                (channel_id, event_type, bucket, bucket_start, count)
+            SELECT
+                videos.channel_id,
+                disappearance_events.event_type,
+                '{bucket}',
+                date_trunc(
+                    '{bucket}', disappearance_events.detected_at AT TIME ZONE 'UTC'
+                ) AT TIME ZONE 'UTC',
+                COUNT(*)
+            FROM disappearance_events
+            JOIN videos ON videos.video_id = disappearance_events.video_id
+            GROUP BY 1, 2, 4
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_disappearance_rollups_bucket_start", table_name="disappearance_rollups"
+    )
+    op.drop_index(
+        op.f("ix_disappearance_rollups_id"), table_name="disappearance_rollups"
+    )
+    op.drop_table("disappearance_rollups")
@@ -0,0 +1,37 @@
+"""add scan run phase timing and api usage
+
+Revision ID: a6b7c8d9e0f1
+Revises: f5a6b7c8d9e0
+Create Date: 2025-09-12 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "a6b7c8d9e0f1"
+down_revision: Union[str, Sequence[str], None] = "f5a6b7c8d9e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USAGE_COLUMNS = ("api_calls", "quota_units", "pages_fetched")
+TIMING_COLUMNS = ("fetch_ms", "diff_ms", "db_write_ms", "notify_ms")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name in USAGE_COLUMNS:
+        op.add_column(
+            "scan_runs",
+            sa.Column(name, sa.Integer(), server_default="0", nullable=False),
+        )
+    for name in TIMING_COLUMNS:
+        op.add_column("scan_runs", sa.Column(name, sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in reversed(USAGE_COLUMNS + TIMING_COLUMNS):
+        op.drop_column("scan_runs", name)
@@ -0,0 +1,60 @@
+"""add video revisions table and video content hash
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2025-09-10 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "e4f5a6b7c8d9"
+down_revision: Union[str, Sequence[str], None] = "d3e4f5a6b7c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("videos", sa.Column("content_hash", sa.String(64), nullable=True))
+
+    op.create_table(
+        "video_revisions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("video_id", sa.String(length=255), nullable=False),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("changes", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["video_id"],
+            ["videos.video_id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_video_revisions_id"), "video_revisions", ["id"], unique=False
+    )
+    op.create_index(
+        "ix_video_revisions_video_id_changed_at",
+        "video_revisions",
+        ["video_id", "changed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_video_revisions_video_id_changed_at", table_name="video_revisions"
+    )
+    op.drop_index(op.f("ix_video_revisions_id"), table_name="video_revisions")
+    op.drop_table("video_revisions")
+    op.drop_column("videos", "content_hash")
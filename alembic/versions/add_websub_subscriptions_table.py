@@ -0,0 +1,75 @@
+"""add websub subscriptions table
+
+Revision ID: c8d9e0f1a2b3
+Revises: b7c8d9e0f1a2
+Create Date: 2025-09-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "c8d9e0f1a2b3"
+down_revision: Union[str, Sequence[str], None] = "b7c8d9e0f1a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "websub_subscriptions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("channel_id", sa.String(length=255), nullable=False),
+        sa.Column("topic_url", sa.String(length=500), nullable=False),
+        sa.Column("secret", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("lease_seconds", sa.Integer(), nullable=True),
+        sa.Column("requested_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("verified_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_notified_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["channel_id"],
+            ["channels.channel_id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_websub_subscriptions_id"),
+        "websub_subscriptions",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_websub_subscriptions_channel_id"),
+        "websub_subscriptions",
+        ["channel_id"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_websub_subscriptions_expires_at"),
+        "websub_subscriptions",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_websub_subscriptions_expires_at"), table_name="websub_subscriptions"
+    )
+    op.drop_index(
+        op.f("ix_websub_subscriptions_channel_id"), table_name="websub_subscriptions"
+    )
+    op.drop_index(op.f("ix_websub_subscriptions_id"), table_name="websub_subscriptions")
+    op.drop_table("websub_subscriptions")
@@ -1,23 +1,75 @@
-from typing import List
+from collections import Counter
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db, record_write
 from app.models.channel import Channel
-from app.schemas.channel import ChannelCreate, ChannelResponse
+from app.models.channel_stats import EVENT_COUNT_COLUMNS, ChannelStats
+from app.models.channel_tag import ChannelTag
+from app.schemas.channel import (
+    ChannelCreate,
+    ChannelImportResponse,
+    ChannelImportRow,
+    ChannelResponse,
+    ChannelStatsResponse,
+    ChannelTagCount,
+    ChannelTagsUpdate,
+    ChannelUsageResponse,
+)
+from app.services.channel_import import (
+    ChannelImporter,
+    ImportFileError,
+    parse_import_file,
+)
+from app.services.channel_registry import (
+    ChannelLimitError,
+    ChannelRegistry,
+    normalize_tags,
+)
+from app.services.channel_stats import ChannelStatsService
 from app.services.youtube_client import YouTubeClient
 
 router = APIRouter(prefix="/channels", tags=["channels"])
 
+MAX_IMPORT_ROWS = 5000
+
+
+def limit_exceeded(limit: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Maximum of {limit} channels allowed. Please "
+        "remove a channel before adding a new one.",
+    )
+
+
+def _tags(tags: List[str]) -> List[str]:
+    try:
+        return normalize_tags(tags)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 
 @router.post("/", response_model=ChannelResponse, status_code=status.HTTP_201_CREATED)
 async def add_channel(
-    channel_data: ChannelCreate, db: Session = Depends(get_db)
+    channel_data: ChannelCreate, response: Response, db: Session = Depends(get_db)
 ) -> ChannelResponse:
     """
-    Add a new channel with validation, 10-channel limit, and deduplication.
+    Add a new channel with validation, the active-channel limit, and
+    deduplication. A previously removed channel is reactivated.
 
     Accepts various input formats:
     - Channel URLs: https://www.youtube.com/channel/UCxxxxx
@@ -27,15 +79,10 @@ async def add_channel(
     - Direct channel IDs: UCxxxxx
     - Direct handles: @handle
     """
-    channel_count = (
-        db.query(func.count(Channel.id)).filter(Channel.is_active.is_(True)).scalar()
-    )
-    if channel_count >= 10:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Maximum of 10 channels allowed. Please remove a channel "
-            "before adding a new one.",
-        )
+    tags = _tags(channel_data.tags)
+    registry = ChannelRegistry(db)
+    if registry.available() == 0:
+        raise limit_exceeded(registry.limit() or 0)
 
     try:
         youtube_client = YouTubeClient()
@@ -53,53 +100,222 @@ async def add_channel(
             detail="Channel not found. Please check the URL or handle and try again.",
         )
 
-    existing_channel = (
-        db.query(Channel)
-        .filter(Channel.channel_id == channel_id, Channel.is_active.is_(True))
-        .first()
-    )
+    new_channel = db.query(Channel).filter(Channel.channel_id == channel_id).first()
 
-    if existing_channel:
+    if new_channel is not None and new_channel.is_active:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Channel '{metadata['title']}' is already registered.",
         )
 
-    new_channel = Channel(
-        channel_id=channel_id,
-        title=metadata["title"],
-        description=metadata.get("description"),
-        thumbnail_url=metadata.get("thumbnail_url"),
-        subscriber_count=metadata.get("subscriber_count"),
-        uploads_playlist_id=metadata.get("uploads_playlist_id"),
-        source_input=channel_data.input,
-    )
+    try:
+        registry.reserve()
+    except ChannelLimitError as e:
+        raise limit_exceeded(e.limit)
 
-    db.add(new_channel)
+    if new_channel is None:
+        new_channel = Channel(
+            channel_id=channel_id,
+            title=metadata["title"],
+            description=metadata.get("description"),
+            thumbnail_url=metadata.get("thumbnail_url"),
+            subscriber_count=metadata.get("subscriber_count"),
+            uploads_playlist_id=metadata.get("uploads_playlist_id"),
+            source_input=channel_data.input,
+        )
+        db.add(new_channel)
+    else:
+        new_channel.is_active = True  # type: ignore[assignment]
+        new_channel.source_input = channel_data.input  # type: ignore[assignment]
+
+    registry.set_tags(new_channel, tags)
+    db.flush()
+    # Created with the channel so the stats endpoint never has to write.
+    ChannelStatsService(db).ensure(channel_id)
     db.commit()
     db.refresh(new_channel)
+    record_write(db, response)
 
     return ChannelResponse.model_validate(new_channel)
 
 
+@router.post("/import", response_model=ChannelImportResponse)
+async def import_channels(
+    response: Response,
+    file: UploadFile = File(..., description="CSV, Takeout subscriptions.csv or OPML"),
+    db: Session = Depends(get_db),
+) -> ChannelImportResponse:
+    """
+    Add many channels at once from an uploaded file.
+
+    Accepts a CSV or text file with one channel URL, @handle or channel ID
+    per line, a Google Takeout ``subscriptions.csv``, or an OPML
+    subscription list. Duplicate inputs are reported rather than resolved
+    twice, and the response has one entry per input row with its outcome:
+    ``added``, ``duplicate``, ``already_registered``, ``not_found``,
+    ``limit_reached``, ``invalid`` or ``error``.
+    """
+    try:
+        inputs = parse_import_file(file.filename or "", await file.read())
+    except ImportFileError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if len(inputs) > MAX_IMPORT_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Import files are limited to {MAX_IMPORT_ROWS} rows.",
+        )
+
+    try:
+        importer = ChannelImporter(db)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="YouTube API configuration error",
+        )
+
+    rows = await run_in_threadpool(importer.run, inputs)
+    record_write(db, response)
+
+    return ChannelImportResponse(
+        total=len(rows),
+        counts=dict(Counter(str(row.status) for row in rows)),
+        rows=[ChannelImportRow.model_validate(row) for row in rows],
+    )
+
+
 @router.get("/", response_model=List[ChannelResponse])
-async def list_channels(db: Session = Depends(get_db)) -> List[ChannelResponse]:
+async def list_channels(
+    tag: Optional[str] = Query(None, description="Only channels with this tag"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_read_db),
+) -> List[ChannelResponse]:
     """
-    List all registered channels with metadata.
+    List registered channels with metadata.
 
-    Returns channels ordered by most recently added first.
+    Returns channels ordered by most recently added first, optionally
+    filtered to one tag, one page of ``limit`` (default 100) at a time.
     """
-    channels = (
-        db.query(Channel)
-        .filter(Channel.is_active.is_(True))
-        .order_by(Channel.added_at.desc())
-        .all()
+    query = (
+        select(Channel)
+        .options(selectinload(Channel.stats), selectinload(Channel.tag_rows))
+        .where(Channel.is_active.is_(True))
+        .order_by(Channel.added_at.desc(), Channel.id.desc())
+        .offset(offset)
+        .limit(limit)
     )
+    if tag is not None:
+        query = query.where(
+            Channel.channel_id.in_(
+                select(ChannelTag.channel_id).where(
+                    ChannelTag.tag == tag.strip().lower()
+                )
+            )
+        )
+    channels = await db.scalars(query)
     return [ChannelResponse.model_validate(channel) for channel in channels]
 
 
+@router.get("/usage", response_model=ChannelUsageResponse)
+async def get_channel_usage(db: Session = Depends(get_db)) -> ChannelUsageResponse:
+    """Active channels counted against the limit, and how many remain."""
+    registry = ChannelRegistry(db)
+    usage = ChannelUsageResponse(
+        current=registry.active(),
+        limit=registry.limit(),
+        remaining=registry.available(),
+    )
+    db.commit()
+    return usage
+
+
+@router.get("/tags", response_model=List[ChannelTagCount])
+async def list_channel_tags(
+    db: AsyncSession = Depends(get_read_db),
+) -> List[ChannelTagCount]:
+    """List tags in use with the number of active channels carrying each."""
+    rows = await db.execute(
+        select(ChannelTag.tag, func.count(ChannelTag.channel_id))
+        .join(Channel, Channel.channel_id == ChannelTag.channel_id)
+        .where(Channel.is_active.is_(True))
+        .group_by(ChannelTag.tag)
+        .order_by(ChannelTag.tag)
+    )
+    return [ChannelTagCount(tag=tag, channels=count) for tag, count in rows]
+
+
+@router.put("/{channel_id}/tags", response_model=ChannelResponse)
+async def set_channel_tags(
+    channel_id: str,
+    tags_update: ChannelTagsUpdate,
+    response: Response,
+    db: Session = Depends(get_db),
+) -> ChannelResponse:
+    """Replace a channel's tags."""
+    tags = _tags(tags_update.tags)
+    channel = (
+        db.query(Channel)
+        .filter(Channel.channel_id == channel_id, Channel.is_active.is_(True))
+        .first()
+    )
+
+    if not channel:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Channel not found or inactive.",
+        )
+
+    ChannelRegistry(db).set_tags(channel, tags)
+    db.commit()
+    db.refresh(channel)
+    record_write(db, response)
+
+    return ChannelResponse.model_validate(channel)
+
+
+@router.get("/{channel_id}/stats", response_model=ChannelStatsResponse)
+async def get_channel_stats(
+    channel_id: str, db: AsyncSession = Depends(get_read_db)
+) -> ChannelStatsResponse:
+    """
+    Get aggregate video and event counts for a channel.
+
+    Counters are maintained incrementally by scans, so this is a single
+    primary-key lookup. The row is created with the channel and by the
+    migration backfill; a channel without one reports zeros until its next
+    scan creates it.
+    """
+    channel_exists = await db.scalar(
+        select(Channel.id).where(
+            Channel.channel_id == channel_id, Channel.is_active.is_(True)
+        )
+    )
+
+    if channel_exists is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Channel not found or inactive.",
+        )
+
+    stats = await db.get(ChannelStats, channel_id)
+    if stats is None:
+        return ChannelStatsResponse(
+            channel_id=channel_id,
+            total_videos=0,
+            available_videos=0,
+            missing_videos=0,
+            total_events=0,
+            events_by_type={event_type.value: 0 for event_type in EVENT_COUNT_COLUMNS},
+        )
+
+    return ChannelStatsResponse.model_validate(stats)
+
+
 @router.delete("/{channel_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_channel(channel_id: str, db: Session = Depends(get_db)) -> None:
+async def remove_channel(
+    channel_id: str, response: Response, db: Session = Depends(get_db)
+) -> None:
     """
     Remove a channel (soft delete).
 
@@ -118,7 +334,9 @@ async def remove_channel(channel_id: str, db: Session = Depends(get_db)) -> None
             detail="Channel not found or already removed.",
         )
 
+    ChannelRegistry(db).release()
     channel.is_active = False  # type: ignore[assignment]
     db.commit()
+    record_write(db, response)
 
     return None
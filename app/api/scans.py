@@ -0,0 +1,59 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import count_rows, get_read_db
+from app.models.scan_run import ScanRun
+from app.schemas.scan import ScanRunListResponse, ScanRunResponse
+
+router = APIRouter(prefix="/scans", tags=["scans"])
+
+
+@router.get("", response_model=ScanRunListResponse)
+async def list_scan_runs(
+    db: AsyncSession = Depends(get_read_db),
+    channel_id: Optional[str] = Query(default=None),
+    status: Optional[str] = Query(
+        default=None, pattern="^(running|succeeded|unchanged|failed)$"
+    ),
+    limit: int = Query(default=50, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+) -> ScanRunListResponse:
+    """
+    Get the scan run ledger, most recent first.
+
+    Each run records its outcome, the YouTube API calls, quota units and
+    pages it consumed, and how long the fetch, diff, database write and
+    notify phases took.
+
+    Args:
+        channel_id: Restrict to a single channel
+        status: Restrict to runs with this status
+        limit: Maximum number of runs to return (1-100)
+        offset: Number of runs to skip
+
+    Returns:
+        List of scan runs with pagination info
+    """
+    query = select(ScanRun)
+
+    if channel_id:
+        query = query.where(ScanRun.channel_id == channel_id)
+    if status:
+        query = query.where(ScanRun.status == status)
+
+    total = await count_rows(db, query)
+    runs = await db.scalars(
+        query.order_by(desc(ScanRun.started_at), desc(ScanRun.id))
+        .offset(offset)
+        .limit(limit)
+    )
+
+    return ScanRunListResponse(
+        scans=[ScanRunResponse.model_validate(run) for run in runs],
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_read_db
+from app.models.disappearance_event import EventType
+from app.schemas.stats import TimeseriesPoint, TimeseriesResponse
+from app.services.event_rollups import EventRollupService
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+def _parse_datetime(value: Optional[str], name: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid '{name}' datetime format. Use ISO format.",
+        )
+
+
+@router.get("/timeseries", response_model=TimeseriesResponse)
+async def get_disappearance_timeseries(
+    db: AsyncSession = Depends(get_read_db),
+    bucket: str = Query(default="day", pattern="^(hour|day)$"),
+    channel_id: Optional[str] = Query(default=None),
+    event_type: Optional[EventType] = Query(default=None),
+    since: Optional[str] = Query(default=None),
+    until: Optional[str] = Query(default=None),
+) -> TimeseriesResponse:
+    """
+    Get disappearance event counts bucketed by hour or day.
+
+    Served from pre-aggregated rollups maintained as events are inserted,
+    so the cost is proportional to the number of buckets, not events.
+
+    Args:
+        bucket: Bucket size ('hour' or 'day')
+        channel_id: Restrict to a single channel
+        event_type: Restrict to a single event type
+        since: Only include buckets from this ISO datetime
+        until: Only include buckets up to this ISO datetime
+
+    Returns:
+        Time-ordered list of (bucket_start, event_type, count) points
+    """
+    since_dt = _parse_datetime(since, "since")
+    until_dt = _parse_datetime(until, "until")
+
+    points = await db.run_sync(
+        lambda session: EventRollupService(session).timeseries(
+            bucket=bucket,
+            channel_id=channel_id,
+            event_type=event_type,
+            since=since_dt,
+            until=until_dt,
+        )
+    )
+
+    return TimeseriesResponse(
+        bucket=bucket,
+        channel_id=channel_id,
+        points=[TimeseriesPoint(**point) for point in points],
+        total=sum(point["count"] for point in points),
+    )
@@ -1,19 +1,27 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import count_rows, get_db, get_read_db
 from app.models.channel import Channel
 from app.models.disappearance_event import DisappearanceEvent, EventType
 from app.models.video import Video
+from app.models.video_revision import VideoRevision
 from app.schemas.disappearance_event import (
     DisappearanceEventListResponse,
     DisappearanceEventResponse,
 )
 from app.schemas.scan import ScanResponse
-from app.schemas.video import VideoListResponse, VideoResponse
+from app.schemas.video import (
+    VideoListResponse,
+    VideoResponse,
+    VideoRevisionListResponse,
+    VideoRevisionResponse,
+)
+from app.services.channel_registry import ChannelLimitError, ChannelRegistry
 from app.services.video_ingestion import VideoIngestionService
 from app.services.youtube_client import YouTubeClient
 
@@ -52,18 +60,13 @@ async def scan_channel(channel_id: str, db: Session = Depends(get_db)) -> ScanRe
                     detail=f"Channel {channel_id} not found on YouTube",
                 )
 
-            from sqlalchemy import func
-
-            channel_count = (
-                db.query(func.count(Channel.id))
-                .filter(Channel.is_active.is_(True))
-                .scalar()
-            )
-            if channel_count >= 10:
+            try:
+                ChannelRegistry(db).reserve()
+            except ChannelLimitError as e:
                 raise HTTPException(
                     status_code=400,
                     detail=(
-                        "Maximum of 10 channels allowed. "
+                        f"Maximum of {e.limit} channels allowed. "
                         "Please remove a channel before scanning a new one."
                     ),
                 )
@@ -135,10 +138,10 @@ async def scan_channel(channel_id: str, db: Session = Depends(get_db)) -> ScanRe
 )
 async def get_channel_videos(
     channel_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    status: Optional[str] = Query(default=None, pattern="^(active|missing)$"),
+    status: Optional[str] = Query(default=None, pattern="^(active|missing|suspected)$"),
 ) -> VideoListResponse:
     """
     Get videos for a specific channel with pagination and filtering.
@@ -147,15 +150,16 @@ async def get_channel_videos(
         channel_id: The YouTube channel ID
         limit: Maximum number of videos to return (1-100)
         offset: Number of videos to skip
-        status: Filter by video status ('active' or 'missing')
+        status: Filter by video status ('active', 'missing' or 'suspected',
+            i.e. still available but absent from recent scans)
 
     Returns:
         Paginated list of videos
     """
-    channel = (
-        db.query(Channel)
-        .filter(Channel.channel_id == channel_id, Channel.is_active.is_(True))
-        .first()
+    channel = await db.scalar(
+        select(Channel).where(
+            Channel.channel_id == channel_id, Channel.is_active.is_(True)
+        )
     )
 
     if not channel:
@@ -164,16 +168,20 @@ async def get_channel_videos(
             detail=f"Channel {channel_id} not found or inactive",
         )
 
-    query = db.query(Video).filter(Video.channel_id == channel_id)
+    query = select(Video).where(Video.channel_id == channel_id)
 
     if status == "active":
-        query = query.filter(Video.is_available.is_(True))
+        query = query.where(Video.is_available.is_(True))
     elif status == "missing":
-        query = query.filter(Video.is_available.is_(False))
+        query = query.where(Video.is_available.is_(False))
+    elif status == "suspected":
+        query = query.where(Video.is_available.is_(True), Video.missed_scans > 0)
 
-    total = query.count()
+    total = await count_rows(db, query)
 
-    videos = query.order_by(desc(Video.published_at)).offset(offset).limit(limit).all()
+    videos = await db.scalars(
+        query.order_by(desc(Video.published_at)).offset(offset).limit(limit)
+    )
 
     return VideoListResponse(
         videos=[VideoResponse.model_validate(video) for video in videos],
@@ -186,7 +194,7 @@ async def get_channel_videos(
 @router.get("/events", response_model=DisappearanceEventListResponse)
 @backward_compat_router.get("/events", response_model=DisappearanceEventListResponse)
 async def get_disappearance_events(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
     channel_id: Optional[str] = Query(default=None),
@@ -206,33 +214,30 @@ async def get_disappearance_events(
     Returns:
         Paginated list of disappearance events
     """
-    query = db.query(DisappearanceEvent)
+    query = select(DisappearanceEvent)
 
     if channel_id:
-        query = query.join(Video).filter(Video.channel_id == channel_id)
+        query = query.join(Video).where(Video.channel_id == channel_id)
 
     if event_type:
-        query = query.filter(DisappearanceEvent.event_type == event_type)
+        query = query.where(DisappearanceEvent.event_type == event_type)
 
     if since:
         try:
             from datetime import datetime
 
             since_dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
-            query = query.filter(DisappearanceEvent.detected_at >= since_dt)
+            query = query.where(DisappearanceEvent.detected_at >= since_dt)
         except ValueError:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid 'since' datetime format. Use ISO format.",
             )
 
-    total = query.count()
+    total = await count_rows(db, query)
 
-    events = (
-        query.order_by(desc(DisappearanceEvent.detected_at))
-        .offset(offset)
-        .limit(limit)
-        .all()
+    events = await db.scalars(
+        query.order_by(desc(DisappearanceEvent.detected_at)).offset(offset).limit(limit)
     )
 
     return DisappearanceEventListResponse(
@@ -241,3 +246,48 @@ async def get_disappearance_events(
         limit=limit,
         offset=offset,
     )
+
+
+@router.get("/videos/{video_id}/history", response_model=VideoRevisionListResponse)
+async def get_video_history(
+    video_id: str,
+    db: AsyncSession = Depends(get_read_db),
+    limit: int = Query(default=50, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+) -> VideoRevisionListResponse:
+    """
+    Get the metadata change history for a video.
+
+    Args:
+        video_id: The YouTube video ID
+        limit: Maximum number of revisions to return (1-100)
+        offset: Number of revisions to skip
+
+    Returns:
+        Paginated list of revisions, newest first
+    """
+    video = await db.scalar(select(Video).where(Video.video_id == video_id))
+
+    if not video:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Video {video_id} not found",
+        )
+
+    query = select(VideoRevision).where(VideoRevision.video_id == video_id)
+    total = await count_rows(db, query)
+
+    revisions = await db.scalars(
+        query.order_by(desc(VideoRevision.changed_at), desc(VideoRevision.id))
+        .offset(offset)
+        .limit(limit)
+    )
+
+    return VideoRevisionListResponse(
+        revisions=[
+            VideoRevisionResponse.model_validate(revision) for revision in revisions
+        ],
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
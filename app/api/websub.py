@@ -0,0 +1,65 @@
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.services.websub import WebSubManager, ingest_pushed_videos
+
+router = APIRouter(prefix="/websub", tags=["websub"])
+
+
+@router.get("/callback/{channel_id}", response_class=PlainTextResponse)
+async def verify_subscription(
+    channel_id: str,
+    mode: str = Query(alias="hub.mode"),
+    topic: str = Query(alias="hub.topic"),
+    challenge: str = Query(default="", alias="hub.challenge"),
+    lease_seconds: Optional[int] = Query(default=None, alias="hub.lease_seconds"),
+    db: Session = Depends(get_db),
+) -> str:
+    """
+    Answer the hub's intent verification for a channel subscription.
+
+    The challenge is echoed only for a subscription or unsubscription this
+    service actually requested; anything else gets a 404 so the hub drops it.
+    """
+    if not WebSubManager(db).verify(channel_id, mode, topic, lease_seconds):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unknown subscription",
+        )
+    return challenge
+
+
+@router.post("/callback/{channel_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def receive_notification(
+    channel_id: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    Receive an Atom push for a channel and ingest the announced videos.
+
+    Unsigned or mis-signed payloads are acknowledged but ignored, as the
+    WebSub spec requires, so the hub does not retry them.
+    """
+    body = await request.body()
+    notification = WebSubManager(db).accept_push(
+        channel_id, body, request.headers.get("X-Hub-Signature")
+    )
+    if notification is not None and notification.videos:
+        video_ids = list(dict.fromkeys(video_id for _, video_id in notification.videos))
+        background_tasks.add_task(ingest_pushed_videos, channel_id, video_ids)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,158 @@
+"""
+Database engine configuration.
+
+Pool sizing, connection recycling, pre-ping and statement timeouts are read
+from the environment so they can be tuned per deployment without code
+changes. ``DB_PGBOUNCER=true`` switches to a mode that is safe behind
+PgBouncer in transaction pooling mode: SQLAlchemy keeps no pool of its own,
+prepared statement caches are disabled and the statement timeout is applied
+per transaction instead of as a connection startup option.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool, Pool, StaticPool
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class EngineConfig:
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout_ms: int = 0
+    pgbouncer: bool = False
+
+    @classmethod
+    def from_env(cls) -> "EngineConfig":
+        """Build a configuration from ``DB_*`` environment variables."""
+        return cls(
+            pool_size=int(os.getenv("DB_POOL_SIZE", str(cls.pool_size))),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", str(cls.max_overflow))),
+            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", str(cls.pool_timeout))),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", str(cls.pool_recycle))),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", cls.pool_pre_ping),
+            statement_timeout_ms=int(
+                os.getenv("DB_STATEMENT_TIMEOUT_MS", str(cls.statement_timeout_ms))
+            ),
+            pgbouncer=_env_bool("DB_PGBOUNCER", cls.pgbouncer),
+        )
+
+
+def to_async_url(url: str) -> str:
+    """
+    Map a synchronous database URL onto its async driver.
+
+    PostgreSQL URLs switch to asyncpg (``sslmode`` becomes asyncpg's ``ssl``)
+    and SQLite URLs to aiosqlite. URLs that already name an async driver are
+    returned unchanged.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "postgresql" and parsed.get_driver_name() != "asyncpg":
+        query = dict(parsed.query)
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        parsed = parsed.set(drivername="postgresql+asyncpg", query=query)
+    elif backend == "sqlite" and parsed.get_driver_name() != "aiosqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+def engine_kwargs(
+    url: str, config: EngineConfig, poolclass: Optional[type[Pool]] = None
+) -> Dict[str, Any]:
+    """
+    Translate an EngineConfig into ``create_engine`` keyword arguments.
+
+    SQLite URLs keep the single shared connection the app has always used
+    for local development and tests; pool settings do not apply to them.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        if parsed.get_driver_name() == "aiosqlite":
+            return {"poolclass": StaticPool}
+        return {
+            "connect_args": {"check_same_thread": False},
+            "poolclass": StaticPool,
+        }
+
+    connect_args: Dict[str, Any] = {}
+    kwargs: Dict[str, Any] = {"pool_pre_ping": config.pool_pre_ping}
+
+    if config.pgbouncer:
+        kwargs["poolclass"] = NullPool
+        if parsed.get_driver_name() == "asyncpg":
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["statement_cache_size"] = 0
+    else:
+        kwargs.update(
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_recycle=config.pool_recycle,
+        )
+        if poolclass is not None:
+            kwargs["poolclass"] = poolclass
+        timeout = config.statement_timeout_ms
+        if timeout and parsed.get_driver_name() == "asyncpg":
+            connect_args["server_settings"] = {"statement_timeout": str(timeout)}
+        elif timeout:
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+
+    if connect_args:
+        kwargs["connect_args"] = connect_args
+    return kwargs
+
+
+def apply_statement_timeout(engine: Engine, timeout_ms: int) -> None:
+    """Set ``statement_timeout`` at the start of every transaction."""
+
+    @event.listens_for(engine, "begin")
+    def _set_statement_timeout(connection: Connection) -> None:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+def create_configured_engine(
+    url: str,
+    config: Optional[EngineConfig] = None,
+    poolclass: Optional[type[Pool]] = None,
+) -> Engine:
+    """Create a synchronous engine for ``url`` using ``config`` (or the env)."""
+    config = config or EngineConfig.from_env()
+    engine = create_engine(url, **engine_kwargs(url, config, poolclass))
+    if (
+        config.pgbouncer
+        and config.statement_timeout_ms
+        and engine.dialect.name == "postgresql"
+    ):
+        apply_statement_timeout(engine, config.statement_timeout_ms)
+    return engine
+
+
+def create_configured_async_engine(
+    url: str, config: Optional[EngineConfig] = None
+) -> AsyncEngine:
+    """Create an async engine for ``url`` using ``config`` (or the env)."""
+    config = config or EngineConfig.from_env()
+    engine = create_async_engine(url, **engine_kwargs(url, config))
+    if (
+        config.pgbouncer
+        and config.statement_timeout_ms
+        and engine.dialect.name == "postgresql"
+    ):
+        apply_statement_timeout(engine.sync_engine, config.statement_timeout_ms)
+    return engine
@@ -30,8 +30,8 @@ class I18n:
                 "channels.no_channels_title": "No channels yet",
                 "channels.no_channels_description": (
                     "Start monitoring YouTube channels by adding your first "
-                    "channel below. You can add up to 10 channels to track "
-                    "video availability."
+                    "channel below. Added channels are checked regularly for "
+                    "videos that go private or disappear."
                 ),
                 "channels.add_first_channel": "Add Your First Channel",
                 "channels.scan": "Scan",
@@ -77,7 +77,7 @@ class I18n:
                 "channels.no_channels_title": "チャンネルがありません",
                 "channels.no_channels_description": (
                     "最初のチャンネルを追加してYouTubeチャンネルの監視を開始してください。"
-                    "最大10個のチャンネルを追加して動画の可用性を追跡できます。"
+                    "追加したチャンネルは非公開・削除された動画がないか定期的に確認されます。"
                 ),
                 "channels.add_first_channel": "最初のチャンネルを追加",
                 "channels.scan": "スキャン",
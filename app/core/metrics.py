@@ -0,0 +1,412 @@
+"""
+Minimal Prometheus-compatible metrics registry.
+
+Implements counters, gauges and histograms with the text exposition format
+so the service can expose ``/metrics`` without an extra dependency. Every
+metric caps its number of label combinations; once the cap is reached new
+combinations are folded into a single ``other`` series so an unexpected
+label value cannot grow memory or scrape size without bound.
+"""
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_MAX_SERIES = 100
+OVERFLOW_LABEL = "other"
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    metric_type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        max_series: int = DEFAULT_MAX_SERIES,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.max_series = max_series
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str], series: Dict) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, "
+                f"got {tuple(labels)}"
+            )
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        if key not in series and len(series) >= self.max_series:
+            return tuple(OVERFLOW_LABEL for _ in self.labelnames)
+        return key
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Lines of the text exposition format for this metric."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Drop every recorded series."""
+
+
+class _ValueMetric(_Metric):
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        max_series: int = DEFAULT_MAX_SERIES,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, max_series)
+        self._values: Dict[LabelValues, float] = {}
+
+    def _add(self, amount: float, labels: Dict[str, str]) -> None:
+        with self._lock:
+            key = self._key(labels, self._values)
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        return self._values.get(key, 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_ValueMetric):
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+        self._add(amount, labels)
+
+
+class Gauge(_ValueMetric):
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels, self._values)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        self._add(amount, labels)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self._add(-amount, labels)
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, max_series)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        with self._lock:
+            key = self._key(labels, self._series)
+            counts, totals = self._series.setdefault(
+                key, ([0] * len(self.buckets), [0.0])
+            )
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            totals[0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        series = self._series.get(key)
+        return series[0][-1] if series else 0
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            for key, (counts, totals) in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, counts):
+                    labels = _format_labels(
+                        self.labelnames + ("le",), key + (_format_value(bound),)
+                    )
+                    lines.append(f"{self.name}_bucket{labels} {count}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(totals[0])}")
+                lines.append(f"{self.name}_count{labels} {counts[-1]}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes sampled gauges before rendering."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def register(self, metric: MetricT) -> MetricT:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return cast(MetricT, existing)
+            self._metrics[metric.name] = metric
+            return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        for collector in list(self._collectors):
+            collector()
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+SCAN_RUNS_TOTAL = counter(
+    "youtube_tracker_scan_runs_total",
+    "Channel scans by outcome.",
+    ["status"],
+)
+SCAN_PHASE_SECONDS = histogram(
+    "youtube_tracker_scan_phase_seconds",
+    "Time spent in each phase of a channel scan.",
+    ["phase"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+SCAN_API_CALLS_TOTAL = counter(
+    "youtube_tracker_scan_api_calls_total",
+    "YouTube Data API requests issued by channel scans.",
+)
+SCAN_QUOTA_UNITS_TOTAL = counter(
+    "youtube_tracker_scan_quota_units_total",
+    "YouTube Data API quota units spent by channel scans.",
+)
+SCAN_PAGES_FETCHED_TOTAL = counter(
+    "youtube_tracker_scan_pages_fetched_total",
+    "Uploads playlist pages fetched by channel scans.",
+)
+SCAN_PLANNED_DAILY_QUOTA_UNITS = gauge(
+    "youtube_tracker_scan_planned_daily_quota_units",
+    "Quota units per day the adaptive scan plan is expected to spend.",
+)
+FEED_PRECHECK_TOTAL = counter(
+    "youtube_tracker_feed_precheck_total",
+    "Feed pre-checks before scheduled scans, by result.",
+    ["result"],
+)
+SCAN_FINGERPRINT_TOTAL = counter(
+    "youtube_tracker_scan_fingerprint_total",
+    "Uploads playlist fingerprint checks before scans, by result.",
+    ["result"],
+)
+DISAPPEARANCE_SUSPICIONS_TOTAL = counter(
+    "youtube_tracker_disappearance_suspicions_total",
+    "Videos missing from a scan, by how the suspicion was resolved.",
+    ["outcome"],
+)
+CHANNEL_REFRESH_TOTAL = counter(
+    "youtube_tracker_channel_refresh_total",
+    "Channels checked by the metadata refresh job, by result.",
+    ["result"],
+)
+YOUTUBE_KEY_QUOTA_UNITS_TOTAL = counter(
+    "youtube_tracker_youtube_key_quota_units_total",
+    "YouTube Data API quota units charged to each pooled API key.",
+    ["key"],
+)
+YOUTUBE_KEY_EVICTIONS_TOTAL = counter(
+    "youtube_tracker_youtube_key_evictions_total",
+    "Pooled API keys taken out of rotation until the daily quota reset.",
+    ["key"],
+)
+WEBSUB_NOTIFICATIONS_TOTAL = counter(
+    "youtube_tracker_websub_notifications_total",
+    "WebSub push notifications by outcome.",
+    ["result"],
+)
+
+HTTP_REQUEST_SECONDS = histogram(
+    "youtube_tracker_http_request_duration_seconds",
+    "HTTP request latency by method, route template and status code.",
+    ["method", "route", "status"],
+)
+
+DB_POOL_CHECKOUT_SECONDS = histogram(
+    "youtube_tracker_db_pool_checkout_seconds",
+    "Time spent waiting to check a connection out of the pool.",
+)
+DB_POOL_SIZE = gauge(
+    "youtube_tracker_db_pool_size",
+    "Configured number of persistent pool connections.",
+)
+DB_POOL_CHECKED_OUT = gauge(
+    "youtube_tracker_db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+)
+DB_POOL_OVERFLOW = gauge(
+    "youtube_tracker_db_pool_overflow",
+    "Connections open beyond the pool size.",
+)
+DB_READ_ROUTING_TOTAL = counter(
+    "youtube_tracker_db_read_routing_total",
+    "Read-only sessions by the database they were routed to.",
+    ["target"],
+)
+
+YOUTUBE_API_REQUEST_SECONDS = histogram(
+    "youtube_tracker_youtube_api_request_seconds",
+    "YouTube Data API request latency by operation.",
+    ["operation"],
+)
+YOUTUBE_API_ERRORS_TOTAL = counter(
+    "youtube_tracker_youtube_api_errors_total",
+    "Failed YouTube Data API requests by operation and reason.",
+    ["operation", "reason"],
+)
+YOUTUBE_CIRCUIT_TRANSITIONS_TOTAL = counter(
+    "youtube_tracker_youtube_circuit_transitions_total",
+    "YouTube API circuit breaker state changes, by new state.",
+    ["state"],
+)
+YOUTUBE_RATE_LIMIT_WAIT_SECONDS = histogram(
+    "youtube_tracker_youtube_rate_limit_wait_seconds",
+    "Time YouTube API calls waited for a rate limiter token, by operation.",
+    ["operation"],
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+SLACK_WEBHOOK_SECONDS = histogram(
+    "youtube_tracker_slack_webhook_seconds",
+    "Slack webhook latency by outcome.",
+    ["outcome"],
+)
+
+SCHEDULER_JOB_SECONDS = histogram(
+    "youtube_tracker_scheduler_job_seconds",
+    "Duration of scheduled background jobs.",
+    ["job"],
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+)
+SCHEDULER_JOB_FAILURES_TOTAL = counter(
+    "youtube_tracker_scheduler_job_failures_total",
+    "Scheduled background jobs that raised.",
+    ["job"],
+)
+SCHEDULER_LEADER = gauge(
+    "youtube_tracker_scheduler_leader",
+    "1 while this process holds the scheduler leader lease, 0 on standby.",
+)
+
+
+def operation_label(operation_name: str) -> str:
+    """
+    Reduce an operation description to a bounded metric label.
+
+    Operation names carry identifiers after a colon (for example
+    ``"fetch playlist items: UU..."``); only the prefix is kept.
+    """
+    return operation_name.split(":", 1)[0].strip() or "unknown"
@@ -0,0 +1,177 @@
+"""
+Startup warm-up and readiness gating.
+
+The schema is owned by alembic (``alembic upgrade head`` runs as the release
+command), so the app only verifies the database is at the expected revision
+instead of creating tables itself. Warm-up runs in the background after
+boot: ``/health`` answers immediately while ``/ready`` stays 503 until the
+schema check, connection pools and YouTube client are all warm. A failed
+warm-up is retried with capped backoff, so a database or Redis that is
+unreachable at boot only delays readiness.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class SchemaOutOfDateError(Exception):
+    """Raised when the database is not at the latest alembic revision."""
+
+    pass
+
+
+@dataclass
+class ReadinessState:
+    ready: bool = False
+    checks: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    warmup_ms: Optional[int] = None
+    attempts: int = 0
+
+    def as_dict(self) -> Dict:
+        return {
+            "ready": self.ready,
+            "checks": dict(self.checks),
+            "error": self.error,
+            "warmup_ms": self.warmup_ms,
+            "attempts": self.attempts,
+        }
+
+
+readiness = ReadinessState()
+
+
+@lru_cache(maxsize=1)
+def expected_schema_heads() -> FrozenSet[str]:
+    """
+    Return the alembic head revisions shipped with this build.
+
+    Cached for the life of the process; an empty set means the migration
+    scripts are not available and the check is skipped.
+    """
+    script_location = PROJECT_ROOT / "alembic"
+    if not script_location.is_dir():
+        return frozenset()
+
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(script_location))
+    return frozenset(ScriptDirectory.from_config(config).get_heads())
+
+
+def check_schema_revision(engine: Engine) -> str:
+    """Compare the database's alembic revision with the shipped heads."""
+    heads = expected_schema_heads()
+    if not heads:
+        return "skipped"
+
+    from alembic.runtime.migration import MigrationContext
+
+    with engine.connect() as connection:
+        current = frozenset(MigrationContext.configure(connection).get_current_heads())
+
+    if current != heads:
+        raise SchemaOutOfDateError(
+            f"Database schema at {sorted(current) or 'no revision'}, "
+            f"expected {sorted(heads)}; run 'alembic upgrade head'"
+        )
+    return "ok"
+
+
+def warm_pool(engine: Engine, connections: int) -> str:
+    """Open up to ``connections`` pooled connections so first requests reuse them."""
+    opened = [engine.connect() for _ in range(max(connections, 1))]
+    try:
+        for connection in opened:
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            connection.close()
+    return "ok"
+
+
+async def warm_async_pool(engine: AsyncEngine, connections: int) -> str:
+    opened = [await engine.connect() for _ in range(max(connections, 1))]
+    try:
+        for connection in opened:
+            await connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            await connection.close()
+    return "ok"
+
+
+def warm_youtube_client() -> str:
+    """
+    Load the API client libraries and discovery document once.
+
+    Keys come from ``YOUTUBE_API_KEYS`` or ``YOUTUBE_API_KEY``, as
+    everywhere else; warm-up fails only when neither sets one.
+    """
+    from app.services.api_key_pool import api_keys_from_env
+
+    if not api_keys_from_env():
+        raise ValueError(
+            "No YouTube API key configured: set YOUTUBE_API_KEYS or YOUTUBE_API_KEY"
+        )
+
+    from app.services.youtube_client import YouTubeClient
+
+    YouTubeClient()
+    return "ok"
+
+
+async def warm_up(
+    engine: Engine,
+    async_engines: Dict[str, AsyncEngine],
+    state: ReadinessState = readiness,
+) -> bool:
+    """
+    Run the startup checks in order and mark the app ready when all pass.
+
+    Blocking work runs in a thread so the event loop keeps serving
+    ``/health`` while warm-up is in progress.
+    """
+    started = time.perf_counter()
+    connections = int(os.getenv("DB_POOL_WARM_CONNECTIONS", "1"))
+    state.ready = False
+    state.error = None
+    state.attempts += 1
+
+    try:
+        if os.getenv("STARTUP_SCHEMA_CHECK", "true").lower() == "true":
+            state.checks["schema"] = await asyncio.to_thread(
+                check_schema_revision, engine
+            )
+        state.checks["database"] = await asyncio.to_thread(
+            warm_pool, engine, connections
+        )
+        for name, async_engine in async_engines.items():
+            state.checks[name] = await warm_async_pool(async_engine, connections)
+        state.checks["youtube"] = await asyncio.to_thread(warm_youtube_client)
+    except Exception as e:
+        state.error = str(e)
+        logger.error(f"Startup warm-up failed: {e}")
+        return False
+    finally:
+        state.warmup_ms = int((time.perf_counter() - started) * 1000)
+
+    state.ready = True
+    logger.info(f"Startup warm-up finished in {state.warmup_ms}ms: {state.checks}")
+    return True
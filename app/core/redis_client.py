@@ -0,0 +1,61 @@
+"""
+Shared Redis connection for state that must be consistent across processes.
+
+The connection is created on first use and only when ``REDIS_URL`` is set;
+callers get ``None`` otherwise and fall back to in-process state. A failed
+connection is retried at most every ``RETRY_SECONDS`` so an outage does not
+add a connect timeout to every call.
+"""
+
+import logging
+import os
+import threading
+import time
+from importlib.util import find_spec
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+RETRY_SECONDS = 30.0
+
+_client: Optional[Any] = None
+_failed_at: Optional[float] = None
+_lock = threading.Lock()
+
+
+def get_redis_client() -> Optional[Any]:
+    """Return a connected Redis client, or None when Redis is not available."""
+    global _client, _failed_at
+    with _lock:
+        if _client is not None:
+            return _client
+
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url or find_spec("redis") is None:
+            return None
+        if _failed_at is not None and time.monotonic() - _failed_at < RETRY_SECONDS:
+            return None
+
+        import redis
+
+        try:
+            client = redis.from_url(
+                redis_url, socket_connect_timeout=2, socket_timeout=2
+            )
+            client.ping()
+        except Exception as e:
+            logger.warning(f"Redis unavailable, using in-process state: {e}")
+            _failed_at = time.monotonic()
+            return None
+
+        _client = client
+        _failed_at = None
+        return _client
+
+
+def reset_redis_client() -> None:
+    """Forget the cached connection (used by tests and after a fork)."""
+    global _client, _failed_at
+    with _lock:
+        _client = None
+        _failed_at = None
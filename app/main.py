@@ -1,10 +1,12 @@
+import asyncio
 import os
-from typing import Any, Dict
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -13,12 +15,20 @@ from sqlalchemy.exc import SQLAlchemyError
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.api.channels import router as channels_router
+from app.api.scans import router as scans_router
+from app.api.stats import router as stats_router
 from app.api.videos import backward_compat_router
 from app.api.videos import router as videos_router
-from app.core.database import Base, SessionLocal, engine
+from app.api.websub import router as websub_router
+from app.core.database import SessionLocal, async_engine, engine, read_async_engine
+from app.core.metrics import HTTP_REQUEST_SECONDS, REGISTRY
+from app.core.readiness import readiness, warm_up
 from app.models import Channel, DisappearanceEvent, Video  # noqa: F401
-from app.services.background_jobs import background_job_service
+from app.services.api_key_pool import ApiKeyPool
+from app.services.background_jobs import get_background_job_service
+from app.services.circuit_breaker import get_circuit_breaker
 from app.web.routes import router as web_router
+from app.web.templating import get_templates
 
 app = FastAPI(
     title="YouTube Disappeared Video Tracker",
@@ -26,8 +36,6 @@ app = FastAPI(
     version="0.1.0",
 )
 
-templates = Jinja2Templates(directory="app/web/templates")
-
 limiter = Limiter(key_func=get_remote_address)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -49,17 +57,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def record_request_metrics(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Record request latency labelled by route template, not raw path."""
+    started = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status,
+        )
+
+
 app.mount("/static", StaticFiles(directory="app/web/static"), name="static")
 
 app.include_router(channels_router, prefix="/api")
+app.include_router(scans_router, prefix="/api")
+app.include_router(stats_router, prefix="/api")
 app.include_router(videos_router, prefix="/api")
+app.include_router(websub_router, prefix="/api")
 app.include_router(backward_compat_router)
 app.include_router(web_router)
 
 
 @app.get("/")
 async def root(request: Request) -> Any:
-    return templates.TemplateResponse("public_index.html", {"request": request})
+    return get_templates().TemplateResponse("public_index.html", {"request": request})
 
 
 @app.get("/health")
@@ -73,7 +106,17 @@ async def health_check() -> Dict[str, str]:
 
 @app.get("/ready")
 async def readiness_check() -> Dict[str, str]:
-    """Readiness check including database connectivity."""
+    """Readiness check: startup warm-up has finished and the database answers."""
+    if not readiness.ready:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "status": "not ready",
+                "error": "Startup warm-up failed" if readiness.error else "Warming up",
+                "message": readiness.error or "Startup checks are still running",
+                "checks": readiness.checks,
+            },
+        )
     try:
         with SessionLocal() as db:
             db.execute(text("SELECT 1"))
@@ -93,26 +136,77 @@ async def readiness_check() -> Dict[str, str]:
         )
 
 
+def shared_state_status() -> Dict:
+    """Scheduler, circuit breaker and API key state; each may call Redis."""
+    return {
+        "scheduler": get_background_job_service().get_status(),
+        "youtube_circuit": get_circuit_breaker().status(),
+        "youtube_keys": ApiKeyPool.from_env().status(),
+    }
+
+
 @app.get("/healthz")
 async def health_check_detailed() -> Dict:
     """Detailed health check including scheduler status."""
-    scheduler_status = background_job_service.get_status()
+    # Redis lookups block; keep a slow Redis from stalling the event loop.
+    status = await asyncio.to_thread(shared_state_status)
     return {
         "status": "healthy",
         "version": "0.1.0",
         "service": "youtube-tracker",
-        "scheduler": scheduler_status,
+        "scheduler": status["scheduler"],
+        "readiness": readiness.as_dict(),
+        "youtube_circuit": status["youtube_circuit"],
+        "youtube_keys": status["youtube_keys"],
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Expose process metrics in the Prometheus text format."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+warmup_task: Optional["asyncio.Task[None]"] = None
+
+
+async def warm_up_and_start(
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> None:
+    """
+    Warm up in the background, retrying failed attempts with backoff
+    capped at ``STARTUP_RETRY_MAX_SECONDS``; only start scheduling once
+    ready.
+    """
+    async_engines = {"async_database": async_engine}
+    if read_async_engine is not None:
+        async_engines["read_replica"] = read_async_engine
+    max_delay = float(os.getenv("STARTUP_RETRY_MAX_SECONDS", "60"))
+    delay = 1.0
+    while not await warm_up(engine, async_engines):
+        await sleep(delay)
+        delay = min(delay * 2, max_delay)
+    # Building the service connects to Redis; keep it off the event loop.
+    service = await asyncio.to_thread(get_background_job_service)
+    service.start()
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
-    """Initialize database schema and start background services."""
-    Base.metadata.create_all(bind=engine)
-    background_job_service.start()
+    """
+    Start warm-up without blocking boot.
+
+    The schema is managed by ``alembic upgrade head`` (the release command);
+    startup only verifies the revision rather than creating tables.
+    """
+    global warmup_task
+    warmup_task = asyncio.create_task(warm_up_and_start())
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Stop background services on application shutdown."""
-    background_job_service.stop()
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    get_background_job_service().stop()
+    await async_engine.dispose()
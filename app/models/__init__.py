@@ -1,5 +1,26 @@
 from app.models.channel import Channel
+from app.models.channel_fingerprint import ChannelFingerprint
+from app.models.channel_quota import ChannelQuota
+from app.models.channel_stats import ChannelStats
+from app.models.channel_tag import ChannelTag
 from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.disappearance_rollup import DisappearanceRollup
+from app.models.scan_run import ScanRun
 from app.models.video import Video
+from app.models.video_revision import VideoRevision
+from app.models.websub_subscription import WebSubSubscription
 
-__all__ = ["Channel", "Video", "DisappearanceEvent", "EventType"]
+__all__ = [
+    "Channel",
+    "ChannelFingerprint",
+    "ChannelQuota",
+    "ChannelStats",
+    "ChannelTag",
+    "Video",
+    "VideoRevision",
+    "DisappearanceEvent",
+    "DisappearanceRollup",
+    "EventType",
+    "ScanRun",
+    "WebSubSubscription",
+]
@@ -1,4 +1,7 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from typing import List
+
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -16,6 +19,10 @@ class Channel(Base):
     uploads_playlist_id = Column(String(255), nullable=True)
     source_input = Column(String(500), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+    scan_interval_minutes = Column(Integer, nullable=True)
+    last_scanned_at = Column(DateTime(timezone=True), nullable=True)
+    next_scan_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    scan_requested_at = Column(DateTime(timezone=True), nullable=True)
     added_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -25,3 +32,14 @@ class Channel(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    stats = relationship("ChannelStats", uselist=False, viewonly=True)
+    tag_rows = relationship(
+        "ChannelTag", order_by="ChannelTag.tag", cascade="all, delete-orphan"
+    )
+
+    __table_args__ = (Index("ix_channels_active_added", "is_active", "added_at"),)
+
+    @property
+    def tags(self) -> List[str]:
+        return sorted(str(row.tag) for row in self.tag_rows)
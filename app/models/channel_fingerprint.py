@@ -0,0 +1,23 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ChannelFingerprint(Base):
+    __tablename__ = "channel_fingerprints"
+
+    channel_id = Column(
+        String(255), ForeignKey("channels.channel_id"), primary_key=True
+    )
+    item_count = Column(Integer, nullable=True)
+    first_page_etag = Column(String(255), nullable=True)
+    newest_video_id = Column(String(255), nullable=True)
+    verified_at = Column(DateTime(timezone=True), nullable=False)
+    checked_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ChannelQuota(Base):
+    __tablename__ = "channel_quotas"
+
+    tenant = Column(String(64), primary_key=True)
+    # NULL falls back to the MAX_ACTIVE_CHANNELS setting; 0 means unlimited.
+    max_active_channels = Column(Integer, nullable=True)
+    active_channels = Column(Integer, default=0, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,48 @@
+from typing import Dict
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.disappearance_event import EventType
+
+EVENT_COUNT_COLUMNS = {
+    EventType.PRIVATE: "private_events",
+    EventType.DELETED: "deleted_events",
+    EventType.GEO_BLOCKED: "geo_blocked_events",
+    EventType.AGE_RESTRICTED: "age_restricted_events",
+    EventType.UNKNOWN: "unknown_events",
+}
+
+
+class ChannelStats(Base):
+    __tablename__ = "channel_stats"
+
+    channel_id = Column(
+        String(255), ForeignKey("channels.channel_id"), primary_key=True
+    )
+    total_videos = Column(Integer, default=0, nullable=False)
+    available_videos = Column(Integer, default=0, nullable=False)
+    missing_videos = Column(Integer, default=0, nullable=False)
+    private_events = Column(Integer, default=0, nullable=False)
+    deleted_events = Column(Integer, default=0, nullable=False)
+    geo_blocked_events = Column(Integer, default=0, nullable=False)
+    age_restricted_events = Column(Integer, default=0, nullable=False)
+    unknown_events = Column(Integer, default=0, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    @property
+    def events_by_type(self) -> Dict[str, int]:
+        return {
+            event_type.value: getattr(self, column) or 0
+            for event_type, column in EVENT_COUNT_COLUMNS.items()
+        }
+
+    @property
+    def total_events(self) -> int:
+        return sum(self.events_by_type.values())
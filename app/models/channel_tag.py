@@ -0,0 +1,12 @@
+from sqlalchemy import Column, ForeignKey, String
+
+from app.core.database import Base
+
+
+class ChannelTag(Base):
+    __tablename__ = "channel_tags"
+
+    channel_id = Column(
+        String(255), ForeignKey("channels.channel_id"), primary_key=True
+    )
+    tag = Column(String(64), primary_key=True, index=True)
@@ -0,0 +1,38 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+
+from app.core.database import Base
+from app.models.disappearance_event import EventType
+
+
+class DisappearanceRollup(Base):
+    __tablename__ = "disappearance_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "channel_id",
+            "event_type",
+            "bucket",
+            "bucket_start",
+            name="uq_disappearance_rollups_key",
+        ),
+        Index(
+            "ix_disappearance_rollups_bucket_start",
+            "bucket",
+            "bucket_start",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(String(255), ForeignKey("channels.channel_id"), nullable=False)
+    event_type: Column[EventType] = Column(Enum(EventType), nullable=False)
+    bucket = Column(String(8), nullable=False)
+    bucket_start = Column(DateTime(timezone=True), nullable=False)
+    count = Column(Integer, default=0, nullable=False)
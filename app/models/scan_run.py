@@ -0,0 +1,31 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ScanRun(Base):
+    __tablename__ = "scan_runs"
+    __table_args__ = (
+        Index("ix_scan_runs_channel_id_started_at", "channel_id", "started_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(String(255), ForeignKey("channels.channel_id"), nullable=False)
+    status = Column(String(20), default="running", nullable=False)
+    started_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    videos_seen = Column(Integer, default=0, nullable=False)
+    added = Column(Integer, default=0, nullable=False)
+    updated = Column(Integer, default=0, nullable=False)
+    events_created = Column(Integer, default=0, nullable=False)
+    api_calls = Column(Integer, default=0, nullable=False)
+    quota_units = Column(Integer, default=0, nullable=False)
+    pages_fetched = Column(Integer, default=0, nullable=False)
+    fetch_ms = Column(Integer, nullable=True)
+    diff_ms = Column(Integer, nullable=True)
+    db_write_ms = Column(Integer, nullable=True)
+    notify_ms = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
@@ -1,4 +1,13 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+)
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -17,6 +26,10 @@ class Video(Base):
     duration = Column(String(50), nullable=True)
     view_count = Column(Integer, nullable=True)
     is_available = Column(Boolean, default=True, nullable=False)
+    content_hash = Column(String(64), nullable=True)
+    # Consecutive scans the video was missing from while still counted as
+    # available; above zero means a suspected, not yet confirmed, disappearance.
+    missed_scans = Column(SmallInteger, default=0, nullable=False)
     last_seen_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
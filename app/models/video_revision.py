@@ -0,0 +1,18 @@
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class VideoRevision(Base):
+    __tablename__ = "video_revisions"
+    __table_args__ = (
+        Index("ix_video_revisions_video_id_changed_at", "video_id", "changed_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    video_id = Column(String(255), ForeignKey("videos.video_id"), nullable=False)
+    changed_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    changes = Column(JSON, nullable=False)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class WebSubSubscription(Base):
+    __tablename__ = "websub_subscriptions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(
+        String(255),
+        ForeignKey("channels.channel_id"),
+        unique=True,
+        index=True,
+        nullable=False,
+    )
+    topic_url = Column(String(500), nullable=False)
+    secret = Column(String(64), nullable=False)
+    status = Column(String(20), default="pending", nullable=False)
+    lease_seconds = Column(Integer, nullable=True)
+    requested_at = Column(DateTime(timezone=True), nullable=True)
+    verified_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    last_notified_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
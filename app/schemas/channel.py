@@ -1,11 +1,39 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
 
 class ChannelCreate(BaseModel):
     input: str = Field(..., description="Channel URL, @handle, or channel ID")
+    tags: List[str] = Field(default_factory=list, description="Group tags")
+
+
+class ChannelTagsUpdate(BaseModel):
+    tags: List[str] = Field(..., description="Replaces the channel's tags")
+
+
+class ChannelTagCount(BaseModel):
+    tag: str
+    channels: int
+
+
+class ChannelUsageResponse(BaseModel):
+    current: int
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+
+
+class ChannelStatsResponse(BaseModel):
+    channel_id: str
+    total_videos: int
+    available_videos: int
+    missing_videos: int
+    total_events: int
+    events_by_type: Dict[str, int]
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
 
 
 class ChannelResponse(BaseModel):
@@ -20,5 +48,24 @@ class ChannelResponse(BaseModel):
     is_active: bool
     added_at: datetime
     updated_at: datetime
+    stats: Optional[ChannelStatsResponse] = None
+    tags: List[str] = Field(default_factory=list)
+
+    model_config = {"from_attributes": True}
+
+
+class ChannelImportRow(BaseModel):
+    row: int
+    input: str
+    status: str
+    channel_id: Optional[str] = None
+    title: Optional[str] = None
+    detail: Optional[str] = None
 
     model_config = {"from_attributes": True}
+
+
+class ChannelImportResponse(BaseModel):
+    total: int
+    counts: Dict[str, int]
+    rows: List[ChannelImportRow]
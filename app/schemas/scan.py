@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -7,3 +10,33 @@ class ScanResponse(BaseModel):
     events_created: int
     channel_id: str
     message: str
+
+
+class ScanRunResponse(BaseModel):
+    id: int
+    channel_id: str
+    status: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    videos_seen: int
+    added: int
+    updated: int
+    events_created: int
+    api_calls: int
+    quota_units: int
+    pages_fetched: int
+    fetch_ms: Optional[int] = None
+    diff_ms: Optional[int] = None
+    db_write_ms: Optional[int] = None
+    notify_ms: Optional[int] = None
+    error: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ScanRunListResponse(BaseModel):
+    scans: list[ScanRunResponse]
+    total: int
+    limit: int
+    offset: int
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.models.disappearance_event import EventType
+
+
+class TimeseriesPoint(BaseModel):
+    bucket_start: datetime
+    event_type: EventType
+    count: int
+
+
+class TimeseriesResponse(BaseModel):
+    bucket: str
+    channel_id: Optional[str] = None
+    points: list[TimeseriesPoint]
+    total: int
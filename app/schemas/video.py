@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
 
@@ -22,6 +22,7 @@ class VideoCreate(VideoBase):
 class VideoResponse(VideoBase):
     id: int
     is_available: bool
+    missed_scans: int = 0
     last_seen_at: datetime
     first_detected_at: datetime
 
@@ -34,3 +35,20 @@ class VideoListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+class VideoRevisionResponse(BaseModel):
+    id: int
+    video_id: str
+    changed_at: datetime
+    changes: Dict[str, Dict[str, Any]]
+
+    class Config:
+        from_attributes = True
+
+
+class VideoRevisionListResponse(BaseModel):
+    revisions: list[VideoRevisionResponse]
+    total: int
+    limit: int
+    offset: int
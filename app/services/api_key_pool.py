@@ -0,0 +1,280 @@
+"""
+Pool of YouTube Data API keys with per-key daily quota ledgers.
+
+Each key belongs to its own Google Cloud project and so has its own daily
+quota, reset at midnight Pacific time. Every request is charged to the key
+that sent it, and each request goes to the key with the most headroom
+left. A key that reports quota exhaustion is evicted until the reset while
+the others carry on; only when every key is out does the circuit breaker
+open. Ledgers are kept in Redis when available so all workers share them,
+and in process memory otherwise.
+
+Keys are configured as a comma-separated ``YOUTUBE_API_KEYS``, falling back
+to the single ``YOUTUBE_API_KEY``. They are identified everywhere else
+(metrics, logs, health output) by a short hash, never by value.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.metrics import YOUTUBE_KEY_EVICTIONS_TOTAL, YOUTUBE_KEY_QUOTA_UNITS_TOTAL
+from app.core.redis_client import get_redis_client
+from app.services.circuit_breaker import next_quota_reset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAILY_QUOTA = 10000
+
+USAGE_KEY = "youtube_keys:usage:{period}:{key_id}"
+EVICTED_KEY = "youtube_keys:evicted:{key_id}"
+
+
+def key_id(api_key: str) -> str:
+    """Short, stable identifier for an API key that does not reveal it."""
+    return "key-" + hashlib.sha256(api_key.encode()).hexdigest()[:8]
+
+
+def api_keys_from_env() -> List[str]:
+    """Configured API keys, in order and without duplicates."""
+    raw = os.getenv("YOUTUBE_API_KEYS") or os.getenv("YOUTUBE_API_KEY") or ""
+    keys: List[str] = []
+    for value in raw.split(","):
+        value = value.strip()
+        if value and value not in keys:
+            keys.append(value)
+    return keys
+
+
+class InProcessLedgerStore:
+    def __init__(self) -> None:
+        self._usage: Dict[Tuple[int, str], int] = {}
+        self._evicted: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def used(self, period: int, key: str) -> int:
+        with self._lock:
+            return self._usage.get((period, key), 0)
+
+    def add(self, period: int, key: str, units: int) -> int:
+        with self._lock:
+            # Drop ledgers of earlier days so the dict does not grow forever.
+            for stale in [p for p in self._usage if p[0] < period]:
+                del self._usage[stale]
+            total = self._usage.get((period, key), 0) + units
+            self._usage[(period, key)] = total
+            return total
+
+    def evicted_until(self, key: str) -> float:
+        with self._lock:
+            return self._evicted.get(key, 0.0)
+
+    def evict(self, key: str, until: float) -> None:
+        with self._lock:
+            self._evicted[key] = until
+
+    def read(self, period: int, keys: List[str]) -> List[Tuple[int, float]]:
+        with self._lock:
+            return [
+                (self._usage.get((period, key), 0), self._evicted.get(key, 0.0))
+                for key in keys
+            ]
+
+
+class RedisLedgerStore:
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def used(self, period: int, key: str) -> int:
+        value = self.client.get(USAGE_KEY.format(period=period, key_id=key))
+        return int(value or 0)
+
+    def add(self, period: int, key: str, units: int) -> int:
+        usage_key = USAGE_KEY.format(period=period, key_id=key)
+        pipeline = self.client.pipeline()
+        pipeline.incrby(usage_key, units)
+        # Keep the ledger an hour past the reset for late health checks.
+        pipeline.expireat(usage_key, period + 3600)
+        total, _ = pipeline.execute()
+        return int(total)
+
+    def evicted_until(self, key: str) -> float:
+        value = self.client.get(EVICTED_KEY.format(key_id=key))
+        return float(value or 0.0)
+
+    def evict(self, key: str, until: float) -> None:
+        self.client.set(EVICTED_KEY.format(key_id=key), until, exat=int(until) + 1)
+
+    def read(self, period: int, keys: List[str]) -> List[Tuple[int, float]]:
+        if not keys:
+            return []
+        values = self.client.mget(
+            [USAGE_KEY.format(period=period, key_id=key) for key in keys]
+            + [EVICTED_KEY.format(key_id=key) for key in keys]
+        )
+        return [
+            (int(used or 0), float(until or 0.0))
+            for used, until in zip(values[: len(keys)], values[len(keys) :])
+        ]
+
+
+class QuotaLedger:
+    """Daily quota units charged per key, and keys evicted until the reset."""
+
+    def __init__(
+        self, store: Optional[Any] = None, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.store = store or InProcessLedgerStore()
+        self.local_store = InProcessLedgerStore()
+        self.clock = clock
+
+    @classmethod
+    def from_env(cls) -> "QuotaLedger":
+        client = get_redis_client()
+        return cls(store=RedisLedgerStore(client) if client is not None else None)
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Run a store operation, falling back to local state if Redis fails."""
+        try:
+            return getattr(self.store, method)(*args)
+        except Exception as e:
+            logger.warning(f"Quota ledger store failed, using local state: {e}")
+            return getattr(self.local_store, method)(*args)
+
+    def _reset_at(self) -> float:
+        return next_quota_reset(
+            datetime.fromtimestamp(self.clock(), timezone.utc)
+        ).timestamp()
+
+    def used(self, key: str) -> int:
+        return int(self._call("used", int(self._reset_at()), key))
+
+    def charge(self, key: str, units: int) -> int:
+        return int(self._call("add", int(self._reset_at()), key, units))
+
+    def evict(self, key: str) -> float:
+        until = self._reset_at()
+        self._call("evict", key, until)
+        return until
+
+    def evicted_until(self, key: str) -> Optional[float]:
+        until = float(self._call("evicted_until", key))
+        return until if until > self.clock() else None
+
+    def read(self, keys: List[str]) -> Dict[str, Tuple[int, Optional[float]]]:
+        """Units used and eviction end for each key, in one store round trip."""
+        now = self.clock()
+        rows = self._call("read", int(self._reset_at()), keys)
+        return {
+            key: (int(used), float(until) if float(until) > now else None)
+            for key, (used, until) in zip(keys, rows)
+        }
+
+    @property
+    def shared(self) -> bool:
+        return isinstance(self.store, RedisLedgerStore)
+
+
+_quota_ledger: Optional[QuotaLedger] = None
+_quota_ledger_lock = threading.Lock()
+
+
+def get_quota_ledger() -> QuotaLedger:
+    """Return the process-wide API key quota ledger."""
+    global _quota_ledger
+    if _quota_ledger is None:
+        with _quota_ledger_lock:
+            if _quota_ledger is None:
+                _quota_ledger = QuotaLedger.from_env()
+    return _quota_ledger
+
+
+def reset_quota_ledger() -> None:
+    """Drop the process-wide ledger so the next call rebuilds it (tests)."""
+    global _quota_ledger
+    with _quota_ledger_lock:
+        _quota_ledger = None
+
+
+@dataclass(frozen=True)
+class ApiKey:
+    key_id: str
+    value: str = field(repr=False)
+
+
+class ApiKeyPool:
+    """Route requests across API keys by remaining daily quota."""
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        daily_quota: int = DEFAULT_DAILY_QUOTA,
+        ledger: Optional[QuotaLedger] = None,
+    ) -> None:
+        self.keys = [ApiKey(key_id(value), value) for value in api_keys]
+        self.daily_quota = daily_quota
+        self.ledger = ledger or get_quota_ledger()
+
+    @classmethod
+    def from_env(cls) -> "ApiKeyPool":
+        return cls(
+            api_keys_from_env(),
+            daily_quota=int(
+                os.getenv("YOUTUBE_KEY_DAILY_QUOTA", str(DEFAULT_DAILY_QUOTA))
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def choose(self) -> Optional[ApiKey]:
+        """The non-evicted key with the most headroom, or None if all are out."""
+        ledger = self.ledger.read([key.key_id for key in self.keys])
+        best: Optional[ApiKey] = None
+        best_used = 0
+        for key in self.keys:
+            used, evicted_until = ledger[key.key_id]
+            if evicted_until is not None:
+                continue
+            if best is None or used < best_used:
+                best, best_used = key, used
+        return best
+
+    def charge(self, key: ApiKey, units: int) -> None:
+        self.ledger.charge(key.key_id, units)
+        YOUTUBE_KEY_QUOTA_UNITS_TOTAL.inc(units, key=key.key_id)
+
+    def evict(self, key: ApiKey) -> None:
+        """Take a key out of rotation until the next daily quota reset."""
+        until = self.ledger.evict(key.key_id)
+        YOUTUBE_KEY_EVICTIONS_TOTAL.inc(key=key.key_id)
+        logger.warning(
+            f"YouTube API key {key.key_id} is out of quota, evicted until "
+            f"{datetime.fromtimestamp(until, timezone.utc).isoformat()}"
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """Per-key usage for health checks."""
+        ledger = self.ledger.read([key.key_id for key in self.keys])
+        keys = []
+        for key in self.keys:
+            used, evicted_until = ledger[key.key_id]
+            keys.append(
+                {
+                    "key": key.key_id,
+                    "quota_units_used": used,
+                    "daily_quota": self.daily_quota,
+                    "remaining": max(0, self.daily_quota - used),
+                    "evicted_until": (
+                        datetime.fromtimestamp(evicted_until, timezone.utc).isoformat()
+                        if evicted_until is not None
+                        else None
+                    ),
+                }
+            )
+        return {"shared": self.ledger.shared, "keys": keys}
@@ -1,27 +1,33 @@
 import logging
 import os
 import random
+import threading
 import time
+from importlib.util import find_spec
 from typing import Any, Optional
 
 from sqlalchemy.orm import Session
 
 from app.core.database import SessionLocal
+from app.core.metrics import SCHEDULER_JOB_FAILURES_TOTAL, SCHEDULER_JOB_SECONDS
 from app.models.channel import Channel
-
-try:
-    import redis
-
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-
-try:
-    import apscheduler.schedulers.background  # type: ignore[import-untyped] # noqa
-
-    SCHEDULER_AVAILABLE = True
-except ImportError:
-    SCHEDULER_AVAILABLE = False
+from app.services.channel_refresh import ChannelMetadataRefresher
+from app.services.circuit_breaker import get_circuit_breaker
+from app.services.feed_precheck import (
+    FEED_UNAVAILABLE,
+    FULL_CHECK_DUE,
+    FeedConfig,
+    FeedDecision,
+    FeedPrecheck,
+)
+from app.services.leader_election import LeaderConfig, LeaderElector
+from app.services.scan_scheduler import AdaptiveScanScheduler
+from app.services.websub import WebSubConfig, WebSubManager
+
+# Only check that the optional dependencies are installed; they are
+# imported when the service is first constructed with scanning enabled.
+REDIS_AVAILABLE = find_spec("redis") is not None
+SCHEDULER_AVAILABLE = find_spec("apscheduler") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +40,20 @@ class BackgroundJobService:
         self.scan_interval_minutes = int(os.getenv("SCAN_INTERVAL_MINUTES", "60"))
         self.scan_concurrency = int(os.getenv("SCAN_CONCURRENCY", "1"))
         self.scan_batch_size = int(os.getenv("SCAN_BATCH_SIZE", "10"))
+        self.adaptive = os.getenv("SCAN_ADAPTIVE", "true").lower() == "true"
+        self.feed_config = FeedConfig.from_env()
+        self.websub_config = WebSubConfig.from_env()
+        # Channel metadata changes slowly; 0 disables the refresh job.
+        self.channel_refresh_hours = float(os.getenv("CHANNEL_REFRESH_HOURS", "24"))
+        # With adaptive scheduling the job only wakes up to look for due
+        # channels, so it ticks at the shortest allowed interval.
+        self.tick_minutes = int(
+            os.getenv("SCAN_MIN_INTERVAL_MINUTES", "5")
+            if self.adaptive
+            else self.scan_interval_minutes
+        )
+        # Only the lease holder runs jobs; the client is set with Redis.
+        self.leader = LeaderElector(None, LeaderConfig.from_env())
 
         if self.enabled:
             if REDIS_AVAILABLE and SCHEDULER_AVAILABLE:
@@ -48,11 +68,14 @@ class BackgroundJobService:
         if not REDIS_AVAILABLE:
             return
 
+        import redis
+
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
         try:
             self.redis_client = redis.from_url(redis_url)
             if self.redis_client is not None:
                 self.redis_client.ping()
+                self.leader.client = self.redis_client
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             self.enabled = False
@@ -62,7 +85,9 @@ class BackgroundJobService:
         if not self.enabled or not SCHEDULER_AVAILABLE:
             return
 
-        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.schedulers.background import (  # type: ignore[import-untyped]
+            BackgroundScheduler,
+        )
         from apscheduler.triggers.interval import (  # type: ignore[import-untyped]
             IntervalTrigger,
         )
@@ -70,23 +95,51 @@ class BackgroundJobService:
         self.scheduler = BackgroundScheduler()
         if self.scheduler is not None:
             self.scheduler.add_job(
-                func=self._scan_all_channels,
-                trigger=IntervalTrigger(minutes=self.scan_interval_minutes),
+                func=self.leader.campaign,
+                trigger=IntervalTrigger(seconds=self.leader.config.renew_seconds),
+                id="leader_lease",
+                name="Renew or campaign for the scheduler leader lease",
+                replace_existing=True,
+            )
+            self.scheduler.add_job(
+                func=self._run_scan_job,
+                trigger=IntervalTrigger(minutes=self.tick_minutes),
                 id="scan_channels",
                 name="Scan all channels for video updates",
                 replace_existing=True,
             )
+            if self.channel_refresh_hours > 0:
+                self.scheduler.add_job(
+                    func=self._run_channel_refresh_job,
+                    trigger=IntervalTrigger(hours=self.channel_refresh_hours),
+                    id="channel_refresh",
+                    name="Refresh channel titles, thumbnails and subscriber counts",
+                    replace_existing=True,
+                )
+            if self.websub_config.enabled:
+                self.scheduler.add_job(
+                    func=self._run_websub_job,
+                    trigger=IntervalTrigger(minutes=60),
+                    id="websub_renewal",
+                    name="Subscribe and renew WebSub channel feeds",
+                    replace_existing=True,
+                )
 
     def start(self) -> None:
         """Start the background job scheduler."""
         if self.enabled and self.scheduler:
+            leader = self.leader.campaign()
             self.scheduler.start()
-            logger.info("Background job scheduler started")
+            logger.info(
+                "Background job scheduler started "
+                f"({'leader' if leader else 'standby'})"
+            )
 
     def stop(self) -> None:
         """Stop the background job scheduler."""
         if self.scheduler:
             self.scheduler.shutdown()
+            self.leader.release()
             logger.info("Background job scheduler stopped")
 
     def get_status(self) -> dict:
@@ -104,6 +157,11 @@ class BackgroundJobService:
             "enabled": True,
             "running": self.scheduler.running if self.scheduler else False,
             "next_run": next_run,
+            "adaptive": self.adaptive,
+            "feed_precheck": self.feed_config.enabled,
+            "websub": self.websub_config.enabled,
+            "channel_refresh_hours": self.channel_refresh_hours,
+            "leader": self.leader.status(),
         }
 
     def _acquire_lock(self, channel_id: str, timeout: int = 300) -> bool:
@@ -234,20 +292,95 @@ class BackgroundJobService:
         except Exception as e:
             logger.error(f"Error releasing lock for channel {channel_id}: {e}")
 
+    def _is_leader(self, job: str) -> bool:
+        """True when this process should run ``job``; standbys skip it."""
+        if self.leader.is_leader:
+            return True
+        logger.debug(f"Skipping {job}: another process holds the scheduler lease")
+        return False
+
+    def _run_scan_job(self) -> None:
+        """Scheduler entry point: run the channel sweep and record its duration."""
+        if not self._is_leader("scan_channels"):
+            return
+        with SCHEDULER_JOB_SECONDS.time(job="scan_channels"):
+            try:
+                self._scan_all_channels()
+            except Exception:
+                SCHEDULER_JOB_FAILURES_TOTAL.inc(job="scan_channels")
+                raise
+
+    def _run_websub_job(self) -> None:
+        """Scheduler entry point: keep WebSub subscriptions current."""
+        if not self._is_leader("websub_renewal"):
+            return
+        with SCHEDULER_JOB_SECONDS.time(job="websub_renewal"):
+            db = SessionLocal()
+            try:
+                counts = WebSubManager(db, self.websub_config).sync()
+                logger.info(f"WebSub subscriptions synced: {counts}")
+            except Exception:
+                SCHEDULER_JOB_FAILURES_TOTAL.inc(job="websub_renewal")
+                raise
+            finally:
+                db.close()
+
+    def _run_channel_refresh_job(self) -> None:
+        """Scheduler entry point: refresh channel metadata in batches."""
+        if not self._is_leader("channel_refresh"):
+            return
+        with SCHEDULER_JOB_SECONDS.time(job="channel_refresh"):
+            db = SessionLocal()
+            try:
+                from app.services.youtube_client import YouTubeClient
+
+                ChannelMetadataRefresher(db, YouTubeClient()).refresh()
+            except Exception:
+                SCHEDULER_JOB_FAILURES_TOTAL.inc(job="channel_refresh")
+                raise
+            finally:
+                db.close()
+
     def _scan_all_channels(self) -> None:
-        """Scan all active channels for video updates."""
+        """Scan active channels that are due for video updates."""
         logger.info("Starting scheduled channel scan")
 
         db = SessionLocal()
         try:
-            channels = (
-                db.query(Channel)
-                .filter(Channel.is_active.is_(True))
-                .limit(self.scan_batch_size)
-                .all()
-            )
+            scheduler: Optional[AdaptiveScanScheduler] = None
+            if self.adaptive:
+                scheduler = AdaptiveScanScheduler(db)
+                planned = scheduler.plan()
+                # SCAN_BATCH_SIZE is only a floor here: a fixed batch would
+                # cap scans below what the planned intervals need.
+                batch_size = max(
+                    self.scan_batch_size,
+                    scheduler.sweep_size(planned, self.tick_minutes),
+                )
+                channels = scheduler.due_channels(limit=batch_size)
+            else:
+                channels = (
+                    db.query(Channel)
+                    .filter(Channel.is_active.is_(True))
+                    .limit(self.scan_batch_size)
+                    .all()
+                )
 
+            circuit_breaker = get_circuit_breaker()
+            # A sweep that started under the lease stops once it lapses.
+            leading = self.leader.is_leader
             for channel in channels:
+                if leading and not self.leader.is_leader:
+                    logger.warning(
+                        "Scheduler lease lost, leaving remaining channels to "
+                        "the new leader"
+                    )
+                    break
+                if circuit_breaker.is_open():
+                    logger.warning(
+                        "YouTube API circuit is open, deferring remaining channels"
+                    )
+                    break
                 if self._acquire_lock(str(channel.channel_id)):
                     try:
                         self._scan_single_channel(db, str(channel.channel_id))
@@ -257,6 +390,8 @@ class BackgroundJobService:
                         )
                     finally:
                         self._release_lock(str(channel.channel_id))
+                        if scheduler is not None:
+                            scheduler.record_scan(channel)
                 else:
                     logger.info(
                         f"Channel {channel.channel_id} is already being scanned"
@@ -267,15 +402,46 @@ class BackgroundJobService:
 
         logger.info("Completed scheduled channel scan")
 
+    def _feed_precheck(self, db: Session, channel_id: str) -> FeedDecision:
+        """
+        Run the zero-quota feed pre-check and decide whether to scan.
+
+        Any failure here falls through to the full scan so the pre-check
+        can only save quota, never hide a change.
+        """
+        try:
+            channel = db.query(Channel).filter(Channel.channel_id == channel_id).first()
+            if channel is None:
+                return FeedDecision(scan=True, reason=FEED_UNAVAILABLE)
+            decision = FeedPrecheck(db, self.feed_config).check(channel)
+        except Exception as e:
+            logger.warning(f"Feed pre-check error for channel {channel_id}: {e}")
+            return FeedDecision(scan=True, reason=FEED_UNAVAILABLE)
+
+        if not decision.scan:
+            logger.info(f"Skipping scan of channel {channel_id}: feed unchanged")
+        return decision
+
     def _scan_single_channel(self, db: Session, channel_id: str) -> None:
         """Scan a single channel for video updates."""
+        force_full = False
+        if self.feed_config.enabled:
+            decision = self._feed_precheck(db, channel_id)
+            if not decision.scan:
+                return
+            # The feed's periodic full check must not stop at the uploads
+            # fingerprint, or it would never happen.
+            force_full = decision.reason == FULL_CHECK_DUE
+
         try:
             from app.services.video_ingestion import VideoIngestionService
             from app.services.youtube_client import YouTubeClient
 
             youtube_client = YouTubeClient()
             ingestion_service = VideoIngestionService(db, youtube_client)
-            added, updated, events = ingestion_service.scan_channel(channel_id)
+            added, updated, events = ingestion_service.scan_channel(
+                channel_id, force_full=force_full
+            )
             logger.info(
                 f"Scanned channel {channel_id}: "
                 f"added={added}, updated={updated}, events={events}"
@@ -285,4 +451,20 @@ class BackgroundJobService:
             raise
 
 
-background_job_service = BackgroundJobService()
+_background_job_service: Optional[BackgroundJobService] = None
+_background_job_service_lock = threading.Lock()
+
+
+def get_background_job_service() -> BackgroundJobService:
+    """
+    Return the process-wide service, creating it on first use.
+
+    Construction connects to Redis and builds the scheduler, so it is
+    deferred until startup needs it rather than done at import.
+    """
+    global _background_job_service
+    if _background_job_service is None:
+        with _background_job_service_lock:
+            if _background_job_service is None:
+                _background_job_service = BackgroundJobService()
+    return _background_job_service
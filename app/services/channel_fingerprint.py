@@ -0,0 +1,123 @@
+"""
+One-call change detection from the uploads playlist's first page.
+
+Before walking every page, a scan fetches only the first page of the
+uploads playlist (1 quota unit) and compares three values with what the
+last full scan stored: the playlist's item count, the page's ETag and the
+newest video ID. Uploads and removals change the count or the newest ID,
+and any edit to a recent video changes the ETag; when all three match the
+scan is recorded as ``unchanged`` without further calls.
+
+Older videos can go private without touching any of the three, so a full
+scan is still forced every ``full_verify_hours``. A channel with suspected
+but unconfirmed disappearances keeps no fingerprint, so its next scan is a
+full one and confirmation waits one scan rather than a full verification
+period.
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import SCAN_FINGERPRINT_TOTAL
+from app.models.channel_fingerprint import ChannelFingerprint
+from app.services.youtube_client import UploadsFingerprint
+
+UNCHANGED = "unchanged"
+CHANGED = "changed"
+VERIFY_DUE = "verify_due"
+UNAVAILABLE = "unavailable"
+
+
+@dataclass(frozen=True)
+class FingerprintConfig:
+    enabled: bool = True
+    full_verify_hours: float = 24.0
+
+    @classmethod
+    def from_env(cls) -> "FingerprintConfig":
+        return cls(
+            enabled=os.getenv("SCAN_FINGERPRINT", "true").lower() == "true",
+            full_verify_hours=float(
+                os.getenv("SCAN_FULL_VERIFY_HOURS", str(cls.full_verify_hours))
+            ),
+        )
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class ChannelFingerprintService:
+    def __init__(self, db: Session, config: Optional[FingerprintConfig] = None):
+        self.db = db
+        self.config = config or FingerprintConfig.from_env()
+
+    def get(self, channel_id: str) -> Optional[ChannelFingerprint]:
+        return self.db.get(ChannelFingerprint, channel_id)
+
+    def check(
+        self,
+        channel_id: str,
+        fingerprint: Optional[UploadsFingerprint],
+        now: datetime,
+    ) -> str:
+        """
+        Compare a fresh fingerprint with the stored one.
+
+        Returns ``UNCHANGED`` only when the full scan can be skipped.
+        """
+        result = self._compare(channel_id, fingerprint, now)
+        SCAN_FINGERPRINT_TOTAL.inc(result=result)
+        return result
+
+    def _compare(
+        self,
+        channel_id: str,
+        fingerprint: Optional[UploadsFingerprint],
+        now: datetime,
+    ) -> str:
+        if fingerprint is None or fingerprint.item_count is None:
+            return UNAVAILABLE
+
+        stored = self.get(channel_id)
+        if stored is None:
+            return CHANGED
+        if now - _aware(stored.verified_at) >= timedelta(  # type: ignore[arg-type]
+            hours=self.config.full_verify_hours
+        ):
+            return VERIFY_DUE
+        if (
+            stored.item_count != fingerprint.item_count
+            or stored.first_page_etag != fingerprint.etag
+            or stored.newest_video_id != fingerprint.newest_video_id
+        ):
+            return CHANGED
+
+        stored.checked_at = now  # type: ignore[assignment]
+        return UNCHANGED
+
+    def record(
+        self, channel_id: str, fingerprint: UploadsFingerprint, verified_at: datetime
+    ) -> None:
+        """Store the fingerprint a full scan has just verified."""
+        stored = self.get(channel_id)
+        if stored is None:
+            stored = ChannelFingerprint(channel_id=channel_id)
+            self.db.add(stored)
+        stored.item_count = fingerprint.item_count  # type: ignore[assignment]
+        stored.first_page_etag = fingerprint.etag  # type: ignore[assignment]
+        stored.newest_video_id = fingerprint.newest_video_id  # type: ignore[assignment]
+        stored.verified_at = verified_at  # type: ignore[assignment]
+        stored.checked_at = verified_at  # type: ignore[assignment]
+        self.db.flush()
+
+    def forget(self, channel_id: str) -> None:
+        """Drop the stored fingerprint so the next scan lists every page."""
+        stored = self.get(channel_id)
+        if stored is not None:
+            self.db.delete(stored)
+            self.db.flush()
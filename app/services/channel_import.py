@@ -0,0 +1,321 @@
+"""
+Bulk channel import from subscription exports.
+
+Accepted files:
+
+* CSV or plain text with one URL, ``@handle`` or channel ID per line;
+* Google Takeout ``subscriptions.csv`` (``Channel Id,Channel Url,Channel
+  Title``);
+* OPML subscription lists, whose outlines point at channel feeds.
+
+Inputs are deduplicated before any API call. Channel IDs need no
+resolution; handles and legacy URLs are resolved through the resolution
+cache first and the API second, a few at a time. Metadata for every new
+channel is then fetched 50 per ``channels.list`` call and the channels
+are inserted in one statement. Each input row gets its own outcome in the
+returned report.
+"""
+
+import csv
+import io
+import logging
+import os
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.channel import Channel
+from app.models.channel_stats import ChannelStats
+from app.services.channel_registry import ChannelLimitError, ChannelRegistry
+from app.services.channel_stats import ChannelStatsService
+from app.services.resolution_cache import (
+    ResolutionCache,
+    cache_key,
+    get_resolution_cache,
+)
+from app.services.youtube_client import YouTubeClient, extract_channel_id
+
+logger = logging.getLogger(__name__)
+
+ADDED = "added"
+DUPLICATE = "duplicate"
+ALREADY_REGISTERED = "already_registered"
+NOT_FOUND = "not_found"
+LIMIT_REACHED = "limit_reached"
+INVALID = "invalid"
+ERROR = "error"
+
+BATCH_SIZE = 50
+HEADER_CELLS = {"input", "channel", "channels", "handle", "url"}
+
+
+class ImportFileError(ValueError):
+    """Raised when an uploaded file cannot be read as a channel list."""
+
+
+@dataclass
+class ImportRow:
+    row: int
+    input: str
+    status: Optional[str] = None
+    channel_id: Optional[str] = None
+    title: Optional[str] = None
+    detail: Optional[str] = None
+
+
+def _channel_from_feed_url(url: str) -> Optional[str]:
+    ids = parse_qs(urlparse(url).query).get("channel_id")
+    return ids[0] if ids else None
+
+
+def _parse_opml(text: str) -> List[str]:
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError as e:
+        raise ImportFileError(f"Invalid OPML: {e}") from e
+
+    inputs = []
+    for outline in root.iter("outline"):
+        xml_url = outline.get("xmlUrl")
+        html_url = outline.get("htmlUrl")
+        if xml_url:
+            inputs.append(_channel_from_feed_url(xml_url) or xml_url)
+        elif html_url:
+            inputs.append(html_url)
+    return inputs
+
+
+def _parse_csv(text: str) -> List[str]:
+    rows = [
+        row
+        for row in csv.reader(io.StringIO(text))
+        if row and row[0].strip() and not row[0].lstrip().startswith("#")
+    ]
+    if not rows:
+        return []
+
+    header = [cell.strip().lower() for cell in rows[0]]
+    column = 0
+    if "channel id" in header:
+        column = header.index("channel id")
+    elif "channel url" in header:
+        column = header.index("channel url")
+    elif header[0] not in HEADER_CELLS:
+        return [row[0].strip() for row in rows]
+
+    return [row[column].strip() for row in rows[1:] if len(row) > column]
+
+
+def parse_import_file(filename: str, content: bytes) -> List[str]:
+    """Extract channel inputs, in file order, from an uploaded file."""
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise ImportFileError("File must be UTF-8 encoded") from e
+
+    if filename.lower().endswith((".opml", ".xml")) or text.lstrip().startswith("<"):
+        return _parse_opml(text)
+    return _parse_csv(text)
+
+
+class ChannelImporter:
+    def __init__(
+        self,
+        db: Session,
+        registry: Optional[ChannelRegistry] = None,
+        client_factory: Optional[Callable[[], YouTubeClient]] = None,
+        cache: Optional[ResolutionCache] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.db = db
+        self.registry = registry or ChannelRegistry(db)
+        self.stats = ChannelStatsService(db)
+        self.client_factory = client_factory or YouTubeClient
+        self.cache = cache or get_resolution_cache()
+        self.concurrency = concurrency or int(
+            os.getenv("IMPORT_RESOLVE_CONCURRENCY", "4")
+        )
+        # The googleapiclient transport is not thread-safe, so every
+        # resolver thread builds its own client.
+        self._local = threading.local()
+        self.client = self._client()
+        self.existing: Dict[str, Channel] = {}
+        self.metadata: Dict[str, Dict] = {}
+
+    def _client(self) -> YouTubeClient:
+        client: Optional[YouTubeClient] = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.client_factory()
+        return client
+
+    def run(self, inputs: List[str]) -> List[ImportRow]:
+        rows = [ImportRow(row=i + 1, input=raw.strip()) for i, raw in enumerate(inputs)]
+
+        pending = self._dedupe_inputs(rows)
+        self._resolve(pending)
+        pending = self._dedupe_channels([r for r in pending if r.status is None])
+        pending = self._skip_registered(pending)
+        available = self.registry.available()
+        self._fetch_metadata(pending, available)
+        self._insert(self._take_slots(pending, available))
+        return rows
+
+    def _dedupe_inputs(self, rows: List[ImportRow]) -> List[ImportRow]:
+        first_by_key: Dict[str, ImportRow] = {}
+        pending = []
+        for row in rows:
+            if not row.input:
+                row.status, row.detail = INVALID, "Empty input"
+                continue
+            key = extract_channel_id(row.input) or cache_key(row.input)
+            first = first_by_key.setdefault(key, row)
+            if first is not row:
+                row.status, row.detail = DUPLICATE, f"Same as row {first.row}"
+                continue
+            pending.append(row)
+        return pending
+
+    def _resolve(self, rows: List[ImportRow]) -> None:
+        unresolved = []
+        for row in rows:
+            row.channel_id = extract_channel_id(row.input) or self.cache.get(row.input)
+            if row.channel_id is None:
+                unresolved.append(row)
+
+        if not unresolved:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(self._resolve_one, unresolved))
+
+    def _resolve_one(self, row: ImportRow) -> None:
+        try:
+            channel_id, _ = self._client().resolve_channel_input(row.input)
+        except Exception as e:
+            logger.warning(f"Failed to resolve import row {row.row}: {e}")
+            row.status, row.detail = ERROR, str(e)
+            return
+
+        if not channel_id:
+            row.status, row.detail = NOT_FOUND, "Channel not found"
+            return
+        row.channel_id = channel_id
+        self.cache.set(row.input, channel_id)
+
+    def _dedupe_channels(self, rows: List[ImportRow]) -> List[ImportRow]:
+        first_by_id: Dict[str, ImportRow] = {}
+        pending = []
+        for row in rows:
+            first = first_by_id.setdefault(str(row.channel_id), row)
+            if first is not row:
+                row.status, row.detail = DUPLICATE, f"Same channel as row {first.row}"
+                continue
+            pending.append(row)
+        return pending
+
+    def _skip_registered(self, rows: List[ImportRow]) -> List[ImportRow]:
+        """Mark channels that are already active."""
+        channel_ids = [str(r.channel_id) for r in rows]
+        for start in range(0, len(channel_ids), 500):
+            chunk = channel_ids[start : start + 500]
+            for channel in self.db.query(Channel).filter(Channel.channel_id.in_(chunk)):
+                self.existing[str(channel.channel_id)] = channel
+
+        pending = []
+        for row in rows:
+            existing = self.existing.get(str(row.channel_id))
+            if existing is not None and existing.is_active:
+                row.status, row.title = ALREADY_REGISTERED, str(existing.title)
+            else:
+                pending.append(row)
+        return pending
+
+    def _fetch_metadata(self, rows: List[ImportRow], wanted: Optional[int]) -> None:
+        """Fetch metadata batch by batch until ``wanted`` channels are found."""
+        for start in range(0, len(rows), BATCH_SIZE):
+            if wanted is not None and len(self.metadata) >= wanted:
+                break
+            batch = rows[start : start + BATCH_SIZE]
+            try:
+                found = self.client.fetch_channels([str(r.channel_id) for r in batch])
+            except Exception as e:
+                logger.warning(f"Failed to fetch metadata for import batch: {e}")
+                for row in batch:
+                    row.status, row.detail = ERROR, str(e)
+                continue
+
+            for row in batch:
+                metadata = found.get(str(row.channel_id))
+                if metadata is None:
+                    row.status, row.detail = NOT_FOUND, "Channel not found"
+                else:
+                    self.metadata[str(row.channel_id)] = metadata
+
+    def _take_slots(
+        self, rows: List[ImportRow], available: Optional[int]
+    ) -> List[ImportRow]:
+        """
+        Hand the free channel slots to found channels in file order.
+
+        Slots are given out only after metadata was fetched, so rows that
+        turn out not to exist do not crowd out valid rows further down.
+        """
+        limit = self.registry.limit()
+        pending: List[ImportRow] = []
+        for row in rows:
+            if row.status is not None:
+                continue
+            if available is not None and len(pending) >= available:
+                row.status = LIMIT_REACHED
+                row.detail = f"Maximum of {limit} channels reached"
+            else:
+                pending.append(row)
+        return pending
+
+    def _insert(self, rows: List[ImportRow]) -> None:
+        if rows:
+            try:
+                self.registry.reserve(len(rows))
+            except ChannelLimitError as e:
+                # Another add took the slots counted in _take_slots.
+                for row in rows:
+                    row.status = LIMIT_REACHED
+                    row.detail = f"Maximum of {e.limit} channels reached"
+                self.db.rollback()
+                return
+
+        values = []
+        for row in rows:
+            metadata = self.metadata[str(row.channel_id)]
+            fields = {
+                "title": metadata["title"],
+                "description": metadata.get("description"),
+                "thumbnail_url": metadata.get("thumbnail_url"),
+                "subscriber_count": metadata.get("subscriber_count"),
+                "uploads_playlist_id": metadata.get("uploads_playlist_id"),
+                "source_input": row.input[:500],
+            }
+            existing = self.existing.get(str(row.channel_id))
+            if existing is not None:
+                # A removed channel keeps its row; adding it again revives it.
+                for field, value in fields.items():
+                    setattr(existing, field, value)
+                existing.is_active = True  # type: ignore[assignment]
+                self.stats.ensure(str(row.channel_id))
+            else:
+                values.append({"channel_id": row.channel_id, **fields})
+            row.status, row.title = ADDED, metadata["title"]
+
+        if values:
+            self.db.execute(insert(Channel), values)
+            self.db.execute(
+                insert(ChannelStats),
+                [{"channel_id": value["channel_id"]} for value in values],
+            )
+        self.db.commit()
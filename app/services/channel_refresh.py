@@ -0,0 +1,91 @@
+"""
+Periodic refresh of channel metadata.
+
+Titles, thumbnails and subscriber counts are stored when a channel is
+added and drift afterwards. The refresh job re-reads them with batched
+``channels.list`` calls, 50 channels per quota unit, and writes a channel
+row only when one of its fields actually changed.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import CHANNEL_REFRESH_TOTAL
+from app.models.channel import Channel
+from app.services.youtube_client import YouTubeClient
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+
+REFRESHED_FIELDS = (
+    "title",
+    "description",
+    "thumbnail_url",
+    "subscriber_count",
+    "uploads_playlist_id",
+)
+
+
+class ChannelMetadataRefresher:
+    def __init__(self, db: Session, youtube_client: YouTubeClient):
+        self.db = db
+        self.youtube_client = youtube_client
+
+    def refresh(self, channel_ids: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Refresh the given channels, or every active channel.
+
+        Each batch is committed on its own so a quota error part-way
+        through keeps the batches already refreshed.
+
+        Returns:
+            Counts of channels ``updated``, ``unchanged`` and ``missing``
+            (not returned by the API)
+        """
+        if channel_ids is None:
+            channel_ids = [
+                str(channel_id)
+                for (channel_id,) in self.db.query(Channel.channel_id)
+                .filter(Channel.is_active.is_(True))
+                .order_by(Channel.id)
+            ]
+
+        counts = {"updated": 0, "unchanged": 0, "missing": 0}
+        for start in range(0, len(channel_ids), BATCH_SIZE):
+            batch = channel_ids[start : start + BATCH_SIZE]
+            for result, count in self._refresh_batch(batch).items():
+                counts[result] += count
+                CHANNEL_REFRESH_TOTAL.inc(count, result=result)
+
+        logger.info(f"Refreshed channel metadata: {counts}")
+        return counts
+
+    def _refresh_batch(self, channel_ids: List[str]) -> Dict[str, int]:
+        metadata = self.youtube_client.fetch_channels(channel_ids)
+        counts = {"updated": 0, "unchanged": 0, "missing": 0}
+
+        channels = self.db.query(Channel).filter(Channel.channel_id.in_(channel_ids))
+        for channel in channels:
+            fresh = metadata.get(str(channel.channel_id))
+            if fresh is None:
+                counts["missing"] += 1
+                continue
+            counts["updated" if self._apply(channel, fresh) else "unchanged"] += 1
+
+        self.db.commit()
+        return counts
+
+    def _apply(self, channel: Channel, fresh: Dict) -> bool:
+        """Copy changed fields onto ``channel``; unchanged rows stay clean."""
+        changed = False
+        for field in REFRESHED_FIELDS:
+            value = fresh.get(field)
+            if field == "uploads_playlist_id" and not value:
+                continue
+            if getattr(channel, field) != value:
+                setattr(channel, field, value)
+                changed = True
+        return changed
@@ -0,0 +1,160 @@
+"""
+Active-channel quota and channel tags.
+
+The number of active channels is kept in a ``channel_quotas`` counter row,
+one per tenant, that every add and removal adjusts in the same transaction
+as the channel itself. Enforcing the limit is then a primary-key read and a
+conditional UPDATE instead of a COUNT(*) over ``channels`` on every add.
+The limit is the row's own ``max_active_channels`` when set, otherwise the
+``MAX_ACTIVE_CHANNELS`` setting; 0 means unlimited.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.models.channel import Channel
+from app.models.channel_quota import ChannelQuota
+from app.models.channel_tag import ChannelTag
+
+logger = logging.getLogger(__name__)
+
+MAX_TAG_LENGTH = 64
+
+
+@dataclass(frozen=True)
+class RegistryConfig:
+    max_active_channels: int = 10
+    tenant: str = "default"
+
+    @classmethod
+    def from_env(cls) -> "RegistryConfig":
+        return cls(
+            max_active_channels=int(
+                os.getenv("MAX_ACTIVE_CHANNELS", str(cls.max_active_channels))
+            ),
+            tenant=os.getenv("CHANNEL_TENANT", cls.tenant),
+        )
+
+
+class ChannelLimitError(Exception):
+    """Raised when adding channels would exceed the active-channel limit."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        super().__init__(f"Maximum of {limit} channels allowed.")
+
+
+def normalize_tags(tags: Iterable[str]) -> List[str]:
+    """Lower-case, strip and deduplicate tags; blank tags are dropped."""
+    normalized = set()
+    for tag in tags:
+        tag = tag.strip().lower()
+        if not tag:
+            continue
+        if len(tag) > MAX_TAG_LENGTH:
+            raise ValueError(f"Tags are limited to {MAX_TAG_LENGTH} characters")
+        normalized.add(tag)
+    return sorted(normalized)
+
+
+class ChannelRegistry:
+    """Enforce the active-channel quota and manage channel tags."""
+
+    def __init__(self, db: Session, config: Optional[RegistryConfig] = None):
+        self.db = db
+        self.config = config or RegistryConfig.from_env()
+
+    def quota(self) -> ChannelQuota:
+        """
+        Return the tenant's counter row, creating it from a COUNT query the
+        first time it is needed.
+        """
+        quota = self.db.get(ChannelQuota, self.config.tenant)
+        if quota is not None:
+            return quota
+
+        quota = ChannelQuota(tenant=self.config.tenant, active_channels=self._count())
+        self.db.add(quota)
+        self.db.flush()
+        logger.info(f"Backfilled channel quota for tenant {self.config.tenant}")
+        return quota
+
+    def limit(self) -> Optional[int]:
+        """The active-channel limit, or None when unlimited."""
+        quota = self.quota()
+        override: Optional[int] = quota.max_active_channels  # type: ignore[assignment]
+        limit = self.config.max_active_channels if override is None else override
+        return int(limit) or None
+
+    def active(self) -> int:
+        return int(self.quota().active_channels)
+
+    def available(self) -> Optional[int]:
+        """Channels that can still be added, or None when unlimited."""
+        limit = self.limit()
+        if limit is None:
+            return None
+        return max(0, limit - self.active())
+
+    def reserve(self, count: int = 1) -> None:
+        """
+        Count ``count`` newly active channels against the limit.
+
+        The check and the increment are one conditional UPDATE, so
+        concurrent adds cannot both take the last slot.
+
+        Raises:
+            ChannelLimitError: If the channels do not fit
+        """
+        limit = self.limit()
+        statement = update(ChannelQuota).where(
+            ChannelQuota.tenant == self.config.tenant
+        )
+        if limit is not None:
+            statement = statement.where(ChannelQuota.active_channels + count <= limit)
+        result = self.db.execute(
+            statement.values(active_channels=ChannelQuota.active_channels + count),
+            execution_options={"synchronize_session": False},
+        )
+        self.db.expire(self.quota(), ["active_channels"])
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            raise ChannelLimitError(limit or 0)
+
+    def release(self, count: int = 1) -> None:
+        """Return ``count`` deactivated channels to the quota."""
+        quota = self.quota()
+        self.db.execute(
+            update(ChannelQuota)
+            .where(ChannelQuota.tenant == self.config.tenant)
+            .values(active_channels=ChannelQuota.active_channels - count),
+            execution_options={"synchronize_session": False},
+        )
+        self.db.expire(quota, ["active_channels"])
+
+    def recount(self) -> int:
+        """Rebuild the counter from the channels table."""
+        quota = self.quota()
+        quota.active_channels = self._count()  # type: ignore[assignment]
+        self.db.flush()
+        return int(quota.active_channels)
+
+    def set_tags(self, channel: Channel, tags: Iterable[str]) -> None:
+        """Replace the channel's tags, keeping rows for tags it already has."""
+        wanted = normalize_tags(tags)
+        kept = [row for row in channel.tag_rows if row.tag in wanted]
+        current = {row.tag for row in kept}
+        channel.tag_rows = kept + [
+            ChannelTag(tag=tag) for tag in wanted if tag not in current
+        ]
+
+    def _count(self) -> int:
+        return int(
+            self.db.query(func.count(Channel.id))
+            .filter(Channel.is_active.is_(True))
+            .scalar()
+        )
@@ -0,0 +1,116 @@
+import logging
+from typing import Dict, Mapping, Optional
+
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+
+from app.models.channel_stats import EVENT_COUNT_COLUMNS, ChannelStats
+from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.video import Video
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelStatsService:
+    """Maintain per-channel aggregate counters as deltas from scan diffs."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def ensure(self, channel_id: str) -> ChannelStats:
+        """
+        Return the stats row for a channel, backfilling it with COUNT queries
+        the first time it is requested.
+
+        The row is flushed so later delta updates in the same transaction
+        apply to it.
+        """
+        stats = self.db.get(ChannelStats, channel_id)
+        if stats is not None:
+            return stats
+
+        stats = ChannelStats(channel_id=channel_id, **self._count(channel_id))
+        self.db.add(stats)
+        self.db.flush()
+        logger.info(f"Backfilled channel stats for {channel_id}")
+        return stats
+
+    def recompute(self, channel_id: str) -> ChannelStats:
+        """Rebuild the stats row for a channel from the source tables."""
+        stats = self.db.get(ChannelStats, channel_id)
+        counts = self._count(channel_id)
+        if stats is None:
+            stats = ChannelStats(channel_id=channel_id, **counts)
+            self.db.add(stats)
+        else:
+            for column, value in counts.items():
+                setattr(stats, column, value)
+        self.db.flush()
+        return stats
+
+    def apply_scan_delta(
+        self,
+        channel_id: str,
+        added: int = 0,
+        reappeared: int = 0,
+        disappeared: int = 0,
+        events_by_type: Optional[Mapping[EventType, int]] = None,
+    ) -> None:
+        """
+        Apply the outcome of a scan as a single atomic UPDATE.
+
+        Must run in the same transaction as the scan's own writes so the
+        counters never drift from the rows they describe.
+        """
+        values: Dict[str, object] = {}
+        if added:
+            values["total_videos"] = ChannelStats.total_videos + added
+        available_delta = added + reappeared - disappeared
+        if available_delta:
+            values["available_videos"] = ChannelStats.available_videos + available_delta
+        missing_delta = disappeared - reappeared
+        if missing_delta:
+            values["missing_videos"] = ChannelStats.missing_videos + missing_delta
+        for event_type, count in (events_by_type or {}).items():
+            if count:
+                column = EVENT_COUNT_COLUMNS[event_type]
+                values[column] = getattr(ChannelStats, column) + count
+
+        if not values:
+            return
+
+        self.db.execute(
+            update(ChannelStats)
+            .where(ChannelStats.channel_id == channel_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _count(self, channel_id: str) -> Dict[str, int]:
+        total, available = (
+            self.db.query(
+                func.count(Video.id),
+                func.coalesce(func.sum(case((Video.is_available.is_(True), 1))), 0),
+            )
+            .filter(Video.channel_id == channel_id)
+            .one()
+        )
+
+        counts = {
+            "total_videos": total or 0,
+            "available_videos": available or 0,
+            "missing_videos": (total or 0) - (available or 0),
+        }
+        counts.update({column: 0 for column in EVENT_COUNT_COLUMNS.values()})
+
+        event_counts = (
+            self.db.query(DisappearanceEvent.event_type, func.count())
+            .join(Video, Video.video_id == DisappearanceEvent.video_id)
+            .filter(Video.channel_id == channel_id)
+            .group_by(DisappearanceEvent.event_type)
+            .all()
+        )
+        for event_type, count in event_counts:
+            counts[EVENT_COUNT_COLUMNS[event_type]] = count
+
+        return counts
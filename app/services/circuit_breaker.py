@@ -0,0 +1,272 @@
+"""
+Circuit breaker for the YouTube Data API.
+
+The breaker opens in two situations:
+
+* quota exhaustion: no request can succeed until the daily quota resets at
+  midnight Pacific time, so the circuit stays open until then;
+* repeated server errors: after ``failure_threshold`` consecutive 5xx
+  responses the circuit opens for ``cooldown_seconds``.
+
+Once the open period ends the breaker is half-open and lets a single probe
+request through. Success closes it; another failure opens it again. State
+is kept in Redis when available so every worker fails fast together, and
+in process memory otherwise.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from app.core.metrics import YOUTUBE_CIRCUIT_TRANSITIONS_TOTAL
+from app.core.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+REASON_QUOTA = "quota_exhausted"
+REASON_SERVER_ERRORS = "server_errors"
+
+STATE_KEY = "circuit:youtube"
+PROBE_KEY = "circuit:youtube:probe"
+
+# Used only if the system has no time zone database; ignores DST, so the
+# reset may be detected up to an hour late in summer.
+PACIFIC_STANDARD_TIME = timezone(timedelta(hours=-8))
+
+
+def next_quota_reset(now: Optional[datetime] = None) -> datetime:
+    """Return the next midnight in US Pacific time, when API quota resets."""
+    try:
+        from zoneinfo import ZoneInfo
+
+        pacific: Any = ZoneInfo("America/Los_Angeles")
+    except Exception:
+        pacific = PACIFIC_STANDARD_TIME
+
+    local = (now or datetime.now(timezone.utc)).astimezone(pacific)
+    midnight = datetime.combine(
+        local.date() + timedelta(days=1), datetime.min.time(), tzinfo=pacific
+    )
+    return midnight.astimezone(timezone.utc)
+
+
+@dataclass
+class BreakerState:
+    state: str = CLOSED
+    reason: Optional[str] = None
+    open_until: float = 0.0
+    failures: int = 0
+
+
+class InProcessBreakerStore:
+    def __init__(self) -> None:
+        self._state = BreakerState()
+        self._probe_until = 0.0
+        self._lock = threading.Lock()
+
+    def load(self) -> BreakerState:
+        with self._lock:
+            return BreakerState(**asdict(self._state))
+
+    def save(self, state: BreakerState) -> None:
+        with self._lock:
+            self._state = BreakerState(**asdict(state))
+
+    def add_failure(self) -> int:
+        with self._lock:
+            self._state.failures += 1
+            return self._state.failures
+
+    def claim_probe(self, ttl: float) -> bool:
+        with self._lock:
+            now = time.time()
+            if now < self._probe_until:
+                return False
+            self._probe_until = now + ttl
+            return True
+
+    def release_probe(self) -> None:
+        with self._lock:
+            self._probe_until = 0.0
+
+
+class RedisBreakerStore:
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def load(self) -> BreakerState:
+        raw = self.client.hgetall(STATE_KEY) or {}
+        values = {
+            (k.decode() if isinstance(k, bytes) else k): (
+                v.decode() if isinstance(v, bytes) else v
+            )
+            for k, v in raw.items()
+        }
+        return BreakerState(
+            state=values.get("state", CLOSED),
+            reason=values.get("reason") or None,
+            open_until=float(values.get("open_until", 0.0)),
+            failures=int(values.get("failures", 0)),
+        )
+
+    def save(self, state: BreakerState) -> None:
+        self.client.hset(
+            STATE_KEY,
+            mapping={
+                "state": state.state,
+                "reason": state.reason or "",
+                "open_until": state.open_until,
+                "failures": state.failures,
+            },
+        )
+
+    def add_failure(self) -> int:
+        return int(self.client.hincrby(STATE_KEY, "failures", 1))
+
+    def claim_probe(self, ttl: float) -> bool:
+        return bool(self.client.set(PROBE_KEY, "1", nx=True, ex=max(1, int(ttl))))
+
+    def release_probe(self) -> None:
+        self.client.delete(PROBE_KEY)
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        store: Optional[Any] = None,
+        failure_threshold: int = 5,
+        cooldown_seconds: float = 60.0,
+        probe_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.store = store or InProcessBreakerStore()
+        self.local_store = InProcessBreakerStore()
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.clock = clock
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        client = get_redis_client()
+        return cls(
+            store=RedisBreakerStore(client) if client is not None else None,
+            failure_threshold=int(os.getenv("YOUTUBE_BREAKER_FAILURE_THRESHOLD", "5")),
+            cooldown_seconds=float(os.getenv("YOUTUBE_BREAKER_COOLDOWN_SECONDS", "60")),
+        )
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Run a store operation, falling back to local state if Redis fails."""
+        try:
+            return getattr(self.store, method)(*args)
+        except Exception as e:
+            logger.warning(f"Circuit breaker store failed, using local state: {e}")
+            return getattr(self.local_store, method)(*args)
+
+    def _transition(self, state: BreakerState, new_state: str) -> None:
+        if state.state != new_state:
+            logger.warning(
+                f"YouTube API circuit {state.state} -> {new_state}"
+                + (f" ({state.reason})" if state.reason else "")
+            )
+            YOUTUBE_CIRCUIT_TRANSITIONS_TOTAL.inc(state=new_state)
+        state.state = new_state
+        self._call("save", state)
+
+    def is_open(self) -> bool:
+        """True while requests are being rejected (does not claim a probe)."""
+        state = self._call("load")
+        return bool(state.state == OPEN and self.clock() < state.open_until)
+
+    def allow(self) -> bool:
+        """
+        Return whether a request may be sent now.
+
+        After the open period only one caller at a time is let through as a
+        half-open probe; the others keep failing fast until it reports back.
+        """
+        state = self._call("load")
+        if state.state == CLOSED:
+            return True
+        if state.state == OPEN and self.clock() < state.open_until:
+            return False
+        if state.state == OPEN:
+            self._transition(state, HALF_OPEN)
+        return bool(self._call("claim_probe", self.probe_timeout_seconds))
+
+    def record_success(self) -> None:
+        state = self._call("load")
+        if state.state == CLOSED and state.failures == 0:
+            return
+        if state.state != CLOSED:
+            self._call("release_probe")
+        state.reason = None
+        state.open_until = 0.0
+        state.failures = 0
+        self._transition(state, CLOSED)
+
+    def record_server_error(self) -> None:
+        failures = self._call("add_failure")
+        state = self._call("load")
+        if state.state == HALF_OPEN or failures >= self.failure_threshold:
+            self._open(
+                state, REASON_SERVER_ERRORS, self.clock() + self.cooldown_seconds
+            )
+
+    def record_quota_exhausted(self) -> None:
+        state = self._call("load")
+        self._open(state, REASON_QUOTA, next_quota_reset().timestamp())
+
+    def _open(self, state: BreakerState, reason: str, until: float) -> None:
+        self._call("release_probe")
+        state.reason = reason
+        state.open_until = until
+        self._transition(state, OPEN)
+
+    def status(self) -> Dict[str, Any]:
+        """Breaker state for health checks."""
+        state = self._call("load")
+        current = state.state
+        if current == OPEN and self.clock() >= state.open_until:
+            current = HALF_OPEN
+        open_until = None
+        if state.state == OPEN:
+            open_until = datetime.fromtimestamp(
+                state.open_until, timezone.utc
+            ).isoformat()
+        return {
+            "state": current,
+            "reason": state.reason,
+            "open_until": open_until,
+            "consecutive_failures": state.failures,
+            "shared": isinstance(self.store, RedisBreakerStore),
+        }
+
+
+_circuit_breaker: Optional[CircuitBreaker] = None
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Return the process-wide YouTube API circuit breaker."""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        with _circuit_breaker_lock:
+            if _circuit_breaker is None:
+                _circuit_breaker = CircuitBreaker.from_env()
+    return _circuit_breaker
+
+
+def reset_circuit_breaker() -> None:
+    """Drop the process-wide breaker so the next call rebuilds it (tests)."""
+    global _circuit_breaker
+    with _circuit_breaker_lock:
+        _circuit_breaker = None
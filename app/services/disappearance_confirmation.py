@@ -0,0 +1,112 @@
+"""
+Debounced confirmation of disappearances.
+
+A video missing from one playlist walk is not necessarily gone: a failed
+``videos.list`` batch or a glitch in the page walk makes every video on
+the page look missing at once. Instead of recording events straight away,
+a missing video becomes SUSPECTED (``Video.missed_scans`` above zero) and
+is confirmed only when
+
+* a direct ``videos.list`` probe does not return it as public, or
+* the probe cannot be made and it has been missing from
+  ``confirm_after_misses`` consecutive scans.
+
+A suspect that turns up again, in the probe or in a later walk, is cleared
+without an event, a Slack alert or a reappearance.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from app.core.metrics import DISAPPEARANCE_SUSPICIONS_TOTAL
+from app.models.disappearance_event import EventType
+from app.models.video import Video
+from app.services.youtube_client import YouTubeClient
+
+logger = logging.getLogger(__name__)
+
+SUSPECTED = "suspected"
+CONFIRMED = "confirmed"
+CLEARED = "cleared"
+
+
+@dataclass(frozen=True)
+class ConfirmationConfig:
+    confirm_after_misses: int = 2
+    probe: bool = True
+
+    @classmethod
+    def from_env(cls) -> "ConfirmationConfig":
+        return cls(
+            confirm_after_misses=max(
+                1,
+                int(
+                    os.getenv(
+                        "DISAPPEARANCE_CONFIRM_MISSES", str(cls.confirm_after_misses)
+                    )
+                ),
+            ),
+            probe=os.getenv("DISAPPEARANCE_PROBE", "true").lower() == "true",
+        )
+
+
+class DisappearanceConfirmer:
+    def __init__(
+        self, youtube_client: YouTubeClient, config: Optional[ConfirmationConfig] = None
+    ):
+        self.youtube_client = youtube_client
+        self.config = config or ConfirmationConfig.from_env()
+
+    def resolve(self, suspects: List[Video]) -> Dict[str, EventType]:
+        """
+        Count a miss for each suspect and decide which are really gone.
+
+        Returns the confirmed disappearances by video ID with their event
+        type. Cleared suspects have their miss count reset; the rest stay
+        suspected until a later scan.
+        """
+        if not suspects:
+            return {}
+
+        for video in suspects:
+            misses = (video.missed_scans or 0) + 1
+            video.missed_scans = misses  # type: ignore[assignment]
+
+        probed = self._probe([str(video.video_id) for video in suspects])
+
+        confirmed: Dict[str, EventType] = {}
+        for video in suspects:
+            video_id = str(video.video_id)
+            if probed is not None:
+                detail = probed.get(video_id)
+                privacy = (
+                    detail.get("status", {}).get("privacyStatus") if detail else None
+                )
+                if detail and privacy != "private":
+                    video.missed_scans = 0  # type: ignore[assignment]
+                    DISAPPEARANCE_SUSPICIONS_TOTAL.inc(outcome=CLEARED)
+                    continue
+                confirmed[video_id] = (
+                    EventType.PRIVATE if privacy == "private" else EventType.UNKNOWN
+                )
+            elif video.missed_scans >= self.config.confirm_after_misses:
+                confirmed[video_id] = EventType.UNKNOWN
+            else:
+                DISAPPEARANCE_SUSPICIONS_TOTAL.inc(outcome=SUSPECTED)
+                continue
+            DISAPPEARANCE_SUSPICIONS_TOTAL.inc(outcome=CONFIRMED)
+
+        return confirmed
+
+    def _probe(self, video_ids: List[str]) -> Optional[Dict[str, Dict]]:
+        """Return the probed videos by ID, or None if no probe was made."""
+        if not self.config.probe:
+            return None
+        try:
+            probed = self.youtube_client.probe_videos(video_ids)
+        except Exception as e:
+            logger.warning(f"Probe of {len(video_ids)} missing videos failed: {e}")
+            return None
+        return probed if isinstance(probed, dict) else None
@@ -0,0 +1,204 @@
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.disappearance_rollup import DisappearanceRollup
+from app.models.video import Video
+
+logger = logging.getLogger(__name__)
+
+BUCKETS = ("hour", "day")
+
+RollupKey = Tuple[str, EventType, str, datetime]
+
+
+def bucket_start(timestamp: datetime, bucket: str) -> datetime:
+    """Truncate a timestamp to the start of its UTC hour or day bucket."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    timestamp = timestamp.astimezone(timezone.utc)
+
+    if bucket == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if bucket == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unsupported rollup bucket: {bucket}")
+
+
+class EventRollupService:
+    """Maintain hourly and daily disappearance event counts per channel."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_events(self, events: Iterable[Tuple[str, EventType, datetime]]) -> None:
+        """
+        Increment rollup counters for newly inserted events.
+
+        Events are aggregated in memory first so a scan that detects many
+        disappearances issues one upsert per bucket rather than per event.
+        """
+        increments: Counter[RollupKey] = Counter()
+        for channel_id, event_type, detected_at in events:
+            for bucket in BUCKETS:
+                key = (
+                    channel_id,
+                    event_type,
+                    bucket,
+                    bucket_start(detected_at, bucket),
+                )
+                increments[key] += 1
+
+        for key, count in increments.items():
+            self._increment(key, count)
+
+    def backfill(self, channel_id: Optional[str] = None) -> int:
+        """
+        Rebuild rollups from the disappearance_events table.
+
+        Returns the number of events that were rolled up.
+        """
+        delete_query = self.db.query(DisappearanceRollup)
+        events_query = self.db.query(
+            Video.channel_id,
+            DisappearanceEvent.event_type,
+            DisappearanceEvent.detected_at,
+        ).join(Video, Video.video_id == DisappearanceEvent.video_id)
+
+        if channel_id:
+            delete_query = delete_query.filter(
+                DisappearanceRollup.channel_id == channel_id
+            )
+            events_query = events_query.filter(Video.channel_id == channel_id)
+
+        delete_query.delete(synchronize_session=False)
+
+        counts: Counter[RollupKey] = Counter()
+        processed = 0
+        for row_channel_id, event_type, detected_at in events_query.yield_per(1000):
+            processed += 1
+            for bucket in BUCKETS:
+                counts[
+                    (
+                        row_channel_id,
+                        event_type,
+                        bucket,
+                        bucket_start(detected_at, bucket),
+                    )
+                ] += 1
+
+        self.db.add_all(
+            DisappearanceRollup(
+                channel_id=key_channel_id,
+                event_type=event_type,
+                bucket=bucket,
+                bucket_start=start,
+                count=count,
+            )
+            for (key_channel_id, event_type, bucket, start), count in counts.items()
+        )
+        self.db.flush()
+
+        logger.info(
+            f"Backfilled {len(counts)} rollup rows from {processed} events"
+            + (f" for channel {channel_id}" if channel_id else "")
+        )
+        return processed
+
+    def timeseries(
+        self,
+        bucket: str = "day",
+        channel_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return event counts per bucket and event type, oldest first."""
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unsupported rollup bucket: {bucket}")
+
+        query = self.db.query(
+            DisappearanceRollup.bucket_start,
+            DisappearanceRollup.event_type,
+            func.sum(DisappearanceRollup.count),
+        ).filter(DisappearanceRollup.bucket == bucket)
+
+        if channel_id:
+            query = query.filter(DisappearanceRollup.channel_id == channel_id)
+        if event_type:
+            query = query.filter(DisappearanceRollup.event_type == event_type)
+        if since:
+            query = query.filter(
+                DisappearanceRollup.bucket_start >= bucket_start(since, bucket)
+            )
+        if until:
+            query = query.filter(DisappearanceRollup.bucket_start <= until)
+
+        rows = (
+            query.group_by(
+                DisappearanceRollup.bucket_start, DisappearanceRollup.event_type
+            )
+            .order_by(DisappearanceRollup.bucket_start, DisappearanceRollup.event_type)
+            .all()
+        )
+
+        return [
+            {"bucket_start": start, "event_type": row_event_type, "count": int(count)}
+            for start, row_event_type, count in rows
+        ]
+
+    def _increment(self, key: RollupKey, count: int) -> None:
+        channel_id, event_type, bucket, start = key
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            from sqlalchemy.dialects import postgresql, sqlite
+
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            statement = insert(DisappearanceRollup).values(
+                channel_id=channel_id,
+                event_type=event_type,
+                bucket=bucket,
+                bucket_start=start,
+                count=count,
+            )
+            self.db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[
+                        "channel_id",
+                        "event_type",
+                        "bucket",
+                        "bucket_start",
+                    ],
+                    set_={"count": DisappearanceRollup.count + count},
+                )
+            )
+            return
+
+        result = self.db.execute(
+            update(DisappearanceRollup)
+            .where(
+                DisappearanceRollup.channel_id == channel_id,
+                DisappearanceRollup.event_type == event_type,
+                DisappearanceRollup.bucket == bucket,
+                DisappearanceRollup.bucket_start == start,
+            )
+            .values(count=DisappearanceRollup.count + count)
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:  # type: ignore[attr-defined]
+            self.db.add(
+                DisappearanceRollup(
+                    channel_id=channel_id,
+                    event_type=event_type,
+                    bucket=bucket,
+                    bucket_start=start,
+                    count=count,
+                )
+            )
+            self.db.flush()
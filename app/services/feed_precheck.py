@@ -0,0 +1,208 @@
+"""
+Zero-quota change detection from a channel's public Atom feed.
+
+``https://www.youtube.com/feeds/videos.xml?channel_id=...`` lists a
+channel's most recent public uploads without touching Data API quota.
+Before a scheduled scan the feed is streamed through an incremental XML
+parser and its video IDs are compared with the database:
+
+* a feed video we have never seen (or have marked unavailable) means a
+  new upload or a reappearance;
+* a video we consider available that was published inside the feed's
+  window but is missing from it has probably gone private or been deleted.
+
+Only then does the full ``fetch_channel_videos`` scan run. The feed only
+covers the newest uploads, so disappearances of older videos are caught
+by a full scan that is forced every ``full_check_hours`` regardless; that
+scan walks the whole playlist even when the uploads fingerprint is unchanged.
+"""
+
+import logging
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, cast
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.metrics import FEED_PRECHECK_TOTAL
+from app.models.channel import Channel
+from app.models.scan_run import ScanRun
+from app.models.video import Video
+
+logger = logging.getLogger(__name__)
+
+FEED_URL = "https://www.youtube.com/feeds/videos.xml"
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+YT_NS = "{http://www.youtube.com/xml/schemas/2015}"
+
+UNCHANGED = "unchanged"
+NEW_VIDEOS = "new_videos"
+MISSING_VIDEOS = "missing_videos"
+FULL_CHECK_DUE = "full_check_due"
+FEED_UNAVAILABLE = "feed_unavailable"
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    video_id: str
+    published_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class FeedDecision:
+    scan: bool
+    reason: str
+
+
+@dataclass(frozen=True)
+class FeedConfig:
+    enabled: bool = True
+    url: str = FEED_URL
+    full_check_hours: float = 24.0
+    timeout_seconds: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "FeedConfig":
+        return cls(
+            enabled=os.getenv("FEED_PRECHECK", "true").lower() == "true",
+            url=os.getenv("FEED_URL", cls.url),
+            full_check_hours=float(
+                os.getenv("FEED_FULL_CHECK_HOURS", str(cls.full_check_hours))
+            ),
+            timeout_seconds=float(
+                os.getenv("FEED_TIMEOUT_SECONDS", str(cls.timeout_seconds))
+            ),
+        )
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_feed(chunks: Iterable[bytes]) -> List[FeedEntry]:
+    """
+    Parse Atom feed bytes incrementally into entries.
+
+    Each ``<entry>`` is cleared once read so memory stays flat however
+    large the document is.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    entries: List[FeedEntry] = []
+
+    def drain() -> None:
+        events = cast(Iterator[Tuple[str, ET.Element]], parser.read_events())
+        for _, element in events:
+            if element.tag != f"{ATOM_NS}entry":
+                continue
+            video_id = element.findtext(f"{YT_NS}videoId")
+            if video_id:
+                entries.append(
+                    FeedEntry(
+                        video_id=video_id.strip(),
+                        published_at=_parse_datetime(
+                            element.findtext(f"{ATOM_NS}published")
+                        ),
+                    )
+                )
+            element.clear()
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        drain()
+    parser.close()
+    drain()
+    return entries
+
+
+def fetch_feed(channel_id: str, config: FeedConfig) -> List[FeedEntry]:
+    """Stream and parse a channel's uploads feed."""
+    import httpx
+
+    with httpx.Client(timeout=config.timeout_seconds) as client:
+        with client.stream(
+            "GET", config.url, params={"channel_id": channel_id}
+        ) as response:
+            response.raise_for_status()
+            return parse_feed(response.iter_bytes())
+
+
+class FeedPrecheck:
+    def __init__(
+        self,
+        db: Session,
+        config: Optional[FeedConfig] = None,
+        fetch: Optional[Callable[[str, FeedConfig], List[FeedEntry]]] = None,
+    ):
+        self.db = db
+        self.config = config or FeedConfig.from_env()
+        self.fetch = fetch or fetch_feed
+
+    def last_full_scan_at(self, channel_id: str) -> Optional[datetime]:
+        last = (
+            self.db.query(func.max(ScanRun.started_at))
+            .filter(ScanRun.channel_id == channel_id, ScanRun.status == "succeeded")
+            .scalar()
+        )
+        if last is not None and last.tzinfo is None:
+            last = last.replace(tzinfo=timezone.utc)
+        return last  # type: ignore[no-any-return]
+
+    def check(self, channel: Channel, now: Optional[datetime] = None) -> FeedDecision:
+        """Decide whether ``channel`` needs a full Data API scan."""
+        decision = self._decide(channel, now or datetime.now(timezone.utc))
+        FEED_PRECHECK_TOTAL.inc(result=decision.reason)
+        return decision
+
+    def _decide(self, channel: Channel, now: datetime) -> FeedDecision:
+        channel_id = str(channel.channel_id)
+
+        last_full_scan = self.last_full_scan_at(channel_id)
+        if last_full_scan is None or now - last_full_scan >= timedelta(
+            hours=self.config.full_check_hours
+        ):
+            return FeedDecision(scan=True, reason=FULL_CHECK_DUE)
+
+        try:
+            entries = self.fetch(channel_id, self.config)
+        except Exception as e:
+            logger.warning(f"Feed pre-check failed for channel {channel_id}: {e}")
+            return FeedDecision(scan=True, reason=FEED_UNAVAILABLE)
+
+        feed_ids = {entry.video_id for entry in entries}
+        if feed_ids:
+            known_available = {
+                video_id
+                for (video_id,) in self.db.query(Video.video_id).filter(
+                    Video.channel_id == channel_id,
+                    Video.video_id.in_(feed_ids),
+                    Video.is_available.is_(True),
+                )
+            }
+            if feed_ids - known_available:
+                return FeedDecision(scan=True, reason=NEW_VIDEOS)
+
+        # Videos we think are public and that are recent enough to be in
+        # the feed's window, yet are not listed.
+        published = [e.published_at for e in entries if e.published_at is not None]
+        window_start = min(published) if published else None
+        query = self.db.query(Video.video_id).filter(
+            Video.channel_id == channel_id, Video.is_available.is_(True)
+        )
+        if window_start is not None:
+            query = query.filter(Video.published_at >= window_start)
+        if feed_ids:
+            query = query.filter(Video.video_id.notin_(feed_ids))
+        if query.first() is not None:
+            return FeedDecision(scan=True, reason=MISSING_VIDEOS)
+
+        return FeedDecision(scan=False, reason=UNCHANGED)
@@ -0,0 +1,167 @@
+"""
+Redis lease-based leader election for the background scheduler.
+
+Every uvicorn worker and every machine builds its own scheduler, but only
+the process holding the ``scheduler:leader`` lease runs the scheduled jobs;
+the rest stand by. The leader renews the lease every
+``LEADER_RENEW_SECONDS`` and standbys campaign on the same interval, so when
+a leader dies without releasing the lease another process takes over once it
+expires: within ``LEADER_LEASE_SECONDS`` plus one renewal interval. A leader
+that shuts down cleanly releases the lease for the next campaign to pick up.
+
+A leader only trusts its lease for ``LEADER_LEASE_SECONDS`` after the last
+successful renewal, measured on its own clock, and steps down as soon as a
+renewal fails, so two processes never both believe they lead for longer
+than a single job tick. Without Redis there is nothing to coordinate
+through and the process always leads.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from app.core.metrics import SCHEDULER_LEADER
+
+logger = logging.getLogger(__name__)
+
+LEADER_KEY = "scheduler:leader"
+
+# Take the lease if it is free, extend it if we already hold it.
+CAMPAIGN_SCRIPT = """
+local current = redis.call("GET", KEYS[1])
+if not current then
+    redis.call("SET", KEYS[1], ARGV[1], "PX", ARGV[2])
+    return 1
+end
+if current == ARGV[1] then
+    redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class LeaderConfig:
+    lease_seconds: float = 30.0
+    renew_seconds: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "LeaderConfig":
+        lease = float(os.getenv("LEADER_LEASE_SECONDS", str(cls.lease_seconds)))
+        renew = float(os.getenv("LEADER_RENEW_SECONDS", str(lease / 3)))
+        # Renewing less than twice per lease lets it lapse between renewals.
+        return cls(lease_seconds=lease, renew_seconds=min(renew, lease / 2))
+
+
+def process_identity() -> str:
+    """Lease token naming this process: host, pid and a random suffix."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderElector:
+    """Hold or wait for the scheduler leader lease."""
+
+    def __init__(
+        self,
+        client: Optional[Any],
+        config: Optional[LeaderConfig] = None,
+        identity: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.config = config or LeaderConfig.from_env()
+        self.identity = identity or process_identity()
+        self.clock = clock
+        self._leader = False
+        self._valid_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        if self.client is None:
+            return True
+        with self._lock:
+            return self._leader and self.clock() < self._valid_until
+
+    def campaign(self) -> bool:
+        """Acquire or renew the lease; True while this process leads."""
+        if self.client is None:
+            return True
+
+        started = self.clock()
+        try:
+            won = bool(
+                self.client.eval(
+                    CAMPAIGN_SCRIPT,
+                    1,
+                    LEADER_KEY,
+                    self.identity,
+                    int(self.config.lease_seconds * 1000),
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Scheduler lease campaign failed, standing by: {e}")
+            won = False
+
+        with self._lock:
+            self._valid_until = started + self.config.lease_seconds if won else 0.0
+            self._transition(won)
+        return won
+
+    def release(self) -> None:
+        """Give up the lease so a standby can take over without waiting."""
+        if self.client is None:
+            return
+
+        with self._lock:
+            self._valid_until = 0.0
+            self._transition(False)
+        try:
+            self.client.eval(RELEASE_SCRIPT, 1, LEADER_KEY, self.identity)
+        except Exception as e:
+            logger.warning(f"Could not release scheduler lease: {e}")
+
+    def holder(self) -> Optional[str]:
+        """Identity of the current lease holder, if known."""
+        if self.client is None:
+            return self.identity
+        try:
+            value = self.client.get(LEADER_KEY)
+        except Exception:
+            return None
+        if isinstance(value, bytes):
+            return value.decode("utf-8", "replace")
+        return str(value) if value is not None else None
+
+    def status(self) -> Dict[str, Any]:
+        """Leadership state for health checks."""
+        return {
+            "leader": self.is_leader,
+            "identity": self.identity,
+            "holder": self.holder(),
+            "shared": self.client is not None,
+            "lease_seconds": self.config.lease_seconds,
+            "renew_seconds": self.config.renew_seconds,
+        }
+
+    def _transition(self, leader: bool) -> None:
+        if leader != self._leader:
+            if leader:
+                logger.info(f"Scheduler leader lease acquired by {self.identity}")
+            else:
+                logger.info(f"Scheduler leader lease lost by {self.identity}")
+        self._leader = leader
+        SCHEDULER_LEADER.set(1 if leader else 0)
@@ -0,0 +1,182 @@
+"""
+Client-side token-bucket rate limiting for YouTube Data API calls.
+
+Every request takes a token from the bucket for its operation before it is
+sent. Buckets live in Redis (updated atomically by a Lua script using the
+server clock) so all workers share one budget; without Redis each process
+keeps its own buckets.
+
+Tokens are reserved rather than polled: a caller that finds the bucket
+empty takes the token anyway, driving the balance negative, and sleeps
+until it would have refilled. Concurrent callers therefore queue in
+arrival order with one round trip each instead of retrying in a loop.
+
+Limits are configured with ``YOUTUBE_RATE_LIMITS`` as comma-separated
+``operation=rate:burst`` pairs, where rate is requests per second and the
+operation is the call's label in snake case (``fetch_playlist_items``,
+``search_by_handle``, ...). ``default`` applies to unlisted operations and
+``off`` disables limiting.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.metrics import YOUTUBE_RATE_LIMIT_WAIT_SECONDS
+from app.core.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMITS = "default=10:20"
+KEY_PREFIX = "rate_limit:youtube:"
+
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate) - requested
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+if tokens >= 0 then
+    return "0"
+end
+return tostring(-tokens / rate)
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    rate: float
+    burst: float
+
+
+def operation_key(operation: str) -> str:
+    """Normalise an operation label (``"fetch playlist items"``) to a key."""
+    return "_".join(operation.lower().split()) or "default"
+
+
+def parse_rate_limits(spec: str) -> Dict[str, RateLimit]:
+    """Parse ``operation=rate:burst`` pairs; an empty dict disables limiting."""
+    spec = spec.strip()
+    if spec.lower() in ("", "off", "none"):
+        return {}
+
+    limits = {}
+    for item in spec.split(","):
+        operation, _, values = item.partition("=")
+        rate, _, burst = values.partition(":")
+        if not operation.strip() or not rate:
+            raise ValueError(f"Invalid rate limit {item!r}, expected op=rate:burst")
+        limit = RateLimit(rate=float(rate), burst=float(burst or rate))
+        if limit.rate <= 0 or limit.burst < 1:
+            raise ValueError(f"Invalid rate limit {item!r}: rate and burst must be >0")
+        limits[operation_key(operation)] = limit
+    return limits
+
+
+class InProcessTokenBuckets:
+    """Token buckets held in this process, used when Redis is unavailable."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, limit: RateLimit, tokens: float = 1.0) -> float:
+        """Take ``tokens`` and return how long the caller must wait first."""
+        with self._lock:
+            now = self.clock()
+            available, updated = self._buckets.get(key, (limit.burst, now))
+            available = min(
+                limit.burst, available + max(0.0, now - updated) * limit.rate
+            )
+            available -= tokens
+            self._buckets[key] = (available, now)
+        return max(0.0, -available / limit.rate)
+
+
+class RedisTokenBuckets:
+    """Token buckets shared by every process through a Redis Lua script."""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def reserve(self, key: str, limit: RateLimit, tokens: float = 1.0) -> float:
+        wait = self._script(
+            keys=[KEY_PREFIX + key], args=[limit.rate, limit.burst, tokens]
+        )
+        if isinstance(wait, bytes):
+            wait = wait.decode()
+        return float(wait)
+
+
+class RateLimiter:
+    """Pace calls per operation, sharing buckets through Redis when possible."""
+
+    def __init__(
+        self,
+        limits: Dict[str, RateLimit],
+        redis_client: Optional[Any] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.limits = limits
+        self.sleep = sleep
+        self.local = InProcessTokenBuckets()
+        self.shared = RedisTokenBuckets(redis_client) if redis_client else None
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        limits = parse_rate_limits(
+            os.getenv("YOUTUBE_RATE_LIMITS", DEFAULT_RATE_LIMITS)
+        )
+        return cls(limits, get_redis_client() if limits else None)
+
+    def limit_for(self, operation: str) -> Tuple[str, Optional[RateLimit]]:
+        key = operation_key(operation)
+        if key in self.limits:
+            return key, self.limits[key]
+        return "default", self.limits.get("default")
+
+    def acquire(self, operation: str, tokens: float = 1.0) -> float:
+        """Block until ``operation`` may proceed; return the seconds waited."""
+        key, limit = self.limit_for(operation)
+        if limit is None:
+            return 0.0
+
+        wait = None
+        if self.shared is not None:
+            try:
+                wait = self.shared.reserve(key, limit, tokens)
+            except Exception as e:
+                logger.warning(f"Redis rate limiter failed, using local bucket: {e}")
+        if wait is None:
+            wait = self.local.reserve(key, limit, tokens)
+
+        YOUTUBE_RATE_LIMIT_WAIT_SECONDS.observe(wait, operation=key)
+        if wait > 0:
+            logger.debug(f"Rate limiting {operation}: waiting {wait:.2f}s")
+            self.sleep(wait)
+        return wait
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter, creating it on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter.from_env()
+    return _rate_limiter
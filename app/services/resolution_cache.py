@@ -0,0 +1,102 @@
+"""
+Cache of channel inputs (handles, legacy usernames, custom URLs) already
+resolved to channel IDs.
+
+Resolving a handle costs an API call and a ``/c/`` custom URL a 100-unit
+search, while the mapping almost never changes. Entries are shared through
+Redis when it is configured and kept in process otherwise.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "channel_resolution:"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+
+def cache_key(input_str: str) -> str:
+    """Normalise a channel input so equivalent spellings share an entry."""
+    return input_str.strip().rstrip("/").lower()
+
+
+class ResolutionCache:
+    def __init__(
+        self, client: Optional[Any] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ResolutionCache":
+        return cls(
+            client=get_redis_client(),
+            ttl_seconds=int(
+                os.getenv(
+                    "CHANNEL_RESOLUTION_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS)
+                )
+            ),
+        )
+
+    def get(self, input_str: str) -> Optional[str]:
+        key = cache_key(input_str)
+        if self.client is not None:
+            try:
+                value = self.client.get(KEY_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"Resolution cache read failed: {e}")
+                return None
+            if isinstance(value, bytes):
+                value = value.decode()
+            return value or None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            channel_id, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return channel_id
+
+    def set(self, input_str: str, channel_id: str) -> None:
+        key = cache_key(input_str)
+        if self.client is not None:
+            try:
+                self.client.set(KEY_PREFIX + key, channel_id, ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Resolution cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._entries[key] = (channel_id, time.monotonic() + self.ttl_seconds)
+
+
+_resolution_cache: Optional[ResolutionCache] = None
+_resolution_cache_lock = threading.Lock()
+
+
+def get_resolution_cache() -> ResolutionCache:
+    """Return the process-wide channel resolution cache."""
+    global _resolution_cache
+    if _resolution_cache is None:
+        with _resolution_cache_lock:
+            if _resolution_cache is None:
+                _resolution_cache = ResolutionCache.from_env()
+    return _resolution_cache
+
+
+def reset_resolution_cache() -> None:
+    """Drop the process-wide cache so the next call rebuilds it (tests)."""
+    global _resolution_cache
+    with _resolution_cache_lock:
+        _resolution_cache = None
@@ -0,0 +1,243 @@
+"""
+Retry policy shared by the outbound HTTP clients.
+
+Only transient failures are retried: socket timeouts, connection resets,
+HTTP 429 and 5xx responses. Anything else, including programming errors,
+fails on the first attempt.
+
+Delays use decorrelated jitter (each delay is drawn between ``base_delay``
+and ``multiplier`` times the previous one, capped at ``max_delay``) so
+workers that failed together do not retry together. A ``Retry-After``
+header replaces the computed delay. Every operation also has a total
+``deadline_seconds`` budget; a retry that would end past it is not
+attempted, so a failing call gives up in bounded time instead of sleeping
+through the full backoff schedule.
+
+The policy itself holds no state. Callers either run a function through
+``run`` / ``run_async`` or drive a ``RetryState`` from ``start()`` when
+each attempt needs custom handling, as the YouTube client does.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Mapping, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRANSIENT_ERRORS = (
+    socket.timeout,
+    TimeoutError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+def _response_of(error: BaseException) -> Any:
+    # googleapiclient's HttpError carries ``resp``, httpx errors ``response``.
+    return getattr(error, "resp", None) or getattr(error, "response", None)
+
+
+def status_code_of(error: BaseException) -> Optional[int]:
+    """HTTP status attached to ``error``, if it came from a response."""
+    response = _response_of(error)
+    for attr in ("status", "status_code"):
+        value = getattr(response, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_retryable_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True for failures that may succeed if the same request is repeated."""
+    status_code = status_code_of(error)
+    if status_code is not None:
+        return is_retryable_status(status_code)
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+
+    # Only check httpx's transport errors if something already imported it.
+    httpx: Any = sys.modules.get("httpx")
+    if httpx is not None:
+        return isinstance(
+            error,
+            (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError),
+        )
+    return False
+
+
+def retry_after_seconds(
+    error: BaseException, now: Optional[datetime] = None
+) -> Optional[float]:
+    """Parse a ``Retry-After`` header (seconds or HTTP date) from ``error``."""
+    response = _response_of(error)
+    headers = response if isinstance(response, Mapping) else None
+    if headers is None:
+        headers = getattr(response, "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at: Optional[datetime] = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, float((retry_at - now).total_seconds()))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    multiplier: float = 3.0
+    deadline_seconds: float = 90.0
+
+    @classmethod
+    def from_env(cls, prefix: str, **defaults: Any) -> "RetryPolicy":
+        """
+        Read ``{prefix}_MAX_RETRIES``, ``_BASE_DELAY``, ``_MAX_DELAY``,
+        ``_BACKOFF_MULTIPLIER`` and ``_RETRY_DEADLINE_SECONDS``.
+        """
+        base = cls(**defaults)
+
+        def env(name: str, default: float) -> str:
+            return os.getenv(f"{prefix}_{name}", str(default))
+
+        return cls(
+            max_retries=int(env("MAX_RETRIES", base.max_retries)),
+            base_delay=float(env("BASE_DELAY", base.base_delay)),
+            max_delay=float(env("MAX_DELAY", base.max_delay)),
+            multiplier=float(env("BACKOFF_MULTIPLIER", base.multiplier)),
+            deadline_seconds=float(
+                env("RETRY_DEADLINE_SECONDS", base.deadline_seconds)
+            ),
+        )
+
+    def start(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ) -> "RetryState":
+        """Begin tracking one operation's attempts and deadline."""
+        return RetryState(self, clock, rng or random.Random())
+
+    def run(
+        self,
+        fn: Callable[[], T],
+        description: str = "operation",
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> T:
+        """Call ``fn`` until it succeeds or the policy gives up."""
+        sleep = sleep or time.sleep
+        retry = self.start()
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                delay = retry.next_delay(e)
+                if delay is None:
+                    raise
+                logger.info(f"Retrying {description} after {delay:.2f}s: {e}")
+                sleep(delay)
+
+    async def run_async(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        description: str = "operation",
+        sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+    ) -> T:
+        """Await ``fn()`` until it succeeds or the policy gives up."""
+        sleep = sleep or asyncio.sleep
+        retry = self.start()
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                delay = retry.next_delay(e)
+                if delay is None:
+                    raise
+                logger.info(f"Retrying {description} after {delay:.2f}s: {e}")
+                await sleep(delay)
+
+
+class RetryState:
+    """Attempts, previous delay and deadline for one operation."""
+
+    def __init__(
+        self, policy: RetryPolicy, clock: Callable[[], float], rng: random.Random
+    ) -> None:
+        self.policy = policy
+        self.clock = clock
+        self.rng = rng
+        self.started = clock()
+        self.attempts = 0
+        self.gave_up_reason: Optional[str] = None
+        self._previous_delay = policy.base_delay
+
+    def backoff(self) -> float:
+        """Next decorrelated-jitter delay."""
+        policy = self.policy
+        upper = max(policy.base_delay, self._previous_delay * policy.multiplier)
+        self._previous_delay = min(
+            policy.max_delay, self.rng.uniform(policy.base_delay, upper)
+        )
+        return self._previous_delay
+
+    def next_delay(
+        self, error: BaseException, retryable: Optional[bool] = None
+    ) -> Optional[float]:
+        """
+        Record a failed attempt and return how long to wait before the next
+        one, or None when ``error`` should be raised instead.
+
+        ``retryable`` overrides the status-based classification for callers
+        that can tell more from the response body.
+        """
+        self.attempts += 1
+        if not (is_retryable(error) if retryable is None else retryable):
+            self.gave_up_reason = "not_retryable"
+            return None
+        if self.attempts > self.policy.max_retries:
+            self.gave_up_reason = "attempts_exhausted"
+            return None
+
+        delay = self.backoff()
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            delay = retry_after
+
+        elapsed = self.clock() - self.started
+        if elapsed + delay > self.policy.deadline_seconds:
+            self.gave_up_reason = "deadline_exceeded"
+            logger.warning(
+                f"Not retrying: waiting {delay:.1f}s would exceed the "
+                f"{self.policy.deadline_seconds:.0f}s deadline "
+                f"({elapsed:.1f}s elapsed)"
+            )
+            return None
+        return delay
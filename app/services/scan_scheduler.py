@@ -0,0 +1,279 @@
+"""
+Adaptive per-channel scan scheduling.
+
+Each channel's scan interval is derived from how often it actually changes:
+uploads (by ``published_at``) and disappearance events over a lookback
+window. Volatile channels are scanned every few minutes, dormant ones about
+once a day, and the plan as a whole is stretched to fit a daily quota
+budget estimated from each channel's recent scan cost.
+
+A scan requested out of band (a WebSub deletion tombstone) is stored in
+``scan_requested_at`` rather than ``next_scan_at``; the plan rewrites the
+latter on every sweep but never touches the request, so the channel stays
+due until it has been scanned.
+"""
+
+import logging
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.metrics import SCAN_PLANNED_DAILY_QUOTA_UNITS
+from app.models.channel import Channel
+from app.models.disappearance_event import DisappearanceEvent
+from app.models.scan_run import ScanRun
+from app.models.video import Video
+from app.services.api_key_pool import api_keys_from_env
+
+logger = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 24 * 60
+
+
+@dataclass(frozen=True)
+class ScheduleConfig:
+    default_interval_minutes: int = 60
+    min_interval_minutes: int = 5
+    max_interval_minutes: int = MINUTES_PER_DAY
+    lookback_days: int = 30
+    # Scans per expected change; 4 means a change is seen within about a
+    # quarter of the typical gap between changes.
+    scans_per_change: float = 4.0
+    # A disappearance is what the tracker exists to catch, so it counts
+    # for more than an upload when estimating churn.
+    disappearance_weight: float = 3.0
+    daily_quota_budget: int = 9000
+    default_scan_cost: float = 3.0
+
+    @classmethod
+    def from_env(cls) -> "ScheduleConfig":
+        """Build a configuration from ``SCAN_*`` environment variables."""
+        return cls(
+            default_interval_minutes=int(
+                os.getenv("SCAN_INTERVAL_MINUTES", str(cls.default_interval_minutes))
+            ),
+            min_interval_minutes=int(
+                os.getenv("SCAN_MIN_INTERVAL_MINUTES", str(cls.min_interval_minutes))
+            ),
+            max_interval_minutes=int(
+                os.getenv("SCAN_MAX_INTERVAL_MINUTES", str(cls.max_interval_minutes))
+            ),
+            lookback_days=int(
+                os.getenv("SCAN_CHURN_LOOKBACK_DAYS", str(cls.lookback_days))
+            ),
+            # The default budget is per API key; pooled keys add up.
+            daily_quota_budget=int(
+                os.getenv(
+                    "SCAN_DAILY_QUOTA_BUDGET",
+                    str(cls.daily_quota_budget * max(1, len(api_keys_from_env()))),
+                )
+            ),
+        )
+
+
+@dataclass
+class ChannelChurn:
+    channel_id: str
+    uploads: int = 0
+    disappearances: int = 0
+    scans: int = 0
+    avg_quota_units: Optional[float] = None
+
+    def changes_per_day(self, config: ScheduleConfig) -> float:
+        weighted = self.uploads + self.disappearances * config.disappearance_weight
+        return weighted / config.lookback_days
+
+
+def _utc(timestamp: datetime) -> datetime:
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+class AdaptiveScanScheduler:
+    """Plan per-channel scan intervals and pick the channels that are due."""
+
+    def __init__(self, db: Session, config: Optional[ScheduleConfig] = None):
+        self.db = db
+        self.config = config or ScheduleConfig.from_env()
+
+    def channel_churn(self, now: Optional[datetime] = None) -> Dict[str, ChannelChurn]:
+        """Collect upload, disappearance and scan-cost history per channel."""
+        now = now or datetime.now(timezone.utc)
+        since = now - timedelta(days=self.config.lookback_days)
+        churn = {
+            str(channel_id): ChannelChurn(channel_id=str(channel_id))
+            for (channel_id,) in self.db.query(Channel.channel_id)
+            .filter(Channel.is_active.is_(True))
+            .all()
+        }
+
+        uploads = (
+            self.db.query(Video.channel_id, func.count(Video.id))
+            .filter(Video.published_at >= since)
+            .group_by(Video.channel_id)
+        )
+        for channel_id, count in uploads:
+            if channel_id in churn:
+                churn[channel_id].uploads = count
+
+        disappearances = (
+            self.db.query(Video.channel_id, func.count(DisappearanceEvent.id))
+            .join(Video, Video.video_id == DisappearanceEvent.video_id)
+            .filter(DisappearanceEvent.detected_at >= since)
+            .group_by(Video.channel_id)
+        )
+        for channel_id, count in disappearances:
+            if channel_id in churn:
+                churn[channel_id].disappearances = count
+
+        scans = (
+            self.db.query(
+                ScanRun.channel_id,
+                func.count(ScanRun.id),
+                func.avg(ScanRun.quota_units),
+            )
+            .filter(
+                ScanRun.status.in_(("succeeded", "unchanged")),
+                ScanRun.started_at >= since,
+            )
+            .group_by(ScanRun.channel_id)
+        )
+        for channel_id, count, avg_quota_units in scans:
+            if channel_id in churn:
+                churn[channel_id].scans = count
+                churn[channel_id].avg_quota_units = (
+                    float(avg_quota_units) if avg_quota_units else None
+                )
+
+        return churn
+
+    def interval_for(self, churn: ChannelChurn) -> float:
+        """Return the unbudgeted scan interval in minutes for one channel."""
+        if churn.scans == 0 and churn.uploads == 0:
+            # Nothing learned yet: keep the uniform interval until it has history.
+            return float(self.config.default_interval_minutes)
+
+        rate = churn.changes_per_day(self.config)
+        if rate <= 0:
+            return float(self.config.max_interval_minutes)
+
+        interval = MINUTES_PER_DAY / (rate * self.config.scans_per_change)
+        return min(
+            max(interval, self.config.min_interval_minutes),
+            self.config.max_interval_minutes,
+        )
+
+    def plan(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Recompute and store the scan interval of every active channel.
+
+        If the intervals would spend more than the daily quota budget, all
+        of them are stretched by the same factor (which may push dormant
+        channels past the maximum interval).
+        """
+        now = now or datetime.now(timezone.utc)
+        churn = self.channel_churn(now)
+        intervals = {
+            channel_id: self.interval_for(history)
+            for channel_id, history in churn.items()
+        }
+
+        def scan_cost(channel_id: str) -> float:
+            return churn[channel_id].avg_quota_units or self.config.default_scan_cost
+
+        demand = sum(
+            scan_cost(channel_id) * MINUTES_PER_DAY / interval
+            for channel_id, interval in intervals.items()
+        )
+        if demand > self.config.daily_quota_budget > 0:
+            stretch = demand / self.config.daily_quota_budget
+            logger.info(
+                f"Scan plan needs {demand:.0f} quota units/day, budget is "
+                f"{self.config.daily_quota_budget}; stretching intervals "
+                f"x{stretch:.2f}"
+            )
+            intervals = {
+                channel_id: interval * stretch
+                for channel_id, interval in intervals.items()
+            }
+            demand = float(self.config.daily_quota_budget)
+        SCAN_PLANNED_DAILY_QUOTA_UNITS.set(demand)
+
+        planned = {
+            channel_id: math.ceil(interval)
+            for channel_id, interval in intervals.items()
+        }
+        # Only channels whose plan moved are touched, so a sweep over a large
+        # and mostly stable watchlist flushes a handful of rows, not all.
+        channels = self.db.query(Channel).filter(Channel.is_active.is_(True))
+        for channel in channels:
+            minutes = planned.get(str(channel.channel_id))
+            if minutes is None:
+                continue
+            if channel.scan_interval_minutes != minutes:
+                channel.scan_interval_minutes = minutes  # type: ignore[assignment]
+            if channel.last_scanned_at is not None:
+                next_scan_at = _utc(
+                    channel.last_scanned_at  # type: ignore[arg-type]
+                ) + timedelta(minutes=minutes)
+                if (
+                    channel.next_scan_at is None
+                    or _utc(channel.next_scan_at)  # type: ignore[arg-type]
+                    != next_scan_at
+                ):
+                    channel.next_scan_at = next_scan_at  # type: ignore[assignment]
+        self.db.commit()
+        return planned
+
+    def sweep_size(self, planned: Dict[str, int], tick_minutes: float) -> int:
+        """Channels a sweep every ``tick_minutes`` must scan to keep the plan."""
+        return math.ceil(
+            sum(tick_minutes / minutes for minutes in planned.values() if minutes > 0)
+        )
+
+    def due_channels(
+        self, now: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> List[Channel]:
+        """
+        Active channels whose next scan is due.
+
+        Channels with a requested scan come first, then never-scanned ones,
+        then the rest by how long they have been due.
+        """
+        now = now or datetime.now(timezone.utc)
+        query = (
+            self.db.query(Channel)
+            .filter(
+                Channel.is_active.is_(True),
+                (Channel.scan_requested_at.is_not(None))
+                | (Channel.next_scan_at.is_(None))
+                | (Channel.next_scan_at <= now),
+            )
+            .order_by(
+                Channel.scan_requested_at.is_(None),
+                Channel.next_scan_at.is_not(None),
+                Channel.next_scan_at,
+            )
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def record_scan(self, channel: Channel, now: Optional[datetime] = None) -> None:
+        """Push the channel's next scan out by its planned interval."""
+        now = now or datetime.now(timezone.utc)
+        interval_minutes = (
+            channel.scan_interval_minutes or self.config.default_interval_minutes
+        )
+        channel.last_scanned_at = now  # type: ignore[assignment]
+        channel.scan_requested_at = None  # type: ignore[assignment]
+        channel.next_scan_at = now + timedelta(  # type: ignore[assignment]
+            minutes=int(interval_minutes)
+        )
+        self.db.commit()
@@ -1,12 +1,13 @@
 import logging
 import os
-from typing import Optional
-
-import httpx
+import time
+from typing import Any, Optional
 
+from app.core.metrics import SLACK_WEBHOOK_SECONDS
 from app.models.channel import Channel
 from app.models.disappearance_event import DisappearanceEvent
 from app.models.video import Video
+from app.services.retry_policy import RetryPolicy, is_retryable_status
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,9 @@ class SlackNotifier:
         self.max_notifications_per_video = int(
             os.getenv("SLACK_MAX_NOTIFICATIONS_PER_VIDEO", "3")
         )
+        self.retry_policy = RetryPolicy.from_env(
+            "SLACK_WEBHOOK", max_retries=2, max_delay=10.0, deadline_seconds=30.0
+        )
 
         if not self.enabled:
             logger.info(
@@ -265,20 +269,34 @@ class SlackNotifier:
 
     async def _send_webhook(self, message: dict) -> bool:
         """Send the webhook request to Slack."""
-        if not self.webhook_url:
+        webhook_url = self.webhook_url
+        if not webhook_url:
             return False
 
+        import httpx
+
+        started = time.perf_counter()
+        outcome = "error"
         try:
             async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    self.webhook_url,
-                    json=message,
-                    headers={"Content-Type": "application/json"},
-                )
+
+                async def post() -> Any:
+                    response = await client.post(
+                        webhook_url,
+                        json=message,
+                        headers={"Content-Type": "application/json"},
+                    )
+                    if is_retryable_status(response.status_code):
+                        response.raise_for_status()
+                    return response
+
+                response = await self.retry_policy.run_async(post, "Slack webhook")
 
                 if response.status_code == 200:
+                    outcome = "ok"
                     return True
                 else:
+                    outcome = "http_error"
                     logger.warning(
                         "Slack webhook returned status %d: %s",
                         response.status_code,
@@ -286,7 +304,12 @@ class SlackNotifier:
                     )
                     return False
 
+        except httpx.HTTPStatusError as e:
+            outcome = "http_error"
+            logger.warning(f"Slack webhook failed after retries: {e}")
+            return False
         except httpx.TimeoutException:
+            outcome = "timeout"
             logger.warning("Slack webhook request timed out")
             return False
         except httpx.RequestError as e:
@@ -295,6 +318,10 @@ class SlackNotifier:
         except Exception as e:
             logger.error(f"Unexpected error sending Slack webhook: {e}")
             return False
+        finally:
+            SLACK_WEBHOOK_SECONDS.observe(
+                time.perf_counter() - started, outcome=outcome
+            )
 
     async def send_test_notification(self) -> bool:
         """Send a test notification to verify Slack integration."""
@@ -1,29 +1,69 @@
 import asyncio
 import logging
-from datetime import datetime
-from typing import Tuple
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import List, Optional, Set, Tuple
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import instance_dict
 
+from app.core.metrics import (
+    SCAN_API_CALLS_TOTAL,
+    SCAN_PAGES_FETCHED_TOTAL,
+    SCAN_PHASE_SECONDS,
+    SCAN_QUOTA_UNITS_TOTAL,
+    SCAN_RUNS_TOTAL,
+)
 from app.models.channel import Channel
 from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.scan_run import ScanRun
 from app.models.video import Video
+from app.services.channel_fingerprint import UNCHANGED, ChannelFingerprintService
+from app.services.channel_stats import ChannelStatsService
+from app.services.disappearance_confirmation import DisappearanceConfirmer
+from app.services.event_rollups import EventRollupService
 from app.services.slack_notifier import SlackNotifier
-from app.services.youtube_client import YouTubeClient
+from app.services.video_revisions import VideoRevisionService, compute_content_hash
+from app.services.youtube_client import ApiUsage, UploadsFingerprint, YouTubeClient
 
 logger = logging.getLogger(__name__)
 
+SCAN_PHASES = ("fetch", "diff", "db_write", "notify")
+
+UNAVAILABLE_EVENT_TYPES = {
+    "private": EventType.PRIVATE,
+    "deleted": EventType.DELETED,
+}
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
+
 
 class VideoIngestionService:
     def __init__(self, db: Session, youtube_client: YouTubeClient):
         self.db = db
         self.youtube_client = youtube_client
         self.slack_notifier = SlackNotifier()
+        self.stats_service = ChannelStatsService(db)
+        self.rollup_service = EventRollupService(db)
+        self.revision_service = VideoRevisionService(db)
+        self.fingerprints = ChannelFingerprintService(db)
+        self.confirmer = DisappearanceConfirmer(youtube_client)
 
-    def scan_channel(self, channel_id: str) -> Tuple[int, int, int]:
+    def scan_channel(
+        self, channel_id: str, force_full: bool = False
+    ) -> Tuple[int, int, int]:
         """
         Scan a channel for videos and detect disappearances.
 
+        Args:
+            channel_id: The channel to scan
+            force_full: Walk the uploads playlist even when the fingerprint
+                shows no change
+
         Returns:
             Tuple of (added_count, updated_count, events_created_count)
         """
@@ -38,46 +78,96 @@ class VideoIngestionService:
                 f"Channel {channel_id} not found or missing uploads playlist"
             )
 
+        # The run is committed before any work so scans that hang or crash
+        # still show up in the ledger as "running".
+        started_at = datetime.now(timezone.utc)
+        scan_run = ScanRun(
+            channel_id=channel_id, status="running", started_at=started_at
+        )
+        self.db.add(scan_run)
+        self.db.commit()
+
+        usage_before = self._api_usage()
+        try:
+            return self._scan(channel, scan_run, started_at, usage_before, force_full)
+        except Exception as e:
+            self._record_failed_run(scan_run, usage_before, e)
+            raise
+
+    def _scan(
+        self,
+        channel: Channel,
+        scan_run: ScanRun,
+        started_at: datetime,
+        usage_before: ApiUsage,
+        force_full: bool = False,
+    ) -> Tuple[int, int, int]:
+        channel_id = str(channel.channel_id)
+
+        phase_started = time.perf_counter()
+        # A forced scan still fetches the fingerprint so that it can store
+        # the one it verifies.
+        fingerprint = self._fingerprint(channel)
+        if (
+            not force_full
+            and self.fingerprints.config.enabled
+            and self.fingerprints.check(channel_id, fingerprint, started_at)
+            == UNCHANGED
+        ):
+            scan_run.fetch_ms = _elapsed_ms(phase_started)  # type: ignore[assignment]
+            self._record_unchanged_run(scan_run, usage_before)
+            return 0, 0, 0
+
         try:
-            current_videos = self.youtube_client.fetch_channel_videos(
+            listed = self.youtube_client.fetch_channel_videos(
                 str(channel.uploads_playlist_id)
             )
         except Exception as e:
             logger.error(f"Failed to fetch videos for channel {channel_id}: {e}")
+            scan_run.fetch_ms = _elapsed_ms(phase_started)  # type: ignore[assignment]
             raise
+        scan_run.fetch_ms = _elapsed_ms(phase_started)  # type: ignore[assignment]
+
+        phase_started = time.perf_counter()
+        # Entries the playlist itself flags as private or deleted say why
+        # the video went away; anything else that vanished is UNKNOWN.
+        current_videos = [v for v in listed if not v.get("unavailable")]
+        classified = {
+            v["video_id"]: UNAVAILABLE_EVENT_TYPES.get(
+                v["unavailable"], EventType.UNKNOWN
+            )
+            for v in listed
+            if v.get("unavailable")
+        }
+        self.stats_service.ensure(channel_id)
 
         existing_videos = (
             self.db.query(Video).filter(Video.channel_id == channel_id).all()
         )
 
-        existing_video_ids = {v.video_id for v in existing_videos}
+        existing_by_id = {str(v.video_id): v for v in existing_videos}
         current_video_ids = {v["video_id"] for v in current_videos}
 
         added_count = 0
         updated_count = 0
         events_created_count = 0
+        disappeared_count = 0
+        revisions_count = 0
+        events_by_type: Counter[EventType] = Counter()
+        new_events: List[Tuple[str, EventType, datetime]] = []
+        notifications: List[Tuple[DisappearanceEvent, Video]] = []
 
         for video_data in current_videos:
             video_id = video_data["video_id"]
-            existing_video = next(
-                (v for v in existing_videos if v.video_id == video_id), None
-            )
+            existing_video = existing_by_id.get(video_id)
 
             if existing_video:
                 if not existing_video.is_available:
                     existing_video.is_available = True  # type: ignore[assignment]
-                    existing_video.last_seen_at = datetime.utcnow()  # type: ignore[assignment]  # noqa: E501
                     updated_count += 1
-                else:
-                    existing_video.last_seen_at = datetime.utcnow()  # type: ignore[assignment]  # noqa: E501
-
-                existing_video.title = video_data["title"]
-                if video_data.get("description") is not None:
-                    existing_video.description = video_data["description"]
-                if video_data.get("thumbnail_url") is not None:
-                    existing_video.thumbnail_url = video_data["thumbnail_url"]
-                if video_data.get("view_count") is not None:
-                    existing_video.view_count = video_data["view_count"]
+
+                if self.revision_service.apply(existing_video, video_data):
+                    revisions_count += 1
             else:
                 new_video = Video(
                     video_id=video_id,
@@ -89,19 +179,40 @@ class VideoIngestionService:
                     duration=video_data.get("duration"),
                     view_count=video_data.get("view_count"),
                     is_available=True,
+                    content_hash=compute_content_hash(video_data),
                 )
                 self.db.add(new_video)
                 added_count += 1
 
-        disappeared_video_ids = existing_video_ids - current_video_ids
-        for video_id in disappeared_video_ids:
-            video = next(v for v in existing_videos if v.video_id == video_id)
+        missing = [
+            existing_by_id[video_id]
+            for video_id in sorted(existing_by_id.keys() - current_video_ids)
+            if existing_by_id[video_id].is_available
+        ]
+        # A playlist entry marked private or deleted is evidence enough;
+        # videos that merely went missing are confirmed before any event.
+        confirmed = {
+            str(v.video_id): classified[str(v.video_id)]
+            for v in missing
+            if str(v.video_id) in classified
+        }
+        confirmed.update(
+            self.confirmer.resolve(
+                [v for v in missing if str(v.video_id) not in classified]
+            )
+        )
+        for video_id, event_type in confirmed.items():
+            video = existing_by_id[video_id]
             if video.is_available:
                 video.is_available = False  # type: ignore[assignment]
+                video.missed_scans = 0  # type: ignore[assignment]
+                disappeared_count += 1
 
+                detected_at = datetime.now(timezone.utc)
                 event = DisappearanceEvent(
                     video_id=video_id,
-                    event_type=EventType.UNKNOWN,
+                    event_type=event_type,
+                    detected_at=detected_at,
                     details={
                         "title": video.title,
                         "channel_id": channel_id,
@@ -115,23 +226,220 @@ class VideoIngestionService:
                 )
                 self.db.add(event)
                 events_created_count += 1
+                events_by_type[event_type] += 1
+                new_events.append((channel_id, event_type, detected_at))
+                notifications.append((event, video))
 
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.create_task(
-                            self.slack_notifier.send_disappearance_alert(
-                                event, video, channel
-                            )
-                        )
-                    else:
-                        asyncio.run(
-                            self.slack_notifier.send_disappearance_alert(
-                                event, video, channel
-                            )
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to send Slack notification: {e}")
+        scan_run.diff_ms = _elapsed_ms(phase_started)  # type: ignore[assignment]
 
+        phase_started = time.perf_counter()
+        self._mark_seen(
+            channel_id,
+            current_video_ids & existing_by_id.keys(),
+            started_at,
+        )
+
+        self.stats_service.apply_scan_delta(
+            channel_id,
+            added=added_count,
+            reappeared=updated_count,
+            disappeared=disappeared_count,
+            events_by_type=events_by_type,
+        )
+        self.rollup_service.record_events(new_events)
+        # Suspects left unconfirmed need the next scan to list the playlist
+        # again; a stored fingerprint would let it skip until the next full
+        # verification instead.
+        if any(video.is_available and video.missed_scans for video in missing):
+            self.fingerprints.forget(channel_id)
+        elif fingerprint is not None:
+            self.fingerprints.record(channel_id, fingerprint, started_at)
+
+        self.db.flush()
+        scan_run.db_write_ms = _elapsed_ms(phase_started)  # type: ignore[assignment]
+
+        if revisions_count:
+            logger.info(
+                f"Recorded metadata changes for {revisions_count} videos "
+                f"in channel {channel_id}"
+            )
+
+        scan_run.status = "succeeded"  # type: ignore[assignment]
+        scan_run.finished_at = datetime.now(timezone.utc)  # type: ignore[assignment]
+        self._apply_usage(scan_run, usage_before)
+        scan_run.videos_seen = len(current_video_ids)  # type: ignore[assignment]
+        scan_run.added = added_count  # type: ignore[assignment]
+        scan_run.updated = updated_count  # type: ignore[assignment]
+        scan_run.events_created = events_created_count  # type: ignore[assignment]
         self.db.commit()
+
+        # Alerts go out only for committed events, and their retries run
+        # without holding the scan's row locks.
+        phase_started = time.perf_counter()
+        for event, video in notifications:
+            self._notify(event, video, channel)
+        scan_run.notify_ms = _elapsed_ms(phase_started)  # type: ignore[assignment]
+        self.db.commit()
+
+        self._observe(scan_run)
         return added_count, updated_count, events_created_count
+
+    def ingest_video(self, channel_id: str, video_id: str) -> bool:
+        """
+        Add or refresh a single video, e.g. one announced by a push
+        notification, without scanning the whole uploads playlist.
+
+        Returns True when the video was new or reappeared. Videos the API
+        does not return as public are left for the next full scan to judge.
+        """
+        video_data = self.youtube_client.fetch_video(video_id)
+        if not video_data:
+            logger.info(f"Video {video_id} is not publicly available yet")
+            return False
+
+        self.stats_service.ensure(channel_id)
+        video = self.db.query(Video).filter(Video.video_id == video_id).first()
+        now = datetime.now(timezone.utc)
+
+        changed = False
+        if video is None:
+            self.db.add(
+                Video(
+                    video_id=video_id,
+                    channel_id=channel_id,
+                    title=video_data["title"],
+                    description=video_data.get("description"),
+                    thumbnail_url=video_data.get("thumbnail_url"),
+                    published_at=video_data["published_at"],
+                    duration=video_data.get("duration"),
+                    view_count=video_data.get("view_count"),
+                    is_available=True,
+                    content_hash=compute_content_hash(video_data),
+                    last_seen_at=now,
+                )
+            )
+            self.stats_service.apply_scan_delta(channel_id, added=1)
+            changed = True
+        else:
+            if not video.is_available:
+                video.is_available = True  # type: ignore[assignment]
+                self.stats_service.apply_scan_delta(channel_id, reappeared=1)
+                changed = True
+            self.revision_service.apply(video, video_data)
+            video.last_seen_at = now  # type: ignore[assignment]
+            video.missed_scans = 0  # type: ignore[assignment]
+
+        self.db.commit()
+        return changed
+
+    def _fingerprint(self, channel: Channel) -> Optional[UploadsFingerprint]:
+        """
+        Fetch the uploads playlist fingerprint, or None when disabled or
+        unavailable; the full scan then runs and reports any API error.
+        """
+        if not self.fingerprints.config.enabled:
+            return None
+        try:
+            fingerprint = self.youtube_client.fetch_uploads_fingerprint(
+                str(channel.uploads_playlist_id)
+            )
+        except Exception as e:
+            logger.warning(
+                f"Fingerprint check failed for channel {channel.channel_id}: {e}"
+            )
+            return None
+        return fingerprint if isinstance(fingerprint, UploadsFingerprint) else None
+
+    def _record_unchanged_run(self, scan_run: ScanRun, usage_before: ApiUsage) -> None:
+        """Persist a scan that the fingerprint showed had nothing to do."""
+        scan_run.status = "unchanged"  # type: ignore[assignment]
+        scan_run.finished_at = datetime.now(timezone.utc)  # type: ignore[assignment]
+        self._apply_usage(scan_run, usage_before)
+        self.db.commit()
+        self._observe(scan_run)
+
+    def _notify(
+        self, event: DisappearanceEvent, video: Video, channel: Channel
+    ) -> None:
+        try:
+            loop = asyncio.get_event_loop()
+            if loop.is_running():
+                asyncio.create_task(
+                    self.slack_notifier.send_disappearance_alert(event, video, channel)
+                )
+            else:
+                asyncio.run(
+                    self.slack_notifier.send_disappearance_alert(event, video, channel)
+                )
+        except Exception as e:
+            logger.warning(f"Failed to send Slack notification: {e}")
+
+    def _api_usage(self) -> ApiUsage:
+        usage = getattr(self.youtube_client, "usage", None)
+        return usage.snapshot() if isinstance(usage, ApiUsage) else ApiUsage()
+
+    def _apply_usage(self, scan_run: ScanRun, usage_before: ApiUsage) -> None:
+        usage = self._api_usage().since(usage_before)
+        scan_run.api_calls = usage.api_calls  # type: ignore[assignment]
+        scan_run.quota_units = usage.quota_units  # type: ignore[assignment]
+        scan_run.pages_fetched = usage.pages_fetched  # type: ignore[assignment]
+
+    def _observe(self, scan_run: ScanRun) -> None:
+        """Export a finished scan run to the process metrics registry."""
+        SCAN_RUNS_TOTAL.inc(status=str(scan_run.status))
+        for metric, column in (
+            (SCAN_API_CALLS_TOTAL, "api_calls"),
+            (SCAN_QUOTA_UNITS_TOTAL, "quota_units"),
+            (SCAN_PAGES_FETCHED_TOTAL, "pages_fetched"),
+        ):
+            metric.inc(getattr(scan_run, column) or 0)
+        for phase in SCAN_PHASES:
+            duration_ms: Optional[int] = getattr(scan_run, f"{phase}_ms")
+            if duration_ms is not None:
+                SCAN_PHASE_SECONDS.observe(duration_ms / 1000, phase=phase)
+
+    def _mark_seen(
+        self, channel_id: str, video_ids: Set[str], seen_at: datetime
+    ) -> None:
+        """
+        Record that videos were present in a scan with one batched UPDATE,
+        clearing any suspicion left by earlier misses.
+
+        Per-row ``last_seen_at`` assignments would make the ORM issue one
+        UPDATE per video on every scan; metadata columns are written
+        separately and only when their content hash changes.
+        """
+        if not video_ids:
+            return
+
+        self.db.execute(
+            update(Video)
+            .where(Video.channel_id == channel_id, Video.video_id.in_(video_ids))
+            .values(last_seen_at=seen_at, missed_scans=0)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _record_failed_run(
+        self, scan_run: ScanRun, usage_before: ApiUsage, error: Exception
+    ) -> None:
+        """Persist a failed scan run without masking the original error."""
+        try:
+            # The rollback expires the row, dropping phase timings measured
+            # before the failure; read them from the instance state, which
+            # does not query the aborted transaction.
+            loaded = instance_dict(scan_run)
+            timings = {
+                f"{phase}_ms": loaded.get(f"{phase}_ms") for phase in SCAN_PHASES
+            }
+            self.db.rollback()
+            for column, value in timings.items():
+                setattr(scan_run, column, value)
+            scan_run.status = "failed"  # type: ignore[assignment]
+            scan_run.finished_at = datetime.now(timezone.utc)  # type: ignore[assignment]  # noqa: E501
+            scan_run.error = str(error)[:1000]  # type: ignore[assignment]
+            self._apply_usage(scan_run, usage_before)
+            self.db.commit()
+            self._observe(scan_run)
+        except Exception as e:
+            logger.warning(f"Failed to record scan run: {e}")
+            self.db.rollback()
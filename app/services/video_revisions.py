@@ -0,0 +1,101 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.video import Video
+from app.models.video_revision import VideoRevision
+
+TRACKED_FIELDS = ("title", "description", "thumbnail_url")
+
+# View counts move on almost every scan of a live video, so they stay out of
+# the hash and the revision history and the stored value is only refreshed
+# once it has drifted by this fraction.
+VIEW_COUNT_REFRESH_RATIO = 0.01
+
+
+def compute_content_hash(fields: Dict[str, Any]) -> str:
+    """Return a stable SHA-256 digest of the tracked video fields."""
+    payload = json.dumps(
+        [fields.get(name) for name in TRACKED_FIELDS],
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def view_count_drifted(stored: Optional[int], incoming: Optional[int]) -> bool:
+    """True when the stored view count is stale enough to rewrite."""
+    if incoming is None:
+        return False
+    if stored is None:
+        return True
+    return abs(incoming - stored) >= max(1, stored * VIEW_COUNT_REFRESH_RATIO)
+
+
+class VideoRevisionService:
+    """Detect metadata changes on existing videos and record them."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def incoming_fields(self, video: Video, video_data: Dict) -> Dict[str, Any]:
+        """
+        Resolve the tracked field values a scan result implies for a video.
+
+        Missing optional fields keep their stored value, matching how scans
+        have always treated partial API responses.
+        """
+        fields: Dict[str, Any] = {"title": video_data["title"]}
+        for name in TRACKED_FIELDS[1:]:
+            value = video_data.get(name)
+            fields[name] = value if value is not None else getattr(video, name)
+        return fields
+
+    def apply(
+        self, video: Video, video_data: Dict, changed_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Apply a scan result to an existing video.
+
+        When the content hash matches the stored one and the view count has
+        not drifted the video is left untouched, so SQLAlchemy emits no
+        UPDATE for it. Otherwise only the fields that differ are written;
+        tracked fields are also recorded as a revision.
+
+        Returns:
+            True if any tracked field changed
+        """
+        view_count = video_data.get("view_count")
+        if view_count_drifted(video.view_count, view_count):  # type: ignore[arg-type]
+            video.view_count = view_count  # type: ignore[assignment]
+
+        fields = self.incoming_fields(video, video_data)
+        content_hash = compute_content_hash(fields)
+        if video.content_hash == content_hash:
+            return False
+
+        changes = {
+            name: {"old": getattr(video, name), "new": value}
+            for name, value in fields.items()
+            if getattr(video, name) != value
+        }
+
+        for name, change in changes.items():
+            setattr(video, name, change["new"])
+        video.content_hash = content_hash  # type: ignore[assignment]
+
+        if not changes:
+            return False
+
+        self.db.add(
+            VideoRevision(
+                video_id=video.video_id,
+                changed_at=changed_at or datetime.now(timezone.utc),
+                changes=changes,
+            )
+        )
+        return True
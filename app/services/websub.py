@@ -0,0 +1,373 @@
+"""
+WebSub (PubSubHubbub) push notifications for channel uploads.
+
+YouTube publishes every channel's uploads feed through Google's hub. Each
+active channel gets a subscription whose callback is
+``{WEBSUB_CALLBACK_URL}/{channel_id}``; the hub confirms it with a GET
+carrying a challenge and afterwards POSTs Atom entries signed with the
+subscription's secret (``X-Hub-Signature``) whenever a video is published
+or updated. Subscriptions are leased, so a periodic job renews the ones
+that are about to expire and drops those of deactivated channels.
+
+Pushed videos are ingested one at a time with a single ``videos.list``
+call. Deletion tombstones only mark the channel as due for a full scan,
+which decides what actually happened to the video.
+"""
+
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, cast
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import WEBSUB_NOTIFICATIONS_TOTAL
+from app.models.channel import Channel
+from app.models.websub_subscription import WebSubSubscription
+from app.services.feed_precheck import ATOM_NS, YT_NS
+
+logger = logging.getLogger(__name__)
+
+HUB_URL = "https://pubsubhubbub.appspot.com/subscribe"
+TOPIC_URL = "https://www.youtube.com/xml/feeds/videos.xml?channel_id={channel_id}"
+TOMBSTONE_NS = "{http://purl.org/atompub/tombstones/1.0}"
+
+PENDING = "pending"
+VERIFIED = "verified"
+UNSUBSCRIBING = "unsubscribing"
+DENIED = "denied"
+FAILED = "failed"
+
+
+def topic_url(channel_id: str) -> str:
+    return TOPIC_URL.format(channel_id=channel_id)
+
+
+@dataclass(frozen=True)
+class WebSubConfig:
+    callback_url: Optional[str] = None
+    hub_url: str = HUB_URL
+    lease_seconds: int = 5 * 24 * 3600
+    renew_before_seconds: int = 24 * 3600
+    # A subscription request the hub never verified is retried after this.
+    pending_timeout_seconds: int = 3600
+    timeout_seconds: float = 10.0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.callback_url)
+
+    @classmethod
+    def from_env(cls) -> "WebSubConfig":
+        return cls(
+            callback_url=os.getenv("WEBSUB_CALLBACK_URL") or None,
+            hub_url=os.getenv("WEBSUB_HUB_URL", cls.hub_url),
+            lease_seconds=int(
+                os.getenv("WEBSUB_LEASE_SECONDS", str(cls.lease_seconds))
+            ),
+            renew_before_seconds=int(
+                os.getenv("WEBSUB_RENEW_BEFORE_SECONDS", str(cls.renew_before_seconds))
+            ),
+        )
+
+    def callback_for(self, channel_id: str) -> str:
+        return f"{str(self.callback_url).rstrip('/')}/{channel_id}"
+
+
+@dataclass
+class PushNotification:
+    videos: List[Tuple[str, str]] = field(default_factory=list)
+    deleted_video_ids: List[str] = field(default_factory=list)
+
+
+def parse_push(body: bytes) -> PushNotification:
+    """
+    Extract ``(channel_id, video_id)`` pairs and deleted video IDs from an
+    Atom push payload.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    parser.feed(body)
+    parser.close()
+
+    notification = PushNotification()
+    for _, element in cast(Iterator[Tuple[str, ET.Element]], parser.read_events()):
+        if element.tag == f"{ATOM_NS}entry":
+            video_id = element.findtext(f"{YT_NS}videoId")
+            channel_id = element.findtext(f"{YT_NS}channelId")
+            if video_id and channel_id:
+                notification.videos.append((channel_id.strip(), video_id.strip()))
+        elif element.tag == f"{TOMBSTONE_NS}deleted-entry":
+            ref = element.get("ref", "")
+            if ref.startswith("yt:video:"):
+                notification.deleted_video_ids.append(ref[len("yt:video:") :])
+    return notification
+
+
+def signature_valid(secret: str, body: bytes, header: Optional[str]) -> bool:
+    """Check an ``X-Hub-Signature: <algo>=<hex hmac>`` header."""
+    if not header or "=" not in header:
+        return False
+    algorithm, _, received = header.partition("=")
+    if algorithm not in ("sha1", "sha256", "sha384", "sha512"):
+        return False
+    expected = hmac.new(secret.encode(), body, getattr(hashlib, algorithm))
+    return hmac.compare_digest(expected.hexdigest(), received.strip())
+
+
+def post_to_hub(url: str, data: Dict[str, str], timeout: float) -> int:
+    """Send a form-encoded request to the hub and return the status code."""
+    import httpx
+
+    response = httpx.post(url, data=data, timeout=timeout)
+    return response.status_code
+
+
+class WebSubManager:
+    """Create, verify, renew and drop per-channel hub subscriptions."""
+
+    def __init__(
+        self,
+        db: Session,
+        config: Optional[WebSubConfig] = None,
+        post: Callable[[str, Dict[str, str], float], int] = post_to_hub,
+    ):
+        self.db = db
+        self.config = config or WebSubConfig.from_env()
+        self.post = post
+
+    def get(self, channel_id: str) -> Optional[WebSubSubscription]:
+        return (
+            self.db.query(WebSubSubscription)
+            .filter(WebSubSubscription.channel_id == channel_id)
+            .first()
+        )
+
+    def _request(self, subscription: WebSubSubscription, mode: str) -> bool:
+        channel_id = str(subscription.channel_id)
+        data = {
+            "hub.mode": mode,
+            "hub.topic": str(subscription.topic_url),
+            "hub.callback": self.config.callback_for(channel_id),
+            "hub.verify": "async",
+        }
+        if mode == "subscribe":
+            data["hub.lease_seconds"] = str(self.config.lease_seconds)
+            data["hub.secret"] = str(subscription.secret)
+        try:
+            status_code = self.post(
+                self.config.hub_url, data, self.config.timeout_seconds
+            )
+        except Exception as e:
+            logger.warning(f"WebSub {mode} request for {channel_id} failed: {e}")
+            return False
+        if status_code not in (202, 204):
+            logger.warning(
+                f"WebSub hub rejected {mode} for {channel_id}: HTTP {status_code}"
+            )
+            return False
+        return True
+
+    def subscribe(
+        self, channel_id: str, now: Optional[datetime] = None
+    ) -> WebSubSubscription:
+        """Ask the hub to (re)subscribe; it confirms via the callback."""
+        now = now or datetime.now(timezone.utc)
+        subscription = self.get(channel_id)
+        if subscription is None:
+            subscription = WebSubSubscription(
+                channel_id=channel_id,
+                topic_url=topic_url(channel_id),
+                secret=secrets.token_hex(32),
+            )
+            self.db.add(subscription)
+
+        subscription.requested_at = now  # type: ignore[assignment]
+        if subscription.status != VERIFIED:
+            subscription.status = PENDING  # type: ignore[assignment]
+        # Commit before calling the hub: it may verify the callback before
+        # answering, and the callback looks the subscription up by channel.
+        self.db.commit()
+
+        if not self._request(subscription, "subscribe"):
+            self.db.refresh(subscription)
+            # A verified subscription keeps receiving pushes until its lease
+            # ends, so a failed renewal is simply retried on the next sync.
+            if subscription.status != VERIFIED:
+                subscription.status = FAILED  # type: ignore[assignment]
+                self.db.commit()
+        return subscription
+
+    def unsubscribe(self, channel_id: str) -> None:
+        subscription = self.get(channel_id)
+        if subscription is None:
+            return
+        subscription.status = UNSUBSCRIBING  # type: ignore[assignment]
+        self.db.commit()
+        if not self._request(subscription, "unsubscribe"):
+            # The lease will simply run out; pushes without a stored secret
+            # are rejected in the meantime.
+            self.db.delete(subscription)
+            self.db.commit()
+
+    def verify(
+        self,
+        channel_id: str,
+        mode: str,
+        topic: str,
+        lease_seconds: Optional[int],
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Handle the hub's intent verification; True means echo the challenge.
+        """
+        now = now or datetime.now(timezone.utc)
+        subscription = self.get(channel_id)
+        if subscription is None or topic != subscription.topic_url:
+            return False
+
+        if mode == "subscribe" and subscription.status != UNSUBSCRIBING:
+            subscription.status = VERIFIED  # type: ignore[assignment]
+            subscription.verified_at = now  # type: ignore[assignment]
+            lease = lease_seconds or self.config.lease_seconds
+            subscription.lease_seconds = lease  # type: ignore[assignment]
+            subscription.expires_at = now + timedelta(  # type: ignore[assignment]
+                seconds=lease
+            )
+        elif mode == "unsubscribe" and subscription.status == UNSUBSCRIBING:
+            self.db.delete(subscription)
+        elif mode == "denied":
+            subscription.status = DENIED  # type: ignore[assignment]
+            self.db.commit()
+            return True
+        else:
+            return False
+
+        self.db.commit()
+        logger.info(f"WebSub {mode} verified for channel {channel_id}")
+        return True
+
+    def sync(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Subscribe new channels, renew leases about to expire and retry
+        requests the hub never confirmed; unsubscribe inactive channels.
+        """
+        now = now or datetime.now(timezone.utc)
+        renew_by = now + timedelta(seconds=self.config.renew_before_seconds)
+        retry_before = now - timedelta(seconds=self.config.pending_timeout_seconds)
+        counts = {"subscribed": 0, "renewed": 0, "unsubscribed": 0}
+
+        subscriptions = {
+            str(s.channel_id): s for s in self.db.query(WebSubSubscription).all()
+        }
+        active_ids = {
+            channel_id
+            for (channel_id,) in self.db.query(Channel.channel_id).filter(
+                Channel.is_active.is_(True)
+            )
+        }
+
+        for channel_id in sorted(active_ids):
+            subscription = subscriptions.get(channel_id)
+            if subscription is None:
+                self.subscribe(channel_id, now)
+                counts["subscribed"] += 1
+            elif self._needs_renewal(subscription, renew_by, retry_before):
+                self.subscribe(channel_id, now)
+                counts["renewed"] += 1
+
+        for channel_id, subscription in subscriptions.items():
+            if channel_id not in active_ids and subscription.status != UNSUBSCRIBING:
+                self.unsubscribe(channel_id)
+                counts["unsubscribed"] += 1
+
+        return counts
+
+    @staticmethod
+    def _needs_renewal(
+        subscription: WebSubSubscription, renew_by: datetime, retry_before: datetime
+    ) -> bool:
+        def aware(value: Optional[datetime]) -> Optional[datetime]:
+            if value is not None and value.tzinfo is None:
+                return value.replace(tzinfo=timezone.utc)
+            return value
+
+        if subscription.status == VERIFIED:
+            expires_at = aware(subscription.expires_at)  # type: ignore[arg-type]
+            return expires_at is None or expires_at <= renew_by
+        if subscription.status == PENDING:
+            requested_at = aware(subscription.requested_at)  # type: ignore[arg-type]
+            return requested_at is None or requested_at <= retry_before
+        return bool(subscription.status == FAILED)
+
+    def accept_push(
+        self,
+        channel_id: str,
+        body: bytes,
+        signature: Optional[str],
+        now: Optional[datetime] = None,
+    ) -> Optional[PushNotification]:
+        """
+        Authenticate and parse a pushed payload for ``channel_id``.
+
+        Returns None when the payload must be ignored. Deleted videos make
+        the channel due for a scan immediately.
+        """
+        now = now or datetime.now(timezone.utc)
+        subscription = self.get(channel_id)
+        if subscription is None or not signature_valid(
+            str(subscription.secret), body, signature
+        ):
+            WEBSUB_NOTIFICATIONS_TOTAL.inc(result="rejected")
+            logger.warning(f"Ignoring unauthenticated WebSub push for {channel_id}")
+            return None
+
+        try:
+            notification = parse_push(body)
+        except ET.ParseError as e:
+            WEBSUB_NOTIFICATIONS_TOTAL.inc(result="invalid")
+            logger.warning(f"Ignoring malformed WebSub push for {channel_id}: {e}")
+            return None
+
+        notification.videos = [
+            (pushed_channel, video_id)
+            for pushed_channel, video_id in notification.videos
+            if pushed_channel == channel_id
+        ]
+        subscription.last_notified_at = now  # type: ignore[assignment]
+        if notification.deleted_video_ids:
+            channel = (
+                self.db.query(Channel).filter(Channel.channel_id == channel_id).first()
+            )
+            if channel is not None:
+                channel.scan_requested_at = now  # type: ignore[assignment]
+            WEBSUB_NOTIFICATIONS_TOTAL.inc(
+                len(notification.deleted_video_ids), result="deleted"
+            )
+        self.db.commit()
+        return notification
+
+
+def ingest_pushed_videos(channel_id: str, video_ids: List[str]) -> None:
+    """Background task: ingest each pushed video with its own session."""
+    from app.core.database import SessionLocal
+    from app.services.video_ingestion import VideoIngestionService
+    from app.services.youtube_client import YouTubeClient
+
+    db = SessionLocal()
+    try:
+        ingestion = VideoIngestionService(db, YouTubeClient())
+        for video_id in video_ids:
+            try:
+                ingestion.ingest_video(channel_id, video_id)
+                WEBSUB_NOTIFICATIONS_TOTAL.inc(result="ingested")
+            except Exception as e:
+                db.rollback()
+                WEBSUB_NOTIFICATIONS_TOTAL.inc(result="failed")
+                logger.error(f"Failed to ingest pushed video {video_id}: {e}")
+    finally:
+        db.close()
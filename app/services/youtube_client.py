@@ -1,14 +1,20 @@
 import logging
-import os
-import random
 import re
 import time
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urlparse
-
-from googleapiclient.discovery import build  # type: ignore[import-untyped]
-from googleapiclient.errors import HttpError  # type: ignore[import-untyped]
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
+
+from app.core.metrics import (
+    YOUTUBE_API_ERRORS_TOTAL,
+    YOUTUBE_API_REQUEST_SECONDS,
+    operation_label,
+)
+from app.services.api_key_pool import ApiKeyPool
+from app.services.circuit_breaker import get_circuit_breaker
+from app.services.rate_limiter import get_rate_limiter
+from app.services.retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -25,117 +31,246 @@ class YouTubeQuotaExhaustedError(YouTubeAPIError):
     pass
 
 
+class YouTubeCircuitOpenError(YouTubeAPIError):
+    """Raised without calling the API while the circuit breaker is open."""
+
+    pass
+
+
+# 403 reasons meaning the key's daily quota is gone until the Pacific reset.
+QUOTA_EXHAUSTED_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+# 403 reasons for short-lived per-second or per-user throttling; retried
+# with backoff like a 429 without evicting the key or opening the breaker.
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+
+def _error_reason(status_code: int) -> str:
+    if status_code == 403:
+        return "forbidden"
+    if status_code == 429:
+        return "rate_limited"
+    if status_code >= 500:
+        return "server_error"
+    return "client_error"
+
+
+@dataclass
+class ApiUsage:
+    """Running totals of Data API usage for one client instance."""
+
+    api_calls: int = 0
+    quota_units: int = 0
+    pages_fetched: int = 0
+
+    def snapshot(self) -> "ApiUsage":
+        return replace(self)
+
+    def since(self, earlier: "ApiUsage") -> "ApiUsage":
+        return ApiUsage(
+            api_calls=self.api_calls - earlier.api_calls,
+            quota_units=self.quota_units - earlier.quota_units,
+            pages_fetched=self.pages_fetched - earlier.pages_fetched,
+        )
+
+
+# Placeholder titles YouTube puts on playlist items it no longer shows.
+UNAVAILABLE_TITLES = {
+    "Private video": "private",
+    "Deleted video": "deleted",
+}
+
+
+@dataclass(frozen=True)
+class UploadsFingerprint:
+    """
+    Cheap summary of an uploads playlist taken from its first page.
+
+    ``item_count`` is the playlist's ``pageInfo.totalResults`` (the same
+    figure ``playlists.list`` reports as ``contentDetails.itemCount``),
+    ``etag`` the first page's ETag and ``newest_video_id`` its first item.
+    """
+
+    item_count: Optional[int]
+    etag: Optional[str]
+    newest_video_id: Optional[str]
+
+
+def _with_api_key(uri: str, api_key: str) -> str:
+    """Return ``uri`` with its ``key`` query parameter set to ``api_key``."""
+    parts = urlsplit(uri)
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name != "key"
+    ]
+    query.append(("key", api_key))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def extract_channel_id(input_str: str) -> Optional[str]:
+    """Return the channel ID in a bare ID or ``/channel/`` URL, else None."""
+    if re.match(r"^UC[a-zA-Z0-9_-]{22}$", input_str):
+        return input_str
+
+    try:
+        parsed = urlparse(input_str)
+        path = parsed.path
+
+        channel_match = re.match(r"^/channel/(UC[a-zA-Z0-9_-]{22})/?$", path)
+        if channel_match:
+            return channel_match.group(1)
+
+    except Exception:
+        pass
+
+    return None
+
+
 class YouTubeClient:
     def __init__(self) -> None:
-        self.api_key = os.getenv("YOUTUBE_API_KEY")
-        if not self.api_key:
+        self.key_pool = ApiKeyPool.from_env()
+        if not len(self.key_pool):
             raise ValueError("YOUTUBE_API_KEY environment variable is required")
+        self.api_key = self.key_pool.keys[0].value
+
+        # googleapiclient is slow to import; load it on first client only.
+        from googleapiclient.discovery import build  # type: ignore[import-untyped]
 
         self.youtube = build("youtube", "v3", developerKey=self.api_key)
 
-        self.max_retries = int(os.getenv("YOUTUBE_API_MAX_RETRIES", "3"))
-        self.base_delay = float(os.getenv("YOUTUBE_API_BASE_DELAY", "1.0"))
-        self.max_delay = float(os.getenv("YOUTUBE_API_MAX_DELAY", "60.0"))
-        self.backoff_multiplier = float(
-            os.getenv("YOUTUBE_API_BACKOFF_MULTIPLIER", "2.0")
-        )
+        self.retry_policy = RetryPolicy.from_env("YOUTUBE_API")
+        self.usage = ApiUsage()
+        self.rate_limiter = get_rate_limiter()
+        self.circuit_breaker = get_circuit_breaker()
 
     def _execute_with_retry(
-        self, request: Any, operation_name: str = "API call"
+        self, request: Any, operation_name: str = "API call", quota_cost: int = 1
     ) -> Any:
-        """Execute YouTube API request with exponential backoff retry."""
-        last_exception = None
+        """
+        Execute a YouTube API request, retrying transient failures.
+
+        Every attempt first takes a token from the shared rate limiter and
+        is counted against ``quota_cost`` because YouTube charges quota for
+        failed requests too. Each attempt is sent with the pooled API key
+        that has the most quota left; a key that runs out is evicted and the
+        request moves on to the next one. Which other failures are retried,
+        how long to wait and when to give up is decided by
+        ``self.retry_policy``.
+        """
+        from googleapiclient.errors import HttpError  # type: ignore[import-untyped]
 
-        for attempt in range(self.max_retries + 1):
-            try:
-                if attempt > 0:
-                    delay = min(
-                        self.base_delay * (self.backoff_multiplier ** (attempt - 1)),
-                        self.max_delay,
-                    )
-                    jitter = random.uniform(0, delay * 0.1)
-                    total_delay = delay + jitter
+        operation = operation_label(operation_name)
+        retry = self.retry_policy.start()
 
-                    logger.info(
-                        f"Retrying {operation_name} "
-                        f"(attempt {attempt + 1}/{self.max_retries + 1}) "
-                        f"after {total_delay:.2f}s delay"
-                    )
-                    time.sleep(total_delay)
+        while True:
+            if not self.circuit_breaker.allow():
+                YOUTUBE_API_ERRORS_TOTAL.inc(operation=operation, reason="circuit_open")
+                raise YouTubeCircuitOpenError(
+                    f"YouTube API circuit is open, skipping {operation_name}"
+                )
 
-                response = request.execute()
+            key = self.key_pool.choose()
+            if key is None:
+                self.circuit_breaker.record_quota_exhausted()
+                raise YouTubeQuotaExhaustedError(
+                    "Every YouTube API key is out of quota until the daily reset"
+                )
 
-                if attempt > 0:
+            try:
+                self.rate_limiter.acquire(operation)
+                uri = getattr(request, "uri", None)
+                if isinstance(uri, str):
+                    request.uri = _with_api_key(uri, key.value)
+                self.usage.api_calls += 1
+                self.usage.quota_units += quota_cost
+                self.key_pool.charge(key, quota_cost)
+                with YOUTUBE_API_REQUEST_SECONDS.time(operation=operation):
+                    response = request.execute()
+                self.circuit_breaker.record_success()
+
+                if retry.attempts > 0:
                     logger.info(
                         f"Successfully completed {operation_name} "
-                        f"after {attempt} retries"
+                        f"after {retry.attempts} retries"
                     )
 
                 return response
 
             except HttpError as e:
-                last_exception = e
                 status_code = e.resp.status
+                YOUTUBE_API_ERRORS_TOTAL.inc(
+                    operation=operation, reason=_error_reason(status_code)
+                )
 
+                rate_limited = False
                 if status_code == 403:
                     error_details = (
                         e.error_details if hasattr(e, "error_details") else []
                     )
-                    quota_errors = [
-                        "quotaExceeded",
-                        "dailyLimitExceeded",
-                        "userRateLimitExceeded",
-                        "rateLimitExceeded",
-                    ]
-
-                    if any(
-                        error.get("reason") in quota_errors for error in error_details
-                    ):
+                    reasons = {error.get("reason") for error in error_details}
+
+                    if reasons & QUOTA_EXHAUSTED_REASONS:
+                        self.key_pool.evict(key)
+                        if self.key_pool.choose() is not None:
+                            logger.warning(
+                                f"Retrying {operation_name} with another API key"
+                            )
+                            continue
                         logger.error(f"YouTube API quota exhausted: {e}")
+                        self.circuit_breaker.record_quota_exhausted()
                         raise YouTubeQuotaExhaustedError(
                             f"YouTube API quota exhausted: {e}"
                         )
-                    else:
+                    elif not reasons & RATE_LIMIT_REASONS:
                         logger.error(f"YouTube API permission error: {e}")
                         raise YouTubeAPIError(f"YouTube API permission error: {e}")
+                    rate_limited = True
 
-                elif status_code == 429:
-                    logger.warning(
-                        f"YouTube API rate limit hit for {operation_name}, "
-                        f"attempt {attempt + 1}"
-                    )
-                    continue
-
-                elif status_code >= 500:
-                    logger.warning(
-                        f"YouTube API server error for {operation_name}: {e}, "
-                        f"attempt {attempt + 1}"
-                    )
-                    continue
+                if status_code >= 500:
+                    self.circuit_breaker.record_server_error()
 
-                else:
+                delay = retry.next_delay(e, retryable=True if rate_limited else None)
+                if delay is None:
+                    if rate_limited or status_code == 429 or status_code >= 500:
+                        logger.error(
+                            f"Giving up on {operation_name} after "
+                            f"{retry.attempts} attempts ({retry.gave_up_reason})"
+                        )
+                        raise YouTubeAPIError(
+                            f"YouTube API error after retries: {e}"
+                        ) from e
                     logger.error(f"YouTube API client error for {operation_name}: {e}")
-                    raise YouTubeAPIError(f"YouTube API client error: {e}")
+                    raise YouTubeAPIError(f"YouTube API client error: {e}") from e
 
-            except Exception as e:
-                last_exception = e
                 logger.warning(
-                    f"Unexpected error in {operation_name}, attempt {attempt + 1}: {e}"
+                    f"YouTube API error {status_code} for {operation_name}, "
+                    f"retrying in {delay:.2f}s (attempt {retry.attempts + 1}/"
+                    f"{self.retry_policy.max_retries + 1})"
                 )
-                continue
+                time.sleep(delay)
 
-        logger.error(f"All retries exhausted for {operation_name}")
-        if isinstance(last_exception, HttpError):
-            if last_exception.resp.status == 403:
-                raise YouTubeQuotaExhaustedError(
-                    f"YouTube API quota exhausted after retries: {last_exception}"
-                )
-            else:
-                raise YouTubeAPIError(
-                    f"YouTube API error after retries: {last_exception}"
+            except YouTubeAPIError:
+                raise
+
+            except Exception as e:
+                YOUTUBE_API_ERRORS_TOTAL.inc(operation=operation, reason="exception")
+                delay = retry.next_delay(e)
+                if delay is None:
+                    if retry.gave_up_reason == "not_retryable":
+                        # Programming errors and the like: fail loudly, once.
+                        raise
+                    logger.error(
+                        f"Giving up on {operation_name} after "
+                        f"{retry.attempts} attempts ({retry.gave_up_reason})"
+                    )
+                    raise YouTubeAPIError(f"Transient error after retries: {e}") from e
+
+                logger.warning(
+                    f"Transient error in {operation_name}, retrying in "
+                    f"{delay:.2f}s (attempt {retry.attempts + 1}/"
+                    f"{self.retry_policy.max_retries + 1}): {e}"
                 )
-        else:
-            raise YouTubeAPIError(f"Unexpected error after retries: {last_exception}")
+                time.sleep(delay)
 
     def resolve_channel_input(
         self, input_str: str
@@ -158,21 +293,7 @@ class YouTubeClient:
 
     def _extract_channel_id(self, input_str: str) -> Optional[str]:
         """Extract channel ID from various URL formats or return if already a channel ID."""  # noqa: E501
-        if re.match(r"^UC[a-zA-Z0-9_-]{22}$", input_str):
-            return input_str
-
-        try:
-            parsed = urlparse(input_str)
-            path = parsed.path
-
-            channel_match = re.match(r"^/channel/(UC[a-zA-Z0-9_-]{22})/?$", path)
-            if channel_match:
-                return channel_match.group(1)
-
-        except Exception:
-            pass
-
-        return None
+        return extract_channel_id(input_str)
 
     def _resolve_by_handle_or_username(
         self, input_str: str
@@ -255,7 +376,7 @@ class YouTubeClient:
                 part="snippet", q=custom_name, type="channel", maxResults=1
             )
             response = self._execute_with_retry(
-                request, f"search by custom name: {custom_name}"
+                request, f"search by custom name: {custom_name}", quota_cost=100
             )
 
             if response.get("items"):
@@ -295,6 +416,28 @@ class YouTubeClient:
 
         return None, None
 
+    def fetch_channels(self, channel_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch metadata for many channels, 50 IDs per ``channels.list`` call.
+
+        Channels the API does not return (deleted or terminated) are absent
+        from the result.
+        """
+        channels: Dict[str, Dict] = {}
+        for start in range(0, len(channel_ids), 50):
+            batch = channel_ids[start : start + 50]
+            request = self.youtube.channels().list(
+                part="snippet,statistics,contentDetails",
+                id=",".join(batch),
+                maxResults=50,
+            )
+            response = self._execute_with_retry(
+                request, f"get channel metadata batch: {len(batch)} channels"
+            )
+            for item in response.get("items", []):
+                channels[item["id"]] = self._extract_metadata(item)
+        return channels
+
     def _extract_metadata(self, channel_data: Dict) -> Dict:
         """Extract relevant metadata from YouTube API response."""
         snippet = channel_data.get("snippet", {})
@@ -326,23 +469,25 @@ class YouTubeClient:
             max_results: Maximum number of videos to fetch
 
         Returns:
-            List of video metadata dictionaries
+            List of video metadata dictionaries. Playlist entries YouTube
+            marks as private or deleted are included as
+            ``{"video_id": ..., "unavailable": "private" | "deleted"}``.
         """
         videos: list[dict[str, Any]] = []
         next_page_token = None
 
         try:
             while len(videos) < max_results:
-                request = self.youtube.playlistItems().list(
-                    part="snippet,contentDetails",
-                    playlistId=uploads_playlist_id,
-                    maxResults=min(50, max_results - len(videos)),
-                    pageToken=next_page_token,
+                request = self._playlist_items_request(
+                    uploads_playlist_id,
+                    min(50, max_results - len(videos)),
+                    next_page_token,
                 )
 
                 response = self._execute_with_retry(
                     request, f"fetch playlist items: {uploads_playlist_id}"
                 )
+                self.usage.pages_fetched += 1
                 items = response.get("items", [])
 
                 if not items:
@@ -355,6 +500,11 @@ class YouTubeClient:
                     video_id = item["contentDetails"]["videoId"]
                     video_detail = video_details.get(video_id, {})
 
+                    reason = self._unavailable_reason(item, video_detail)
+                    if reason:
+                        videos.append({"video_id": video_id, "unavailable": reason})
+                        continue
+
                     if not video_detail:
                         continue
 
@@ -374,6 +524,88 @@ class YouTubeClient:
 
         return videos
 
+    def _unavailable_reason(
+        self, playlist_item: Dict, video_detail: Dict
+    ) -> Optional[str]:
+        """
+        Classify a playlist entry that can no longer be watched.
+
+        Uploads playlists keep listing private and deleted videos under
+        their IDs, with the item's own status and a placeholder title saying
+        which, so no follow-up request is needed to tell them apart.
+        """
+        title = playlist_item.get("snippet", {}).get("title")
+        if title in UNAVAILABLE_TITLES:
+            return UNAVAILABLE_TITLES[title]
+
+        item_privacy = playlist_item.get("status", {}).get("privacyStatus")
+        video_privacy = video_detail.get("status", {}).get("privacyStatus")
+        if "private" in (item_privacy, video_privacy):
+            return "private"
+        return None
+
+    def fetch_uploads_fingerprint(
+        self, uploads_playlist_id: str, max_results: int = 50
+    ) -> UploadsFingerprint:
+        """
+        Fingerprint an uploads playlist with a single 1-unit call.
+
+        The request is identical to the first page ``fetch_channel_videos``
+        walks, so its ETag changes whenever anything on that page does.
+        """
+        request = self._playlist_items_request(
+            uploads_playlist_id, min(50, max_results), None
+        )
+        response = self._execute_with_retry(
+            request, f"fetch playlist fingerprint: {uploads_playlist_id}"
+        )
+        items = response.get("items", [])
+        total = response.get("pageInfo", {}).get("totalResults")
+        return UploadsFingerprint(
+            item_count=int(total) if total is not None else None,
+            etag=response.get("etag"),
+            newest_video_id=items[0]["contentDetails"]["videoId"] if items else None,
+        )
+
+    def _playlist_items_request(
+        self, playlist_id: str, max_results: int, page_token: Optional[str]
+    ) -> Any:
+        return self.youtube.playlistItems().list(
+            part="snippet,contentDetails,status",
+            playlistId=playlist_id,
+            maxResults=max_results,
+            pageToken=page_token,
+        )
+
+    def fetch_video(self, video_id: str) -> Optional[Dict]:
+        """
+        Fetch metadata for a single video (one ``videos.list`` call).
+
+        Returns None when the video does not exist or is not public.
+        """
+        detail = self._get_video_details([video_id]).get(video_id)
+        if not detail:
+            return None
+        return self._extract_video_metadata({}, detail)
+
+    def probe_videos(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Look videos up directly, 50 IDs per ``videos.list`` call.
+
+        Unlike ``_get_video_details`` every error propagates, so a failed
+        probe can never be mistaken for videos that no longer exist.
+        """
+        found: Dict[str, Dict] = {}
+        for start in range(0, len(video_ids), 50):
+            batch = video_ids[start : start + 50]
+            request = self.youtube.videos().list(part="status", id=",".join(batch))
+            response = self._execute_with_retry(
+                request, f"probe videos: {len(batch)} videos"
+            )
+            for item in response.get("items", []):
+                found[item["id"]] = item
+        return found
+
     def _get_video_details(self, video_ids: List[str]) -> Dict[str, Dict]:
         """Get detailed video information for a list of video IDs."""
         if not video_ids:
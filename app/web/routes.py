@@ -3,14 +3,16 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy import desc
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import count_rows, get_db, get_read_db, record_write
 from app.models.channel import Channel
 from app.models.disappearance_event import DisappearanceEvent
 from app.models.video import Video
+from app.services.channel_registry import ChannelRegistry
+from app.services.channel_stats import ChannelStatsService
 from app.services.video_ingestion import VideoIngestionService
 from app.services.youtube_client import YouTubeClient
 from app.web.auth import (
@@ -20,11 +22,11 @@ from app.web.auth import (
     verify_admin_credentials,
     verify_csrf_token,
 )
+from app.web.templating import get_templates
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/web/templates")
 
 
 @router.get("/admin", response_class=RedirectResponse)
@@ -42,7 +44,7 @@ async def admin_channels(
     request: Request,
     page: int = 1,
     search: str = "",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     admin_user: str = Depends(verify_admin_credentials),
 ) -> Any:
     """Admin channels list page with pagination and search."""
@@ -51,24 +53,24 @@ async def admin_channels(
     per_page = 10
     offset = (page - 1) * per_page
 
-    query = db.query(Channel).filter(Channel.is_active.is_(True))
+    query = select(Channel).where(Channel.is_active.is_(True))
 
     if search:
-        query = query.filter(
+        query = query.where(
             Channel.title.ilike(f"%{search}%")
             | Channel.channel_id.ilike(f"%{search}%")
             | Channel.source_input.ilike(f"%{search}%")
         )
 
-    total_channels = query.count()
+    total_channels = await count_rows(db, query)
     total_pages = (total_channels + per_page - 1) // per_page
 
-    channels = query.offset(offset).limit(per_page).all()
+    channels = (await db.scalars(query.offset(offset).limit(per_page))).all()
 
     csrf_token = generate_csrf_token()
     request.session["csrf_token"] = csrf_token
 
-    return templates.TemplateResponse(
+    return get_templates().TemplateResponse(
         "channels.html",
         {
             "request": request,
@@ -91,33 +93,34 @@ async def admin_channels(
 async def channel_videos(
     request: Request,
     channel_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     admin_user: str = Depends(verify_admin_credentials),
 ) -> Any:
     """Channel videos page."""
     require_https(request)
 
-    channel = (
-        db.query(Channel)
-        .filter(Channel.channel_id == channel_id, Channel.is_active.is_(True))
-        .first()
+    channel = await db.scalar(
+        select(Channel).where(
+            Channel.channel_id == channel_id, Channel.is_active.is_(True)
+        )
     )
 
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
 
     videos = (
-        db.query(Video)
-        .filter(Video.channel_id == channel_id)
-        .order_by(desc(Video.published_at))
-        .limit(100)
-        .all()
-    )
+        await db.scalars(
+            select(Video)
+            .where(Video.channel_id == channel_id)
+            .order_by(desc(Video.published_at))
+            .limit(100)
+        )
+    ).all()
 
     csrf_token = generate_csrf_token()
     request.session["csrf_token"] = csrf_token
 
-    return templates.TemplateResponse(
+    return get_templates().TemplateResponse(
         "channel_videos.html",
         {
             "request": request,
@@ -132,25 +135,26 @@ async def channel_videos(
 @router.get("/admin/events")
 async def disappearance_events(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     admin_user: str = Depends(verify_admin_credentials),
 ) -> Any:
     """Disappearance events page."""
     require_https(request)
 
     events = (
-        db.query(DisappearanceEvent)
-        .join(Video)
-        .join(Channel)
-        .order_by(desc(DisappearanceEvent.detected_at))
-        .limit(100)
-        .all()
-    )
+        await db.scalars(
+            select(DisappearanceEvent)
+            .join(Video)
+            .join(Channel)
+            .order_by(desc(DisappearanceEvent.detected_at))
+            .limit(100)
+        )
+    ).all()
 
     csrf_token = generate_csrf_token()
     request.session["csrf_token"] = csrf_token
 
-    return templates.TemplateResponse(
+    return get_templates().TemplateResponse(
         "events.html",
         {
             "request": request,
@@ -187,14 +191,18 @@ async def add_channel(
             db.query(Channel).filter(Channel.channel_id == channel_id).first()
         )
 
+        registry = ChannelRegistry(db)
         if existing_channel:
             if not existing_channel.is_active:
+                registry.reserve()
                 existing_channel.is_active = True  # type: ignore[assignment]
+                ChannelStatsService(db).ensure(channel_id)
                 db.commit()
                 logger.info(f"Reactivated channel {channel_id}")
             else:
                 raise HTTPException(status_code=400, detail="Channel already exists")
         else:
+            registry.reserve()
             new_channel = Channel(
                 channel_id=channel_id,
                 title=metadata.get("title", "Unknown"),
@@ -205,10 +213,14 @@ async def add_channel(
                 is_active=True,
             )
             db.add(new_channel)
+            db.flush()
+            ChannelStatsService(db).ensure(channel_id)
             db.commit()
             logger.info(f"Added new channel {channel_id}")
 
-        return RedirectResponse(url="/admin/channels", status_code=303)
+        response = RedirectResponse(url="/admin/channels", status_code=303)
+        record_write(db, response)
+        return response
 
     except Exception as e:
         logger.error(f"Failed to add channel {channel_input}: {e}")
@@ -280,8 +292,11 @@ async def delete_channel(
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
 
+    ChannelRegistry(db).release()
     channel.is_active = False  # type: ignore[assignment]
     db.commit()
 
     logger.info(f"Soft deleted channel {channel_id}")
-    return RedirectResponse(url="/admin/channels", status_code=303)
+    response = RedirectResponse(url="/admin/channels", status_code=303)
+    record_write(db, response)
+    return response
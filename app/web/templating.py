@@ -0,0 +1,13 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastapi.templating import Jinja2Templates
+
+
+@lru_cache(maxsize=1)
+def get_templates() -> "Jinja2Templates":
+    """Build the Jinja environment on the first rendered page, not at import."""
+    from fastapi.templating import Jinja2Templates
+
+    return Jinja2Templates(directory="app/web/templates")
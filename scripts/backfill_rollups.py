@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+YouTube Disappeared Video Tracker - Rollup Backfill Script
+
+Rebuilds the hourly/daily disappearance rollups from the
+disappearance_events table. Safe to re-run: existing rollup rows for the
+selected scope are replaced.
+
+Usage:
+    python scripts/backfill_rollups.py [--channel-id UCxxxx]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.services.event_rollups import EventRollupService  # noqa: E402
+
+
+def main() -> None:
+    """Main entry point for the backfill script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--channel-id", help="Only backfill this channel")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        processed = EventRollupService(db).backfill(args.channel_id)
+        db.commit()
+
+    print(f"✅ Rolled up {processed} disappearance events")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+YouTube Disappeared Video Tracker - Channel Registry Benchmark
+
+Seeds a synthetic watchlist (10,000 channels by default, with stats rows
+and tags) into a scratch database and times the channel list endpoints,
+the quota check behind every add, and the scan planner's sweep queries.
+No YouTube API calls are made.
+
+Usage:
+    python scripts/benchmark_channels.py [--channels 10000] [--repeat 5]
+        [--database-url sqlite:///bench.db]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Callable, Generator, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, func, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.api.channels import router  # noqa: E402
+from app.core.database import Base, get_async_db, get_db  # noqa: E402
+from app.core.db_config import to_async_url  # noqa: E402
+from app.models.channel import Channel  # noqa: E402
+from app.models.channel_stats import ChannelStats  # noqa: E402
+from app.models.channel_tag import ChannelTag  # noqa: E402
+from app.services.channel_registry import ChannelRegistry, RegistryConfig  # noqa: E402
+from app.services.scan_scheduler import AdaptiveScanScheduler  # noqa: E402
+
+TAGS = [f"group-{index:02d}" for index in range(20)]
+SEED_BATCH = 1000
+
+
+def seed(db: Session, channels: int) -> None:
+    """Insert the synthetic channels, their stats rows and tags."""
+    for start in range(0, channels, SEED_BATCH):
+        indexes = range(start, min(start + SEED_BATCH, channels))
+        ids = [f"UC{index:022d}" for index in indexes]
+        db.execute(
+            insert(Channel),
+            [
+                {
+                    "channel_id": channel_id,
+                    "title": f"Channel {index}",
+                    "uploads_playlist_id": "UU" + channel_id[2:],
+                    "source_input": channel_id,
+                }
+                for index, channel_id in zip(indexes, ids)
+            ],
+        )
+        db.execute(
+            insert(ChannelStats),
+            [{"channel_id": channel_id, "total_videos": 100} for channel_id in ids],
+        )
+        db.execute(
+            insert(ChannelTag),
+            [
+                {"channel_id": channel_id, "tag": TAGS[index % len(TAGS)]}
+                for index, channel_id in zip(indexes, ids)
+            ],
+        )
+    db.commit()
+
+
+def timed(label: str, repeat: int, action: Callable[[], object]) -> None:
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - started) * 1000)
+    print(
+        f"{label:<42} median {statistics.median(samples):8.1f} ms"
+        f"   max {max(samples):8.1f} ms"
+    )
+
+
+def main() -> None:
+    """Main entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--channels", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--database-url",
+        help="Scratch database to use; its tables are dropped and recreated",
+    )
+    args = parser.parse_args()
+
+    scratch = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite:///{scratch.name}/bench.db"
+    engine = create_engine(database_url)
+    async_engine = create_async_engine(to_async_url(database_url))
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        seed(db, args.channels)
+    print(f"Seeded {args.channels} channels in {time.perf_counter() - started:.1f}s")
+
+    def override_get_db() -> Generator[Session, None, None]:
+        with SessionLocal() as db:
+            yield db
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    client = TestClient(app)
+
+    def get(url: str) -> Callable[[], object]:
+        def request() -> object:
+            response = client.get(url)
+            response.raise_for_status()
+            return response
+
+        return request
+
+    timed("GET /api/channels/ (default page)", args.repeat, get("/api/channels/"))
+    timed(
+        "GET /api/channels/?limit=1000", args.repeat, get("/api/channels/?limit=1000")
+    )
+    timed(
+        "GET /api/channels/?limit=100&offset=9000",
+        args.repeat,
+        get(f"/api/channels/?limit=100&offset={max(0, args.channels - 1000)}"),
+    )
+    timed(
+        f"GET /api/channels/?tag={TAGS[0]}",
+        args.repeat,
+        get(f"/api/channels/?tag={TAGS[0]}"),
+    )
+    timed("GET /api/channels/tags", args.repeat, get("/api/channels/tags"))
+    timed("GET /api/channels/usage", args.repeat, get("/api/channels/usage"))
+
+    with SessionLocal() as db:
+        registry = ChannelRegistry(db, RegistryConfig(max_active_channels=0))
+        registry.quota()
+
+        def count_active() -> object:
+            return (
+                db.query(func.count(Channel.id))
+                .filter(Channel.is_active.is_(True))
+                .scalar()
+            )
+
+        def reserve() -> None:
+            registry.reserve()
+            db.rollback()
+
+        timed("add check: COUNT(*) (before)", args.repeat, count_active)
+        timed("add check: counter reserve", args.repeat, reserve)
+
+        scheduler = AdaptiveScanScheduler(db)
+        timed("scan sweep: plan()", args.repeat, scheduler.plan)
+        timed(
+            "scan sweep: due_channels(limit=10)",
+            args.repeat,
+            lambda: scheduler.due_channels(limit=10),
+        )
+
+    client.close()
+    asyncio.run(async_engine.dispose())
+    engine.dispose()
+    scratch.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env bash
+# Bring the database schema up to date, then run the container command.
+# The app no longer creates tables itself and stays unready until the schema
+# is at the latest revision. Set RUN_MIGRATIONS=false where a separate release
+# step (Fly release_command, the compose migrate service) already migrates.
+set -euo pipefail
+
+if [ "${RUN_MIGRATIONS:-true}" = "true" ]; then
+    alembic upgrade head
+fi
+
+exec "$@"
@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+from typing import AsyncGenerator, Callable, Generator, Iterator, List
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, get_async_db, get_db
+from app.core.db_config import to_async_url
+
+
+class TestDatabase:
+    """
+    An in-memory SQLite database reachable from sync and async sessions.
+
+    The database is a named shared-cache one, so the aiosqlite engine that
+    serves the async read endpoints sees the rows the sync session wrote.
+    It lives until ``dispose`` closes both engines.
+    """
+
+    __test__ = False
+
+    def __init__(self, name: str) -> None:
+        self.url = f"sqlite:///file:{name}?mode=memory&cache=shared&uri=true"
+        self.engine = create_engine(
+            self.url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        self.async_engine = create_async_engine(
+            to_async_url(self.url), poolclass=StaticPool
+        )
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine
+        )
+        self.AsyncSessionLocal = async_sessionmaker(
+            self.async_engine, expire_on_commit=False
+        )
+        self._apps: List[FastAPI] = []
+        Base.metadata.create_all(bind=self.engine)
+
+    def override_get_db(self) -> Generator[Session, None, None]:
+        db = self.SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self.AsyncSessionLocal() as db:
+            yield db
+
+    def install(self, app: FastAPI) -> None:
+        """Point ``app``'s database dependencies at this database."""
+        app.dependency_overrides[get_db] = self.override_get_db
+        app.dependency_overrides[get_async_db] = self.override_get_async_db
+        self._apps.append(app)
+
+    def dispose(self) -> None:
+        for app in self._apps:
+            app.dependency_overrides.pop(get_db, None)
+            app.dependency_overrides.pop(get_async_db, None)
+        self.engine.dispose()
+        asyncio.run(self.async_engine.dispose())
+
+
+@pytest.fixture
+def make_database() -> Iterator[Callable[[], TestDatabase]]:
+    """Factory for fresh test databases, disposed after the test."""
+    databases: List[TestDatabase] = []
+
+    def make() -> TestDatabase:
+        database = TestDatabase(f"test_{uuid.uuid4().hex}")
+        databases.append(database)
+        return database
+
+    yield make
+    for database in databases:
+        database.dispose()
+
+
+@pytest.fixture
+def database(make_database: Callable[[], TestDatabase]) -> TestDatabase:
+    """A fresh test database with the schema created."""
+    return make_database()
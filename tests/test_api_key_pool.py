@@ -0,0 +1,266 @@
+import asyncio
+import os
+from datetime import datetime, timezone
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from googleapiclient.errors import HttpError
+
+from app.core.metrics import YOUTUBE_KEY_EVICTIONS_TOTAL
+from app.main import app
+from app.services.api_key_pool import (
+    ApiKeyPool,
+    QuotaLedger,
+    RedisLedgerStore,
+    api_keys_from_env,
+    key_id,
+)
+from app.services.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from app.services.scan_scheduler import ScheduleConfig
+from app.services.youtube_client import YouTubeClient, YouTubeQuotaExhaustedError
+
+# 2025-09-18 12:00 UTC; the next Pacific midnight is 07:00 UTC on the 19th.
+NOW = datetime(2025, 9, 18, 12, 0, tzinfo=timezone.utc).timestamp()
+RESET = datetime(2025, 9, 19, 7, 0, tzinfo=timezone.utc).timestamp()
+
+
+class Clock:
+    def __init__(self, now: float = NOW) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestApiKeyPool:
+    def setup_method(self) -> None:
+        self.clock = Clock()
+        self.ledger = QuotaLedger(clock=self.clock)
+        self.pool = ApiKeyPool(["key-a", "key-b", "key-c"], 100, ledger=self.ledger)
+        self.a, self.b, self.c = self.pool.keys
+
+    def test_routes_to_key_with_most_headroom(self) -> None:
+        assert self.pool.choose() == self.a
+
+        self.pool.charge(self.a, 10)
+        self.pool.charge(self.b, 5)
+
+        assert self.pool.choose() == self.c
+        self.pool.charge(self.c, 20)
+        assert self.pool.choose() == self.b
+
+    def test_evicted_key_returns_after_reset(self) -> None:
+        before = YOUTUBE_KEY_EVICTIONS_TOTAL.value(key=self.a.key_id)
+
+        self.pool.evict(self.a)
+        self.pool.evict(self.b)
+
+        assert self.pool.choose() == self.c
+        self.pool.evict(self.c)
+        assert self.pool.choose() is None
+        assert YOUTUBE_KEY_EVICTIONS_TOTAL.value(key=self.a.key_id) == before + 1
+
+        self.clock.now = RESET + 1
+        assert self.pool.choose() == self.a
+
+    def test_ledger_starts_over_each_day(self) -> None:
+        self.pool.charge(self.a, 60)
+        self.clock.now = RESET + 1
+
+        assert self.ledger.used(self.a.key_id) == 0
+
+    def test_status_reports_usage_without_key_values(self) -> None:
+        self.pool.charge(self.b, 30)
+        self.pool.evict(self.c)
+
+        status = self.pool.status()
+
+        assert status["shared"] is False
+        assert status["keys"][1] == {
+            "key": key_id("key-b"),
+            "quota_units_used": 30,
+            "daily_quota": 100,
+            "remaining": 70,
+            "evicted_until": None,
+        }
+        assert status["keys"][2]["evicted_until"] == "2025-09-19T07:00:00+00:00"
+        assert "key-b" not in str(status).replace(key_id("key-b"), "")
+
+    def test_ledger_falls_back_when_redis_fails(self) -> None:
+        store = Mock()
+        store.add.side_effect = ConnectionError("down")
+        store.used.side_effect = ConnectionError("down")
+        ledger = QuotaLedger(store, clock=self.clock)
+
+        ledger.charge("key-x", 3)
+
+        assert ledger.used("key-x") == 3
+
+
+def test_redis_store_keeps_ledgers_per_reset_period() -> None:
+    client = Mock()
+    client.pipeline.return_value.execute.return_value = [7, True]
+    client.get.return_value = b"7"
+    ledger = QuotaLedger(RedisLedgerStore(client), clock=Clock())
+
+    assert ledger.charge("key-x", 7) == 7
+    assert ledger.used("key-x") == 7
+    ledger.evict("key-x")
+
+    period = int(RESET)
+    client.pipeline.return_value.incrby.assert_called_once_with(
+        f"youtube_keys:usage:{period}:key-x", 7
+    )
+    client.pipeline.return_value.expireat.assert_called_once_with(
+        f"youtube_keys:usage:{period}:key-x", period + 3600
+    )
+    client.set.assert_called_once_with(
+        "youtube_keys:evicted:key-x", RESET, exat=period + 1
+    )
+    assert ledger.shared is True
+
+
+def test_choose_reads_all_ledgers_in_one_round_trip() -> None:
+    client = Mock()
+    # Usage of key-a, key-b and key-c, then their eviction deadlines.
+    client.mget.return_value = [b"40", b"10", b"50", None, str(RESET).encode(), None]
+    ledger = QuotaLedger(RedisLedgerStore(client), clock=Clock())
+    pool = ApiKeyPool(["key-a", "key-b", "key-c"], 100, ledger=ledger)
+
+    assert pool.choose() == pool.keys[0]
+
+    client.mget.assert_called_once()
+    client.get.assert_not_called()
+    period = int(RESET)
+    assert client.mget.call_args.args[0] == [
+        f"youtube_keys:usage:{period}:{key_id('key-a')}",
+        f"youtube_keys:usage:{period}:{key_id('key-b')}",
+        f"youtube_keys:usage:{period}:{key_id('key-c')}",
+        f"youtube_keys:evicted:{key_id('key-a')}",
+        f"youtube_keys:evicted:{key_id('key-b')}",
+        f"youtube_keys:evicted:{key_id('key-c')}",
+    ]
+
+
+@pytest.mark.parametrize(
+    "env, expected",
+    [
+        ({"YOUTUBE_API_KEYS": " k1, k2,,k1 "}, ["k1", "k2"]),
+        ({"YOUTUBE_API_KEYS": "", "YOUTUBE_API_KEY": "single"}, ["single"]),
+        ({}, []),
+    ],
+)
+def test_keys_from_env(env: dict, expected: List[str]) -> None:
+    with patch.dict(os.environ, env, clear=True):
+        assert api_keys_from_env() == expected
+
+
+def test_scan_budget_scales_with_pool() -> None:
+    with patch.dict(os.environ, {"YOUTUBE_API_KEYS": "k1,k2,k3"}, clear=True):
+        assert ScheduleConfig.from_env().daily_quota_budget == 27000
+
+
+class TestYouTubeClientKeyRouting:
+    @pytest.fixture
+    def client(self) -> YouTubeClient:
+        with patch("googleapiclient.discovery.build"), patch.dict(
+            os.environ, {"YOUTUBE_API_KEYS": "first-key,second-key"}
+        ):
+            client = YouTubeClient()
+        client.circuit_breaker = CircuitBreaker()
+        client.key_pool = ApiKeyPool(
+            ["first-key", "second-key"], ledger=QuotaLedger(clock=Clock())
+        )
+        return client
+
+    def request(self, *results: object) -> Mock:
+        request = Mock()
+        request.uri = "https://youtube.googleapis.com/youtube/v3/videos?id=abc&key=old"
+        keys: List[str] = []
+
+        def execute() -> object:
+            keys.append(request.uri.rsplit("key=", 1)[1])
+            result = results[len(keys) - 1]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        request.execute.side_effect = execute
+        request.sent_with = keys
+        return request
+
+    def quota_error(self) -> HttpError:
+        error = HttpError(Mock(status=403), b"Quota exceeded")
+        error.error_details = [{"reason": "quotaExceeded"}]
+        return error
+
+    def test_exhausted_key_fails_over(self, client: YouTubeClient) -> None:
+        request = self.request(self.quota_error(), {"items": []})
+
+        assert client._execute_with_retry(request, "get video details") == {"items": []}
+
+        assert request.sent_with == ["first-key", "second-key"]
+        assert client.key_pool.choose() == client.key_pool.keys[1]
+        assert client.circuit_breaker.status()["state"] == CLOSED
+        assert "id=abc" in request.uri
+
+    def test_requests_spread_across_keys(self, client: YouTubeClient) -> None:
+        request = self.request({}, {}, {}, {})
+
+        for _ in range(4):
+            client._execute_with_retry(request, "get video details", quota_cost=1)
+
+        assert request.sent_with == [
+            "first-key",
+            "second-key",
+            "first-key",
+            "second-key",
+        ]
+        assert client.usage.quota_units == 4
+
+    def test_circuit_opens_when_every_key_is_out(self, client: YouTubeClient) -> None:
+        request = self.request(self.quota_error(), self.quota_error())
+
+        with pytest.raises(YouTubeQuotaExhaustedError):
+            client._execute_with_retry(request, "get video details")
+
+        assert request.sent_with == ["first-key", "second-key"]
+        assert client.circuit_breaker.status()["state"] == OPEN
+
+
+def test_healthz_reports_key_usage() -> None:
+    pool = ApiKeyPool(["key-a"], 50, ledger=QuotaLedger())
+    pool.charge(pool.keys[0], 5)
+
+    with patch("app.main.ApiKeyPool.from_env", return_value=pool):
+        response = TestClient(app).get("/healthz")
+
+    assert response.json()["youtube_keys"]["keys"] == [
+        {
+            "key": key_id("key-a"),
+            "quota_units_used": 5,
+            "daily_quota": 50,
+            "remaining": 45,
+            "evicted_until": None,
+        }
+    ]
+
+
+def test_healthz_reads_shared_state_off_the_event_loop() -> None:
+    in_event_loop = []
+
+    def from_env() -> ApiKeyPool:
+        try:
+            asyncio.get_running_loop()
+            in_event_loop.append(True)
+        except RuntimeError:
+            in_event_loop.append(False)
+        return ApiKeyPool([], ledger=QuotaLedger())
+
+    with patch("app.main.ApiKeyPool.from_env", side_effect=from_env):
+        response = TestClient(app).get("/healthz")
+
+    assert response.status_code == 200
+    assert in_event_loop == [False]
@@ -42,7 +42,7 @@ class TestBackgroundJobService:
     def teardown_method(self) -> None:
         self.db.close()
 
-    @patch("app.services.background_jobs.redis")
+    @patch("redis.from_url")
     def test_init_disabled_by_default(self, mock_redis):
         with patch.dict(os.environ, {}, clear=True):
             service = BackgroundJobService()
@@ -50,13 +50,13 @@ class TestBackgroundJobService:
             assert service.scheduler is None
             assert service.redis_client is None
 
-    @patch("app.services.background_jobs.redis")
+    @patch("redis.from_url")
     @patch("apscheduler.schedulers.background.BackgroundScheduler")
     def test_init_enabled(self, mock_scheduler_class, mock_redis):
         mock_scheduler = Mock()
         mock_scheduler_class.return_value = mock_scheduler
         mock_redis_client = Mock()
-        mock_redis.from_url.return_value = mock_redis_client
+        mock_redis.return_value = mock_redis_client
 
         with patch.dict(
             os.environ,
@@ -83,13 +83,13 @@ class TestBackgroundJobService:
                 with patch("apscheduler.triggers.interval.IntervalTrigger"):
                     service._setup_scheduler()
 
-    @patch("app.services.background_jobs.redis")
+    @patch("redis.from_url")
     @patch("apscheduler.schedulers.background.BackgroundScheduler")
     def test_start_stop(self, mock_scheduler_class, mock_redis):
         mock_scheduler = Mock()
         mock_scheduler_class.return_value = mock_scheduler
         mock_redis_client = Mock()
-        mock_redis.from_url.return_value = mock_redis_client
+        mock_redis.return_value = mock_redis_client
 
         with patch.dict(os.environ, {"SCAN_ENABLED": "true"}):
             service = BackgroundJobService()
@@ -103,7 +103,7 @@ class TestBackgroundJobService:
             service.stop()
             mock_scheduler.shutdown.assert_called_once()
 
-    @patch("app.services.background_jobs.redis")
+    @patch("redis.from_url")
     @patch("apscheduler.schedulers.background.BackgroundScheduler")
     def test_get_status(self, mock_scheduler_class, mock_redis):
         mock_scheduler = Mock()
@@ -124,12 +124,12 @@ class TestBackgroundJobService:
             assert status["running"] is True
             assert "next_run" in status
 
-    @patch("app.services.background_jobs.redis")
+    @patch("redis.from_url")
     @patch("apscheduler.schedulers.background.BackgroundScheduler")
     def test_acquire_release_lock(self, mock_scheduler_class, mock_redis):
         mock_redis_client = Mock()
         mock_redis_client.set.return_value = True
-        mock_redis.from_url.return_value = mock_redis_client
+        mock_redis.return_value = mock_redis_client
 
         with patch.dict(os.environ, {"SCAN_ENABLED": "true"}):
             service = BackgroundJobService()
@@ -158,9 +158,12 @@ class TestBackgroundJobService:
             with patch("app.services.youtube_client.YouTubeClient"):
                 service._scan_single_channel(self.db, "UCtest123")
 
-                mock_ingestion_service.scan_channel.assert_called_with("UCtest123")
+                # No full scan on record yet, so the feed asks for one.
+                mock_ingestion_service.scan_channel.assert_called_with(
+                    "UCtest123", force_full=True
+                )
 
-    @patch("app.services.background_jobs.redis")
+    @patch("redis.from_url")
     @patch("apscheduler.schedulers.background.BackgroundScheduler")
     @patch("app.services.background_jobs.SessionLocal")
     def test_scan_all_channels(
@@ -174,7 +177,7 @@ class TestBackgroundJobService:
         query_mock = mock_db.query.return_value.filter.return_value.limit.return_value
         query_mock.all.return_value = [mock_channel]
 
-        with patch.dict(os.environ, {"SCAN_ENABLED": "true"}):
+        with patch.dict(os.environ, {"SCAN_ENABLED": "true", "SCAN_ADAPTIVE": "false"}):
             service = BackgroundJobService()
 
             service._acquire_lock = Mock(return_value=True)
@@ -49,7 +49,7 @@ class TestBackgroundJobServiceExtended:
         ), patch("app.services.background_jobs.REDIS_AVAILABLE", True), patch(
             "app.services.background_jobs.SCHEDULER_AVAILABLE", True
         ), patch(
-            "app.services.background_jobs.redis.from_url"
+            "redis.from_url"
         ) as mock_redis:
             mock_client = Mock()
             mock_client.ping.side_effect = Exception("Connection failed")
@@ -178,6 +178,7 @@ class TestBackgroundJobServiceExtended:
 
         service = BackgroundJobService()
         service.scan_batch_size = 1
+        service.adaptive = False
 
         with patch.object(service, "_acquire_lock", return_value=True), patch.object(
             service, "_scan_single_channel"
@@ -199,6 +200,7 @@ class TestBackgroundJobServiceExtended:
 
         service = BackgroundJobService()
         service.scan_batch_size = 1
+        service.adaptive = False
 
         with patch.object(service, "_acquire_lock", return_value=False), patch.object(
             service, "_scan_single_channel"
@@ -219,6 +221,7 @@ class TestBackgroundJobServiceExtended:
 
         service = BackgroundJobService()
         service.scan_batch_size = 1
+        service.adaptive = False
 
         with patch.object(service, "_acquire_lock", return_value=True), patch.object(
             service, "_scan_single_channel", side_effect=Exception("Scan failed")
@@ -245,7 +248,9 @@ class TestBackgroundJobServiceExtended:
             service = BackgroundJobService()
             service._scan_single_channel(mock_db, "UCtest123")
 
-            mock_ingestion.scan_channel.assert_called_once_with("UCtest123")
+            mock_ingestion.scan_channel.assert_called_once_with(
+                "UCtest123", force_full=False
+            )
 
     def test_scan_single_channel_error(self) -> None:
         mock_db = Mock(spec=Session)
@@ -280,7 +285,7 @@ class TestBackgroundJobServiceExtended:
         ), patch("app.services.background_jobs.REDIS_AVAILABLE", True), patch(
             "app.services.background_jobs.SCHEDULER_AVAILABLE", True
         ), patch(
-            "app.services.background_jobs.redis.from_url"
+            "redis.from_url"
         ) as mock_redis:
             mock_client = Mock()
             mock_client.ping.return_value = True
@@ -0,0 +1,249 @@
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.metrics import SCAN_FINGERPRINT_TOTAL
+from app.models.channel import Channel
+from app.models.channel_fingerprint import ChannelFingerprint
+from app.models.scan_run import ScanRun
+from app.services.channel_fingerprint import (
+    CHANGED,
+    UNAVAILABLE,
+    UNCHANGED,
+    VERIFY_DUE,
+    ChannelFingerprintService,
+    FingerprintConfig,
+)
+from app.services.video_ingestion import VideoIngestionService
+from app.services.youtube_client import ApiUsage, UploadsFingerprint, YouTubeClient
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+NOW = datetime(2025, 9, 17, 12, 0, tzinfo=timezone.utc)
+CHANNEL_ID = "UCprint00000000000000000"
+FINGERPRINT = UploadsFingerprint(item_count=120, etag="etag-1", newest_video_id="vid1")
+
+
+class TestFingerprintComparison:
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        self.db.add(
+            Channel(
+                channel_id=CHANNEL_ID,
+                title="Fingerprint channel",
+                uploads_playlist_id="UUprint",
+                source_input=CHANNEL_ID,
+            )
+        )
+        self.db.commit()
+        self.service = ChannelFingerprintService(
+            self.db, FingerprintConfig(full_verify_hours=24)
+        )
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def test_first_check_requires_scan(self) -> None:
+        assert self.service.check(CHANNEL_ID, FINGERPRINT, NOW) == CHANGED
+
+    def test_matching_fingerprint_skips_scan(self) -> None:
+        self.service.record(CHANNEL_ID, FINGERPRINT, NOW)
+        before = SCAN_FINGERPRINT_TOTAL.value(result=UNCHANGED)
+
+        later = NOW + timedelta(hours=1)
+        assert self.service.check(CHANNEL_ID, FINGERPRINT, later) == UNCHANGED
+        assert SCAN_FINGERPRINT_TOTAL.value(result=UNCHANGED) == before + 1
+
+        stored = self.service.get(CHANNEL_ID)
+        assert stored is not None
+        assert stored.checked_at.replace(tzinfo=timezone.utc) == later
+
+    def test_any_difference_requires_scan(self) -> None:
+        self.service.record(CHANNEL_ID, FINGERPRINT, NOW)
+
+        for changed in (
+            UploadsFingerprint(119, "etag-1", "vid1"),
+            UploadsFingerprint(120, "etag-2", "vid1"),
+            UploadsFingerprint(120, "etag-1", "vid2"),
+        ):
+            assert self.service.check(CHANNEL_ID, changed, NOW) == CHANGED
+
+    def test_full_verification_is_forced_periodically(self) -> None:
+        self.service.record(CHANNEL_ID, FINGERPRINT, NOW)
+
+        assert (
+            self.service.check(CHANNEL_ID, FINGERPRINT, NOW + timedelta(hours=23))
+            == UNCHANGED
+        )
+        assert (
+            self.service.check(CHANNEL_ID, FINGERPRINT, NOW + timedelta(hours=24))
+            == VERIFY_DUE
+        )
+
+    def test_missing_fingerprint_requires_scan(self) -> None:
+        self.service.record(CHANNEL_ID, FINGERPRINT, NOW)
+
+        assert self.service.check(CHANNEL_ID, None, NOW) == UNAVAILABLE
+        assert (
+            self.service.check(CHANNEL_ID, UploadsFingerprint(None, None, None), NOW)
+            == UNAVAILABLE
+        )
+
+    def test_from_env(self) -> None:
+        with patch.dict(
+            os.environ, {"SCAN_FINGERPRINT": "false", "SCAN_FULL_VERIFY_HOURS": "6"}
+        ):
+            config = FingerprintConfig.from_env()
+
+        assert config == FingerprintConfig(enabled=False, full_verify_hours=6)
+
+
+class TestScanShortCircuit:
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        self.db.add(
+            Channel(
+                channel_id=CHANNEL_ID,
+                title="Fingerprint channel",
+                uploads_playlist_id="UUprint",
+                source_input=CHANNEL_ID,
+            )
+        )
+        self.db.commit()
+
+        self.youtube_client = Mock()
+        self.youtube_client.usage = ApiUsage()
+        self.youtube_client.fetch_uploads_fingerprint.side_effect = self._probe
+        self.youtube_client.fetch_channel_videos.return_value = [
+            {
+                "video_id": "vid1",
+                "title": "Video 1",
+                "published_at": NOW,
+            }
+        ]
+        self.fingerprint = FINGERPRINT
+        self.service = VideoIngestionService(self.db, self.youtube_client)
+        self.service.fingerprints.config = FingerprintConfig(full_verify_hours=24)
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def _probe(self, uploads_playlist_id: str) -> UploadsFingerprint:
+        self.youtube_client.usage.api_calls += 1
+        self.youtube_client.usage.quota_units += 1
+        return self.fingerprint
+
+    def test_unchanged_channel_costs_one_call(self) -> None:
+        self.service.scan_channel(CHANNEL_ID)
+        self.youtube_client.fetch_channel_videos.reset_mock()
+
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 0)
+
+        self.youtube_client.fetch_channel_videos.assert_not_called()
+        run = self.db.query(ScanRun).order_by(ScanRun.id.desc()).first()
+        assert run is not None
+        assert run.status == "unchanged"
+        assert run.quota_units == 1
+
+    def test_forced_scan_ignores_unchanged_fingerprint(self) -> None:
+        self.service.scan_channel(CHANNEL_ID)
+
+        self.service.scan_channel(CHANNEL_ID, force_full=True)
+
+        assert self.youtube_client.fetch_channel_videos.call_count == 2
+        run = self.db.query(ScanRun).order_by(ScanRun.id.desc()).first()
+        assert run is not None and run.status == "succeeded"
+
+    def test_full_scan_stores_fingerprint(self) -> None:
+        self.service.scan_channel(CHANNEL_ID)
+
+        stored = self.db.get(ChannelFingerprint, CHANNEL_ID)
+        assert stored is not None
+        assert stored.item_count == 120
+        assert stored.first_page_etag == "etag-1"
+        assert stored.newest_video_id == "vid1"
+
+    def test_changed_fingerprint_runs_full_scan(self) -> None:
+        self.service.scan_channel(CHANNEL_ID)
+        self.fingerprint = UploadsFingerprint(121, "etag-2", "vid2")
+
+        self.service.scan_channel(CHANNEL_ID)
+
+        assert self.youtube_client.fetch_channel_videos.call_count == 2
+        stored = self.db.get(ChannelFingerprint, CHANNEL_ID)
+        assert stored is not None and stored.newest_video_id == "vid2"
+
+    def test_unconfirmed_suspect_forces_next_full_scan(self) -> None:
+        self.youtube_client.fetch_channel_videos.return_value = [
+            {"video_id": "vid1", "title": "Video 1", "published_at": NOW},
+            {"video_id": "vid2", "title": "Video 2", "published_at": NOW},
+        ]
+        self.service.scan_channel(CHANNEL_ID)
+
+        # vid2 drops out of the playlist and the direct probe is unavailable,
+        # so it is only suspected; the fingerprint then stays the same.
+        self.fingerprint = UploadsFingerprint(119, "etag-2", "vid1")
+        self.youtube_client.fetch_channel_videos.return_value = [
+            {"video_id": "vid1", "title": "Video 1", "published_at": NOW}
+        ]
+        self.youtube_client.probe_videos.side_effect = RuntimeError("probe down")
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 0)
+        assert self.db.get(ChannelFingerprint, CHANNEL_ID) is None
+
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 1)
+
+        assert self.youtube_client.fetch_channel_videos.call_count == 3
+        assert self.db.get(ChannelFingerprint, CHANNEL_ID) is not None
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 0)
+        assert self.youtube_client.fetch_channel_videos.call_count == 3
+
+    def test_probe_failure_falls_through_to_scan(self) -> None:
+        self.youtube_client.fetch_uploads_fingerprint.side_effect = RuntimeError("x")
+
+        self.service.scan_channel(CHANNEL_ID)
+
+        self.youtube_client.fetch_channel_videos.assert_called_once()
+        assert self.db.get(ChannelFingerprint, CHANNEL_ID) is None
+
+    def test_disabled_never_probes(self) -> None:
+        self.service.fingerprints.config = FingerprintConfig(enabled=False)
+
+        self.service.scan_channel(CHANNEL_ID)
+        self.service.scan_channel(CHANNEL_ID)
+
+        self.youtube_client.fetch_uploads_fingerprint.assert_not_called()
+        assert self.youtube_client.fetch_channel_videos.call_count == 2
+
+
+@patch.dict(os.environ, {"YOUTUBE_API_KEY": "test-api-key"})
+@patch("googleapiclient.discovery.build")
+def test_client_fingerprint_uses_first_playlist_page(build: Mock) -> None:
+    client = YouTubeClient()
+    client.youtube.playlistItems().list().execute.return_value = {
+        "etag": "etag-1",
+        "pageInfo": {"totalResults": 120, "resultsPerPage": 50},
+        "items": [{"contentDetails": {"videoId": "vid1"}}],
+    }
+
+    assert client.fetch_uploads_fingerprint("UUprint") == FINGERPRINT
+    client.youtube.playlistItems().list.assert_called_with(
+        part="snippet,contentDetails,status",
+        playlistId="UUprint",
+        maxResults=50,
+        pageToken=None,
+    )
+    assert client.usage.quota_units == 1
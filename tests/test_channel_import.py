@@ -0,0 +1,348 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.channels import router
+from app.core.database import Base, get_db
+from app.models.channel import Channel
+from app.models.channel_quota import ChannelQuota
+from app.models.channel_stats import ChannelStats
+from app.services.channel_import import (
+    ADDED,
+    ALREADY_REGISTERED,
+    DUPLICATE,
+    ERROR,
+    LIMIT_REACHED,
+    NOT_FOUND,
+    ChannelImporter,
+    ImportFileError,
+    parse_import_file,
+)
+from app.services.channel_registry import ChannelRegistry, RegistryConfig
+from app.services.resolution_cache import ResolutionCache
+from app.services.youtube_client import YouTubeQuotaExhaustedError
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def channel_id(index: int) -> str:
+    return f"UC{index:022d}"
+
+
+class FakeYouTubeClient:
+    """Resolves ``@handleN`` to channel N and knows channels 0-199."""
+
+    lock = threading.Lock()
+    resolved: List[str] = []
+    batches: List[List[str]] = []
+    in_flight = 0
+    max_in_flight = 0
+    fail_batches = False
+
+    def resolve_channel_input(self, input_str: str) -> Tuple[Optional[str], Any]:
+        cls = FakeYouTubeClient
+        with cls.lock:
+            cls.resolved.append(input_str)
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.01)
+        with cls.lock:
+            cls.in_flight -= 1
+        if input_str.startswith("@handle"):
+            return channel_id(int(input_str[len("@handle") :])), {}
+        return None, None
+
+    def fetch_channels(self, channel_ids: List[str]) -> Dict[str, Dict]:
+        FakeYouTubeClient.batches.append(channel_ids)
+        if FakeYouTubeClient.fail_batches:
+            raise YouTubeQuotaExhaustedError("quota exhausted")
+        return {
+            cid: {
+                "title": f"Channel {int(cid[2:])}",
+                "uploads_playlist_id": "UU" + cid[2:],
+            }
+            for cid in channel_ids
+            if int(cid[2:]) < 200
+        }
+
+
+class ImportTestCase:
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        FakeYouTubeClient.resolved = []
+        FakeYouTubeClient.batches = []
+        FakeYouTubeClient.max_in_flight = 0
+        FakeYouTubeClient.fail_batches = False
+        self.cache = ResolutionCache()
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def importer(self, limit: int = 1000) -> ChannelImporter:
+        return ChannelImporter(
+            self.db,
+            registry=ChannelRegistry(
+                self.db, RegistryConfig(max_active_channels=limit)
+            ),
+            client_factory=FakeYouTubeClient,  # type: ignore[arg-type]
+            cache=self.cache,
+            concurrency=3,
+        )
+
+
+class TestParseImportFile:
+    def test_plain_list(self) -> None:
+        content = b"# my channels\n@handle1\nhttps://www.youtube.com/@handle2\n\n"
+
+        assert parse_import_file("channels.txt", content) == [
+            "@handle1",
+            "https://www.youtube.com/@handle2",
+        ]
+
+    def test_csv_with_header(self) -> None:
+        content = b"url,note\n@handle1,first\n@handle2,second\n"
+
+        assert parse_import_file("channels.csv", content) == ["@handle1", "@handle2"]
+
+    def test_takeout_subscriptions(self) -> None:
+        content = (
+            "﻿Channel Id,Channel Url,Channel Title\n"
+            f"{channel_id(1)},http://www.youtube.com/channel/{channel_id(1)},One\n"
+            f"{channel_id(2)},http://www.youtube.com/channel/{channel_id(2)},Two\n"
+        ).encode()
+
+        assert parse_import_file("subscriptions.csv", content) == [
+            channel_id(1),
+            channel_id(2),
+        ]
+
+    def test_opml(self) -> None:
+        content = f"""<?xml version="1.0"?>
+<opml version="1.1"><body><outline text="YouTube Subscriptions">
+  <outline text="One" xmlUrl="https://www.youtube.com/feeds/videos.xml?channel_id={channel_id(1)}"/>
+  <outline text="Two" htmlUrl="https://www.youtube.com/@handle2"/>
+</outline></body></opml>""".encode()  # noqa: E501
+
+        assert parse_import_file("subs.opml", content) == [
+            channel_id(1),
+            "https://www.youtube.com/@handle2",
+        ]
+
+    def test_unreadable_files(self) -> None:
+        with pytest.raises(ImportFileError):
+            parse_import_file("subs.opml", b"<opml><body>")
+        with pytest.raises(ImportFileError):
+            parse_import_file("subs.csv", b"\xff\xfe\x00")
+
+
+class TestChannelImporter(ImportTestCase):
+    def test_ids_are_fetched_fifty_per_call(self) -> None:
+        rows = self.importer().run([channel_id(i) for i in range(120)])
+
+        assert {row.status for row in rows} == {ADDED}
+        assert [len(batch) for batch in FakeYouTubeClient.batches] == [50, 50, 20]
+        assert FakeYouTubeClient.resolved == []
+        assert self.db.query(Channel).count() == 120
+        assert self.db.query(ChannelStats).count() == 120
+        channel = self.db.query(Channel).filter_by(channel_id=channel_id(7)).one()
+        assert channel.uploads_playlist_id == "UU" + channel_id(7)[2:]
+        assert channel.is_active is True
+
+    def test_handles_resolve_with_bounded_concurrency(self) -> None:
+        rows = self.importer().run([f"@handle{i}" for i in range(12)])
+
+        assert [row.channel_id for row in rows] == [channel_id(i) for i in range(12)]
+        assert 1 < FakeYouTubeClient.max_in_flight <= 3
+
+    def test_resolution_cache_skips_repeat_lookups(self) -> None:
+        self.importer().run(["@handle1", "@handle2"])
+        FakeYouTubeClient.resolved = []
+        self.db.query(ChannelStats).delete()
+        self.db.query(Channel).delete()
+        self.db.commit()
+
+        rows = self.importer().run(["@Handle1", "@handle2/"])
+
+        assert FakeYouTubeClient.resolved == []
+        assert [row.status for row in rows] == [ADDED, ADDED]
+
+    def test_per_row_report(self) -> None:
+        self.db.add(
+            Channel(
+                channel_id=channel_id(5),
+                title="Channel 5",
+                source_input=channel_id(5),
+            )
+        )
+        self.db.commit()
+
+        rows = self.importer().run(
+            [
+                "@handle1",
+                "@handle1",
+                f"https://www.youtube.com/channel/{channel_id(1)}",
+                channel_id(5),
+                "@nobody",
+                channel_id(500),
+            ]
+        )
+
+        assert [(row.row, row.status) for row in rows] == [
+            (1, ADDED),
+            (2, DUPLICATE),
+            (3, DUPLICATE),
+            (4, ALREADY_REGISTERED),
+            (5, NOT_FOUND),
+            (6, NOT_FOUND),
+        ]
+        assert rows[1].detail == "Same as row 1"
+        assert rows[2].detail == "Same channel as row 1"
+        assert rows[0].title == "Channel 1"
+
+    def test_removed_channel_is_revived(self) -> None:
+        self.db.add(
+            Channel(
+                channel_id=channel_id(5),
+                title="Old title",
+                source_input=channel_id(5),
+                is_active=False,
+            )
+        )
+        self.db.commit()
+
+        rows = self.importer().run([channel_id(5)])
+
+        assert rows[0].status == ADDED
+        channel = self.db.query(Channel).one()
+        assert channel.is_active is True
+        assert channel.title == "Channel 5"
+
+    def test_channel_limit(self) -> None:
+        rows = self.importer(limit=2).run([channel_id(i) for i in range(4)])
+
+        assert [row.status for row in rows] == [
+            ADDED,
+            ADDED,
+            LIMIT_REACHED,
+            LIMIT_REACHED,
+        ]
+        assert [len(batch) for batch in FakeYouTubeClient.batches] == [4]
+        assert self.db.query(ChannelQuota).one().active_channels == 2
+
+    def test_missing_channels_do_not_use_up_slots(self) -> None:
+        inputs = [channel_id(500), "@nobody", channel_id(1), channel_id(2)]
+
+        rows = self.importer(limit=2).run(inputs + [channel_id(3)])
+
+        assert [row.status for row in rows] == [
+            NOT_FOUND,
+            NOT_FOUND,
+            ADDED,
+            ADDED,
+            LIMIT_REACHED,
+        ]
+
+    def test_metadata_stops_once_slots_are_filled(self) -> None:
+        rows = self.importer(limit=3).run([channel_id(i) for i in range(120)])
+
+        assert [row.status for row in rows].count(ADDED) == 3
+        assert [len(batch) for batch in FakeYouTubeClient.batches] == [50]
+
+    def test_failed_batch_is_reported(self) -> None:
+        FakeYouTubeClient.fail_batches = True
+
+        rows = self.importer().run([channel_id(1)])
+
+        assert rows[0].status == ERROR
+        assert "quota exhausted" in str(rows[0].detail)
+        assert self.db.query(Channel).count() == 0
+
+
+class TestImportEndpoint(ImportTestCase):
+    def setup_method(self) -> None:
+        super().setup_method()
+        test_app = FastAPI()
+        test_app.include_router(router, prefix="/api")
+
+        def override_get_db() -> Any:
+            db = TestingSessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        test_app.dependency_overrides[get_db] = override_get_db
+        self.client = TestClient(test_app)
+
+    @patch("app.services.channel_import.get_resolution_cache")
+    @patch("app.services.channel_import.YouTubeClient", FakeYouTubeClient)
+    def test_upload_returns_report(self, get_cache: Mock) -> None:
+        get_cache.return_value = self.cache
+        content = f"@handle1\n{channel_id(2)}\n@handle1\n@nobody\n".encode()
+
+        response = self.client.post(
+            "/api/channels/import",
+            files={"file": ("channels.txt", content, "text/plain")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 4
+        assert data["counts"] == {ADDED: 2, DUPLICATE: 1, NOT_FOUND: 1}
+        assert data["rows"][0] == {
+            "row": 1,
+            "input": "@handle1",
+            "status": ADDED,
+            "channel_id": channel_id(1),
+            "title": "Channel 1",
+            "detail": None,
+        }
+        assert self.db.query(Channel).count() == 2
+
+    def test_unreadable_file_is_rejected(self) -> None:
+        response = self.client.post(
+            "/api/channels/import",
+            files={"file": ("subs.opml", b"<opml>", "text/xml")},
+        )
+
+        assert response.status_code == 400
+
+    @patch("app.api.channels.MAX_IMPORT_ROWS", 2)
+    def test_oversized_file_is_rejected(self) -> None:
+        response = self.client.post(
+            "/api/channels/import",
+            files={"file": ("channels.txt", b"@a\n@b\n@c\n", "text/plain")},
+        )
+
+        assert response.status_code == 400
+        assert "2 rows" in response.json()["detail"]
+
+
+def test_resolution_cache_uses_redis_when_configured() -> None:
+    redis = Mock()
+    redis.get.return_value = channel_id(1).encode()
+    cache = ResolutionCache(client=redis, ttl_seconds=60)
+
+    cache.set(" @Handle1/ ", channel_id(1))
+
+    redis.set.assert_called_once_with(
+        "channel_resolution:@handle1", channel_id(1), ex=60
+    )
+    assert cache.get("@handle1") == channel_id(1)
+    redis.get.side_effect = ConnectionError("down")
+    assert cache.get("@handle1") is None
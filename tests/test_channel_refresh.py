@@ -0,0 +1,146 @@
+import os
+from typing import Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.metrics import CHANNEL_REFRESH_TOTAL, SCHEDULER_JOB_FAILURES_TOTAL
+from app.models.channel import Channel
+from app.services.background_jobs import BackgroundJobService
+from app.services.channel_refresh import ChannelMetadataRefresher
+from app.services.youtube_client import YouTubeClient
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def channel_id(index: int) -> str:
+    return f"UC{index:022d}"
+
+
+def metadata(index: int, title: str = "", subscribers: int = 100) -> Dict:
+    return {
+        "title": title or f"Channel {index}",
+        "description": "",
+        "thumbnail_url": f"https://yt3.ggpht.com/{index}",
+        "subscriber_count": subscribers,
+        "uploads_playlist_id": f"UU{index:022d}",
+    }
+
+
+class TestChannelMetadataRefresher:
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        for index in range(120):
+            self.db.add(
+                Channel(
+                    channel_id=channel_id(index),
+                    source_input=channel_id(index),
+                    **metadata(index),
+                )
+            )
+        self.db.commit()
+
+        self.fresh = {channel_id(i): metadata(i) for i in range(120)}
+        self.youtube_client = Mock()
+        self.youtube_client.fetch_channels.side_effect = lambda ids: {
+            i: self.fresh[i] for i in ids if i in self.fresh
+        }
+        self.refresher = ChannelMetadataRefresher(self.db, self.youtube_client)
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def test_batches_fifty_channels_per_call(self) -> None:
+        self.refresher.refresh()
+
+        batches = [c.args[0] for c in self.youtube_client.fetch_channels.call_args_list]
+        assert [len(batch) for batch in batches] == [50, 50, 20]
+
+    def test_writes_only_changed_channels(self) -> None:
+        self.fresh[channel_id(3)] = metadata(3, title="Renamed")
+        self.fresh[channel_id(70)] = metadata(70, subscribers=250)
+        before = CHANNEL_REFRESH_TOTAL.value(result="updated")
+        statements: List[str] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE channels"):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            counts = self.refresher.refresh()
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert counts == {"updated": 2, "unchanged": 118, "missing": 0}
+        assert len(statements) == 2
+        assert CHANNEL_REFRESH_TOTAL.value(result="updated") == before + 2
+        self.db.expire_all()
+        assert self.db.get(Channel, 4).title == "Renamed"
+        assert self.db.get(Channel, 71).subscriber_count == 250
+
+    def test_missing_channels_are_left_alone(self) -> None:
+        del self.fresh[channel_id(5)]
+
+        counts = self.refresher.refresh()
+
+        assert counts["missing"] == 1
+        self.db.expire_all()
+        assert self.db.get(Channel, 6).title == "Channel 5"
+
+    def test_inactive_channels_are_skipped(self) -> None:
+        self.db.query(Channel).filter(Channel.id > 10).update({"is_active": False})
+        self.db.commit()
+
+        assert sum(self.refresher.refresh().values()) == 10
+
+    def test_refresh_job_records_failures(self) -> None:
+        service = BackgroundJobService()
+        failures = SCHEDULER_JOB_FAILURES_TOTAL.value(job="channel_refresh")
+
+        with patch(
+            "app.services.background_jobs.SessionLocal", TestingSessionLocal
+        ), patch(
+            "app.services.youtube_client.YouTubeClient",
+            side_effect=ValueError("YOUTUBE_API_KEY environment variable is required"),
+        ):
+            with pytest.raises(ValueError):
+                service._run_channel_refresh_job()
+
+        assert SCHEDULER_JOB_FAILURES_TOTAL.value(job="channel_refresh") == failures + 1
+
+
+@patch.dict(os.environ, {"YOUTUBE_API_KEY": "test-api-key"})
+@patch("googleapiclient.discovery.build")
+def test_client_fetches_channels_in_batches(build: Mock) -> None:
+    client = YouTubeClient()
+    client.youtube.channels().list().execute.side_effect = [
+        {
+            "items": [
+                {
+                    "id": channel_id(0),
+                    "snippet": {"title": "Channel 0"},
+                    "statistics": {"subscriberCount": "100"},
+                    "contentDetails": {"relatedPlaylists": {"uploads": "UU0"}},
+                }
+            ]
+        },
+        {"items": []},
+    ]
+
+    channels = client.fetch_channels([channel_id(i) for i in range(60)])
+
+    assert list(channels) == [channel_id(0)]
+    assert channels[channel_id(0)]["subscriber_count"] == 100
+    assert client.usage.quota_units == 2
@@ -0,0 +1,224 @@
+import os
+from typing import Any, Dict, Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+from conftest import TestDatabase
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.api.channels import router
+from app.models.channel import Channel
+from app.models.channel_quota import ChannelQuota
+from app.services.channel_registry import (
+    ChannelLimitError,
+    ChannelRegistry,
+    RegistryConfig,
+    normalize_tags,
+)
+
+
+def channel_id(index: int) -> str:
+    return f"UC{index:022d}"
+
+
+def metadata(index: int) -> Dict[str, Any]:
+    return {
+        "title": f"Channel {index}",
+        "uploads_playlist_id": f"UU{index:022d}",
+    }
+
+
+class RegistryTestCase:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> Iterator[None]:
+        self.database = database
+        self.engine = database.engine
+        self.db = database.SessionLocal()
+        yield
+        self.db.close()
+
+    def add_channels(self, count: int, active: bool = True) -> None:
+        for index in range(count):
+            self.db.add(
+                Channel(
+                    channel_id=channel_id(index),
+                    source_input=channel_id(index),
+                    is_active=active,
+                    **metadata(index),
+                )
+            )
+        self.db.commit()
+
+
+class TestChannelRegistry(RegistryTestCase):
+    def test_counter_is_backfilled_once(self) -> None:
+        self.add_channels(3)
+        registry = ChannelRegistry(self.db, RegistryConfig(max_active_channels=5))
+
+        assert registry.active() == 3
+        assert registry.available() == 2
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", capture)
+        try:
+            registry.reserve()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", capture)
+
+        assert not any("count(" in statement.lower() for statement in statements)
+        assert registry.active() == 4
+
+    def test_reserve_refuses_beyond_limit(self) -> None:
+        registry = ChannelRegistry(self.db, RegistryConfig(max_active_channels=2))
+
+        registry.reserve(2)
+        with pytest.raises(ChannelLimitError) as error:
+            registry.reserve()
+
+        assert error.value.limit == 2
+        assert registry.active() == 2
+
+    def test_tenant_override_and_unlimited(self) -> None:
+        registry = ChannelRegistry(self.db, RegistryConfig(max_active_channels=2))
+        registry.quota().max_active_channels = 0  # type: ignore[assignment]
+
+        registry.reserve(50)
+
+        assert registry.limit() is None
+        assert registry.available() is None
+
+    def test_release_and_recount(self) -> None:
+        self.add_channels(4)
+        registry = ChannelRegistry(self.db)
+
+        registry.release()
+        assert registry.active() == 3
+        assert registry.recount() == 4
+
+    def test_limit_comes_from_settings(self) -> None:
+        with patch.dict(os.environ, {"MAX_ACTIVE_CHANNELS": "250"}):
+            registry = ChannelRegistry(self.db)
+
+        assert registry.limit() == 250
+
+    def test_set_tags_keeps_existing_rows(self) -> None:
+        self.add_channels(1)
+        channel = self.db.query(Channel).one()
+        registry = ChannelRegistry(self.db)
+
+        registry.set_tags(channel, ["News", "music "])
+        self.db.commit()
+        registry.set_tags(channel, ["news", "gaming"])
+        self.db.commit()
+
+        self.db.expire_all()
+        assert channel.tags == ["gaming", "news"]
+
+    def test_normalize_tags(self) -> None:
+        assert normalize_tags([" B", "a", "b", ""]) == ["a", "b"]
+        with pytest.raises(ValueError):
+            normalize_tags(["x" * 65])
+
+
+class TestRegistryEndpoints(RegistryTestCase):
+    @pytest.fixture(autouse=True)
+    def setup_client(self, setup_database: None) -> None:
+        test_app = FastAPI()
+        test_app.include_router(router, prefix="/api")
+        self.database.install(test_app)
+        self.client = TestClient(test_app)
+
+    @patch.dict(os.environ, {"MAX_ACTIVE_CHANNELS": "12"})
+    @patch("app.api.channels.YouTubeClient")
+    def test_configured_limit_is_enforced(self, youtube_client_class: Mock) -> None:
+        self.add_channels(11)
+        youtube_client_class.return_value.resolve_channel_input.side_effect = [
+            (channel_id(11), metadata(11)),
+            (channel_id(12), metadata(12)),
+        ]
+
+        first = self.client.post("/api/channels/", json={"input": "@eleven"})
+        second = self.client.post("/api/channels/", json={"input": "@twelve"})
+
+        assert first.status_code == 201
+        assert second.status_code == 400
+        assert "Maximum of 12 channels allowed" in second.json()["detail"]
+        assert self.client.get("/api/channels/usage").json() == {
+            "current": 12,
+            "limit": 12,
+            "remaining": 0,
+        }
+
+    @patch("app.api.channels.YouTubeClient")
+    def test_removed_channel_is_reactivated(self, youtube_client_class: Mock) -> None:
+        self.add_channels(1)
+        youtube_client_class.return_value.resolve_channel_input.return_value = (
+            channel_id(0),
+            metadata(0),
+        )
+
+        assert self.client.delete(f"/api/channels/{channel_id(0)}").status_code == 204
+        assert self.client.get("/api/channels/usage").json()["current"] == 0
+
+        response = self.client.post(
+            "/api/channels/", json={"input": "@zero", "tags": ["News"]}
+        )
+
+        assert response.status_code == 201
+        assert response.json()["tags"] == ["news"]
+        assert self.db.query(Channel).count() == 1
+        assert self.db.query(ChannelQuota).one().active_channels == 1
+
+    def test_tags_filter_and_paging(self) -> None:
+        self.add_channels(5)
+        for index in (1, 3):
+            response = self.client.put(
+                f"/api/channels/{channel_id(index)}/tags",
+                json={"tags": ["Music", "featured"]},
+            )
+            assert response.status_code == 200
+        self.client.put(f"/api/channels/{channel_id(4)}/tags", json={"tags": ["music"]})
+
+        tagged = self.client.get("/api/channels/?tag=music").json()
+        page = self.client.get("/api/channels/?limit=2&offset=1").json()
+
+        assert sorted(c["channel_id"] for c in tagged) == [
+            channel_id(1),
+            channel_id(3),
+            channel_id(4),
+        ]
+        assert tagged[0]["tags"]
+        assert len(page) == 2
+        assert self.client.get("/api/channels/tags").json() == [
+            {"tag": "featured", "channels": 2},
+            {"tag": "music", "channels": 3},
+        ]
+
+    def test_listing_is_paged_by_default(self) -> None:
+        self.add_channels(105)
+
+        assert len(self.client.get("/api/channels/").json()) == 100
+        assert len(self.client.get("/api/channels/?offset=100").json()) == 5
+        assert self.client.get("/api/channels/?limit=1001").status_code == 422
+
+    def test_tags_for_unknown_channel(self) -> None:
+        response = self.client.put(
+            f"/api/channels/{channel_id(9)}/tags", json={"tags": ["music"]}
+        )
+
+        assert response.status_code == 404
+
+    def test_overlong_tag_is_rejected(self) -> None:
+        self.add_channels(1)
+
+        response = self.client.put(
+            f"/api/channels/{channel_id(0)}/tags", json={"tags": ["x" * 65]}
+        )
+
+        assert response.status_code == 400
@@ -0,0 +1,207 @@
+from datetime import datetime, timezone
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+from conftest import TestDatabase
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.channel import Channel
+from app.models.channel_stats import ChannelStats
+from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.video import Video
+from app.services.channel_stats import ChannelStatsService
+from app.services.video_ingestion import VideoIngestionService
+
+
+def _video(video_id: str, is_available: bool = True) -> Video:
+    return Video(
+        video_id=video_id,
+        channel_id="UCtest123",
+        title=f"Title {video_id}",
+        published_at=datetime.now(timezone.utc),
+        is_available=is_available,
+    )
+
+
+class TestChannelStatsService:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> Iterator[None]:
+        self.db = database.SessionLocal()
+        self.db.add(
+            Channel(
+                channel_id="UCtest123",
+                title="Test Channel",
+                uploads_playlist_id="UUtest123",
+                source_input="@testchannel",
+            )
+        )
+        self.db.commit()
+        self.service = ChannelStatsService(self.db)
+        yield
+        self.db.close()
+
+    def test_ensure_backfills_from_existing_rows(self) -> None:
+        self.db.add_all([_video("v1"), _video("v2"), _video("v3", False)])
+        self.db.add(DisappearanceEvent(video_id="v3", event_type=EventType.DELETED))
+        self.db.commit()
+
+        stats = self.service.ensure("UCtest123")
+        self.db.commit()
+
+        assert stats.total_videos == 3
+        assert stats.available_videos == 2
+        assert stats.missing_videos == 1
+        assert stats.deleted_events == 1
+        assert stats.total_events == 1
+        assert stats.events_by_type["DELETED"] == 1
+        assert stats.events_by_type["UNKNOWN"] == 0
+
+    def test_ensure_returns_existing_row_without_recounting(self) -> None:
+        self.service.ensure("UCtest123")
+        self.db.commit()
+
+        self.db.add(_video("v1"))
+        self.db.commit()
+
+        stats = self.service.ensure("UCtest123")
+        assert stats.total_videos == 0
+
+    def test_apply_scan_delta(self) -> None:
+        self.service.ensure("UCtest123")
+        self.service.apply_scan_delta(
+            "UCtest123",
+            added=5,
+            reappeared=1,
+            disappeared=2,
+            events_by_type={EventType.UNKNOWN: 2},
+        )
+        self.db.commit()
+
+        stats = self.db.get(ChannelStats, "UCtest123")
+        assert stats.total_videos == 5
+        assert stats.available_videos == 4
+        assert stats.missing_videos == 1
+        assert stats.unknown_events == 2
+
+    def test_apply_empty_delta_is_noop(self) -> None:
+        stats = self.service.ensure("UCtest123")
+        self.service.apply_scan_delta("UCtest123")
+        self.db.commit()
+
+        assert stats.total_videos == 0
+
+    def test_recompute_repairs_drift(self) -> None:
+        stats = self.service.ensure("UCtest123")
+        stats.total_videos = 99
+        self.db.add(_video("v1"))
+        self.db.commit()
+
+        stats = self.service.recompute("UCtest123")
+        self.db.commit()
+
+        assert stats.total_videos == 1
+        assert stats.available_videos == 1
+
+    def test_scan_updates_stats_incrementally(self) -> None:
+        self.db.add(_video("gone"))
+        self.db.commit()
+
+        youtube_client = Mock()
+        youtube_client.probe_videos.return_value = {}
+        youtube_client.fetch_channel_videos.return_value = [
+            {
+                "video_id": "new",
+                "title": "New",
+                "published_at": datetime.now(timezone.utc),
+            }
+        ]
+        VideoIngestionService(self.db, youtube_client).scan_channel("UCtest123")
+
+        stats = self.db.get(ChannelStats, "UCtest123")
+        assert stats.total_videos == 2
+        assert stats.available_videos == 1
+        assert stats.missing_videos == 1
+        assert stats.unknown_events == 1
+
+
+class TestChannelStatsAPI:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> None:
+        self.database = database
+        db = database.SessionLocal()
+        for channel_id in ("UCtest123", "UCnostats"):
+            db.add(
+                Channel(
+                    channel_id=channel_id,
+                    title="Test Channel",
+                    uploads_playlist_id="UU" + channel_id[2:],
+                    source_input="@testchannel",
+                )
+            )
+        db.add(_video("v1"))
+        db.flush()
+        # As the migration backfill would have done.
+        ChannelStatsService(db).ensure("UCtest123")
+        db.commit()
+        db.close()
+
+        test_app = FastAPI()
+        test_app.include_router(app.router)
+        database.install(test_app)
+        self.client = TestClient(test_app)
+
+    def test_get_channel_stats(self) -> None:
+        response = self.client.get("/api/channels/UCtest123/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["channel_id"] == "UCtest123"
+        assert data["total_videos"] == 1
+        assert data["available_videos"] == 1
+        assert data["missing_videos"] == 0
+        assert data["events_by_type"]["PRIVATE"] == 0
+
+    def test_get_channel_stats_not_found(self) -> None:
+        response = self.client.get("/api/channels/UCmissing/stats")
+        assert response.status_code == 404
+
+    def test_missing_stats_row_reads_as_zeros_without_writing(self) -> None:
+        response = self.client.get("/api/channels/UCnostats/stats")
+
+        assert response.status_code == 200
+        assert response.json()["total_videos"] == 0
+        assert response.json()["events_by_type"]["DELETED"] == 0
+        db = self.database.SessionLocal()
+        try:
+            assert db.get(ChannelStats, "UCnostats") is None
+        finally:
+            db.close()
+
+    def test_list_channels_includes_stats(self) -> None:
+        channels = {
+            channel["channel_id"]: channel
+            for channel in self.client.get("/api/channels/").json()
+        }
+
+        assert channels["UCtest123"]["stats"]["total_videos"] == 1
+        assert channels["UCnostats"]["stats"] is None
+
+    @patch("app.api.channels.YouTubeClient")
+    def test_added_channel_gets_stats_row(self, youtube_client_class: Mock) -> None:
+        youtube_client_class.return_value.resolve_channel_input.return_value = (
+            "UCadded",
+            {"title": "Added", "uploads_playlist_id": "UUadded"},
+        )
+
+        response = self.client.post("/api/channels/", json={"input": "@added"})
+
+        assert response.status_code == 201
+        assert response.json()["stats"]["total_videos"] == 0
+        db = self.database.SessionLocal()
+        try:
+            assert db.get(ChannelStats, "UCadded") is not None
+        finally:
+            db.close()
@@ -1,51 +1,21 @@
-from typing import Callable, Generator
 from unittest.mock import Mock, patch
 
+import pytest
+from conftest import TestDatabase
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.core.database import Base, get_db
 from app.main import app
 
 
-def create_test_db_dependency(
-    engine: Engine,
-) -> Callable[[], Generator[Session, None, None]]:
-    """Create a test database session factory for dependency injection."""
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    def get_test_db() -> Generator[Session, None, None]:
-        try:
-            db = TestingSessionLocal()
-            yield db
-        finally:
-            db.close()
-
-    return get_test_db
-
-
 class TestChannelsAPI:
-    def setup_method(self) -> None:
-        self.engine = create_engine(
-            "sqlite:///:memory:",
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-        )
-
-        Base.metadata.create_all(bind=self.engine)
-
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> None:
         test_app = FastAPI()
         test_app.include_router(app.router)
-        test_app.dependency_overrides[get_db] = create_test_db_dependency(self.engine)
+        database.install(test_app)
         self.client = TestClient(test_app)
 
-    def teardown_method(self) -> None:
-        Base.metadata.drop_all(bind=self.engine)
-        self.engine.dispose()
-
     @patch("app.api.channels.YouTubeClient")
     def test_add_channel_success(self, mock_youtube_client_class: Mock) -> None:
         mock_client = Mock()
@@ -0,0 +1,304 @@
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from googleapiclient.errors import HttpError
+
+from app.main import app
+from app.services.api_key_pool import ApiKeyPool, QuotaLedger
+from app.services.background_jobs import BackgroundJobService
+from app.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    REASON_QUOTA,
+    REASON_SERVER_ERRORS,
+    CircuitBreaker,
+    RedisBreakerStore,
+    next_quota_reset,
+)
+from app.services.youtube_client import (
+    YouTubeAPIError,
+    YouTubeCircuitOpenError,
+    YouTubeClient,
+    YouTubeQuotaExhaustedError,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2025, 9, 15, 12, 0, tzinfo=timezone.utc).timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """Just enough of the Redis hash/string API for the breaker store."""
+
+    def __init__(self) -> None:
+        self.hashes: Dict[str, Dict[bytes, bytes]] = {}
+        self.strings: Dict[str, bytes] = {}
+
+    def hgetall(self, key: str) -> Dict[bytes, bytes]:
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key: str, mapping: Dict[str, Any]) -> None:
+        self.hashes.setdefault(key, {}).update(
+            {k.encode(): str(v).encode() for k, v in mapping.items()}
+        )
+
+    def hincrby(self, key: str, field: str, amount: int) -> int:
+        values = self.hashes.setdefault(key, {})
+        value = int(values.get(field.encode(), b"0")) + amount
+        values[field.encode()] = str(value).encode()
+        return value
+
+    def set(
+        self, key: str, value: str, nx: bool = False, ex: Optional[int] = None
+    ) -> Optional[bool]:
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value.encode()
+        return True
+
+    def delete(self, key: str) -> None:
+        self.strings.pop(key, None)
+
+
+class TestQuotaReset:
+    def test_next_pacific_midnight(self) -> None:
+        summer = datetime(2025, 9, 15, 12, 0, tzinfo=timezone.utc)
+        winter = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+        assert next_quota_reset(summer) == datetime(
+            2025, 9, 16, 7, 0, tzinfo=timezone.utc
+        )
+        assert next_quota_reset(winter) == datetime(
+            2025, 1, 16, 8, 0, tzinfo=timezone.utc
+        )
+
+
+class TestCircuitBreaker:
+    def setup_method(self) -> None:
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            failure_threshold=3, cooldown_seconds=60, clock=self.clock
+        )
+
+    def test_quota_exhaustion_opens_until_reset(self) -> None:
+        reset = datetime(2025, 9, 16, 7, 0, tzinfo=timezone.utc)
+        with patch("app.services.circuit_breaker.next_quota_reset", return_value=reset):
+            self.breaker.record_quota_exhausted()
+
+        assert self.breaker.allow() is False
+        assert self.breaker.is_open() is True
+        status = self.breaker.status()
+        assert status["state"] == OPEN
+        assert status["reason"] == REASON_QUOTA
+        assert status["open_until"] == reset.isoformat()
+
+        self.clock.now = reset.timestamp()
+        assert self.breaker.is_open() is False
+        assert self.breaker.allow() is True
+        assert self.breaker.status()["state"] == HALF_OPEN
+
+    def test_repeated_server_errors_open_the_circuit(self) -> None:
+        self.breaker.record_server_error()
+        self.breaker.record_server_error()
+        assert self.breaker.allow() is True
+
+        self.breaker.record_server_error()
+
+        assert self.breaker.allow() is False
+        assert self.breaker.status()["reason"] == REASON_SERVER_ERRORS
+
+    def test_success_resets_failure_count(self) -> None:
+        self.breaker.record_server_error()
+        self.breaker.record_server_error()
+        self.breaker.record_success()
+        self.breaker.record_server_error()
+
+        assert self.breaker.allow() is True
+        assert self.breaker.status()["consecutive_failures"] == 1
+
+    def test_half_open_allows_single_probe(self) -> None:
+        for _ in range(3):
+            self.breaker.record_server_error()
+        self.clock.now += 61
+
+        assert self.breaker.allow() is True
+        assert self.breaker.allow() is False
+
+        self.breaker.record_success()
+        assert self.breaker.status()["state"] == CLOSED
+        assert self.breaker.allow() is True
+        assert self.breaker.allow() is True
+
+    def test_failed_probe_reopens(self) -> None:
+        for _ in range(3):
+            self.breaker.record_server_error()
+        self.clock.now += 61
+        assert self.breaker.allow() is True
+
+        self.breaker.record_server_error()
+
+        assert self.breaker.status()["state"] == OPEN
+        assert self.breaker.allow() is False
+        self.clock.now += 61
+        assert self.breaker.allow() is True
+
+
+class TestSharedState:
+    def test_workers_share_state_through_redis(self) -> None:
+        redis = FakeRedis()
+        clock = FakeClock()
+        worker_a = CircuitBreaker(RedisBreakerStore(redis), clock=clock)
+        worker_b = CircuitBreaker(RedisBreakerStore(redis), clock=clock)
+
+        worker_a.record_quota_exhausted()
+
+        assert worker_b.allow() is False
+        assert worker_b.status()["reason"] == REASON_QUOTA
+        assert worker_b.status()["shared"] is True
+
+        clock.now = next_quota_reset().timestamp() + 1
+        assert worker_b.allow() is True
+        assert worker_a.allow() is False  # only one probe across workers
+
+    def test_falls_back_to_local_state_when_redis_fails(self) -> None:
+        store = Mock()
+        store.load.side_effect = ConnectionError("down")
+        store.save.side_effect = ConnectionError("down")
+        store.release_probe.side_effect = ConnectionError("down")
+        breaker = CircuitBreaker(store)
+
+        breaker.record_quota_exhausted()
+
+        assert breaker.allow() is False
+
+
+class TestYouTubeClientIntegration:
+    @pytest.fixture
+    def client(self) -> YouTubeClient:
+        with patch("googleapiclient.discovery.build"), patch.dict(
+            os.environ, {"YOUTUBE_API_KEY": "test-api-key"}
+        ):
+            client = YouTubeClient()
+        client.circuit_breaker = CircuitBreaker()
+        client.key_pool = ApiKeyPool(["test-api-key"], ledger=QuotaLedger())
+        return client
+
+    def test_quota_error_fails_fast_afterwards(self, client: YouTubeClient) -> None:
+        error = HttpError(Mock(status=403), b"Quota exceeded")
+        error.error_details = [{"reason": "quotaExceeded"}]
+        request = Mock()
+        request.execute.side_effect = error
+
+        with pytest.raises(YouTubeQuotaExhaustedError):
+            client._execute_with_retry(request, "fetch playlist items: UU1")
+        with pytest.raises(YouTubeCircuitOpenError):
+            client._execute_with_retry(request, "fetch playlist items: UU2")
+
+        assert request.execute.call_count == 1
+        assert client.usage.api_calls == 1
+
+    @patch("app.services.youtube_client.time.sleep")
+    def test_server_errors_are_recorded(
+        self, sleep: Mock, client: YouTubeClient
+    ) -> None:
+        client.circuit_breaker = CircuitBreaker(failure_threshold=2)
+        request = Mock()
+        request.execute.side_effect = HttpError(Mock(status=503), b"Unavailable")
+
+        with pytest.raises(YouTubeCircuitOpenError):
+            client._execute_with_retry(request, "get video details")
+
+        assert request.execute.call_count == 2
+
+    @pytest.mark.parametrize("reason", ["quotaExceeded", "dailyLimitExceeded"])
+    def test_daily_quota_reasons_evict_and_open(
+        self, reason: str, client: YouTubeClient
+    ) -> None:
+        error = HttpError(Mock(status=403), b"Quota exceeded")
+        error.error_details = [{"reason": reason}]
+        request = Mock()
+        request.execute.side_effect = error
+
+        with pytest.raises(YouTubeQuotaExhaustedError):
+            client._execute_with_retry(request, "get video details")
+
+        assert client.circuit_breaker.status()["state"] == OPEN
+        assert client.key_pool.choose() is None
+
+    @pytest.mark.parametrize("reason", ["rateLimitExceeded", "userRateLimitExceeded"])
+    @patch("app.services.youtube_client.time.sleep")
+    def test_rate_limit_reasons_are_retried(
+        self, sleep: Mock, reason: str, client: YouTubeClient
+    ) -> None:
+        error = HttpError(Mock(status=403), b"Rate limit exceeded")
+        error.error_details = [{"reason": reason}]
+        request = Mock()
+        request.execute.side_effect = [error, {"items": []}]
+
+        assert client._execute_with_retry(request, "get video details") == {"items": []}
+
+        sleep.assert_called_once()
+        assert client.circuit_breaker.status()["state"] == CLOSED
+        assert client.key_pool.choose() == client.key_pool.keys[0]
+
+    @patch("app.services.youtube_client.time.sleep")
+    def test_persistent_rate_limit_gives_up_without_opening(
+        self, sleep: Mock, client: YouTubeClient
+    ) -> None:
+        error = HttpError(Mock(status=403), b"Rate limit exceeded")
+        error.error_details = [{"reason": "rateLimitExceeded"}]
+        request = Mock()
+        request.execute.side_effect = error
+
+        with pytest.raises(YouTubeAPIError) as raised:
+            client._execute_with_retry(request, "get video details")
+
+        assert not isinstance(raised.value, YouTubeQuotaExhaustedError)
+        assert request.execute.call_count == client.retry_policy.max_retries + 1
+        assert client.circuit_breaker.status()["state"] == CLOSED
+        assert client.key_pool.choose() is not None
+
+
+class TestScanSweep:
+    @patch("app.services.background_jobs.SessionLocal")
+    def test_sweep_stops_when_circuit_opens(self, session_local: Mock) -> None:
+        channels = [Mock(channel_id="UCone"), Mock(channel_id="UCtwo")]
+        query = session_local.return_value.query.return_value
+        query.filter.return_value.limit.return_value.all.return_value = channels
+        breaker = CircuitBreaker()
+
+        service = BackgroundJobService()
+        service.adaptive = False
+        service._acquire_lock = Mock(return_value=True)  # type: ignore[method-assign]
+        service._release_lock = Mock()  # type: ignore[method-assign]
+        service._scan_single_channel = Mock(  # type: ignore[method-assign]
+            side_effect=lambda db, channel_id: breaker.record_quota_exhausted()
+        )
+
+        with patch(
+            "app.services.background_jobs.get_circuit_breaker", return_value=breaker
+        ):
+            service._scan_all_channels()
+
+        service._scan_single_channel.assert_called_once()
+
+
+def test_healthz_reports_circuit_state() -> None:
+    breaker = CircuitBreaker()
+    breaker.record_quota_exhausted()
+
+    with patch("app.main.get_circuit_breaker", return_value=breaker):
+        response = TestClient(app).get("/healthz")
+
+    circuit = response.json()["youtube_circuit"]
+    assert circuit["state"] == OPEN
+    assert circuit["reason"] == REASON_QUOTA
@@ -0,0 +1,199 @@
+import os
+from datetime import datetime, timezone
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.metrics import DISAPPEARANCE_SUSPICIONS_TOTAL
+from app.models.channel import Channel
+from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.video import Video
+from app.services.disappearance_confirmation import (
+    CLEARED,
+    SUSPECTED,
+    ConfirmationConfig,
+)
+from app.services.video_ingestion import VideoIngestionService
+from app.services.youtube_client import YouTubeAPIError, YouTubeClient
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+NOW = datetime(2025, 9, 17, 12, 0, tzinfo=timezone.utc)
+CHANNEL_ID = "UCflap000000000000000000"
+VIDEO_IDS = ["vid0", "vid1", "vid2"]
+
+
+def public(video_id: str) -> dict:
+    return {"id": video_id, "status": {"privacyStatus": "public"}}
+
+
+class TestDebouncedDisappearances:
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        self.db.add(
+            Channel(
+                channel_id=CHANNEL_ID,
+                title="Flapping channel",
+                uploads_playlist_id="UUflap",
+                source_input=CHANNEL_ID,
+            )
+        )
+        for video_id in VIDEO_IDS:
+            self.db.add(
+                Video(
+                    video_id=video_id,
+                    channel_id=CHANNEL_ID,
+                    title=f"Video {video_id}",
+                    published_at=NOW,
+                    is_available=True,
+                )
+            )
+        self.db.commit()
+
+        self.youtube_client = Mock()
+        self.youtube_client.fetch_channel_videos.return_value = []
+        self.service = VideoIngestionService(self.db, self.youtube_client)
+        self.service.confirmer.config = ConfirmationConfig(confirm_after_misses=2)
+        self.service._notify = Mock()  # type: ignore[method-assign]
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def _walk(self, video_ids: List[str]) -> None:
+        self.youtube_client.fetch_channel_videos.return_value = [
+            {"video_id": video_id, "title": f"Video {video_id}", "published_at": NOW}
+            for video_id in video_ids
+        ]
+
+    def _missed_scans(self) -> List[int]:
+        self.db.expire_all()
+        return [
+            v.missed_scans for v in self.db.query(Video).order_by(Video.video_id).all()
+        ]
+
+    def test_failed_probe_only_suspects(self) -> None:
+        self.youtube_client.probe_videos.side_effect = YouTubeAPIError("boom")
+        before = DISAPPEARANCE_SUSPICIONS_TOTAL.value(outcome=SUSPECTED)
+
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 0)
+
+        assert self._missed_scans() == [1, 1, 1]
+        assert all(v.is_available for v in self.db.query(Video))
+        assert self.db.query(DisappearanceEvent).count() == 0
+        self.service._notify.assert_not_called()  # type: ignore[attr-defined]
+        assert DISAPPEARANCE_SUSPICIONS_TOTAL.value(outcome=SUSPECTED) == before + 3
+
+    def test_confirmed_after_consecutive_misses(self) -> None:
+        self.youtube_client.probe_videos.side_effect = YouTubeAPIError("boom")
+
+        self.service.scan_channel(CHANNEL_ID)
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 3)
+
+        events = self.db.query(DisappearanceEvent).all()
+        assert {e.event_type for e in events} == {EventType.UNKNOWN}
+        assert self._missed_scans() == [0, 0, 0]
+
+    def test_suspect_seen_again_is_cleared_silently(self) -> None:
+        self.youtube_client.probe_videos.side_effect = YouTubeAPIError("boom")
+        self.service.scan_channel(CHANNEL_ID)
+
+        self._walk(VIDEO_IDS)
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 0)
+
+        assert self._missed_scans() == [0, 0, 0]
+        self._walk([])
+        self.service.scan_channel(CHANNEL_ID)
+        assert self.db.query(DisappearanceEvent).count() == 0
+
+    def test_probe_decides_on_first_miss(self) -> None:
+        self.youtube_client.probe_videos.return_value = {
+            "vid0": public("vid0"),
+            "vid1": {"id": "vid1", "status": {"privacyStatus": "private"}},
+        }
+        before = DISAPPEARANCE_SUSPICIONS_TOTAL.value(outcome=CLEARED)
+
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 2)
+
+        self.youtube_client.probe_videos.assert_called_once_with(VIDEO_IDS)
+        event_types = {
+            e.video_id: e.event_type for e in self.db.query(DisappearanceEvent)
+        }
+        assert event_types == {"vid1": EventType.PRIVATE, "vid2": EventType.UNKNOWN}
+        assert self.db.query(Video).filter_by(video_id="vid0").one().is_available
+        assert self._missed_scans() == [0, 0, 0]
+        assert DISAPPEARANCE_SUSPICIONS_TOTAL.value(outcome=CLEARED) == before + 1
+
+    def test_playlist_markers_skip_the_probe(self) -> None:
+        self.youtube_client.fetch_channel_videos.return_value = [
+            {"video_id": "vid0", "unavailable": "deleted"},
+            {"video_id": "vid1", "title": "Video vid1", "published_at": NOW},
+            {"video_id": "vid2", "title": "Video vid2", "published_at": NOW},
+        ]
+
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 1)
+
+        self.youtube_client.probe_videos.assert_not_called()
+        assert self.db.query(DisappearanceEvent).one().event_type == EventType.DELETED
+
+    def test_probing_can_be_disabled(self) -> None:
+        self.service.confirmer.config = ConfirmationConfig(
+            confirm_after_misses=1, probe=False
+        )
+
+        assert self.service.scan_channel(CHANNEL_ID) == (0, 0, 3)
+        self.youtube_client.probe_videos.assert_not_called()
+
+    def test_from_env(self) -> None:
+        with patch.dict(
+            os.environ,
+            {"DISAPPEARANCE_CONFIRM_MISSES": "0", "DISAPPEARANCE_PROBE": "false"},
+        ):
+            config = ConfirmationConfig.from_env()
+
+        assert config == ConfirmationConfig(confirm_after_misses=1, probe=False)
+
+
+class TestProbeVideos:
+    @pytest.fixture
+    def client(self) -> YouTubeClient:
+        with patch("googleapiclient.discovery.build"), patch.dict(
+            os.environ, {"YOUTUBE_API_KEY": "test-api-key"}
+        ):
+            return YouTubeClient()
+
+    def test_batches_fifty_ids_per_call(self, client: YouTubeClient) -> None:
+        video_ids = [f"vid{i}" for i in range(120)]
+        client.youtube.videos().list().execute.side_effect = [
+            {"items": [public("vid0")]},
+            {"items": []},
+            {"items": [public("vid119")]},
+        ]
+
+        found = client.probe_videos(video_ids)
+
+        assert set(found) == {"vid0", "vid119"}
+        assert client.usage.api_calls == 3
+        batches = [
+            c.kwargs["id"].split(",")
+            for c in client.youtube.videos().list.call_args_list
+            if c.kwargs
+        ]
+        assert [len(batch) for batch in batches] == [50, 50, 20]
+
+    def test_errors_propagate(self, client: YouTubeClient) -> None:
+        client.youtube.videos().list().execute.side_effect = KeyError("items")
+
+        with pytest.raises(KeyError):
+            client.probe_videos(["vid0"])
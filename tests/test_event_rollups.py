@@ -0,0 +1,197 @@
+from datetime import datetime, timezone
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+from conftest import TestDatabase
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.models.channel import Channel
+from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.disappearance_rollup import DisappearanceRollup
+from app.models.video import Video
+from app.services.event_rollups import EventRollupService, bucket_start
+from app.services.video_ingestion import VideoIngestionService
+
+
+def _seed(db: Session) -> None:
+    for channel_id in ("UCone", "UCtwo"):
+        db.add(
+            Channel(
+                channel_id=channel_id,
+                title=channel_id,
+                uploads_playlist_id=f"UU{channel_id}",
+                source_input=channel_id,
+            )
+        )
+        db.add(
+            Video(
+                video_id=f"{channel_id}-video",
+                channel_id=channel_id,
+                title="Video",
+                published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                is_available=False,
+            )
+        )
+    db.commit()
+
+
+class TestBucketStart:
+    def test_hour_and_day(self) -> None:
+        ts = datetime(2025, 3, 4, 15, 42, 7, tzinfo=timezone.utc)
+        assert bucket_start(ts, "hour") == datetime(2025, 3, 4, 15, tzinfo=timezone.utc)
+        assert bucket_start(ts, "day") == datetime(2025, 3, 4, tzinfo=timezone.utc)
+
+    def test_naive_treated_as_utc(self) -> None:
+        ts = datetime(2025, 3, 4, 15, 42)
+        assert bucket_start(ts, "day").tzinfo == timezone.utc
+
+    def test_unknown_bucket(self) -> None:
+        with pytest.raises(ValueError):
+            bucket_start(datetime.now(timezone.utc), "week")
+
+
+class TestEventRollupService:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> Iterator[None]:
+        self.db = database.SessionLocal()
+        _seed(self.db)
+        self.service = EventRollupService(self.db)
+        yield
+        self.db.close()
+
+    def test_record_events_aggregates_per_bucket(self) -> None:
+        self.service.record_events(
+            [
+                ("UCone", EventType.DELETED, datetime(2025, 1, 1, 10, 5)),
+                ("UCone", EventType.DELETED, datetime(2025, 1, 1, 10, 50)),
+                ("UCone", EventType.DELETED, datetime(2025, 1, 1, 11, 0)),
+            ]
+        )
+        self.db.commit()
+
+        hourly = self.service.timeseries(bucket="hour", channel_id="UCone")
+        assert [point["count"] for point in hourly] == [2, 1]
+
+        daily = self.service.timeseries(bucket="day", channel_id="UCone")
+        assert len(daily) == 1
+        assert daily[0]["count"] == 3
+
+    def test_record_events_increments_existing_rows(self) -> None:
+        event = ("UCone", EventType.PRIVATE, datetime(2025, 1, 1, 10, 5))
+        self.service.record_events([event])
+        self.db.commit()
+        self.service.record_events([event])
+        self.db.commit()
+
+        assert self.db.query(DisappearanceRollup).count() == 2
+        daily = self.service.timeseries(bucket="day")
+        assert daily[0]["count"] == 2
+
+    def test_timeseries_filters(self) -> None:
+        self.service.record_events(
+            [
+                ("UCone", EventType.DELETED, datetime(2025, 1, 1)),
+                ("UCtwo", EventType.PRIVATE, datetime(2025, 1, 2)),
+            ]
+        )
+        self.db.commit()
+
+        assert len(self.service.timeseries()) == 2
+        assert len(self.service.timeseries(event_type=EventType.PRIVATE)) == 1
+        assert len(self.service.timeseries(since=datetime(2025, 1, 2))) == 1
+        assert len(self.service.timeseries(until=datetime(2025, 1, 1, 12))) == 1
+
+        with pytest.raises(ValueError):
+            self.service.timeseries(bucket="week")
+
+    def test_backfill_from_events(self) -> None:
+        self.db.add_all(
+            [
+                DisappearanceEvent(
+                    video_id="UCone-video",
+                    event_type=EventType.DELETED,
+                    detected_at=datetime(2025, 1, 1, 9),
+                ),
+                DisappearanceEvent(
+                    video_id="UCtwo-video",
+                    event_type=EventType.UNKNOWN,
+                    detected_at=datetime(2025, 1, 1, 9),
+                ),
+            ]
+        )
+        self.service.record_events([("UCone", EventType.DELETED, datetime(2024, 1, 1))])
+        self.db.commit()
+
+        assert self.service.backfill("UCone") == 1
+        self.db.commit()
+
+        daily = self.service.timeseries(channel_id="UCone")
+        assert len(daily) == 1
+        assert daily[0]["count"] == 1
+
+        assert self.service.backfill() == 2
+        self.db.commit()
+        assert len(self.service.timeseries()) == 2
+
+    def test_scan_records_rollups(self) -> None:
+        video = self.db.query(Video).filter(Video.video_id == "UCone-video").one()
+        video.is_available = True
+        self.db.commit()
+
+        youtube_client = Mock()
+        youtube_client.probe_videos.return_value = {}
+        youtube_client.fetch_channel_videos.return_value = []
+        VideoIngestionService(self.db, youtube_client).scan_channel("UCone")
+
+        daily = self.service.timeseries(channel_id="UCone")
+        assert daily[0]["event_type"] == EventType.UNKNOWN
+        assert daily[0]["count"] == 1
+
+
+class TestTimeseriesAPI:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> None:
+        db = database.SessionLocal()
+        _seed(db)
+        EventRollupService(db).record_events(
+            [
+                ("UCone", EventType.DELETED, datetime(2025, 1, 1, 10)),
+                ("UCtwo", EventType.DELETED, datetime(2025, 1, 1, 11)),
+            ]
+        )
+        db.commit()
+        db.close()
+
+        test_app = FastAPI()
+        test_app.include_router(app.router)
+        database.install(test_app)
+        self.client = TestClient(test_app)
+
+    def test_daily_timeseries_across_channels(self) -> None:
+        response = self.client.get("/api/stats/timeseries?bucket=day")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["bucket"] == "day"
+        assert data["total"] == 2
+        assert len(data["points"]) == 1
+        assert data["points"][0]["event_type"] == "DELETED"
+
+    def test_hourly_timeseries_for_channel(self) -> None:
+        response = self.client.get("/api/stats/timeseries?bucket=hour&channel_id=UCone")
+
+        data = response.json()
+        assert data["channel_id"] == "UCone"
+        assert data["total"] == 1
+
+    def test_invalid_bucket(self) -> None:
+        response = self.client.get("/api/stats/timeseries?bucket=week")
+        assert response.status_code == 422
+
+    def test_invalid_since(self) -> None:
+        response = self.client.get("/api/stats/timeseries?since=yesterday")
+        assert response.status_code == 400
@@ -0,0 +1,314 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlparse
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.metrics import FEED_PRECHECK_TOTAL
+from app.models.channel import Channel
+from app.models.scan_run import ScanRun
+from app.models.video import Video
+from app.services.background_jobs import BackgroundJobService
+from app.services.feed_precheck import (
+    FEED_UNAVAILABLE,
+    FULL_CHECK_DUE,
+    MISSING_VIDEOS,
+    NEW_VIDEOS,
+    UNCHANGED,
+    FeedConfig,
+    FeedDecision,
+    FeedEntry,
+    FeedPrecheck,
+    fetch_feed,
+    parse_feed,
+)
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+NOW = datetime(2025, 9, 15, 12, 0, tzinfo=timezone.utc)
+CHANNEL_ID = "UCfeed000000000000000000"
+
+
+def atom_feed(entries: List[FeedEntry]) -> bytes:
+    body = "".join(
+        f"""
+  <entry>
+    <id>yt:video:{e.video_id}</id>
+    <yt:videoId>{e.video_id}</yt:videoId>
+    <yt:channelId>{CHANNEL_ID}</yt:channelId>
+    <title>Video {e.video_id}</title>
+    <published>{e.published_at.isoformat() if e.published_at else ""}</published>
+  </entry>"""
+        for e in entries
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns:media="http://search.yahoo.com/mrss/"
+      xmlns="http://www.w3.org/2005/Atom">
+  <title>Feed channel</title>
+  <yt:channelId>{CHANNEL_ID}</yt:channelId>{body}
+</feed>""".encode()
+
+
+class FeedStub:
+    """Local stand-in for youtube.com/feeds/videos.xml."""
+
+    def __init__(self) -> None:
+        self.feeds: Dict[str, bytes] = {}
+        self.requests: List[str] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                channel_id = parse_qs(url.query).get("channel_id", [""])[0]
+                stub.requests.append(channel_id)
+                body = stub.feeds.get(channel_id)
+                if url.path != "/feeds/videos.xml" or body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/atom+xml")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}/feeds/videos.xml"
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestParseFeed:
+    def test_streams_entries_from_chunks(self) -> None:
+        published = NOW - timedelta(days=1)
+        document = atom_feed(
+            [FeedEntry("vid1", published), FeedEntry("vid2", published)]
+        )
+        chunks = [document[i : i + 7] for i in range(0, len(document), 7)]
+
+        entries = parse_feed(chunks)
+
+        assert entries == [FeedEntry("vid1", published), FeedEntry("vid2", published)]
+
+    def test_missing_published_date(self) -> None:
+        assert parse_feed([atom_feed([FeedEntry("vid1", None)])]) == [
+            FeedEntry("vid1", None)
+        ]
+
+    def test_empty_feed(self) -> None:
+        assert parse_feed([atom_feed([])]) == []
+
+
+class TestFeedPrecheck:
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.stub = FeedStub()
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.stub.close()
+
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        self.config = FeedConfig(url=self.stub.url, full_check_hours=24)
+        self.channel = Channel(
+            channel_id=CHANNEL_ID,
+            title="Feed channel",
+            uploads_playlist_id="UUfeed",
+            source_input=CHANNEL_ID,
+        )
+        self.db.add(self.channel)
+        self.db.add(
+            ScanRun(
+                channel_id=CHANNEL_ID,
+                status="succeeded",
+                started_at=NOW - timedelta(hours=2),
+            )
+        )
+        for index in range(3):
+            self.db.add(
+                Video(
+                    video_id=f"vid{index}",
+                    channel_id=CHANNEL_ID,
+                    title=f"Video {index}",
+                    published_at=NOW - timedelta(days=index + 1),
+                    is_available=True,
+                )
+            )
+        self.db.commit()
+        self.stub.feeds.clear()
+        self.stub.requests.clear()
+        self.precheck = FeedPrecheck(self.db, self.config)
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def _serve(self, video_ids: List[str]) -> None:
+        days = {"vid0": 1, "vid1": 2, "vid2": 3}
+        self.stub.feeds[CHANNEL_ID] = atom_feed(
+            [
+                FeedEntry(video_id, NOW - timedelta(days=days.get(video_id, 0)))
+                for video_id in video_ids
+            ]
+        )
+
+    def test_fetches_feed_over_http(self) -> None:
+        self._serve(["vid0", "vid1"])
+
+        entries = fetch_feed(CHANNEL_ID, self.config)
+
+        assert [e.video_id for e in entries] == ["vid0", "vid1"]
+        assert self.stub.requests[-1] == CHANNEL_ID
+
+    def test_unchanged_feed_skips_scan(self) -> None:
+        self._serve(["vid0", "vid1", "vid2"])
+        before = FEED_PRECHECK_TOTAL.value(result=UNCHANGED)
+
+        decision = self.precheck.check(self.channel, NOW)
+
+        assert decision.scan is False
+        assert decision.reason == UNCHANGED
+        assert FEED_PRECHECK_TOTAL.value(result=UNCHANGED) == before + 1
+
+    def test_feed_window_ignores_older_videos(self) -> None:
+        # vid2 is older than anything in the feed, so its absence is expected.
+        self._serve(["vid0", "vid1"])
+
+        assert self.precheck.check(self.channel, NOW).reason == UNCHANGED
+
+    def test_new_upload_triggers_scan(self) -> None:
+        self._serve(["vidnew", "vid0", "vid1", "vid2"])
+
+        decision = self.precheck.check(self.channel, NOW)
+
+        assert decision.scan is True
+        assert decision.reason == NEW_VIDEOS
+
+    def test_reappearance_triggers_scan(self) -> None:
+        video = self.db.query(Video).filter(Video.video_id == "vid1").one()
+        video.is_available = False  # type: ignore[assignment]
+        self.db.commit()
+        self._serve(["vid0", "vid1", "vid2"])
+
+        assert self.precheck.check(self.channel, NOW).reason == NEW_VIDEOS
+
+    def test_missing_recent_video_triggers_scan(self) -> None:
+        self._serve(["vid0", "vid2"])
+
+        decision = self.precheck.check(self.channel, NOW)
+
+        assert decision.scan is True
+        assert decision.reason == MISSING_VIDEOS
+
+    def test_full_check_is_forced_periodically(self) -> None:
+        self._serve(["vid0", "vid1", "vid2"])
+
+        # The last full scan started two hours before NOW.
+        decision = self.precheck.check(self.channel, NOW + timedelta(hours=21))
+        assert decision.reason == UNCHANGED
+
+        decision = self.precheck.check(self.channel, NOW + timedelta(hours=22))
+        assert decision.scan is True
+        assert decision.reason == FULL_CHECK_DUE
+
+    def test_never_scanned_channel_gets_full_scan(self) -> None:
+        self.db.query(ScanRun).delete()
+        self.db.commit()
+        self._serve(["vid0", "vid1", "vid2"])
+
+        assert self.precheck.check(self.channel, NOW).reason == FULL_CHECK_DUE
+        assert self.stub.requests == []
+
+    def test_unreachable_feed_falls_back_to_scan(self) -> None:
+        decision = self.precheck.check(self.channel, NOW)  # stub returns 404
+
+        assert decision.scan is True
+        assert decision.reason == FEED_UNAVAILABLE
+
+
+class TestScanIntegration:
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        self.db.add(
+            Channel(
+                channel_id=CHANNEL_ID,
+                title="Feed channel",
+                uploads_playlist_id="UUfeed",
+                source_input=CHANNEL_ID,
+            )
+        )
+        self.db.commit()
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def _scan(
+        self,
+        decision_scan: Optional[bool],
+        enabled: bool = True,
+        reason: str = NEW_VIDEOS,
+    ) -> Mock:
+        service = BackgroundJobService()
+        service.feed_config = FeedConfig(enabled=enabled)
+        ingestion = Mock()
+        ingestion.scan_channel.return_value = (0, 0, 0)
+        check = Mock(return_value=FeedDecision(scan=bool(decision_scan), reason=reason))
+        if decision_scan is None:
+            check.side_effect = RuntimeError("boom")
+
+        with patch(
+            "app.services.video_ingestion.VideoIngestionService",
+            return_value=ingestion,
+        ), patch("app.services.youtube_client.YouTubeClient"), patch.object(
+            FeedPrecheck, "check", check
+        ):
+            service._scan_single_channel(self.db, CHANNEL_ID)
+        return ingestion
+
+    def test_unchanged_feed_skips_data_api_scan(self) -> None:
+        self._scan(False).scan_channel.assert_not_called()
+
+    def test_changed_feed_runs_full_scan(self) -> None:
+        self._scan(True).scan_channel.assert_called_once_with(
+            CHANNEL_ID, force_full=False
+        )
+
+    def test_due_full_check_bypasses_fingerprint(self) -> None:
+        self._scan(True, reason=FULL_CHECK_DUE).scan_channel.assert_called_once_with(
+            CHANNEL_ID, force_full=True
+        )
+
+    def test_precheck_errors_fall_through_to_scan(self) -> None:
+        self._scan(None).scan_channel.assert_called_once_with(
+            CHANNEL_ID, force_full=False
+        )
+
+    def test_disabled_precheck_always_scans(self) -> None:
+        self._scan(False, enabled=False).scan_channel.assert_called_once()
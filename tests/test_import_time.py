@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Cold-start budget for ``import app.main``; override on slow CI machines.
+IMPORT_TIME_BUDGET_MS = int(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+
+# Modules that must only load on first use.
+LAZY_MODULES = ("googleapiclient", "httpx", "redis", "apscheduler", "jinja2")
+
+
+def _import_app(code: str = "import app.main") -> subprocess.CompletedProcess:
+    env = {
+        key: value for key, value in os.environ.items() if not key.startswith("COV_")
+    }
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(importtime_output: str) -> Dict[str, int]:
+    """Parse ``-X importtime`` lines into module -> cumulative microseconds."""
+    times = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.slow
+class TestImportTime:
+    def test_app_import_within_budget(self) -> None:
+        result = _import_app()
+        cumulative_ms = _cumulative_us(result.stderr)["app.main"] / 1000
+
+        assert cumulative_ms < IMPORT_TIME_BUDGET_MS, (
+            f"import app.main took {cumulative_ms:.0f}ms "
+            f"(budget {IMPORT_TIME_BUDGET_MS}ms)"
+        )
+
+    def test_heavy_modules_load_lazily(self) -> None:
+        code = (
+            "import sys, app.main; "
+            f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+        )
+
+        assert _import_app(code).stdout.strip() == ""
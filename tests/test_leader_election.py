@@ -0,0 +1,181 @@
+import os
+from typing import Any, Dict, Optional, Tuple
+from unittest.mock import Mock, patch
+
+from app.core.metrics import SCHEDULER_LEADER
+from app.services.background_jobs import BackgroundJobService
+from app.services.leader_election import (
+    CAMPAIGN_SCRIPT,
+    LEADER_KEY,
+    RELEASE_SCRIPT,
+    LeaderConfig,
+    LeaderElector,
+)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LeaseRedis:
+    """Just enough of Redis to run the lease scripts against a fake clock."""
+
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+        self.values: Dict[str, Tuple[str, float]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self.values.get(key)
+        if entry is None or entry[1] <= self.clock():
+            return None
+        return entry[0].encode()
+
+    def eval(self, script: str, numkeys: int, key: str, *args: Any) -> int:
+        current = self.get(key)
+        if script == CAMPAIGN_SCRIPT:
+            token, lease_ms = args
+            if current is None or current.decode() == token:
+                self.values[key] = (token, self.clock() + lease_ms / 1000)
+                return 1
+            return 0
+        if script == RELEASE_SCRIPT and current is not None:
+            if current.decode() == args[0]:
+                del self.values[key]
+                return 1
+        return 0
+
+
+class TestLeaderElector:
+    def setup_method(self) -> None:
+        self.clock = Clock()
+        self.redis = LeaseRedis(self.clock)
+        config = LeaderConfig(lease_seconds=30, renew_seconds=10)
+        self.first = LeaderElector(self.redis, config, "first", self.clock)
+        self.second = LeaderElector(self.redis, config, "second", self.clock)
+
+    def test_only_one_process_leads(self) -> None:
+        assert self.first.campaign() is True
+        assert self.second.campaign() is False
+
+        assert self.first.is_leader
+        assert not self.second.is_leader
+        assert self.second.status()["holder"] == "first"
+
+    def test_renewal_keeps_the_lease(self) -> None:
+        self.first.campaign()
+        for _ in range(6):
+            self.clock.now += 10
+            assert self.first.campaign() is True
+            assert self.second.campaign() is False
+
+        assert self.first.is_leader
+
+    def test_standby_takes_over_after_lease_expires(self) -> None:
+        self.first.campaign()
+
+        # The leader stops renewing; standbys keep campaigning every 10s.
+        takeover = None
+        for _ in range(5):
+            self.clock.now += 10
+            if self.second.campaign():
+                takeover = self.clock.now
+                break
+
+        assert takeover is not None and takeover <= 30 + 10
+        assert not self.first.is_leader
+        assert self.first.campaign() is False
+
+    def test_release_hands_over_immediately(self) -> None:
+        self.first.campaign()
+        self.first.release()
+
+        assert not self.first.is_leader
+        assert SCHEDULER_LEADER.value() == 0
+        assert self.second.campaign() is True
+        assert SCHEDULER_LEADER.value() == 1
+
+    def test_redis_failure_steps_down(self) -> None:
+        self.first.campaign()
+        self.redis.eval = Mock(side_effect=ConnectionError("down"))  # type: ignore
+
+        assert self.first.campaign() is False
+        assert not self.first.is_leader
+
+    def test_without_redis_always_leads(self) -> None:
+        elector = LeaderElector(None, LeaderConfig())
+
+        assert elector.campaign() is True
+        assert elector.is_leader
+
+    def test_renew_interval_is_capped(self) -> None:
+        with patch.dict(
+            os.environ, {"LEADER_LEASE_SECONDS": "20", "LEADER_RENEW_SECONDS": "30"}
+        ):
+            assert LeaderConfig.from_env() == LeaderConfig(20, 10)
+        with patch.dict(os.environ, {"LEADER_LEASE_SECONDS": "60"}, clear=True):
+            assert LeaderConfig.from_env().renew_seconds == 20
+
+
+class TestSchedulerLeadership:
+    def setup_method(self) -> None:
+        self.clock = Clock()
+        self.redis = LeaseRedis(self.clock)
+        config = LeaderConfig(lease_seconds=30, renew_seconds=10)
+        self.services = []
+        for identity in ("first", "second"):
+            service = BackgroundJobService()
+            service.leader = LeaderElector(self.redis, config, identity, self.clock)
+            service._scan_all_channels = Mock()  # type: ignore[method-assign]
+            self.services.append(service)
+
+    def test_standby_skips_scheduled_jobs(self) -> None:
+        leader, standby = self.services
+        leader.leader.campaign()
+        standby.leader.campaign()
+
+        leader._run_scan_job()
+        standby._run_scan_job()
+        standby._run_channel_refresh_job()
+        standby._run_websub_job()
+
+        leader._scan_all_channels.assert_called_once()  # type: ignore[attr-defined]
+        standby._scan_all_channels.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_stop_releases_the_lease(self) -> None:
+        leader, standby = self.services
+        leader.scheduler = Mock()
+        leader.leader.campaign()
+
+        leader.stop()
+
+        assert self.redis.get(LEADER_KEY) is None
+        assert standby.leader.campaign() is True
+
+    @patch("app.services.background_jobs.SessionLocal")
+    def test_sweep_stops_when_lease_lapses(self, mock_session_local: Mock) -> None:
+        service = BackgroundJobService()
+        service.adaptive = False
+        service.leader = LeaderElector(
+            self.redis, LeaderConfig(30, 10), "first", self.clock
+        )
+        service.leader.campaign()
+        channels = [Mock(channel_id=f"UC{index}") for index in range(3)]
+        query = mock_session_local.return_value.query.return_value
+        query.filter.return_value.limit.return_value.all.return_value = channels
+
+        def scan(db: Any, channel_id: str) -> None:
+            self.clock.now += 31
+
+        service._acquire_lock = Mock(return_value=True)  # type: ignore[method-assign]
+        service._release_lock = Mock()  # type: ignore[method-assign]
+        service._scan_single_channel = Mock(  # type: ignore[method-assign]
+            side_effect=scan
+        )
+
+        service._scan_all_channels()
+
+        service._scan_single_channel.assert_called_once()
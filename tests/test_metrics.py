@@ -0,0 +1,250 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from conftest import TestDatabase
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from googleapiclient.errors import HttpError
+from sqlalchemy import create_engine
+
+from app.core.database import InstrumentedQueuePool, collect_pool_metrics
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_OVERFLOW,
+    HTTP_REQUEST_SECONDS,
+    SCHEDULER_JOB_FAILURES_TOTAL,
+    SCHEDULER_JOB_SECONDS,
+    SLACK_WEBHOOK_SECONDS,
+    YOUTUBE_API_ERRORS_TOTAL,
+    YOUTUBE_API_REQUEST_SECONDS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    _Metric,
+    operation_label,
+)
+from app.main import app
+from app.models.channel import Channel
+from app.models.scan_run import ScanRun
+from app.services.background_jobs import BackgroundJobService
+from app.services.slack_notifier import SlackNotifier
+from app.services.youtube_client import YouTubeClient
+
+
+class TestMetricsRegistry:
+    def setup_method(self) -> None:
+        self.registry = MetricsRegistry()
+
+    def test_counter_render(self) -> None:
+        counter = self.registry.register(
+            Counter("test_requests_total", "Requests.", ["status"])
+        )
+        counter.inc(status="ok")
+        counter.inc(2, status="ok")
+
+        output = self.registry.render()
+        assert "# TYPE test_requests_total counter" in output
+        assert 'test_requests_total{status="ok"} 3' in output
+
+        with pytest.raises(ValueError):
+            counter.inc(-1, status="ok")
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+
+    def test_register_returns_existing_metric(self) -> None:
+        first = self.registry.register(Counter("test_total", "Test."))
+        second = self.registry.register(Counter("test_total", "Test."))
+        assert first is second
+
+    def test_label_cardinality_is_capped(self) -> None:
+        gauge = self.registry.register(
+            Gauge("test_gauge", "Gauge.", ["key"], max_series=2)
+        )
+        for key in ("a", "b", "c", "d"):
+            gauge.inc(key=key)
+
+        assert gauge.value(key="a") == 1
+        assert gauge.value(key="other") == 2
+        assert 'key="c"' not in self.registry.render()
+
+    def test_histogram_buckets(self) -> None:
+        histogram = self.registry.register(
+            Histogram("test_seconds", "Durations.", buckets=(0.1, 1.0))
+        )
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        output = self.registry.render()
+        assert 'test_seconds_bucket{le="0.1"} 1' in output
+        assert 'test_seconds_bucket{le="1"} 2' in output
+        assert 'test_seconds_bucket{le="+Inf"} 3' in output
+        assert "test_seconds_count 3" in output
+        assert histogram.count() == 3
+
+        self.registry.reset()
+        assert histogram.count() == 0
+
+    def test_incomplete_metric_type_fails_on_creation(self) -> None:
+        class RenderOnly(_Metric):
+            def render(self) -> List[str]:
+                return []
+
+        with pytest.raises(TypeError):
+            RenderOnly("test_incomplete", "Incomplete.")  # type: ignore[abstract]
+
+    def test_collectors_run_before_render(self) -> None:
+        gauge = self.registry.register(Gauge("test_sampled", "Sampled."))
+        self.registry.add_collector(lambda: gauge.set(7))
+
+        assert "test_sampled 7" in self.registry.render()
+
+
+class TestInstrumentation:
+    def test_operation_label_drops_identifiers(self) -> None:
+        assert operation_label("fetch playlist items: UU123") == "fetch playlist items"
+        assert operation_label("") == "unknown"
+
+    def test_pool_checkout_wait_and_gauges(self) -> None:
+        pool_engine = create_engine(
+            "sqlite://", poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=2
+        )
+        before = DB_POOL_CHECKOUT_SECONDS.count()
+
+        with patch("app.core.database.engine", pool_engine):
+            with pool_engine.connect(), pool_engine.connect():
+                collect_pool_metrics()
+                assert DB_POOL_CHECKED_OUT.value() == 2
+                assert DB_POOL_OVERFLOW.value() == 1
+
+        assert DB_POOL_CHECKOUT_SECONDS.count() == before + 2
+        pool_engine.dispose()
+
+    def test_http_requests_labelled_by_route_template(self) -> None:
+        before = HTTP_REQUEST_SECONDS.count(method="GET", route="/health", status="200")
+
+        TestClient(app).get("/health")
+
+        after = HTTP_REQUEST_SECONDS.count(method="GET", route="/health", status="200")
+        assert after == before + 1
+
+    @patch("app.services.youtube_client.time.sleep")
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test-api-key"})
+    def test_youtube_latency_and_errors_by_operation(self, mock_sleep: Mock) -> None:
+        client = YouTubeClient()
+        request = Mock()
+        request.execute.side_effect = [
+            HttpError(Mock(status=503), b"Unavailable"),
+            {"items": []},
+        ]
+        errors_before = YOUTUBE_API_ERRORS_TOTAL.value(
+            operation="get video details", reason="server_error"
+        )
+        calls_before = YOUTUBE_API_REQUEST_SECONDS.count(operation="get video details")
+
+        client._execute_with_retry(request, "get video details: 3 videos")
+
+        assert (
+            YOUTUBE_API_ERRORS_TOTAL.value(
+                operation="get video details", reason="server_error"
+            )
+            == errors_before + 1
+        )
+        assert (
+            YOUTUBE_API_REQUEST_SECONDS.count(operation="get video details")
+            == calls_before + 2
+        )
+
+    @pytest.mark.asyncio
+    async def test_slack_webhook_latency(self) -> None:
+        notifier = SlackNotifier("https://hooks.slack.com/services/test")
+        response = MagicMock()
+        response.status_code = 200
+        before = SLACK_WEBHOOK_SECONDS.count(outcome="ok")
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+                return_value=response
+            )
+            await notifier._send_webhook({"text": "hi"})
+
+        assert SLACK_WEBHOOK_SECONDS.count(outcome="ok") == before + 1
+
+    def test_scheduler_job_duration_and_failures(self) -> None:
+        service = BackgroundJobService()
+        before = SCHEDULER_JOB_SECONDS.count(job="scan_channels")
+        failures_before = SCHEDULER_JOB_FAILURES_TOTAL.value(job="scan_channels")
+
+        with patch.object(service, "_scan_all_channels", side_effect=RuntimeError):
+            with pytest.raises(RuntimeError):
+                service._run_scan_job()
+
+        assert SCHEDULER_JOB_SECONDS.count(job="scan_channels") == before + 1
+        assert (
+            SCHEDULER_JOB_FAILURES_TOTAL.value(job="scan_channels")
+            == failures_before + 1
+        )
+
+
+class TestScansAPI:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> None:
+        db = database.SessionLocal()
+        db.add(
+            Channel(
+                channel_id="UCtest123",
+                title="Test Channel",
+                uploads_playlist_id="UUtest123",
+                source_input="@testchannel",
+            )
+        )
+        started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for index, status in enumerate(("succeeded", "failed", "succeeded")):
+            db.add(
+                ScanRun(
+                    channel_id="UCtest123",
+                    status=status,
+                    started_at=started + timedelta(hours=index),
+                    api_calls=2,
+                    quota_units=2,
+                    pages_fetched=1,
+                    fetch_ms=120,
+                )
+            )
+        db.commit()
+        db.close()
+
+        test_app = FastAPI()
+        test_app.include_router(app.router)
+        database.install(test_app)
+        self.client = TestClient(test_app)
+
+    def test_list_scans(self) -> None:
+        response = self.client.get("/api/scans?limit=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert len(data["scans"]) == 2
+        assert data["scans"][0]["started_at"].startswith("2025-01-01T02")
+        assert data["scans"][0]["quota_units"] == 2
+        assert data["scans"][0]["fetch_ms"] == 120
+
+    def test_filter_scans(self) -> None:
+        response = self.client.get("/api/scans?status=failed&channel_id=UCtest123")
+        assert response.json()["total"] == 1
+
+        response = self.client.get("/api/scans?status=bogus")
+        assert response.status_code == 422
+
+    def test_metrics_endpoint(self) -> None:
+        response = self.client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE youtube_tracker_scan_runs_total counter" in response.text
@@ -7,7 +7,9 @@ import pytest
 from googleapiclient.errors import HttpError
 
 from app.core.i18n import I18n
+from app.services.api_key_pool import reset_quota_ledger
 from app.services.background_jobs import BackgroundJobService
+from app.services.circuit_breaker import reset_circuit_breaker
 from app.services.slack_notifier import SlackNotifier
 from app.services.youtube_client import YouTubeClient, YouTubeQuotaExhaustedError
 
@@ -82,6 +84,11 @@ class TestSlackNotifierEnhancements:
 class TestYouTubeClientRetry:
     """Test YouTube API retry and backoff mechanisms."""
 
+    def teardown_method(self) -> None:
+        # Quota errors open the process-wide circuit breaker and evict the key.
+        reset_circuit_breaker()
+        reset_quota_ledger()
+
     @patch("app.services.youtube_client.time.sleep")
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test-api-key"})
     def test_retry_on_rate_limit(self, mock_sleep):
@@ -116,8 +123,8 @@ class TestYouTubeClientRetry:
             client._execute_with_retry(mock_request, "test operation")
 
     @patch("app.services.youtube_client.time.sleep")
-    def test_exponential_backoff_timing(self, mock_sleep):
-        """Test exponential backoff timing calculation."""
+    def test_decorrelated_jitter_backoff_timing(self, mock_sleep):
+        """Each delay is drawn between the base and a multiple of the last."""
         with patch.dict(
             os.environ,
             {
@@ -139,18 +146,18 @@ class TestYouTubeClientRetry:
 
             sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
             assert len(sleep_calls) == 2
-            assert sleep_calls[0] >= 1.0
-            assert sleep_calls[1] >= 2.0
+            assert 1.0 <= sleep_calls[0] <= 2.0
+            assert 1.0 <= sleep_calls[1] <= sleep_calls[0] * 2.0
 
 
 class TestBackgroundJobLocking:
     """Test enhanced background job locking mechanisms."""
 
-    @patch("app.services.background_jobs.redis")
+    @patch("redis.from_url")
     def test_lock_acquisition_with_retry(self, mock_redis_module):
         """Test lock acquisition with retry logic."""
         mock_redis = Mock()
-        mock_redis_module.from_url.return_value = mock_redis
+        mock_redis_module.return_value = mock_redis
 
         mock_redis.set.side_effect = [False, True]
         mock_redis.get.return_value = None
@@ -163,12 +170,12 @@ class TestBackgroundJobLocking:
         assert result is True
         assert mock_redis.set.call_count == 2
 
-    @patch("app.services.background_jobs.redis")
+    @patch("redis.from_url")
     @patch("app.services.background_jobs.time.time")
     def test_stale_lock_detection(self, mock_time, mock_redis_module):
         """Test detection and cleanup of stale locks."""
         mock_redis = Mock()
-        mock_redis_module.from_url.return_value = mock_redis
+        mock_redis_module.return_value = mock_redis
 
         current_time = 1000.0
         stale_time = 500.0
@@ -0,0 +1,156 @@
+import os
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.core import redis_client
+from app.services.rate_limiter import (
+    KEY_PREFIX,
+    InProcessTokenBuckets,
+    RateLimit,
+    RateLimiter,
+    RedisTokenBuckets,
+    operation_key,
+    parse_rate_limits,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimitConfig:
+    def test_operation_key(self) -> None:
+        assert operation_key("fetch playlist items") == "fetch_playlist_items"
+        assert operation_key("") == "default"
+
+    def test_parse_rate_limits(self) -> None:
+        limits = parse_rate_limits("default=10:20, search by handle=0.5:2,videos=3")
+
+        assert limits == {
+            "default": RateLimit(rate=10, burst=20),
+            "search_by_handle": RateLimit(rate=0.5, burst=2),
+            "videos": RateLimit(rate=3, burst=3),
+        }
+
+    def test_off_disables_limiting(self) -> None:
+        assert parse_rate_limits("off") == {}
+        assert RateLimiter({}).acquire("anything") == 0.0
+
+    @pytest.mark.parametrize("spec", ["default", "=1:2", "default=0:1", "x=1:0"])
+    def test_invalid_specs(self, spec: str) -> None:
+        with pytest.raises(ValueError):
+            parse_rate_limits(spec)
+
+
+class TestInProcessTokenBuckets:
+    def test_burst_then_paced(self) -> None:
+        clock = FakeClock()
+        buckets = InProcessTokenBuckets(clock)
+        limit = RateLimit(rate=2, burst=3)
+
+        waits = [buckets.reserve("op", limit) for _ in range(5)]
+
+        # Three tokens are free, the next callers queue 0.5s apart.
+        assert waits == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+    def test_refills_over_time_up_to_burst(self) -> None:
+        clock = FakeClock()
+        buckets = InProcessTokenBuckets(clock)
+        limit = RateLimit(rate=2, burst=3)
+        for _ in range(3):
+            buckets.reserve("op", limit)
+
+        clock.now += 1.0
+        assert buckets.reserve("op", limit) == 0.0
+        assert buckets.reserve("op", limit) == 0.0
+        assert buckets.reserve("op", limit) == 0.5
+
+        clock.now += 60
+        assert [buckets.reserve("op", limit) for _ in range(4)] == [0, 0, 0, 0.5]
+
+    def test_buckets_are_per_key(self) -> None:
+        buckets = InProcessTokenBuckets(FakeClock())
+        limit = RateLimit(rate=1, burst=1)
+
+        assert buckets.reserve("a", limit) == 0.0
+        assert buckets.reserve("b", limit) == 0.0
+        assert buckets.reserve("a", limit) == 1.0
+
+
+class TestRateLimiter:
+    def setup_method(self) -> None:
+        self.slept: List[float] = []
+        self.limits = parse_rate_limits("default=1:1,search_by_handle=0.1:1")
+
+    def test_sleeps_for_reserved_wait(self) -> None:
+        limiter = RateLimiter(self.limits, sleep=self.slept.append)
+        limiter.local = InProcessTokenBuckets(FakeClock())
+
+        limiter.acquire("fetch playlist items")
+        limiter.acquire("get video details")
+        limiter.acquire("search by handle")
+        limiter.acquire("search by handle")
+
+        # Unlisted operations share the default bucket.
+        assert self.slept == [1.0, 10.0]
+
+    def test_uses_redis_buckets_when_available(self) -> None:
+        client = Mock()
+        client.register_script.return_value.return_value = b"0.25"
+        limiter = RateLimiter(self.limits, client, sleep=self.slept.append)
+
+        assert limiter.acquire("search by handle") == 0.25
+
+        script = client.register_script.return_value
+        script.assert_called_once_with(
+            keys=[KEY_PREFIX + "search_by_handle"], args=[0.1, 1.0, 1.0]
+        )
+        assert self.slept == [0.25]
+
+    def test_falls_back_to_local_when_redis_fails(self) -> None:
+        client = Mock()
+        client.register_script.return_value.side_effect = ConnectionError("down")
+        limiter = RateLimiter(self.limits, client, sleep=self.slept.append)
+
+        assert limiter.acquire("search by handle") == 0.0
+        assert limiter.acquire("search by handle") > 9.0
+
+    def test_redis_script_is_registered_once(self) -> None:
+        client = Mock()
+        RedisTokenBuckets(client)
+
+        source = client.register_script.call_args.args[0]
+        assert 'redis.call("TIME")' in source
+
+
+class TestRedisClient:
+    def setup_method(self) -> None:
+        redis_client.reset_redis_client()
+
+    def teardown_method(self) -> None:
+        redis_client.reset_redis_client()
+
+    def test_none_without_redis_url(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            assert redis_client.get_redis_client() is None
+
+    @patch("redis.from_url")
+    def test_connects_once_and_backs_off_after_failure(self, from_url: Mock) -> None:
+        from_url.return_value.ping.side_effect = [ConnectionError("down"), True]
+
+        with patch.dict(os.environ, {"REDIS_URL": "redis://cache:6379/0"}):
+            assert redis_client.get_redis_client() is None
+            assert redis_client.get_redis_client() is None
+            assert from_url.call_count == 1
+
+            with patch.object(redis_client, "RETRY_SECONDS", 0):
+                client = redis_client.get_redis_client()
+            assert client is from_url.return_value
+            assert redis_client.get_redis_client() is client
+            assert from_url.call_count == 2
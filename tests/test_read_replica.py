@@ -0,0 +1,97 @@
+import asyncio
+from typing import Callable, Iterator
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from conftest import TestDatabase
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.database import LAST_WRITE_COOKIE, replica_has_replayed
+from app.main import app
+from app.models.channel import Channel
+
+
+def _channel(channel_id: str) -> Channel:
+    return Channel(
+        channel_id=channel_id,
+        title=channel_id,
+        uploads_playlist_id=f"UU{channel_id}",
+        source_input=channel_id,
+    )
+
+
+class TestReadReplicaRouting:
+    @pytest.fixture(autouse=True)
+    def setup_database(
+        self, make_database: Callable[[], TestDatabase]
+    ) -> Iterator[None]:
+        primary = make_database()
+        self.replica = make_database()
+        for database, channel_id in (
+            (primary, "UCprimary"),
+            (self.replica, "UCreplica"),
+        ):
+            db = database.SessionLocal()
+            db.add(_channel(channel_id))
+            db.commit()
+            db.close()
+
+        test_app = FastAPI()
+        test_app.include_router(app.router)
+        primary.install(test_app)
+        self.client = TestClient(test_app)
+
+        with patch(
+            "app.core.database.ReadAsyncSessionLocal", self.replica.AsyncSessionLocal
+        ):
+            yield
+
+    def _listed_ids(self) -> list:
+        response = self.client.get("/api/channels/")
+        assert response.status_code == 200
+        return [channel["channel_id"] for channel in response.json()]
+
+    def test_reads_use_replica(self) -> None:
+        assert self._listed_ids() == ["UCreplica"]
+
+    def test_reads_use_primary_without_replica(self) -> None:
+        with patch("app.core.database.ReadAsyncSessionLocal", None):
+            assert self._listed_ids() == ["UCprimary"]
+
+    @patch("app.api.channels.YouTubeClient")
+    def test_add_channel_reads_own_write(self, mock_youtube_client_class: Mock) -> None:
+        mock_client = mock_youtube_client_class.return_value
+        mock_client.resolve_channel_input.return_value = (
+            "UCnew",
+            {"title": "New", "uploads_playlist_id": "UUnew"},
+        )
+
+        response = self.client.post("/api/channels/", json={"input": "UCnew"})
+
+        assert response.status_code == 201
+        assert response.cookies[LAST_WRITE_COOKIE] == "-"
+        assert sorted(self._listed_ids()) == ["UCnew", "UCprimary"]
+
+    def test_replica_used_once_write_is_replayed(self) -> None:
+        self.client.cookies.set(LAST_WRITE_COOKIE, "0/16B3748")
+
+        with patch(
+            "app.core.database.replica_has_replayed", AsyncMock(return_value=False)
+        ):
+            assert self._listed_ids() == ["UCprimary"]
+
+        with patch(
+            "app.core.database.replica_has_replayed", AsyncMock(return_value=True)
+        ) as replayed:
+            assert self._listed_ids() == ["UCreplica"]
+        assert replayed.await_args.args[1] == "0/16B3748"
+
+    def test_replica_lag_check_falls_back_to_primary(self) -> None:
+        async def check(position: str) -> bool:
+            async with self.replica.AsyncSessionLocal() as replica:
+                return await replica_has_replayed(replica, position)
+
+        assert asyncio.run(check("-")) is False
+        # SQLite has no WAL position functions; errors mean "not caught up".
+        assert asyncio.run(check("0/16B3748")) is False
@@ -0,0 +1,202 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core import readiness as readiness_module
+from app.core.readiness import (
+    ReadinessState,
+    SchemaOutOfDateError,
+    check_schema_revision,
+    expected_schema_heads,
+    warm_up,
+)
+from app.main import app, warm_up_and_start
+
+
+def _engine_at_revision(revision: str) -> Engine:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)")
+        )
+        connection.execute(
+            text("INSERT INTO alembic_version VALUES (:revision)"),
+            {"revision": revision},
+        )
+    return engine
+
+
+def _head() -> str:
+    return next(iter(expected_schema_heads()))
+
+
+class TestSchemaCheck:
+    def test_expected_heads_are_cached(self) -> None:
+        assert len(expected_schema_heads()) == 1
+        assert expected_schema_heads() is expected_schema_heads()
+
+    def test_current_revision_passes(self) -> None:
+        assert check_schema_revision(_engine_at_revision(_head())) == "ok"
+
+    def test_stale_revision_fails(self) -> None:
+        with pytest.raises(SchemaOutOfDateError, match="alembic upgrade head"):
+            check_schema_revision(_engine_at_revision("8dbdd85ed11e"))
+
+    def test_skipped_without_migration_scripts(self) -> None:
+        with patch.object(readiness_module, "expected_schema_heads", return_value=()):
+            assert check_schema_revision(Mock()) == "skipped"
+
+
+class TestWarmUp:
+    def setup_method(self) -> None:
+        self.engine = _engine_at_revision(_head())
+        self.async_engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:", poolclass=StaticPool
+        )
+
+    def teardown_method(self) -> None:
+        asyncio.run(self.async_engine.dispose())
+
+    def test_warm_up_marks_ready(self) -> None:
+        state = ReadinessState()
+        with patch.dict(os.environ, {"YOUTUBE_API_KEY": "key"}), patch(
+            "app.services.youtube_client.YouTubeClient"
+        ) as youtube_client:
+            ready = asyncio.run(
+                warm_up(self.engine, {"async_database": self.async_engine}, state)
+            )
+
+        assert ready is True
+        assert state.ready is True
+        assert state.error is None
+        assert state.checks == {
+            "schema": "ok",
+            "database": "ok",
+            "async_database": "ok",
+            "youtube": "ok",
+        }
+        youtube_client.assert_called_once_with()
+        assert state.warmup_ms is not None
+
+    def test_failed_check_keeps_not_ready(self) -> None:
+        state = ReadinessState()
+        stale = _engine_at_revision("8dbdd85ed11e")
+
+        assert asyncio.run(warm_up(stale, {}, state)) is False
+        assert state.ready is False
+        assert "alembic upgrade head" in (state.error or "")
+        assert "database" not in state.checks
+        assert state.attempts == 1
+
+    @patch("app.services.youtube_client.YouTubeClient")
+    def test_schema_check_can_be_disabled(self, youtube_client: Mock) -> None:
+        state = ReadinessState()
+        stale = _engine_at_revision("8dbdd85ed11e")
+        env = {"STARTUP_SCHEMA_CHECK": "false", "YOUTUBE_API_KEY": "key"}
+
+        with patch.dict(os.environ, env):
+            assert asyncio.run(warm_up(stale, {}, state)) is True
+        assert state.checks == {"database": "ok", "youtube": "ok"}
+
+    @patch("app.services.youtube_client.YouTubeClient")
+    def test_pooled_keys_alone_pass_the_youtube_check(
+        self, youtube_client: Mock
+    ) -> None:
+        state = ReadinessState()
+        env = {"YOUTUBE_API_KEYS": "key-a,key-b", "YOUTUBE_API_KEY": ""}
+
+        with patch.dict(os.environ, env):
+            assert asyncio.run(warm_up(self.engine, {}, state)) is True
+        assert state.checks["youtube"] == "ok"
+        youtube_client.assert_called_once_with()
+
+    def test_missing_api_keys_fail_warm_up(self) -> None:
+        state = ReadinessState()
+        env = {"YOUTUBE_API_KEYS": "", "YOUTUBE_API_KEY": ""}
+
+        with patch.dict(os.environ, env):
+            assert asyncio.run(warm_up(self.engine, {}, state)) is False
+        assert "YOUTUBE_API_KEYS" in (state.error or "")
+
+
+class TestReadyEndpoint:
+    def setup_method(self) -> None:
+        self.state = ReadinessState()
+        self.state_patch = patch("app.main.readiness", self.state)
+        self.state_patch.start()
+        self.client = TestClient(app)
+
+    def teardown_method(self) -> None:
+        self.state_patch.stop()
+
+    def test_not_ready_until_warm(self) -> None:
+        self.state.checks["schema"] = "ok"
+
+        response = self.client.get("/ready")
+
+        assert response.status_code == 503
+        detail = response.json()["detail"]
+        assert detail["status"] == "not ready"
+        assert detail["error"] == "Warming up"
+        assert detail["checks"] == {"schema": "ok"}
+
+    def test_reports_warm_up_failure(self) -> None:
+        self.state.error = "Database schema at ['x'], expected ['y']"
+
+        response = self.client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["detail"]["error"] == "Startup warm-up failed"
+
+    @patch("app.main.SessionLocal")
+    def test_ready_once_warm(self, session_local: Mock) -> None:
+        self.state.ready = True
+
+        response = self.client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        session_local.return_value.__enter__.return_value.execute.assert_called_once()
+
+    @patch("app.main.get_background_job_service")
+    @patch("app.main.warm_up")
+    def test_failed_warm_up_is_retried_before_scheduling(
+        self, warm_up_mock: Mock, get_background_job_service: Mock
+    ) -> None:
+        started_after = []
+        warm_up_mock.side_effect = [False, True]
+        get_background_job_service.return_value.start.side_effect = (
+            lambda: started_after.append(warm_up_mock.call_count)
+        )
+        sleep = AsyncMock()
+
+        asyncio.run(warm_up_and_start(sleep=sleep))
+
+        assert warm_up_mock.call_count == 2
+        sleep.assert_awaited_once_with(1.0)
+        assert started_after == [2]
+
+    @patch.dict(os.environ, {"STARTUP_RETRY_MAX_SECONDS": "5"})
+    @patch("app.main.get_background_job_service")
+    @patch("app.main.warm_up")
+    def test_retry_backoff_is_capped(
+        self, warm_up_mock: Mock, get_background_job_service: Mock
+    ) -> None:
+        warm_up_mock.side_effect = [False] * 5 + [True]
+        sleep = AsyncMock()
+
+        asyncio.run(warm_up_and_start(sleep=sleep))
+
+        assert [c.args[0] for c in sleep.await_args_list] == [1, 2, 4, 5, 5]
+        get_background_job_service.return_value.start.assert_called_once_with()
@@ -0,0 +1,271 @@
+import os
+import random
+import socket
+from datetime import datetime, timezone
+from typing import List
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from googleapiclient.errors import HttpError
+from httplib2 import Response
+
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.retry_policy import (
+    RetryPolicy,
+    is_retryable,
+    retry_after_seconds,
+    status_code_of,
+)
+from app.services.slack_notifier import SlackNotifier
+from app.services.youtube_client import YouTubeAPIError, YouTubeClient
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def http_error(status: int, retry_after: str = "") -> HttpError:
+    headers = {"status": str(status)}
+    if retry_after:
+        headers["retry-after"] = retry_after
+    return HttpError(Response(headers), b"error")
+
+
+def httpx_status_error(status: int, retry_after: str = "") -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://hooks.slack.com/services/test")
+    headers = {"Retry-After": retry_after} if retry_after else {}
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestClassification:
+    @pytest.mark.parametrize(
+        "error",
+        [
+            http_error(500),
+            http_error(503),
+            http_error(429),
+            httpx_status_error(502),
+            socket.timeout("timed out"),
+            TimeoutError(),
+            ConnectionResetError(104, "Connection reset by peer"),
+            httpx.ReadTimeout("timed out"),
+            httpx.ConnectError("refused"),
+            httpx.RemoteProtocolError("disconnected"),
+        ],
+    )
+    def test_transient_errors_are_retryable(self, error: Exception) -> None:
+        assert is_retryable(error) is True
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            http_error(400),
+            http_error(403),
+            http_error(404),
+            httpx_status_error(401),
+            TypeError("unsupported operand"),
+            KeyError("items"),
+            AttributeError("'NoneType' object has no attribute 'execute'"),
+            ValueError("bad input"),
+        ],
+    )
+    def test_other_errors_are_not(self, error: Exception) -> None:
+        assert is_retryable(error) is False
+
+    def test_status_code_from_either_client(self) -> None:
+        assert status_code_of(http_error(503)) == 503
+        assert status_code_of(httpx_status_error(429)) == 429
+        assert status_code_of(ValueError()) is None
+
+
+class TestRetryAfter:
+    def test_seconds(self) -> None:
+        assert retry_after_seconds(http_error(429, "7")) == 7.0
+        assert retry_after_seconds(httpx_status_error(503, "2.5")) == 2.5
+
+    def test_http_date(self) -> None:
+        now = datetime(2025, 9, 15, 12, 0, 0, tzinfo=timezone.utc)
+        error = http_error(503, "Mon, 15 Sep 2025 12:00:30 GMT")
+
+        assert retry_after_seconds(error, now) == 30.0
+
+    def test_missing_or_invalid(self) -> None:
+        assert retry_after_seconds(http_error(503)) is None
+        assert retry_after_seconds(http_error(503, "soon")) is None
+        assert retry_after_seconds(ValueError()) is None
+
+
+class TestRetryState:
+    def setup_method(self) -> None:
+        self.clock = FakeClock()
+        self.policy = RetryPolicy(
+            max_retries=5, base_delay=1.0, max_delay=20.0, deadline_seconds=60.0
+        )
+
+    def test_decorrelated_jitter_stays_within_bounds(self) -> None:
+        retry = self.policy.start(self.clock, random.Random(42))
+        previous = self.policy.base_delay
+
+        for _ in range(5):
+            delay = retry.next_delay(http_error(503))
+            assert delay is not None
+            assert 1.0 <= delay <= min(20.0, previous * 3)
+            previous = delay
+
+        assert retry.next_delay(http_error(503)) is None
+        assert retry.gave_up_reason == "attempts_exhausted"
+
+    def test_retry_after_overrides_backoff(self) -> None:
+        retry = self.policy.start(self.clock)
+
+        assert retry.next_delay(http_error(429, "12")) == 12.0
+
+    def test_gives_up_when_deadline_would_be_exceeded(self) -> None:
+        retry = self.policy.start(self.clock)
+        assert retry.next_delay(http_error(503, "30")) == 30.0
+
+        self.clock.now += 35
+        assert retry.next_delay(http_error(503, "30")) is None
+        assert retry.gave_up_reason == "deadline_exceeded"
+
+    def test_programming_errors_are_not_retried(self) -> None:
+        retry = self.policy.start(self.clock)
+
+        assert retry.next_delay(TypeError("oops")) is None
+        assert retry.gave_up_reason == "not_retryable"
+
+    def test_from_env(self) -> None:
+        with patch.dict(
+            os.environ,
+            {"TEST_MAX_RETRIES": "7", "TEST_RETRY_DEADLINE_SECONDS": "15"},
+        ):
+            policy = RetryPolicy.from_env("TEST", max_delay=5.0)
+
+        assert policy == RetryPolicy(
+            max_retries=7, max_delay=5.0, deadline_seconds=15.0
+        )
+
+
+class TestRun:
+    def test_sync_run_retries_transient_errors(self) -> None:
+        slept: List[float] = []
+        fn = Mock(side_effect=[ConnectionResetError(), "ok"])
+
+        assert RetryPolicy().run(fn, sleep=slept.append) == "ok"
+        assert fn.call_count == 2
+        assert len(slept) == 1
+
+    def test_sync_run_raises_programming_errors_immediately(self) -> None:
+        slept: List[float] = []
+        fn = Mock(side_effect=KeyError("items"))
+
+        with pytest.raises(KeyError):
+            RetryPolicy().run(fn, sleep=slept.append)
+
+        assert fn.call_count == 1
+        assert slept == []
+
+    @pytest.mark.asyncio
+    async def test_async_run_honours_retry_after(self) -> None:
+        sleep = AsyncMock()
+        fn = AsyncMock(side_effect=[httpx_status_error(429, "3"), "ok"])
+
+        assert await RetryPolicy().run_async(fn, sleep=sleep) == "ok"
+        sleep.assert_awaited_once_with(3.0)
+
+
+class TestYouTubeClientRetries:
+    @pytest.fixture
+    def client(self) -> YouTubeClient:
+        with patch("googleapiclient.discovery.build"), patch.dict(
+            os.environ, {"YOUTUBE_API_KEY": "test-api-key"}
+        ):
+            client = YouTubeClient()
+        client.circuit_breaker = CircuitBreaker()
+        return client
+
+    @patch("app.services.youtube_client.time.sleep")
+    def test_programming_error_is_not_retried(
+        self, sleep: Mock, client: YouTubeClient
+    ) -> None:
+        request = Mock()
+        request.execute.side_effect = AttributeError("no attribute 'get'")
+
+        with pytest.raises(AttributeError):
+            client._execute_with_retry(request, "get video details")
+
+        assert request.execute.call_count == 1
+        sleep.assert_not_called()
+
+    @patch("app.services.youtube_client.time.sleep")
+    def test_socket_timeout_is_retried(
+        self, sleep: Mock, client: YouTubeClient
+    ) -> None:
+        request = Mock()
+        request.execute.side_effect = [socket.timeout("timed out"), {"items": []}]
+
+        assert client._execute_with_retry(request, "get video details") == {"items": []}
+        assert request.execute.call_count == 2
+
+    @patch("app.services.youtube_client.time.sleep")
+    def test_retry_after_header_is_used(
+        self, sleep: Mock, client: YouTubeClient
+    ) -> None:
+        request = Mock()
+        request.execute.side_effect = [http_error(429, "4"), {"items": []}]
+
+        client._execute_with_retry(request, "search by handle")
+
+        sleep.assert_called_once_with(4.0)
+
+    @patch("app.services.youtube_client.time.sleep")
+    def test_client_errors_are_not_retried(
+        self, sleep: Mock, client: YouTubeClient
+    ) -> None:
+        request = Mock()
+        request.execute.side_effect = http_error(404)
+
+        with pytest.raises(YouTubeAPIError, match="client error"):
+            client._execute_with_retry(request, "get video details")
+
+        assert request.execute.call_count == 1
+
+    @patch("app.services.youtube_client.time.sleep")
+    def test_deadline_stops_retries_early(
+        self, sleep: Mock, client: YouTubeClient
+    ) -> None:
+        client.retry_policy = RetryPolicy(max_retries=5, deadline_seconds=10.0)
+        request = Mock()
+        request.execute.side_effect = http_error(503, "60")
+
+        with pytest.raises(YouTubeAPIError, match="after retries"):
+            client._execute_with_retry(request, "get video details")
+
+        assert request.execute.call_count == 1
+        sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slack_webhook_retries_server_errors() -> None:
+    notifier = SlackNotifier("https://hooks.slack.com/services/test")
+    request = httpx.Request("POST", "https://hooks.slack.com/services/test")
+    responses = [
+        httpx.Response(503, request=request),
+        httpx.Response(200, request=request),
+    ]
+
+    with patch("httpx.AsyncClient") as mock_client, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ):
+        post = AsyncMock(side_effect=responses)
+        mock_client.return_value.__aenter__.return_value.post = post
+
+        assert await notifier._send_webhook({"test": "message"}) is True
+
+    assert post.call_count == 2
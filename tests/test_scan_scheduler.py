@@ -0,0 +1,219 @@
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.metrics import SCAN_PLANNED_DAILY_QUOTA_UNITS
+from app.models.channel import Channel
+from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.scan_run import ScanRun
+from app.models.video import Video
+from app.services.background_jobs import BackgroundJobService
+from app.services.scan_scheduler import (
+    AdaptiveScanScheduler,
+    ChannelChurn,
+    ScheduleConfig,
+)
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+NOW = datetime(2025, 9, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    return timestamp.replace(tzinfo=timezone.utc)
+
+
+class TestAdaptiveScanScheduler:
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        self.config = ScheduleConfig(
+            default_interval_minutes=60,
+            min_interval_minutes=5,
+            max_interval_minutes=1440,
+            lookback_days=30,
+            daily_quota_budget=100000,
+        )
+        self.scheduler = AdaptiveScanScheduler(self.db, self.config)
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def _channel(self, channel_id: str) -> Channel:
+        channel = Channel(
+            channel_id=channel_id,
+            title=channel_id,
+            uploads_playlist_id=f"UU{channel_id}",
+            source_input=channel_id,
+            last_scanned_at=NOW - timedelta(minutes=10),
+        )
+        self.db.add(channel)
+        self.db.add(
+            ScanRun(
+                channel_id=channel_id,
+                status="succeeded",
+                started_at=NOW - timedelta(days=1),
+                quota_units=2,
+            )
+        )
+        return channel
+
+    def _videos(self, channel_id: str, count: int, age: timedelta) -> None:
+        for index in range(count):
+            self.db.add(
+                Video(
+                    video_id=f"{channel_id}-{index}",
+                    channel_id=channel_id,
+                    title="Video",
+                    published_at=NOW - age,
+                )
+            )
+
+    def test_volatile_channels_scan_more_often_than_dormant(self) -> None:
+        self._channel("UCvolatile")
+        self._videos("UCvolatile", 60, timedelta(days=2))
+        self._channel("UCdormant")
+        self._videos("UCdormant", 5, timedelta(days=400))
+        self.db.commit()
+
+        planned = self.scheduler.plan(NOW)
+
+        # 60 uploads / 30 days = 2 changes a day, scanned 4x per change.
+        assert planned["UCvolatile"] == 180
+        assert planned["UCdormant"] == 1440
+        volatile = self.db.query(Channel).filter_by(channel_id="UCvolatile").one()
+        assert volatile.scan_interval_minutes == 180
+        assert _as_utc(volatile.next_scan_at) == NOW + timedelta(minutes=170)
+
+    def test_disappearances_weigh_more_than_uploads(self) -> None:
+        self._channel("UCchurn")
+        self._videos("UCchurn", 10, timedelta(days=400))
+        for index in range(10):
+            self.db.add(
+                DisappearanceEvent(
+                    video_id=f"UCchurn-{index}",
+                    event_type=EventType.DELETED,
+                    detected_at=NOW - timedelta(days=1),
+                )
+            )
+        self.db.commit()
+
+        churn = self.scheduler.channel_churn(NOW)["UCchurn"]
+
+        assert churn.uploads == 0
+        assert churn.disappearances == 10
+        assert churn.changes_per_day(self.config) == 1.0
+        assert self.scheduler.interval_for(churn) == 360
+
+    def test_interval_bounds(self) -> None:
+        assert self.scheduler.interval_for(ChannelChurn("UCnew")) == 60
+        assert self.scheduler.interval_for(ChannelChurn("UCbusy", uploads=9000)) == 5
+        assert self.scheduler.interval_for(ChannelChurn("UCquiet", scans=3)) == 1440
+
+    def test_plan_is_stretched_to_quota_budget(self) -> None:
+        for index in range(10):
+            channel_id = f"UCbusy{index}"
+            self._channel(channel_id)
+            self._videos(channel_id, 9000, timedelta(days=1))
+        self.db.commit()
+
+        # Ten channels at the 5 minute floor at 2 units a scan would spend
+        # 5760 units a day.
+        scheduler = AdaptiveScanScheduler(
+            self.db, ScheduleConfig(daily_quota_budget=1440)
+        )
+        planned = scheduler.plan(NOW)
+
+        assert set(planned.values()) == {20}
+        assert SCAN_PLANNED_DAILY_QUOTA_UNITS.value() == 1440
+
+    def test_sweep_size_keeps_up_with_plan(self) -> None:
+        # Every 5 minutes: one channel due each tick, twelve more hourly.
+        planned = {"UCfast": 5, **{f"UChourly{i}": 60 for i in range(12)}}
+
+        assert self.scheduler.sweep_size(planned, 5) == 2
+        assert self.scheduler.sweep_size({}, 5) == 0
+
+    def test_due_channels(self) -> None:
+        due = self._channel("UCdue")
+        due.next_scan_at = NOW - timedelta(minutes=1)  # type: ignore[assignment]
+        later = self._channel("UClater")
+        later.next_scan_at = NOW + timedelta(hours=1)  # type: ignore[assignment]
+        self._channel("UCnever").last_scanned_at = None  # type: ignore[assignment]
+        inactive = self._channel("UCinactive")
+        inactive.is_active = False  # type: ignore[assignment]
+        requested = self._channel("UCrequested")
+        requested.next_scan_at = NOW + timedelta(hours=1)  # type: ignore[assignment]
+        requested.scan_requested_at = NOW  # type: ignore[assignment]
+        self.db.commit()
+
+        due_ids = [c.channel_id for c in self.scheduler.due_channels(NOW)]
+
+        assert due_ids == ["UCrequested", "UCnever", "UCdue"]
+        assert len(self.scheduler.due_channels(NOW, limit=1)) == 1
+
+    def test_record_scan_schedules_next_run(self) -> None:
+        channel = self._channel("UCscanned")
+        channel.scan_interval_minutes = 15  # type: ignore[assignment]
+        channel.scan_requested_at = NOW  # type: ignore[assignment]
+        self.db.commit()
+        assert self.scheduler.due_channels(NOW) == [channel]
+
+        self.scheduler.record_scan(channel, NOW)
+
+        assert _as_utc(channel.last_scanned_at) == NOW
+        assert channel.scan_requested_at is None
+        assert _as_utc(channel.next_scan_at) == NOW + timedelta(minutes=15)
+        assert self.scheduler.due_channels(NOW) == []
+
+    @patch("app.services.background_jobs.SessionLocal", TestingSessionLocal)
+    def test_background_job_scans_only_due_channels(self) -> None:
+        # plan() derives next_scan_at from last_scanned_at and the interval.
+        just_scanned = datetime.now(timezone.utc)
+        self._channel("UCdue").last_scanned_at = NOW  # type: ignore[assignment]
+        self._channel("UClater").last_scanned_at = just_scanned  # type: ignore
+        self.db.commit()
+
+        with patch.dict(os.environ, {"SCAN_ADAPTIVE": "true"}):
+            service = BackgroundJobService()
+        service._acquire_lock = Mock(return_value=True)  # type: ignore[method-assign]
+        service._release_lock = Mock()  # type: ignore[method-assign]
+        service._scan_single_channel = Mock()  # type: ignore[method-assign]
+
+        service._scan_all_channels()
+
+        scanned = [call.args[1] for call in service._scan_single_channel.call_args_list]
+        assert scanned == ["UCdue"]
+        self.db.expire_all()
+        channel = self.db.query(Channel).filter_by(channel_id="UCdue").one()
+        assert _as_utc(channel.next_scan_at) > datetime.now(timezone.utc)
+
+    @patch("app.services.background_jobs.SessionLocal", TestingSessionLocal)
+    def test_background_job_batch_grows_with_plan(self) -> None:
+        # 30 new channels on the 60 minute default need 2.5 scans per
+        # 5 minute tick, more than SCAN_BATCH_SIZE allows.
+        for index in range(30):
+            self._channel(f"UCnew{index:02d}").last_scanned_at = None  # type: ignore
+        self.db.commit()
+
+        env = {"SCAN_ADAPTIVE": "true", "SCAN_BATCH_SIZE": "1"}
+        with patch.dict(os.environ, env):
+            service = BackgroundJobService()
+        service._acquire_lock = Mock(return_value=True)  # type: ignore[method-assign]
+        service._release_lock = Mock()  # type: ignore[method-assign]
+        service._scan_single_channel = Mock()  # type: ignore[method-assign]
+
+        service._scan_all_channels()
+
+        assert service._scan_single_channel.call_count == 3
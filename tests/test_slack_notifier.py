@@ -171,7 +171,9 @@ class TestSlackNotifier:
     async def test_send_webhook_timeout(self):
         notifier = SlackNotifier("https://hooks.slack.com/services/test")
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("httpx.AsyncClient") as mock_client, patch(
+            "asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
             mock_client.return_value.__aenter__.return_value.post = AsyncMock(
                 side_effect=TimeoutException("Timeout")
             )
@@ -179,6 +181,9 @@ class TestSlackNotifier:
             result = await notifier._send_webhook({"test": "message"})
 
             assert result is False
+            # Timeouts are retried before giving up.
+            assert mock_client.return_value.__aenter__.return_value.post.call_count == 3
+            assert mock_sleep.await_count == 2
 
     @pytest.mark.asyncio
     async def test_send_webhook_request_error(self):
@@ -2,15 +2,19 @@ from datetime import datetime, timezone
 from unittest.mock import Mock
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.core.database import Base
+from app.core.metrics import SCAN_RUNS_TOTAL
 from app.models.channel import Channel
+from app.models.channel_stats import ChannelStats
 from app.models.disappearance_event import DisappearanceEvent, EventType
+from app.models.scan_run import ScanRun
 from app.models.video import Video
 from app.services.video_ingestion import VideoIngestionService
+from app.services.youtube_client import ApiUsage
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test_video_ingestion.db"
 engine = create_engine(
@@ -26,8 +30,10 @@ Base.metadata.create_all(bind=engine)
 class TestVideoIngestionService:
     def setup_method(self) -> None:
         self.db = TestingSessionLocal()
+        self.db.query(ScanRun).delete()
         self.db.query(Video).delete()
         self.db.query(DisappearanceEvent).delete()
+        self.db.query(ChannelStats).delete()
         self.db.query(Channel).delete()
         self.db.commit()
 
@@ -41,6 +47,8 @@ class TestVideoIngestionService:
         self.db.commit()
 
         self.mock_youtube_client = Mock()
+        # The direct probe finds none of the videos missing from a walk.
+        self.mock_youtube_client.probe_videos.return_value = {}
         self.service = VideoIngestionService(self.db, self.mock_youtube_client)
 
     def teardown_method(self) -> None:
@@ -139,6 +147,42 @@ class TestVideoIngestionService:
         assert event is not None
         assert event.event_type == EventType.UNKNOWN
 
+    def test_scan_classifies_private_and_deleted_entries(self) -> None:
+        for video_id in ("went_private", "was_deleted", "vanished"):
+            self.db.add(
+                Video(
+                    video_id=video_id,
+                    channel_id="UCtest123",
+                    title=video_id,
+                    published_at=datetime.now(timezone.utc),
+                    is_available=True,
+                )
+            )
+        self.db.commit()
+
+        self.mock_youtube_client.fetch_channel_videos.return_value = [
+            {"video_id": "went_private", "unavailable": "private"},
+            {"video_id": "was_deleted", "unavailable": "deleted"},
+            {"video_id": "never_seen", "unavailable": "private"},
+        ]
+
+        added, updated, events = self.service.scan_channel("UCtest123")
+
+        assert (added, updated, events) == (0, 0, 3)
+        event_types = {
+            e.video_id: e.event_type for e in self.db.query(DisappearanceEvent)
+        }
+        assert event_types == {
+            "went_private": EventType.PRIVATE,
+            "was_deleted": EventType.DELETED,
+            "vanished": EventType.UNKNOWN,
+        }
+        stats = self.db.get(ChannelStats, "UCtest123")
+        assert stats is not None
+        assert stats.private_events == 1
+        assert stats.deleted_events == 1
+        assert stats.unknown_events == 1
+
     def test_scan_channel_reappearance(self) -> None:
         disappeared_video = Video(
             video_id="reappeared_video",
@@ -183,3 +227,148 @@ class TestVideoIngestionService:
 
         with pytest.raises(Exception, match="API Error"):
             self.service.scan_channel("UCtest123")
+
+    def test_scan_records_successful_run(self) -> None:
+        self.mock_youtube_client.fetch_channel_videos.return_value = [
+            {
+                "video_id": "video1",
+                "title": "Video 1",
+                "published_at": datetime.now(timezone.utc),
+            }
+        ]
+
+        self.service.scan_channel("UCtest123")
+
+        scan_run = self.db.query(ScanRun).one()
+        assert scan_run.status == "succeeded"
+        assert scan_run.videos_seen == 1
+        assert scan_run.added == 1
+        assert scan_run.finished_at is not None
+        for phase in ("fetch", "diff", "db_write", "notify"):
+            assert getattr(scan_run, f"{phase}_ms") >= 0
+
+    def test_scan_run_records_api_usage(self) -> None:
+        self.mock_youtube_client.usage = ApiUsage(api_calls=3, quota_units=3)
+
+        def fetch(playlist_id: str) -> list:
+            self.mock_youtube_client.usage.api_calls += 2
+            self.mock_youtube_client.usage.quota_units += 2
+            self.mock_youtube_client.usage.pages_fetched += 1
+            return []
+
+        self.mock_youtube_client.fetch_channel_videos.side_effect = fetch
+        runs_before = SCAN_RUNS_TOTAL.value(status="succeeded")
+
+        self.service.scan_channel("UCtest123")
+
+        scan_run = self.db.query(ScanRun).one()
+        assert scan_run.api_calls == 2
+        assert scan_run.quota_units == 2
+        assert scan_run.pages_fetched == 1
+        assert SCAN_RUNS_TOTAL.value(status="succeeded") == runs_before + 1
+
+    def test_scan_records_failed_run(self) -> None:
+        self.mock_youtube_client.fetch_channel_videos.side_effect = Exception(
+            "API Error"
+        )
+
+        with pytest.raises(Exception, match="API Error"):
+            self.service.scan_channel("UCtest123")
+
+        scan_run = self.db.query(ScanRun).one()
+        assert scan_run.status == "failed"
+        assert scan_run.error == "API Error"
+        assert scan_run.fetch_ms is not None
+        assert scan_run.diff_ms is None
+
+    def test_scan_run_is_committed_when_scan_starts(self) -> None:
+        seen = []
+
+        def fetch(playlist_id: str) -> list:
+            with TestingSessionLocal() as other:
+                seen.extend(run.status for run in other.query(ScanRun))
+            return []
+
+        self.mock_youtube_client.fetch_channel_videos.side_effect = fetch
+
+        self.service.scan_channel("UCtest123")
+
+        assert seen == ["running"]
+        assert self.db.query(ScanRun).one().status == "succeeded"
+
+    def test_failure_after_fetch_keeps_phase_timings(self) -> None:
+        self.mock_youtube_client.fetch_channel_videos.return_value = []
+        self.service.stats_service.apply_scan_delta = Mock(  # type: ignore
+            side_effect=RuntimeError("stats down")
+        )
+
+        with pytest.raises(RuntimeError):
+            self.service.scan_channel("UCtest123")
+
+        scan_run = self.db.query(ScanRun).one()
+        assert scan_run.status == "failed"
+        assert scan_run.error == "stats down"
+        assert scan_run.finished_at is not None
+        assert scan_run.fetch_ms is not None
+        assert scan_run.diff_ms is not None
+        assert scan_run.db_write_ms is None
+
+    def test_alerts_are_sent_after_the_scan_commits(self) -> None:
+        self.db.add(
+            Video(
+                video_id="gone_video",
+                channel_id="UCtest123",
+                title="Gone Video",
+                published_at=datetime.now(timezone.utc),
+                is_available=True,
+            )
+        )
+        self.db.commit()
+        self.mock_youtube_client.fetch_channel_videos.return_value = []
+        open_transactions = []
+
+        def notify(*args: object) -> None:
+            open_transactions.append(self.db.in_transaction())
+
+        self.service._notify = Mock(side_effect=notify)  # type: ignore[method-assign]
+
+        self.service.scan_channel("UCtest123")
+
+        assert open_transactions == [False]
+        scan_run = self.db.query(ScanRun).one()
+        assert scan_run.status == "succeeded"
+        assert scan_run.notify_ms is not None
+
+    def test_unchanged_rescan_issues_single_video_update(self) -> None:
+        mock_videos = [
+            {
+                "video_id": f"video{i}",
+                "title": f"Video {i}",
+                "description": "Description",
+                "published_at": datetime.now(timezone.utc),
+                "view_count": 100,
+            }
+            for i in range(5)
+        ]
+        self.mock_youtube_client.fetch_channel_videos.return_value = mock_videos
+        self.service.scan_channel("UCtest123")
+        first_seen = {v.video_id: v.last_seen_at for v in self.db.query(Video).all()}
+
+        statements: list[str] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE videos"):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            self.service.scan_channel("UCtest123")
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert len(statements) == 1
+        assert "last_seen_at" in statements[0]
+
+        self.db.expire_all()
+        for video in self.db.query(Video).all():
+            assert video.last_seen_at >= first_seen[video.video_id]
@@ -0,0 +1,184 @@
+from datetime import datetime, timezone
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+from conftest import TestDatabase
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.channel import Channel
+from app.models.video import Video
+from app.models.video_revision import VideoRevision
+from app.services.video_ingestion import VideoIngestionService
+from app.services.video_revisions import VideoRevisionService, compute_content_hash
+
+VIDEO_DATA = {
+    "video_id": "video1",
+    "title": "Title",
+    "description": "Description",
+    "thumbnail_url": "https://example.com/thumb.jpg",
+    "published_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+    "view_count": 100,
+}
+
+
+class TestContentHash:
+    def test_hash_is_stable(self) -> None:
+        assert compute_content_hash(VIDEO_DATA) == compute_content_hash(
+            dict(VIDEO_DATA)
+        )
+
+    def test_hash_ignores_untracked_fields(self) -> None:
+        other = dict(VIDEO_DATA, duration="PT1M", published_at=None)
+        assert compute_content_hash(other) == compute_content_hash(VIDEO_DATA)
+
+    def test_hash_changes_with_tracked_fields(self) -> None:
+        other = dict(VIDEO_DATA, thumbnail_url="https://example.com/new.jpg")
+        assert compute_content_hash(other) != compute_content_hash(VIDEO_DATA)
+
+    def test_hash_ignores_view_count(self) -> None:
+        other = dict(VIDEO_DATA, view_count=101)
+        assert compute_content_hash(other) == compute_content_hash(VIDEO_DATA)
+
+
+class TestVideoRevisionService:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> Iterator[None]:
+        self.db = database.SessionLocal()
+        self.db.add(
+            Channel(
+                channel_id="UCtest123",
+                title="Test Channel",
+                uploads_playlist_id="UUtest123",
+                source_input="@testchannel",
+            )
+        )
+        self.video = Video(
+            channel_id="UCtest123",
+            is_available=True,
+            content_hash=compute_content_hash(VIDEO_DATA),
+            **VIDEO_DATA,
+        )
+        self.db.add(self.video)
+        self.db.commit()
+        self.service = VideoRevisionService(self.db)
+        yield
+        self.db.close()
+
+    def test_unchanged_video_is_not_dirtied(self) -> None:
+        assert self.service.apply(self.video, dict(VIDEO_DATA)) is False
+        assert not self.db.is_modified(self.video)
+        assert self.db.query(VideoRevision).count() == 0
+
+    def test_missing_optional_fields_keep_stored_values(self) -> None:
+        partial = {"video_id": "video1", "title": "Title"}
+        assert self.service.apply(self.video, partial) is False
+        assert self.video.description == "Description"
+
+    def test_changed_fields_are_recorded(self) -> None:
+        changed = dict(VIDEO_DATA, title="New Title", view_count=150)
+        assert self.service.apply(self.video, changed) is True
+        self.db.commit()
+
+        revision = self.db.query(VideoRevision).one()
+        assert revision.changes == {"title": {"old": "Title", "new": "New Title"}}
+        assert self.video.title == "New Title"
+        assert self.video.view_count == 150
+        assert self.video.content_hash == compute_content_hash(changed)
+
+    def test_view_count_only_refreshes_after_drift(self) -> None:
+        self.video.view_count = 100000
+        self.db.commit()
+
+        assert (
+            self.service.apply(self.video, dict(VIDEO_DATA, view_count=100500)) is False
+        )
+        assert not self.db.is_modified(self.video)
+
+        assert (
+            self.service.apply(self.video, dict(VIDEO_DATA, view_count=101000)) is False
+        )
+        assert self.video.view_count == 101000
+        self.db.commit()
+        assert self.db.query(VideoRevision).count() == 0
+
+    def test_scan_with_only_view_count_changes_writes_no_revision(self) -> None:
+        youtube_client = Mock()
+        youtube_client.fetch_channel_videos.return_value = [
+            dict(VIDEO_DATA, view_count=5000)
+        ]
+
+        VideoIngestionService(self.db, youtube_client).scan_channel("UCtest123")
+
+        assert self.db.query(VideoRevision).count() == 0
+        assert self.db.query(Video).one().view_count == 5000
+
+    def test_legacy_video_without_hash_gets_hash_and_no_revision(self) -> None:
+        self.video.content_hash = None
+        self.db.commit()
+
+        assert self.service.apply(self.video, dict(VIDEO_DATA)) is False
+        self.db.commit()
+
+        assert self.video.content_hash == compute_content_hash(VIDEO_DATA)
+        assert self.db.query(VideoRevision).count() == 0
+
+    def test_scan_records_revisions(self) -> None:
+        youtube_client = Mock()
+        youtube_client.fetch_channel_videos.return_value = [
+            dict(VIDEO_DATA, description="Edited"),
+            dict(VIDEO_DATA, video_id="video2"),
+        ]
+
+        VideoIngestionService(self.db, youtube_client).scan_channel("UCtest123")
+
+        revision = self.db.query(VideoRevision).one()
+        assert revision.video_id == "video1"
+        assert list(revision.changes) == ["description"]
+
+        new_video = self.db.query(Video).filter(Video.video_id == "video2").one()
+        assert new_video.content_hash == compute_content_hash(VIDEO_DATA)
+
+
+class TestVideoHistoryAPI:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> None:
+        db = database.SessionLocal()
+        db.add(
+            Channel(
+                channel_id="UCtest123",
+                title="Test Channel",
+                uploads_playlist_id="UUtest123",
+                source_input="@testchannel",
+            )
+        )
+        db.add(Video(channel_id="UCtest123", is_available=True, **VIDEO_DATA))
+        for title in ("Second", "Third"):
+            db.add(
+                VideoRevision(
+                    video_id="video1",
+                    changes={"title": {"old": "Title", "new": title}},
+                )
+            )
+        db.commit()
+        db.close()
+
+        test_app = FastAPI()
+        test_app.include_router(app.router)
+        database.install(test_app)
+        self.client = TestClient(test_app)
+
+    def test_get_video_history(self) -> None:
+        response = self.client.get("/api/videos/video1/history?limit=1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert len(data["revisions"]) == 1
+        assert data["revisions"][0]["changes"]["title"]["new"] == "Third"
+
+    def test_get_video_history_not_found(self) -> None:
+        response = self.client.get("/api/videos/missing/history")
+        assert response.status_code == 404
@@ -1,48 +1,25 @@
 from datetime import datetime, timezone
-from typing import Generator
 from unittest.mock import Mock, patch
 
+import pytest
+from conftest import TestDatabase
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.core.database import Base, get_db
 from app.main import app
 from app.models.channel import Channel
 from app.models.disappearance_event import DisappearanceEvent, EventType
 from app.models.video import Video
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-Base.metadata.create_all(bind=engine)
-
-
-def override_get_db() -> Generator[Session, None, None]:
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-
 client = TestClient(app)
 
 
 class TestVideosAPI:
-    def setup_method(self) -> None:
-        app.dependency_overrides[get_db] = override_get_db
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase) -> None:
+        self.database = database
+        database.install(app)
 
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
-
-        db = TestingSessionLocal()
+        db = database.SessionLocal()
         try:
             self.channel = Channel(
                 channel_id="UCtest123",
@@ -57,10 +34,6 @@ class TestVideosAPI:
         finally:
             db.close()
 
-    def teardown_method(self) -> None:
-        if get_db in app.dependency_overrides:
-            del app.dependency_overrides[get_db]
-
     @patch("app.api.videos.YouTubeClient")
     @patch("app.api.videos.VideoIngestionService")
     def test_scan_channel_success(
@@ -105,7 +78,7 @@ class TestVideosAPI:
         assert data["total"] == 0
 
     def test_get_channel_videos_with_data(self) -> None:
-        db = TestingSessionLocal()
+        db = self.database.SessionLocal()
         video1 = Video(
             video_id="video1",
             channel_id="UCtest123",
@@ -131,7 +104,7 @@ class TestVideosAPI:
         assert data["total"] == 2
 
     def test_get_channel_videos_filter_active(self) -> None:
-        db = TestingSessionLocal()
+        db = self.database.SessionLocal()
         video1 = Video(
             video_id="video1",
             channel_id="UCtest123",
@@ -156,8 +129,38 @@ class TestVideosAPI:
         assert len(data["videos"]) == 1
         assert data["videos"][0]["title"] == "Active Video"
 
+    def test_get_channel_videos_filter_suspected(self) -> None:
+        db = self.database.SessionLocal()
+        db.add_all(
+            [
+                Video(
+                    video_id="video1",
+                    channel_id="UCtest123",
+                    title="Suspected Video",
+                    published_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                    is_available=True,
+                    missed_scans=1,
+                ),
+                Video(
+                    video_id="video2",
+                    channel_id="UCtest123",
+                    title="Active Video",
+                    published_at=datetime(2023, 1, 2, tzinfo=timezone.utc),
+                    is_available=True,
+                ),
+            ]
+        )
+        db.commit()
+        db.close()
+
+        response = client.get("/api/channels/UCtest123/videos?status=suspected")
+        assert response.status_code == 200
+        data = response.json()
+        assert [v["title"] for v in data["videos"]] == ["Suspected Video"]
+        assert data["videos"][0]["missed_scans"] == 1
+
     def test_get_channel_videos_pagination(self) -> None:
-        db = TestingSessionLocal()
+        db = self.database.SessionLocal()
         for i in range(10):
             video = Video(
                 video_id=f"video{i}",
@@ -190,7 +193,7 @@ class TestVideosAPI:
         assert data["total"] == 0
 
     def test_get_disappearance_events_with_data(self) -> None:
-        db = TestingSessionLocal()
+        db = self.database.SessionLocal()
         video = Video(
             video_id="disappeared_video",
             channel_id="UCtest123",
@@ -214,7 +217,7 @@ class TestVideosAPI:
         assert data["events"][0]["event_type"] == "PRIVATE"
 
     def test_get_disappearance_events_filter_by_type(self) -> None:
-        db = TestingSessionLocal()
+        db = self.database.SessionLocal()
         video = Video(
             video_id="disappeared_video",
             channel_id="UCtest123",
@@ -296,7 +299,7 @@ class TestVideosAPI:
         assert "total" in data
 
     def test_get_channel_videos_backward_compatibility(self) -> None:
-        db = TestingSessionLocal()
+        db = self.database.SessionLocal()
         video = Video(
             video_id="test_video",
             channel_id="UCtest123",
@@ -1,46 +1,24 @@
 import os
 from unittest.mock import MagicMock, patch
 
+import pytest
+from conftest import TestDatabase
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.core.database import Base, get_db
 from app.main import app
 from app.models.channel import Channel
 from app.models.disappearance_event import DisappearanceEvent, EventType
 from app.models.video import Video
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-Base.metadata.create_all(bind=engine)
-
-
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-
 client = TestClient(app)
 
 
 class TestWebRoutes:
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_database(self, database: TestDatabase):
         """Set up test data before each test."""
-        app.dependency_overrides[get_db] = override_get_db
-
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
+        self.database = database
+        database.install(app)
 
         self.admin_username = "testadmin"
         self.admin_password = "testpass123"
@@ -48,7 +26,7 @@ class TestWebRoutes:
         self.test_channel_id = "UC123456789"
         self.test_video_id = "abc123"
 
-        db = TestingSessionLocal()
+        db = database.SessionLocal()
         try:
             from datetime import datetime
 
@@ -330,8 +308,3 @@ class TestWebRoutes:
         """Test rate limiting on scan channel endpoint."""
         response = client.post(f"/admin/channels/{self.test_channel_id}/scan")
         assert response.status_code == 401
-
-    def teardown_method(self):
-        """Clean up test data after each test."""
-        if get_db in app.dependency_overrides:
-            del app.dependency_overrides[get_db]
@@ -0,0 +1,446 @@
+import hashlib
+import hmac
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.websub import router
+from app.core.database import Base, get_db
+from app.core.metrics import WEBSUB_NOTIFICATIONS_TOTAL
+from app.models.channel import Channel
+from app.models.channel_stats import ChannelStats
+from app.models.video import Video
+from app.models.websub_subscription import WebSubSubscription
+from app.services.background_jobs import BackgroundJobService
+from app.services.video_ingestion import VideoIngestionService
+from app.services.websub import (
+    FAILED,
+    PENDING,
+    VERIFIED,
+    WebSubConfig,
+    WebSubManager,
+    parse_push,
+    signature_valid,
+    topic_url,
+)
+from app.services.youtube_client import YouTubeClient
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+NOW = datetime(2025, 9, 16, 12, 0, tzinfo=timezone.utc)
+CHANNEL_ID = "UCpush000000000000000000"
+CALLBACK_URL = "http://testserver/api/websub/callback"
+
+
+def push_body(video_id: str, channel_id: str = CHANNEL_ID) -> bytes:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns="http://www.w3.org/2005/Atom">
+  <link rel="hub" href="https://pubsubhubbub.appspot.com"/>
+  <title>YouTube video feed</title>
+  <entry>
+    <id>yt:video:{video_id}</id>
+    <yt:videoId>{video_id}</yt:videoId>
+    <yt:channelId>{channel_id}</yt:channelId>
+    <title>New upload</title>
+    <published>2025-09-16T11:59:00+00:00</published>
+  </entry>
+</feed>""".encode()
+
+
+def tombstone_body(video_id: str) -> bytes:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:at="http://purl.org/atompub/tombstones/1.0"
+      xmlns="http://www.w3.org/2005/Atom">
+  <at:deleted-entry ref="yt:video:{video_id}" when="2025-09-16T11:59:00+00:00">
+    <link href="https://www.youtube.com/watch?v={video_id}"/>
+  </at:deleted-entry>
+</feed>""".encode()
+
+
+def sign(secret: str, body: bytes) -> str:
+    return "sha1=" + hmac.new(secret.encode(), body, hashlib.sha1).hexdigest()
+
+
+class HubStandIn:
+    """
+    Local stand-in for the WebSub hub.
+
+    Subscription requests are recorded and, like Google's hub, verified
+    against the subscriber's callback before the hub answers.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, str]] = []
+        self.status_code = 202
+        self.verifier: Optional[Callable[[str, Dict[str, str]], Any]] = None
+        self.verifications: List[Any] = []
+        hub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", "0"))
+                form = parse_qs(self.rfile.read(length).decode())
+                request = {key: values[0] for key, values in form.items()}
+                hub.requests.append(request)
+                if hub.status_code == 202 and hub.verifier is not None:
+                    hub.verifications.append(hub.verify(request))
+                self.send_response(hub.status_code)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}/subscribe"
+
+    def verify(self, request: Dict[str, str]) -> Any:
+        params = {
+            "hub.mode": request["hub.mode"],
+            "hub.topic": request["hub.topic"],
+            "hub.challenge": "challenge-123",
+        }
+        if "hub.lease_seconds" in request:
+            params["hub.lease_seconds"] = request["hub.lease_seconds"]
+        assert self.verifier is not None
+        return self.verifier(request["hub.callback"], params)
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class WebSubTestCase:
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.hub = HubStandIn()
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.hub.close()
+
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        self.db.add(
+            Channel(
+                channel_id=CHANNEL_ID,
+                title="Push channel",
+                uploads_playlist_id="UUpush",
+                source_input=CHANNEL_ID,
+            )
+        )
+        self.db.commit()
+
+        self.config = WebSubConfig(callback_url=CALLBACK_URL, hub_url=self.hub.url)
+        self.manager = WebSubManager(self.db, self.config)
+
+        self.app = FastAPI()
+        self.app.include_router(router, prefix="/api")
+
+        def override_get_db() -> Any:
+            db = TestingSessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        self.app.dependency_overrides[get_db] = override_get_db
+        self.client = TestClient(self.app)
+
+        self.hub.requests.clear()
+        self.hub.verifications.clear()
+        self.hub.status_code = 202
+        self.hub.verifier = lambda url, params: self.client.get(url, params=params)
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def subscription(self) -> Optional[WebSubSubscription]:
+        self.db.expire_all()
+        return self.manager.get(CHANNEL_ID)
+
+
+class TestPayloads:
+    def test_parse_push_entries_and_tombstones(self) -> None:
+        assert parse_push(push_body("vidA")).videos == [(CHANNEL_ID, "vidA")]
+        assert parse_push(tombstone_body("vidB")).deleted_video_ids == ["vidB"]
+
+    def test_signature(self) -> None:
+        body = push_body("vidA")
+
+        assert signature_valid("s3cret", body, sign("s3cret", body))
+        assert not signature_valid("s3cret", body, sign("other", body))
+        assert not signature_valid("s3cret", body, None)
+        assert not signature_valid("s3cret", body, "md5=abc")
+
+    def test_disabled_without_callback_url(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            assert WebSubConfig.from_env().enabled is False
+
+
+class TestSubscriptions(WebSubTestCase):
+    def test_sync_subscribes_and_hub_verifies(self) -> None:
+        counts = self.manager.sync(NOW)
+
+        assert counts["subscribed"] == 1
+        request = self.hub.requests[0]
+        assert request["hub.mode"] == "subscribe"
+        assert request["hub.topic"] == topic_url(CHANNEL_ID)
+        assert request["hub.callback"] == f"{CALLBACK_URL}/{CHANNEL_ID}"
+        assert request["hub.lease_seconds"] == str(self.config.lease_seconds)
+
+        verification = self.hub.verifications[0]
+        assert verification.status_code == 200
+        assert verification.text == "challenge-123"
+
+        subscription = self.subscription()
+        assert subscription is not None
+        assert subscription.status == VERIFIED
+        assert subscription.secret == request["hub.secret"]
+        assert subscription.expires_at is not None
+
+    def test_rejected_request_is_retried_on_next_sync(self) -> None:
+        self.hub.status_code = 500
+        self.manager.sync(NOW)
+        subscription = self.subscription()
+        assert subscription is not None and subscription.status == FAILED
+
+        self.hub.status_code = 202
+        assert self.manager.sync(NOW)["renewed"] == 1
+        subscription = self.subscription()
+        assert subscription is not None and subscription.status == VERIFIED
+
+    def test_renews_only_leases_about_to_expire(self) -> None:
+        self.manager.sync(NOW)
+        self.hub.requests.clear()
+        subscription = self.subscription()
+        assert subscription is not None
+
+        subscription.expires_at = NOW + timedelta(days=3)  # type: ignore[assignment]
+        self.db.commit()
+        assert self.manager.sync(NOW)["renewed"] == 0
+
+        subscription.expires_at = NOW + timedelta(hours=2)  # type: ignore[assignment]
+        self.db.commit()
+        assert self.manager.sync(NOW)["renewed"] == 1
+        assert self.hub.requests[0]["hub.mode"] == "subscribe"
+
+    def test_unverified_request_is_retried_after_timeout(self) -> None:
+        self.hub.verifier = None
+        self.manager.sync(NOW)
+        subscription = self.subscription()
+        assert subscription is not None and subscription.status == PENDING
+
+        assert self.manager.sync(NOW + timedelta(minutes=10))["renewed"] == 0
+        assert self.manager.sync(NOW + timedelta(hours=2))["renewed"] == 1
+
+    def test_inactive_channel_is_unsubscribed(self) -> None:
+        self.manager.sync(NOW)
+        channel = self.db.query(Channel).one()
+        channel.is_active = False  # type: ignore[assignment]
+        self.db.commit()
+
+        assert self.manager.sync(NOW)["unsubscribed"] == 1
+
+        assert self.hub.requests[-1]["hub.mode"] == "unsubscribe"
+        assert self.hub.verifications[-1].text == "challenge-123"
+        assert self.subscription() is None
+
+    def test_unknown_verification_is_refused(self) -> None:
+        self.manager.sync(NOW)
+        params = {"hub.mode": "subscribe", "hub.challenge": "x"}
+
+        response = self.client.get(
+            f"/api/websub/callback/{CHANNEL_ID}",
+            params={**params, "hub.topic": topic_url("UCsomeoneelse")},
+        )
+        assert response.status_code == 404
+
+        response = self.client.get(
+            "/api/websub/callback/UCunknown",
+            params={**params, "hub.topic": topic_url("UCunknown")},
+        )
+        assert response.status_code == 404
+
+
+class TestNotifications(WebSubTestCase):
+    def setup_method(self) -> None:
+        super().setup_method()
+        self.manager.sync(NOW)
+        subscription = self.subscription()
+        assert subscription is not None
+        self.secret = str(subscription.secret)
+
+    def _push(self, body: bytes, signature: Optional[str] = None) -> Any:
+        return self.client.post(
+            f"/api/websub/callback/{CHANNEL_ID}",
+            content=body,
+            headers={
+                "Content-Type": "application/atom+xml",
+                "X-Hub-Signature": signature or sign(self.secret, body),
+            },
+        )
+
+    @patch("app.api.websub.ingest_pushed_videos")
+    def test_signed_push_ingests_video(self, ingest: Mock) -> None:
+        response = self._push(push_body("vidNew"))
+
+        assert response.status_code == 204
+        ingest.assert_called_once_with(CHANNEL_ID, ["vidNew"])
+        subscription = self.subscription()
+        assert subscription is not None and subscription.last_notified_at is not None
+
+    @patch("app.api.websub.ingest_pushed_videos")
+    def test_unsigned_push_is_ignored(self, ingest: Mock) -> None:
+        before = WEBSUB_NOTIFICATIONS_TOTAL.value(result="rejected")
+        body = push_body("vidNew")
+
+        response = self._push(body, signature=sign("wrong", body))
+
+        assert response.status_code == 204
+        ingest.assert_not_called()
+        assert WEBSUB_NOTIFICATIONS_TOTAL.value(result="rejected") == before + 1
+
+    @patch("app.api.websub.ingest_pushed_videos")
+    def test_entries_for_other_channels_are_dropped(self, ingest: Mock) -> None:
+        self._push(push_body("vidElse", channel_id="UCsomeoneelse"))
+
+        ingest.assert_not_called()
+
+    @patch("app.api.websub.ingest_pushed_videos")
+    def test_tombstone_makes_channel_due(self, ingest: Mock) -> None:
+        self._push(tombstone_body("vidGone"))
+
+        ingest.assert_not_called()
+        self.db.expire_all()
+        assert self.db.query(Channel).one().scan_requested_at is not None
+
+    @patch("app.api.websub.ingest_pushed_videos")
+    def test_tombstone_is_scanned_on_next_tick(self, ingest: Mock) -> None:
+        # Scanned a minute ago on a daily interval: not due by the plan.
+        channel = self.db.query(Channel).one()
+        channel.scan_interval_minutes = 1440  # type: ignore[assignment]
+        channel.last_scanned_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        self.db.commit()
+
+        self._push(tombstone_body("vidGone"))
+        with patch.dict(os.environ, {"SCAN_ADAPTIVE": "true"}):
+            service = BackgroundJobService()
+        service._acquire_lock = Mock(return_value=True)  # type: ignore[method-assign]
+        service._release_lock = Mock()  # type: ignore[method-assign]
+        service._scan_single_channel = Mock()  # type: ignore[method-assign]
+        with patch("app.services.background_jobs.SessionLocal", TestingSessionLocal):
+            service._scan_all_channels()
+            service._scan_all_channels()
+
+        service._scan_single_channel.assert_called_once()
+        assert service._scan_single_channel.call_args.args[1] == CHANNEL_ID
+        self.db.expire_all()
+        assert self.db.query(Channel).one().scan_requested_at is None
+
+
+class TestSingleVideoIngestion:
+    def setup_method(self) -> None:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = TestingSessionLocal()
+        self.db.add(
+            Channel(
+                channel_id=CHANNEL_ID,
+                title="Push channel",
+                uploads_playlist_id="UUpush",
+                source_input=CHANNEL_ID,
+            )
+        )
+        self.db.commit()
+        self.youtube_client = Mock()
+        self.service = VideoIngestionService(self.db, self.youtube_client)
+
+    def teardown_method(self) -> None:
+        self.db.close()
+
+    def _video_data(self, video_id: str) -> Dict[str, Any]:
+        return {
+            "video_id": video_id,
+            "title": "New upload",
+            "description": "",
+            "thumbnail_url": None,
+            "published_at": NOW,
+            "duration": "PT1M",
+            "view_count": 5,
+        }
+
+    def test_adds_new_video(self) -> None:
+        self.youtube_client.fetch_video.return_value = self._video_data("vidNew")
+
+        assert self.service.ingest_video(CHANNEL_ID, "vidNew") is True
+
+        video = self.db.query(Video).one()
+        assert video.video_id == "vidNew"
+        assert video.is_available is True
+        stats = self.db.get(ChannelStats, CHANNEL_ID)
+        assert stats is not None and stats.total_videos == 1
+
+    def test_marks_known_video_available_again(self) -> None:
+        self.db.add(
+            Video(
+                video_id="vidBack",
+                channel_id=CHANNEL_ID,
+                title="New upload",
+                published_at=NOW,
+                is_available=False,
+            )
+        )
+        self.db.commit()
+        self.youtube_client.fetch_video.return_value = self._video_data("vidBack")
+
+        assert self.service.ingest_video(CHANNEL_ID, "vidBack") is True
+        assert self.service.ingest_video(CHANNEL_ID, "vidBack") is False
+        assert self.db.query(Video).one().is_available is True
+
+    def test_non_public_video_is_skipped(self) -> None:
+        self.youtube_client.fetch_video.return_value = None
+
+        assert self.service.ingest_video(CHANNEL_ID, "vidPrivate") is False
+        assert self.db.query(Video).count() == 0
+
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test-api-key"})
+    @patch("googleapiclient.discovery.build")
+    def test_client_fetches_one_video(self, build: Mock) -> None:
+        client = YouTubeClient()
+        detail = {
+            "id": "vidNew",
+            "snippet": {"title": "New upload", "publishedAt": "2025-09-16T11:59:00Z"},
+            "status": {"privacyStatus": "public"},
+        }
+
+        with patch.object(
+            client, "_get_video_details", return_value={"vidNew": detail}
+        ) as details:
+            metadata = client.fetch_video("vidNew")
+
+        details.assert_called_once_with(["vidNew"])
+        assert metadata is not None and metadata["title"] == "New upload"
@@ -9,7 +9,7 @@ from app.services.youtube_client import YouTubeClient
 class TestYouTubeClient:
     @pytest.fixture
     def mock_youtube_service(self) -> Generator[Mock, None, None]:
-        with patch("app.services.youtube_client.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_service = Mock()
             mock_build.return_value = mock_service
             yield mock_service
@@ -264,6 +264,99 @@ class TestYouTubeClient:
         assert result_id is None
         assert metadata is None
 
+    def test_usage_counts_calls_quota_and_pages(
+        self, youtube_client: YouTubeClient, mock_youtube_service: Mock
+    ) -> None:
+        playlist_request = Mock()
+        playlist_request.execute.return_value = {"items": []}
+        mock_youtube_service.playlistItems.return_value.list.return_value = (
+            playlist_request
+        )
+        search_request = Mock()
+        search_request.execute.return_value = {"items": []}
+        mock_youtube_service.search.return_value.list.return_value = search_request
+
+        youtube_client.fetch_channel_videos("UUtest")
+        youtube_client._search_by_custom_name("somename")
+
+        assert youtube_client.usage.api_calls == 2
+        assert youtube_client.usage.quota_units == 101
+        assert youtube_client.usage.pages_fetched == 1
+
+    def test_calls_pass_through_rate_limiter(
+        self, youtube_client: YouTubeClient, mock_youtube_service: Mock
+    ) -> None:
+        youtube_client.rate_limiter = Mock()
+        request = Mock()
+        request.execute.return_value = {"items": []}
+        mock_youtube_service.playlistItems.return_value.list.return_value = request
+
+        youtube_client.fetch_channel_videos("UUtest")
+
+        youtube_client.rate_limiter.acquire.assert_called_once_with(
+            "fetch playlist items"
+        )
+
+    def test_playlist_walk_classifies_unavailable_entries(
+        self, youtube_client: YouTubeClient, mock_youtube_service: Mock
+    ) -> None:
+        def item(video_id: str, title: str, privacy: str = "public") -> Dict:
+            return {
+                "snippet": {"title": title},
+                "contentDetails": {"videoId": video_id},
+                "status": {"privacyStatus": privacy},
+            }
+
+        playlist_request = Mock()
+        playlist_request.execute.return_value = {
+            "items": [
+                item("public1", "Still here"),
+                item("private1", "Private video", "private"),
+                item("deleted1", "Deleted video", "privacyStatusUnspecified"),
+                item("private2", "Old title"),
+                item("gone1", "Old title"),
+            ]
+        }
+        mock_youtube_service.playlistItems.return_value.list.return_value = (
+            playlist_request
+        )
+        details_request = Mock()
+        details_request.execute.return_value = {
+            "items": [
+                {
+                    "id": "public1",
+                    "snippet": {
+                        "title": "Still here",
+                        "publishedAt": "2025-09-01T00:00:00Z",
+                    },
+                    "status": {"privacyStatus": "public"},
+                },
+                {
+                    "id": "private2",
+                    "snippet": {"publishedAt": "2025-09-01T00:00:00Z"},
+                    "status": {"privacyStatus": "private"},
+                },
+            ]
+        }
+        mock_youtube_service.videos.return_value.list.return_value = details_request
+
+        videos = youtube_client.fetch_channel_videos("UUtest")
+
+        assert [v["video_id"] for v in videos] == [
+            "public1",
+            "private1",
+            "deleted1",
+            "private2",
+        ]
+        assert [v.get("unavailable") for v in videos] == [
+            None,
+            "private",
+            "deleted",
+            "private",
+        ]
+        # One playlist page plus one batched videos.list call, no probes.
+        assert youtube_client.usage.api_calls == 2
+
     def test_extract_metadata_complete(self, youtube_client: YouTubeClient) -> None:
         channel_data: Dict[str, Any] = {
             "snippet": {